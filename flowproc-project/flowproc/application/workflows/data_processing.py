@@ -14,6 +14,7 @@ from ...domain.parsing.service import ParseService
 from ...domain.processing.core import UnifiedProcessingService, ProcessingConfig, ProcessingMode
 from ...domain.export.service import ExportService
 from ...infrastructure.monitoring.metrics import metrics_collector
+from ...infrastructure.monitoring.exporters import run_metrics, begin_run, end_run, file_size
 from ...core.exceptions import FlowProcError
 from ...domain.visualization.naming_utils import NamingUtils
 
@@ -108,11 +109,17 @@ class DataProcessingWorkflow:
             
             logger.info("Data processing workflow completed successfully")
             metrics_collector.end_operation(operation_id, success=True)
+            run_metrics.record_file(
+                rows=len(parsed_data),
+                bytes_read=file_size(input_file),
+                bytes_written=sum(file_size(path) for path in results['outputs'].get('export_paths', []))
+            )
             return results
             
         except Exception as e:
             logger.error(f"Data processing workflow failed: {e}")
             metrics_collector.end_operation(operation_id, success=False, error_message=str(e))
+            run_metrics.record_failure()
             results['success'] = False
             results['error'] = str(e)
             return results
@@ -213,6 +220,7 @@ class DataProcessingWorkflow:
             "process_batch", 
             metadata={'file_count': len(input_files)}
         )
+        begin_run()
         
         try:
             results = {
@@ -256,6 +264,8 @@ class DataProcessingWorkflow:
                 'success': False,
                 'error': str(e)
             }
+        finally:
+            end_run()
     
     def validate_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Validate processing configuration."""
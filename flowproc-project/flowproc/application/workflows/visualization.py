@@ -7,6 +7,7 @@ PlotFactory architecture to eliminate code duplication.
 
 import logging
 import warnings
+from functools import partial
 from typing import Dict, Any, List, Optional, Union
 from pathlib import Path
 import pandas as pd
@@ -15,6 +16,7 @@ import plotly.graph_objects as go
 from ...domain.visualization.flow_cytometry_visualizer import plot
 from ...domain.visualization.time_plots import create_timecourse_visualization
 from ...domain.visualization.plotly_renderer import PlotlyRenderer
+from ...domain.visualization.report_builder import StudyReport
 from ...infrastructure.monitoring.metrics import metrics_collector
 from ...core.exceptions import FlowProcError
 from ...domain.visualization.naming_utils import NamingUtils
@@ -127,19 +129,7 @@ class VisualizationWorkflow:
             
             for i, plot_config in enumerate(plots_config):
                 try:
-                    # Create plot using existing plot function
-                    plot_type = plot_config.get('type', 'scatter')
-                    x_axis = plot_config.get('x', 'Group')
-                    y_axis = plot_config.get('y', 'Freq. of Parent')
-                    
-                    fig = plot(
-                        data=data,
-                        x=x_axis,
-                        y=y_axis,
-                        plot_type=plot_type,
-                        width=plot_config.get('width', 1200),
-                        height=plot_config.get('height', 500)
-                    )
+                    fig = self._build_plot(data, plot_config)
                     
                     # Generate standard filename
                     plot_filename = NamingUtils.generate_plot_filename(
@@ -178,6 +168,111 @@ class VisualizationWorkflow:
             results['errors'].append(str(e))
             return results
     
+    @staticmethod
+    def _build_plot(data: pd.DataFrame, plot_config: Dict[str, Any]) -> go.Figure:
+        """Create one figure from a plot configuration ('timecourse' or a plot() type)."""
+        plot_type = plot_config.get('type', 'scatter')
+        if plot_type == 'timecourse':
+            return create_timecourse_visualization(
+                data,
+                metric=plot_config.get('y', 'Freq. of Parent'),
+                group_by=plot_config.get('group_by', 'Group'),
+                width=plot_config.get('width', 1200),
+                height=plot_config.get('height', 500)
+            )
+        return plot(
+            data=data,
+            x=plot_config.get('x', 'Group'),
+            y=plot_config.get('y', 'Freq. of Parent'),
+            plot_type=plot_type,
+            width=plot_config.get('width', 1200),
+            height=plot_config.get('height', 500)
+        )
+    
+    def create_report(self, data: pd.DataFrame, config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create one study report holding every plot, instead of one file per plot.
+        
+        The 'report' section of the config takes the same 'plots' entries as
+        create_individual_plots (plus type 'timecourse'). With 'split_by',
+        every plot is repeated for each value of those columns (e.g. Tissue,
+        Time), one report section per value. Figures are built concurrently.
+        
+        Args:
+            data: Input DataFrame
+            config: Visualization configuration; 'report' may set 'title',
+                'filename' (without extension), 'formats' ('html', 'pdf'),
+                'plots', 'split_by', 'max_workers' and 'include_plotlyjs'
+            
+        Returns:
+            Dictionary with report results
+        """
+        operation_id = metrics_collector.start_operation(
+            "create_report",
+            metadata={'data_shape': data.shape}
+        )
+        
+        try:
+            results = {
+                'success': True,
+                'report_paths': [],
+                'plots_created': 0,
+                'errors': []
+            }
+            
+            report_config = config.get('report', {})
+            output_dir = Path(config.get('output_dir', '.'))
+            split_by = report_config.get('split_by') or []
+            if isinstance(split_by, str):
+                split_by = [split_by]
+            missing = [col for col in split_by if col not in data.columns]
+            if missing:
+                raise FlowProcError(f"Report split columns not found: {missing}")
+            
+            if split_by:
+                subsets = [
+                    (', '.join(f"{col}: {value}" for col, value in zip(split_by, key)), subset)
+                    for key, subset in data.groupby(split_by, sort=True)
+                ]
+            else:
+                subsets = [('', data)]
+            
+            specs = []
+            for section, subset in subsets:
+                for plot_config in report_config.get('plots', []):
+                    title = plot_config.get('title') or (
+                        f"{plot_config.get('y', 'Freq. of Parent')} ({plot_config.get('type', 'scatter')})"
+                    )
+                    build = partial(self._build_plot, subset, plot_config)
+                    specs.append((title, section, build))
+            
+            report = StudyReport(report_config.get('title', 'Study Report'))
+            results['errors'].extend(report.add_figures(specs, report_config.get('max_workers')))
+            results['plots_created'] = len(report.figures)
+            
+            filename = report_config.get('filename', 'report')
+            for fmt in report_config.get('formats', ['html']):
+                report_path = output_dir / f"{filename}.{fmt.lower()}"
+                if fmt.lower() == 'html':
+                    report.write_html(report_path, report_config.get('include_plotlyjs', True))
+                elif fmt.lower() == 'pdf':
+                    report.write_pdf(report_path)
+                else:
+                    results['errors'].append(f"Unsupported report format: {fmt}")
+                    continue
+                results['report_paths'].append(str(report_path))
+            
+            logger.info(f"Report created: {results['plots_created']} figures in {len(subsets)} section(s)")
+            metrics_collector.end_operation(operation_id, success=True)
+            return results
+            
+        except Exception as e:
+            logger.error(f"Report creation failed: {e}")
+            metrics_collector.end_operation(operation_id, success=False, error_message=str(e))
+            results['success'] = False
+            results['errors'].append(str(e))
+            return results
+    
     def create_comparison_plots(self, data_dict: Dict[str, pd.DataFrame], 
                               config: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -397,5 +492,5 @@ class VisualizationWorkflow:
             'available_plot_types': ['scatter', 'histogram', 'boxplot', 'violin', 'heatmap', 'scatter3d', 'surface'],
             'available_themes': ['default', 'dark', 'light'],
             'supported_formats': ['html', 'png', 'pdf', 'svg'],
-            'workflow_types': ['dashboard', 'individual_plots', 'comparison_plots', 'time_series_plots']
+            'workflow_types': ['dashboard', 'individual_plots', 'comparison_plots', 'time_series_plots', 'report']
         } 
\ No newline at end of file
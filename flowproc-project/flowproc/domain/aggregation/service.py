@@ -15,7 +15,8 @@ import numpy as np
 import pandas as pd
 
 from .core import group_stats, group_stats_multi, generic_aggregate
-from ..parsing.tissue_parser import extract_tissue
+from ..parsing.tissue_parser import extract_tissues
+from ..parsing.column_catalog import all_nan_columns, get_column_catalog
 from ...core.constants import Constants, KEYWORDS
 
 logger = logging.getLogger(__name__)
@@ -205,17 +206,19 @@ class AggregationService:
         result = AggregationResult()
         result.config = config
         
+        # Headers are classified and empty columns found once, not per metric
+        catalog = get_column_catalog(self.df)
+        empty_cols = all_nan_columns(self.df)
+        excluded = {self.sid_col, 'Well', 'Group', 'Animal', 'Time', 'Replicate', 'Tissue'}
+        
         # Process each metric
         for metric_name in metrics:
             key_substring = KEYWORDS.get(metric_name, metric_name.lower())
             
             # Find matching columns
             raw_cols = [
-                col for col in self.df.columns
-                if key_substring in col.lower()
-                and col not in {self.sid_col, 'Well', 'Group', 'Animal', 
-                              'Time', 'Replicate', 'Tissue'}
-                and not self.df[col].isna().all()
+                col for col in catalog.columns_containing(key_substring)
+                if col not in excluded and col not in empty_cols
             ]
             
             if raw_cols:
@@ -281,7 +284,7 @@ class AggregationService:
         
         # Vectorized tissue extraction
         if self.sid_col in working_df.columns:
-            working_df['Tissue'] = working_df[self.sid_col].apply(extract_tissue)
+            working_df['Tissue'] = extract_tissues(working_df[self.sid_col])
         else:
             working_df['Tissue'] = Constants.UNKNOWN_TISSUE.value
             
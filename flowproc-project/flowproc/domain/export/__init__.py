@@ -10,14 +10,38 @@ from .formatters import DataFormatter
 from .data_aggregator import aggregate_by_group, aggregate_with_stats, aggregate_by_replicate, create_export_aggregator
 from .replicate_mapper import ReplicateMapper
 from .excel_formatter import ExcelFormatter
+from ..parsing.column_catalog import get_column_catalog
+from ...infrastructure.monitoring.tracing import tracer
+from ...infrastructure.monitoring.exporters import run_metrics, begin_run, end_run, file_size
+from ...infrastructure.monitoring.profiling import profile_file
 
 logger = logging.getLogger(__name__)
 
 
+def _time_parse_cache_stats():
+    """Hits and misses of the memoized time parser."""
+    from ..parsing.time_service import TimeService
+    info = TimeService._parse_text.cache_info()
+    return info.hits, info.misses
+
+
+run_metrics.register_cache("time_parse", _time_parse_cache_stats)
+
 # Convenience functions that mimic the old writer API
 def process_csv(input_file, output_file, time_course_mode=False, user_replicates=None,
                 auto_parse_groups=True, user_group_labels=None, user_groups=None):
     """Process a CSV file to Excel using the export domain services."""
+    # Writes a per-file stage report when profiling is enabled
+    with profile_file(input_file):
+        return _process_csv(
+            input_file, output_file, time_course_mode, user_replicates,
+            auto_parse_groups, user_group_labels, user_groups
+        )
+
+
+@tracer.trace("process_csv")
+def _process_csv(input_file, output_file, time_course_mode, user_replicates,
+                 auto_parse_groups, user_group_labels, user_groups):
     from pathlib import Path
     from ..parsing import load_and_parse_df_with_type, extract_group_animal
     from ..processing.transform import map_replicates
@@ -36,15 +60,18 @@ def process_csv(input_file, output_file, time_course_mode=False, user_replicates
     logger.info(f"Processing CSV: {input_file}")
     
     # Load and parse the CSV with data type detection
-    df, sid_col, data_type = load_and_parse_df_with_type(input_file)
+    with tracer.span("process_csv.parse", input_file=str(input_file)) as span:
+        df, sid_col, data_type = load_and_parse_df_with_type(input_file)
+        span.metadata['rows'] = len(df)
     logger.info(f"Detected data type: {data_type.value}")
     
     # Map replicates
-    df, replicate_count = map_replicates(
-        df, auto_parse=auto_parse_groups, 
-        user_replicates=user_replicates, 
-        user_groups=user_groups
-    )
+    with tracer.span("process_csv.map"):
+        df, replicate_count = map_replicates(
+            df, auto_parse=auto_parse_groups, 
+            user_replicates=user_replicates, 
+            user_groups=user_groups
+        )
     
     if replicate_count == 0:
         logger.warning("No replicates found")
@@ -53,6 +80,10 @@ def process_csv(input_file, output_file, time_course_mode=False, user_replicates
         wb.create_sheet("No Data")
         wb.save(output_file)
         logger.info(f"Saved empty output to {output_file}")
+        run_metrics.record_file(
+            rows=len(df), bytes_read=file_size(input_file),
+            bytes_written=file_size(output_file)
+        )
         return
     
     # Check if we have time data
@@ -77,6 +108,8 @@ def process_csv(input_file, output_file, time_course_mode=False, user_replicates
         f"Processing modes - Grouped: {process_grouped}, Timecourse: {process_timecourse}"
     )
     
+    outputs = []
+    
     # Process in grouped mode if needed
     if process_grouped:
         # Backward-compatible: if caller provided an .xlsx path, use it directly for grouped output
@@ -91,17 +124,20 @@ def process_csv(input_file, output_file, time_course_mode=False, user_replicates
         wb_grouped.remove(wb_grouped.active)
         
         # Process and write categories in grouped mode
-        process_and_write_categories(
-            df, sid_col, wb_grouped, replicate_count, 
-            False, user_group_labels, data_type  # time_course_mode=False for grouped
-        )
+        with tracer.span("process_csv.build", mode="grouped"):
+            process_and_write_categories(
+                df, sid_col, wb_grouped, replicate_count, 
+                False, user_group_labels, data_type  # time_course_mode=False for grouped
+            )
         
         # Save grouped workbook
         if not wb_grouped.sheetnames:
             logger.warning(f"No valid data for grouped mode in {input_file}")
             wb_grouped.create_sheet("No Data")
         
-        wb_grouped.save(grouped_output)
+        with tracer.span("process_csv.write", mode="grouped"):
+            wb_grouped.save(grouped_output)
+        outputs.append(grouped_output)
         logger.info(f"Saved grouped output to {grouped_output}")
     
     # Process in timecourse mode if needed
@@ -114,19 +150,27 @@ def process_csv(input_file, output_file, time_course_mode=False, user_replicates
         wb_timecourse.remove(wb_timecourse.active)
         
         # Process and write categories in timecourse mode
-        process_and_write_categories(
-            df, sid_col, wb_timecourse, replicate_count, 
-            True, user_group_labels, data_type  # time_course_mode=True for timecourse
-        )
+        with tracer.span("process_csv.build", mode="timecourse"):
+            process_and_write_categories(
+                df, sid_col, wb_timecourse, replicate_count, 
+                True, user_group_labels, data_type  # time_course_mode=True for timecourse
+            )
         
         # Save timecourse workbook
         if not wb_timecourse.sheetnames:
             logger.warning(f"No valid data for timecourse mode in {input_file}")
             wb_timecourse.create_sheet("No Data")
         
-        wb_timecourse.save(timecourse_output)
+        with tracer.span("process_csv.write", mode="timecourse"):
+            wb_timecourse.save(timecourse_output)
+        outputs.append(timecourse_output)
         logger.info(f"Saved timecourse output to {timecourse_output}")
     
+    run_metrics.record_file(
+        rows=len(df), bytes_read=file_size(input_file),
+        bytes_written=sum(file_size(path) for path in outputs)
+    )
+    
     # Only produce the explicit outputs. Do not create a generic "*_Processed.xlsx" copy.
     # If both modes were processed, both _Grouped.xlsx and _Timecourse.xlsx exist.
 
@@ -152,27 +196,32 @@ def process_directory(input_dir, output_dir, recursive=True, pattern="*.csv",
         return 0
     
     count = 0
-    for idx, f in enumerate(csv_files, 1):
-        if not f.is_file():
-            continue
+    begin_run()
+    try:
+        for idx, f in enumerate(csv_files, 1):
+            if not f.is_file():
+                continue
+                
+            if status_callback:
+                status_callback(f"Processing file {idx}/{len(csv_files)}: {f.name}")
             
-        if status_callback:
-            status_callback(f"Processing file {idx}/{len(csv_files)}: {f.name}")
-        
-        # Generate base output filename - the actual output files will be created with suffixes
-        base_output = output_dir / f"{f.stem}_Processed"
+            # Generate base output filename - the actual output files will be created with suffixes
+            base_output = output_dir / f"{f.stem}_Processed"
+            
+            try:
+                process_csv(f, base_output, time_course_mode, user_replicates, 
+                           auto_parse_groups, user_group_labels, user_groups)
+                count += 1
+            except Exception as exc:
+                logger.error(f"Error processing '{f}': {exc}")
+                run_metrics.record_failure()
+                if status_callback:
+                    status_callback(f"Error: {exc}")
         
-        try:
-            process_csv(f, base_output, time_course_mode, user_replicates, 
-                       auto_parse_groups, user_group_labels, user_groups)
-            count += 1
-        except Exception as exc:
-            logger.error(f"Error processing '{f}': {exc}")
-            if status_callback:
-                status_callback(f"Error: {exc}")
-    
-    if status_callback:
-        status_callback(f"Processed {count} files.")
+        if status_callback:
+            status_callback(f"Processed {count} files.")
+    finally:
+        end_run()
     
     return count
 
@@ -225,11 +274,8 @@ def _get_group_label_map(groups, user_group_labels=None):
 
 def _get_raw_cols(df, sid_col, key_substring):
     """Get columns matching the keyword substring."""
-    return [
-        c for c in df.columns
-        if key_substring in _clean_column_name(c).lower()
-        and c not in {sid_col, "Well", "Group", "Animal", "Time", "Replicate", "Tissue"}
-    ]
+    excluded = {sid_col, "Well", "Group", "Animal", "Time", "Replicate", "Tissue"}
+    return [c for c in get_column_catalog(df).columns_containing(key_substring) if c not in excluded]
 
 def _create_sheet_pair(wb, sheet_root, num_replicates, raw_cols, group_label_map, groups, tissues_detected, is_time_course=False, has_time_data=False):
     """Create a pair of worksheets (values and IDs) with headers."""
@@ -348,9 +394,10 @@ def _write_standard_data(df, sid_col, ws_vals, ws_ids, raw_cols, num_replicates,
     for col_idx, col in enumerate(raw_cols):
         # Get blocks for this specific column
         # For grouped mode, use group-first iteration while preserving time data
-        val_blocks, id_blocks, tissue_codes, group_numbers, time_values = reshape_pair(
-            df, sid_col, [col], num_replicates, use_tissue=tissues_detected, include_time=has_time_data, group_first=True
-        )
+        with tracer.span("process_csv.reshape"):
+            val_blocks, id_blocks, tissue_codes, group_numbers, time_values = reshape_pair(
+                df, sid_col, [col], num_replicates, use_tissue=tissues_detected, include_time=has_time_data, group_first=True
+            )
         
         if val_blocks:
             all_data.append((col_idx, col, val_blocks, id_blocks, time_values))
@@ -515,8 +562,9 @@ def process_and_write_categories(df, sid_col, wb, n, time_course_mode=False, use
 
     # Flow cytometry processing (original logic)
     # Check if we have tissues (any tissue, not just multiple)
-    from ..parsing import extract_tissue
-    tissue_codes = df[sid_col].apply(lambda x: extract_tissue(str(x)) if pd.notna(x) else 'UNK')
+    from ..parsing import extract_tissues
+    sample_ids = df[sid_col]
+    tissue_codes = extract_tissues(sample_ids[sample_ids.notna()].astype(str))
     tissues_detected = (tissue_codes != 'UNK').any()
 
     # Process each metric category
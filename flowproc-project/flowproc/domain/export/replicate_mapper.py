@@ -1,11 +1,16 @@
 """Map samples to replicates for Excel output."""
+from collections import OrderedDict
 from typing import Dict, List, Tuple, Optional, Set
+import hashlib
 import pandas as pd
 import numpy as np
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Number of plate layouts remembered by a single mapper instance
+_MAX_CACHED_MAPPINGS = 32
+
 
 class ReplicateMapper:
     """Maps samples to replicate numbers."""
@@ -18,7 +23,7 @@ class ReplicateMapper:
             auto_map: Whether to automatically map replicates
         """
         self.auto_map = auto_map
-        self._mapping_cache: Dict[str, Dict[int, int]] = {}
+        self._mapping_cache: "OrderedDict[Tuple, pd.Series]" = OrderedDict()
         
     def map_replicates(self, df: pd.DataFrame,
                       groups: Optional[List[int]] = None,
@@ -53,11 +58,8 @@ class ReplicateMapper:
         # Create mapping
         mapping = self._create_mapping(df, groups, replicates)
         
-        # Apply mapping
-        df['Replicate'] = df.apply(
-            lambda row: mapping.get((row['Group'], row['Animal'])),
-            axis=1
-        )
+        # Apply mapping with a single vectorized index lookup
+        df['Replicate'] = self._apply_mapping(df, mapping)
         
         # Log mapping results
         mapped_count = df['Replicate'].notna().sum()
@@ -75,50 +77,78 @@ class ReplicateMapper:
         
     def _create_mapping(self, df: pd.DataFrame,
                        groups: List[int],
-                       replicates: List[int]) -> Dict[Tuple[int, int], int]:
-        """Create group/animal to replicate mapping."""
-        mapping = {}
-        
+                       replicates: List[int]) -> pd.Series:
+        """
+        Create a key to replicate lookup table.
+
+        The table is indexed by (Group, Animal), or by (Tissue, Group, Animal)
+        when several tissues are present so that animals are ranked within
+        each tissue. Tables are cached on a fingerprint of the key columns,
+        so the same plate layout seen in another file reuses the mapping.
+        """
         # Check for tissue-specific mapping
         has_tissues = 'Tissue' in df.columns and df['Tissue'].nunique() > 1
-        
-        # Create cache key
-        cache_key = f"{tuple(groups)}_{tuple(replicates)}_{has_tissues}"
-        
-        if cache_key in self._mapping_cache:
-            return self._mapping_cache[cache_key]
-            
-        if has_tissues:
-            # Map within each tissue
-            tissues = df['Tissue'].unique()
-            
-            for tissue in tissues:
-                tissue_df = df[df['Tissue'] == tissue]
-                
-                for group in groups:
-                    group_df = tissue_df[tissue_df['Group'] == group]
-                    animals = sorted(group_df['Animal'].dropna().unique())
-                    
-                    # Map animals to replicates
-                    for i, animal in enumerate(animals[:len(replicates)]):
-                        mapping[(group, animal)] = replicates[i]
-        else:
-            # Map globally
-            for group in groups:
-                group_df = df[df['Group'] == group]
-                animals = sorted(group_df['Animal'].dropna().unique())
-                
-                # Map animals to replicates
-                for i, animal in enumerate(animals[:len(replicates)]):
-                    mapping[(group, animal)] = replicates[i]
-                    
-        # Cache the mapping
+        key_cols = self._key_columns(has_tissues)
+
+        keys = df.loc[df['Group'].isin(groups), key_cols]
+        keys = keys.dropna(subset=['Animal'])
+
+        cache_key = (self._fingerprint(keys), tuple(groups), tuple(replicates))
+        cached = self._mapping_cache.get(cache_key)
+        if cached is not None:
+            self._mapping_cache.move_to_end(cache_key)
+            logger.debug("Reusing cached replicate mapping")
+            return cached
+
+        # Rank animals within each group (and tissue) in sorted order
+        keys = keys.drop_duplicates().sort_values(key_cols)
+        # Rows without a tissue are ranked together as one more tissue
+        rank = keys.groupby(key_cols[:-1], sort=False, dropna=False).cumcount().to_numpy(dtype=int)
+        keep = rank < len(replicates)
+
+        mapping = pd.Series(
+            np.asarray(replicates)[rank[keep]],
+            index=pd.MultiIndex.from_frame(keys[keep]),
+            name='Replicate',
+        )
+
+        # Cache the mapping, evicting the least recently used layout
         self._mapping_cache[cache_key] = mapping
-        
+        if len(self._mapping_cache) > _MAX_CACHED_MAPPINGS:
+            self._mapping_cache.popitem(last=False)
+
         # Log mapping details
         logger.debug(f"Created mapping for {len(mapping)} group/animal combinations")
-        
+
         return mapping
+
+    @staticmethod
+    def _key_columns(has_tissues: bool) -> List[str]:
+        """Columns identifying a sample for replicate mapping."""
+        return ['Tissue', 'Group', 'Animal'] if has_tissues else ['Group', 'Animal']
+
+    @staticmethod
+    def _fingerprint(keys: pd.DataFrame) -> str:
+        """Order-independent fingerprint of the distinct key rows."""
+        row_hashes = pd.util.hash_pandas_object(keys, index=False).to_numpy()
+        digest = hashlib.blake2b(np.unique(row_hashes).tobytes(), digest_size=16)
+        digest.update(','.join(map(str, keys.columns)).encode())
+        return digest.hexdigest()
+
+    @staticmethod
+    def _apply_mapping(df: pd.DataFrame, mapping: pd.Series) -> pd.Series:
+        """Look up the replicate of every row; unmapped rows become NaN."""
+        lookup = pd.MultiIndex.from_frame(df[list(mapping.index.names)])
+        positions = mapping.index.get_indexer(lookup)
+        found = positions >= 0
+
+        if found.all():
+            values = mapping.to_numpy()[positions]
+        else:
+            values = np.full(len(df), np.nan)
+            values[found] = mapping.to_numpy()[positions[found]]
+
+        return pd.Series(values, index=df.index, name='Replicate')
         
     def validate_mapping(self, df: pd.DataFrame) -> Tuple[bool, List[str]]:
         """
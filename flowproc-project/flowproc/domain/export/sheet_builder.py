@@ -1,5 +1,6 @@
 """Build Excel sheets with proper structure."""
 from typing import List, Dict, Optional, Tuple, Any
+import numpy as np
 import pandas as pd
 from openpyxl import Workbook
 from openpyxl.worksheet.worksheet import Worksheet
@@ -57,7 +58,7 @@ class SheetBuilder:
         self._write_headers(ws, metadata_cols, value_cols, n_replicates)
         
         # Write data
-        self._write_data(ws, data, metadata_cols, value_cols)
+        self._write_data(ws, data, metadata_cols, value_cols, n_replicates)
         
         # Apply formatting
         self._format_sheet(ws, metadata_cols, value_cols)
@@ -93,7 +94,7 @@ class SheetBuilder:
         self._write_headers(ws, metadata_cols, value_cols, n_replicates)
         
         # Write sample IDs instead of values
-        self._write_ids(ws, data, metadata_cols, value_cols)
+        self._write_ids(ws, data, metadata_cols, value_cols, n_replicates)
         
         # Apply formatting
         self._format_sheet(ws, metadata_cols, value_cols, is_id_sheet=True)
@@ -135,86 +136,102 @@ class SheetBuilder:
     def _write_data(self, ws: Worksheet,
                    data: pd.DataFrame,
                    metadata_cols: List[str],
-                   value_cols: List[str]) -> None:
-        """Write data values to sheet."""
-        row_offset = 3  # After headers
+                   value_cols: List[str],
+                   n_replicates: int) -> None:
+        """Write data values to sheet, one appended row per record."""
+        blocks = [self._metadata_block(data, metadata_cols)]
         
-        for idx, (_, row) in enumerate(data.iterrows()):
-            excel_row = idx + row_offset
+        for col_name in value_cols:
+            values, _ = self._replicate_block(data, col_name, n_replicates)
+            blocks.append(values)
             
-            # Write metadata
-            for col_idx, col_name in enumerate(metadata_cols, 1):
-                value = row.get(col_name, '')
-                
-                # Format time values
-                if col_name == 'Time' and value is not None and value != '':
-                    value = self.time_formatter.format(value)
-                    
-                ws.cell(row=excel_row, column=col_idx, value=value)
-                
-            # Write values
-            col_offset = len(metadata_cols)
-            for col_name in value_cols:
-                if col_name in row:
-                    value = row[col_name]
-                    
-                    # Handle different value types
-                    if pd.isna(value):
-                        display_value = None
-                    elif isinstance(value, (list, pd.Series)):
-                        # Multiple replicate values
-                        for i, val in enumerate(value):
-                            if i < len(value):
-                                ws.cell(
-                                    row=excel_row,
-                                    column=col_offset + i + 1,
-                                    value=val if not pd.isna(val) else None
-                                )
-                    else:
-                        # Single value
-                        ws.cell(
-                            row=excel_row,
-                            column=col_offset + 1,
-                            value=value
-                        )
-                        
-                col_offset += len(row.get(col_name, [None]))
+        self._append_rows(ws, blocks)
                 
     def _write_ids(self, ws: Worksheet,
                   data: pd.DataFrame,
                   metadata_cols: List[str],
-                  value_cols: List[str]) -> None:
-        """Write sample IDs to sheet."""
-        row_offset = 3
+                  value_cols: List[str],
+                  n_replicates: int) -> None:
+        """Write sample IDs to sheet, one appended row per record."""
+        blocks = [self._metadata_block(data, metadata_cols)]
+        
+        # Same ID for every replicate slot that holds a value
+        if 'SampleID' in data.columns:
+            sample_ids = data['SampleID'].to_numpy(dtype=object)
+        else:
+            sample_ids = np.full(len(data), '', dtype=object)
+        id_block = np.repeat(sample_ids[:, np.newaxis], n_replicates, axis=1)
         
-        for idx, (_, row) in enumerate(data.iterrows()):
-            excel_row = idx + row_offset
+        for col_name in value_cols:
+            _, present = self._replicate_block(data, col_name, n_replicates)
+            blocks.append(np.where(present, id_block, None))
             
-            # Write metadata (same as data sheet)
-            for col_idx, col_name in enumerate(metadata_cols, 1):
-                value = row.get(col_name, '')
+        self._append_rows(ws, blocks)
+        
+    def _metadata_block(self, data: pd.DataFrame,
+                        metadata_cols: List[str]) -> np.ndarray:
+        """Build the metadata columns, formatting each distinct time once."""
+        block = np.full((len(data), len(metadata_cols)), '', dtype=object)
+        
+        for col_idx, col_name in enumerate(metadata_cols):
+            if col_name not in data.columns:
+                continue
                 
-                if col_name == 'Time' and value is not None and value != '':
-                    value = self.time_formatter.format(value)
-                    
-                ws.cell(row=excel_row, column=col_idx, value=value)
+            column = data[col_name]
+            if col_name == 'Time':
+                labels = {
+                    t: ('' if t == '' or pd.isna(t) else self.time_formatter.format(t))
+                    for t in column.dropna().unique()
+                }
+                column = column.map(labels).fillna('')
                 
-            # Write sample IDs
-            sample_id = row.get('SampleID', '')
-            col_offset = len(metadata_cols)
+            block[:, col_idx] = column.to_numpy(dtype=object)
+            
+        return block
+        
+    @staticmethod
+    def _replicate_block(data: pd.DataFrame, col_name: str,
+                         n_replicates: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Expand a value column into an (n_rows, n_replicates) block.
+        
+        Cells may hold a list/Series of replicate values or a single value,
+        which goes into the first replicate slot.
+        
+        Returns:
+            Tuple of (values with NaN replaced by None, mask of filled slots)
+        """
+        n_rows = len(data)
+        values = np.full((n_rows, n_replicates), None, dtype=object)
+        present = np.zeros((n_rows, n_replicates), dtype=bool)
+        
+        if col_name not in data.columns or n_rows == 0 or n_replicates == 0:
+            return values, present
             
-            for col_name in value_cols:
-                if col_name in row:
-                    # Write same ID for all replicates of this column
-                    n_reps = len(row.get(col_name, [None]))
-                    for i in range(n_reps):
-                        ws.cell(
-                            row=excel_row,
-                            column=col_offset + i + 1,
-                            value=sample_id
-                        )
-                        
-                col_offset += n_reps
+        column = data[col_name].to_numpy(dtype=object)
+        is_seq = np.fromiter(
+            (isinstance(v, (list, tuple, np.ndarray, pd.Series)) for v in column),
+            dtype=bool, count=n_rows
+        )
+        
+        # Single values fill the first replicate slot
+        values[~is_seq, 0] = column[~is_seq]
+        present[~is_seq, 0] = True
+        
+        # Replicate lists are truncated/padded to n_replicates
+        for row_idx in np.flatnonzero(is_seq):
+            reps = list(column[row_idx])[:n_replicates]
+            values[row_idx, :len(reps)] = reps
+            present[row_idx, :len(reps)] = True
+            
+        values[pd.isna(values)] = None
+        return values, present
+        
+    @staticmethod
+    def _append_rows(ws: Worksheet, blocks: List[np.ndarray]) -> None:
+        """Append the horizontally stacked blocks below the headers."""
+        for row in np.hstack(blocks).tolist():
+            ws.append(row)
                 
     def _format_sheet(self, ws: Worksheet,
                      metadata_cols: List[str],
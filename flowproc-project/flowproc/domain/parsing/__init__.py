@@ -6,11 +6,12 @@ from .service import ParseService
 from .strategies import ParsingStrategy, DefaultParsingStrategy, MinimalParsingStrategy, CustomParsingStrategy
 from .validators import DataValidator
 from .group_animal_parser import extract_group_animal
-from .tissue_parser import extract_tissue, get_tissue_full_name
+from .tissue_parser import extract_tissue, extract_tissues, get_tissue_full_name
 from .time_service import TimeService, TimeFormat, parse_time, format_time, parse_formatted_time
 from .parsing_utils import load_and_parse_df, load_and_parse_df_with_type, is_likely_id_column, ParsedID, validate_parsed_data
 from .data_type_detector import DataTypeDetector
 from .generic_lab_strategy import GenericLabParsingStrategy
+from .column_catalog import ColumnCatalog, get_column_catalog
 from ...core.constants import Constants, DataType
 
 __all__ = [
@@ -27,6 +28,7 @@ __all__ = [
     'parse_formatted_time',
     'extract_group_animal',
     'extract_tissue',
+    'extract_tissues',
     'get_tissue_full_name',
     'load_and_parse_df',
     'load_and_parse_df_with_type',
@@ -35,6 +37,8 @@ __all__ = [
     'validate_parsed_data',
     'DataTypeDetector',
     'GenericLabParsingStrategy',
+    'ColumnCatalog',
+    'get_column_catalog',
     'Constants',
     'DataType',
 ] 
\ No newline at end of file
@@ -0,0 +1,283 @@
+"""
+One-pass classification of flow cytometry column headers.
+
+Parsing, aggregation, export and visualization all need to know which
+columns hold which metric. Each used to rescan every header with lowercase
+substring checks, several times per plot. A ColumnCatalog parses every
+header once (gating path, population leaf, metric text and metric type)
+and answers those questions from precomputed lists.
+
+Catalogs depend only on the column headers, so frames that share them
+(e.g. filtered views of a dataset) share one catalog via get_column_catalog.
+Whether a column is entirely empty depends on the data and is tracked per
+DataFrame by all_nan_columns.
+"""
+
+import logging
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DataFrame = pd.DataFrame
+
+# Metric types offered for selection, in display order, with the lowercase
+# substring that identifies each one (and one to exclude, if any)
+METRIC_TYPE_RULES: Tuple[Tuple[str, str, Optional[str]], ...] = (
+    ('Freq. of Parent', 'freq. of parent', None),
+    ('Freq. of Live', 'freq. of live', None),
+    ('Freq. of Total', 'freq. of total', None),
+    ('Median', 'median', None),
+    ('Mean', 'mean', 'geometric mean'),
+    ('Geometric Mean', 'geometric mean', None),
+    ('Count', 'count', None),
+    ('CV', 'cv', None),
+    ('MAD', 'mad', None),
+    ('Mode', 'mode', None),
+)
+
+# Categories of detect_flow_columns; marker matching is case-sensitive
+# except for frequencies
+FLOW_CATEGORIES: Tuple[str, ...] = (
+    'frequencies', 'medians', 'means', 'counts', 'geometric_means', 'cvs', 'mads',
+)
+_FREQUENCY_MARKERS = ('freq', 'frequency', '%')
+_GEOMETRIC_MEAN_MARKERS = ('Geometric Mean', 'Geo Mean', 'GeoMean')
+
+# Number of distinct header sets whose catalogs are kept
+CATALOG_CACHE_SIZE = 32
+
+
+@dataclass(frozen=True)
+class ColumnInfo:
+    """Everything derived from one column header."""
+    name: Any
+    lower: str
+    # Gating path segments before the '|' metric separator
+    path: Tuple[str, ...]
+    # Leaf population of the gating path (e.g. "CD4+GFP+")
+    population: str
+    # Text after the last '|', or the whole header if there is none
+    metric: str
+    metric_types: FrozenSet[str]
+    flow_categories: Tuple[str, ...]
+
+
+@lru_cache(maxsize=65536)
+def parse_header(name: Any) -> ColumnInfo:
+    """
+    Parse one column header.
+
+    Headers repeat across files of the same panel, so results are cached.
+
+    Args:
+        name: Column name
+
+    Returns:
+        ColumnInfo for the header
+    """
+    text = name if isinstance(name, str) else str(name)
+    lower = text.lower()
+
+    path_part = text.split('|', 1)[0].strip().strip('/ ')
+    path = tuple(p.strip() for p in path_part.split('/') if p.strip())
+    population = path[-1] if path else (path_part or text)
+    metric = text.split('|')[-1].strip() if '|' in text else text
+
+    metric_types = frozenset(
+        metric_type for metric_type, keyword, exclude in METRIC_TYPE_RULES
+        if keyword in lower and not (exclude and exclude in lower)
+    )
+
+    categories = []
+    if any(marker in lower for marker in _FREQUENCY_MARKERS):
+        categories.append('frequencies')
+    if 'Median' in text:
+        categories.append('medians')
+    is_geometric_mean = any(marker in text for marker in _GEOMETRIC_MEAN_MARKERS)
+    if 'Mean' in text and not is_geometric_mean:
+        categories.append('means')
+    if 'Count' in text:
+        categories.append('counts')
+    if is_geometric_mean:
+        categories.append('geometric_means')
+    if 'CV' in text:
+        categories.append('cvs')
+    if 'MAD' in text:
+        categories.append('mads')
+
+    return ColumnInfo(
+        name=name,
+        lower=lower,
+        path=path,
+        population=population,
+        metric=metric,
+        metric_types=metric_types,
+        flow_categories=tuple(categories),
+    )
+
+
+class ColumnCatalog:
+    """Column roles of one set of headers, computed in a single pass."""
+
+    def __init__(self, columns: Iterable[Any]):
+        """
+        Classify every header.
+
+        Args:
+            columns: Column names, e.g. df.columns
+        """
+        self.columns: Tuple[Any, ...] = tuple(columns)
+        self._info: Dict[Any, ColumnInfo] = {}
+        self._by_metric_type: Dict[str, List[Any]] = {metric_type: [] for metric_type, _, _ in METRIC_TYPE_RULES}
+        self._flow: Dict[str, List[Any]] = {category: [] for category in FLOW_CATEGORIES}
+
+        for name in self.columns:
+            info = parse_header(name)
+            self._info[name] = info
+            for metric_type in info.metric_types:
+                self._by_metric_type[metric_type].append(name)
+            for category in info.flow_categories:
+                self._flow[category].append(name)
+
+        self.metric_types: List[str] = [
+            metric_type for metric_type, _, _ in METRIC_TYPE_RULES if self._by_metric_type[metric_type]
+        ]
+        # Memoized answers to ad-hoc substring and keyword queries
+        self._containing: Dict[str, List[Any]] = {}
+        self._first_match: Dict[Tuple[str, ...], Dict[str, List[Any]]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    def info(self, name: Any) -> Optional[ColumnInfo]:
+        """Parsed header of a column, or None if it is not in the catalog."""
+        return self._info.get(name)
+
+    def columns_for_metric(self, metric_type: str) -> List[Any]:
+        """
+        Columns of a metric type such as 'Freq. of Parent'.
+
+        Unknown types match any header containing the type, ignoring case.
+        """
+        columns = self._by_metric_type.get(metric_type)
+        if columns is None:
+            columns = self.columns_containing(metric_type.lower())
+        return columns
+
+    def flow_columns(self, category: str) -> List[Any]:
+        """Columns of a detect_flow_columns category such as 'frequencies'."""
+        return self._flow[category]
+
+    def columns_containing(self, substring: str) -> List[Any]:
+        """Columns whose lowercase header contains substring (memoized)."""
+        columns = self._containing.get(substring)
+        if columns is None:
+            columns = [name for name in self.columns if substring in self._info[name].lower]
+            with self._lock:
+                self._containing[substring] = columns
+        return columns
+
+    def columns_by_first_keyword(self, keywords: Sequence[str]) -> Dict[str, List[Any]]:
+        """
+        Assign each column to the first keyword its lowercase header contains.
+
+        Args:
+            keywords: Lowercase keywords in priority order
+
+        Returns:
+            Keyword -> columns, for keywords that matched any column
+        """
+        key = tuple(keywords)
+        result = self._first_match.get(key)
+        if result is None:
+            result = {}
+            for name in self.columns:
+                lower = self._info[name].lower
+                keyword = next((k for k in key if k in lower), None)
+                if keyword is not None:
+                    result.setdefault(keyword, []).append(name)
+            with self._lock:
+                self._first_match[key] = result
+        return result
+
+
+_catalogs: "OrderedDict[Tuple[Any, ...], ColumnCatalog]" = OrderedDict()
+# Fast path keyed on the identity of a columns Index; filtered frames share it
+_catalogs_by_index: Dict[int, Tuple["weakref.ref", ColumnCatalog]] = {}
+_all_nan_by_frame: Dict[int, Tuple["weakref.ref", FrozenSet[Any]]] = {}
+_cache_lock = threading.Lock()
+
+
+def get_column_catalog(data: Union[DataFrame, pd.Index, Sequence[Any]]) -> ColumnCatalog:
+    """
+    Shared catalog for the headers of a DataFrame.
+
+    Args:
+        data: DataFrame, columns Index, or sequence of column names
+
+    Returns:
+        Cached ColumnCatalog for those headers
+    """
+    columns = data.columns if isinstance(data, DataFrame) else data
+    index_key = id(columns) if isinstance(columns, pd.Index) else None
+    if index_key is not None:
+        entry = _catalogs_by_index.get(index_key)
+        if entry is not None and entry[0]() is columns:
+            return entry[1]
+
+    key = tuple(columns)
+    with _cache_lock:
+        catalog = _catalogs.get(key)
+        if catalog is None:
+            catalog = ColumnCatalog(key)
+            _catalogs[key] = catalog
+            if len(_catalogs) > CATALOG_CACHE_SIZE:
+                _catalogs.popitem(last=False)
+            logger.debug("Built column catalog for %d columns", len(key))
+        else:
+            _catalogs.move_to_end(key)
+        if index_key is not None:
+            _catalogs_by_index[index_key] = (
+                weakref.ref(columns, lambda _, k=index_key: _catalogs_by_index.pop(k, None)),
+                catalog,
+            )
+    return catalog
+
+
+def all_nan_columns(df: DataFrame) -> FrozenSet[Any]:
+    """
+    Columns of df that contain no values, computed once per DataFrame.
+
+    The result reflects the data when first requested; in-place edits made
+    afterwards are not seen.
+    """
+    key = id(df)
+    entry = _all_nan_by_frame.get(key)
+    if entry is not None and entry[0]() is df:
+        return entry[1]
+    empty = frozenset(df.columns[df.isna().all().to_numpy()]) if len(df.columns) else frozenset()
+    with _cache_lock:
+        _all_nan_by_frame[key] = (
+            weakref.ref(df, lambda _, k=key: _all_nan_by_frame.pop(k, None)),
+            empty,
+        )
+    return empty
+
+
+__all__ = [
+    'METRIC_TYPE_RULES',
+    'FLOW_CATEGORIES',
+    'ColumnInfo',
+    'parse_header',
+    'ColumnCatalog',
+    'get_column_catalog',
+    'all_nan_columns',
+]
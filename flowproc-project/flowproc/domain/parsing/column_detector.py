@@ -1,11 +1,12 @@
 """Detect and identify column types in flow cytometry data."""
-from typing import Optional, Dict, List, Set
+from typing import Optional, Dict, Iterable, List, Set
 import pandas as pd
 import re
 import logging
 
 from ...core.exceptions import ParsingError
 from ...core.constants import is_pure_metric_column
+from .column_catalog import get_column_catalog
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +33,9 @@ class ColumnDetector:
         'geomean': 'geometric mean',
     }
     
+    # Lowercase names of metadata columns that are never metrics
+    METADATA_NAMES = frozenset({'sampleid', 'group', 'animal', 'well', 'time', 'replicate'})
+    
     def __init__(self):
         """Initialize column detector."""
         self._cache: Dict[str, str] = {}
@@ -49,13 +53,8 @@ class ColumnDetector:
         Raises:
             ParseError: If no sample ID column found
         """
-        candidates = []
-        
         # First try columns with 'sample' or 'id' in name
-        for col in df.columns:
-            col_lower = col.lower()
-            if 'sample' in col_lower or 'id' in col_lower or col == 'Unnamed: 0':
-                candidates.append((col, self._score_id_column(df[col])))
+        candidates = [(col, self._score_id_column(df[col])) for col in self.id_name_candidates(df.columns)]
                 
         # If no candidates, try all string columns
         if not candidates:
@@ -71,6 +70,13 @@ class ColumnDetector:
         candidates.sort(key=lambda x: x[1], reverse=True)
         return candidates[0][0]
         
+    def id_name_candidates(self, columns: Iterable[str]) -> List[str]:
+        """Columns whose name suggests sample IDs ('sample', 'id' or unnamed)."""
+        return [
+            col for col in columns
+            if 'sample' in col.lower() or 'id' in col.lower() or col == 'Unnamed: 0'
+        ]
+        
     def _score_id_column(self, series: pd.Series) -> float:
         """Score a column for likelihood of being sample IDs."""
         if series.empty:
@@ -102,26 +108,23 @@ class ColumnDetector:
         Returns:
             Dictionary mapping metric types to column names
         """
-        metric_map: Dict[str, List[str]] = {
-            metric: [] for metric in self.METRIC_KEYWORDS
-        }
+        metric_map: Dict[str, List[str]] = {}
         
-        for col in df.columns:
-            col_lower = col.lower()
-            
-            # Skip metadata columns
-            if col_lower in ['sampleid', 'group', 'animal', 'well', 'time', 'replicate']:
-                continue
-                
-            # Check for metric keywords
-            for keyword, metric_type in self.METRIC_KEYWORDS.items():
-                if keyword in col_lower:
-                    # Check if this is a pure metric column (not a subpopulation)
-                    if is_pure_metric_column(col, keyword):
-                        metric_map[keyword].append(col)
-                    break
+        # Each column counts under the first keyword its header contains
+        catalog = get_column_catalog(df)
+        matches = catalog.columns_by_first_keyword(self.METRIC_KEYWORDS)
+        for keyword in self.METRIC_KEYWORDS:
+            pure = [
+                col for col in matches.get(keyword, [])
+                # Skip metadata columns
+                if catalog.info(col).lower not in self.METADATA_NAMES
+                # Check if this is a pure metric column (not a subpopulation)
+                and is_pure_metric_column(col, keyword)
+            ]
+            if pure:
+                metric_map[keyword] = pure
                     
-        return {k: v for k, v in metric_map.items() if v}
+        return metric_map
         
     def detect_metadata_columns(self, df: pd.DataFrame) -> Set[str]:
         """
@@ -7,6 +7,7 @@ from pathlib import Path
 
 from .sample_id_parser import SampleIDParser, ParsedSampleID
 from .column_detector import ColumnDetector
+from .validation_utils import has_text_markers
 from ...core.exceptions import ParsingError as ParseError, ValidationError
 from ...core.constants import DataType
 
@@ -186,7 +187,7 @@ class DataTransformer:
         for col in numeric_cols:
             if col not in ['SampleID', 'Tissue', 'Well', 'Group', 'Animal', 'Replicate', 'Timepoint', 'Time']:
                 # Check if column has text markers that should be preserved
-                if self._has_text_markers(df[col]):
+                if has_text_markers(df[col]):
                     logger.debug(f"Preserving text markers in column '{col}' during cleanup")
                     continue
                 
@@ -241,7 +242,7 @@ class DataTransformer:
         for col in numeric_cols:
             if df[col].dtype == 'object':
                 # Check if column has text markers that should be preserved
-                if self._has_text_markers(df[col]):
+                if has_text_markers(df[col]):
                     logger.debug(f"Preserving text markers in column '{col}' during generic cleanup")
                     continue
                 
@@ -278,52 +279,3 @@ class DataTransformer:
             logger.warning(
                 f"{null_groups}/{len(df)} rows have null Group values in generic lab data"
             )
-    
-    def _has_text_markers(self, series: pd.Series) -> bool:
-        """
-        Check if a column contains text markers that should be preserved.
-        
-        Args:
-            series: pandas Series to check
-            
-        Returns:
-            True if column contains text markers that should remain as text
-        """
-        if series.empty:
-            return False
-            
-        # Convert to string and drop NaN values
-        string_values = series.astype(str).dropna()
-        if string_values.empty:
-            return False
-        
-        # Check for common text markers
-        text_markers = [
-            r'\*',  # Asterisk prefix (like *4.51) - escaped for regex
-            'OOR',  # Out of range markers
-            r'<',  # Less than markers
-            r'>',  # Greater than markers
-            'ND',  # Not detected
-            'LOD',  # Limit of detection
-            'BLQ',  # Below limit of quantification
-        ]
-        
-        # Check if any values contain these markers
-        for marker in text_markers:
-            if string_values.str.contains(marker, na=False, regex=True).any():
-                logger.debug(f"Found text marker '{marker}' in column")
-                return True
-        
-        # Check for values that start with asterisk (common pattern)
-        if string_values.str.startswith('*').any():
-            logger.debug("Found asterisk prefix in column")
-            return True
-            
-        # Check for values that contain range markers
-        range_patterns = [r'<', r'>', '≤', '≥']
-        for pattern in range_patterns:
-            if string_values.str.contains(pattern, na=False, regex=True).any():
-                logger.debug(f"Found range marker '{pattern}' in column")
-                return True
-        
-        return False
\ No newline at end of file
@@ -4,15 +4,17 @@ Generic lab data parsing strategy for non-flow cytometry data.
 Handles clinical chemistry, CBC, and other lab data with Group/Replicate/Timepoint structure.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import pandas as pd
 import logging
-import re
 
 from .time_service import TimeService
 
 logger = logging.getLogger(__name__)
 
+# Distinct unparsed timepoints listed in the warning
+MAX_UNPARSED_SHOWN = 10
+
 
 class GenericLabParsingStrategy:
     """
@@ -37,7 +39,8 @@ class GenericLabParsingStrategy:
         Returns:
             Parsed DataFrame with standardized columns
         """
-        result_df = df.copy()
+        # Shallow copy: only whole columns are added or replaced, never written in place
+        result_df = df.copy(deep=False)
         
         # Normalize column names (case-insensitive matching)
         result_df = self._normalize_columns(result_df)
@@ -76,7 +79,8 @@ class GenericLabParsingStrategy:
                 column_mapping[col] = 'Timepoint'
         
         if column_mapping:
-            df = df.rename(columns=column_mapping)
+            # Relabel in place rather than rename(), which would copy every column
+            df.columns = [column_mapping.get(col, col) for col in df.columns]
             logger.debug(f"Normalized columns: {column_mapping}")
         
         return df
@@ -87,18 +91,15 @@ class GenericLabParsingStrategy:
         
         Format: G{group}_R{replicate}_T{timepoint}
         """
-        if 'Group' in df.columns and 'Replicate' in df.columns and 'Timepoint' in df.columns:
-            df['SampleID'] = df.apply(
-                lambda row: f"G{row['Group']}_R{row['Replicate']}_T{row['Timepoint']}", 
-                axis=1
-            )
-            logger.debug("Created synthetic SampleID column with timepoint")
-        elif 'Group' in df.columns and 'Replicate' in df.columns:
-            df['SampleID'] = df.apply(
-                lambda row: f"G{row['Group']}_R{row['Replicate']}", 
-                axis=1
-            )
-            logger.debug("Created synthetic SampleID column without timepoint")
+        if 'Group' in df.columns and 'Replicate' in df.columns:
+            # Column-wise concatenation; a row-wise apply is far slower on large exports
+            sample_id = 'G' + df['Group'].astype(str) + '_R' + df['Replicate'].astype(str)
+            if 'Timepoint' in df.columns:
+                df['SampleID'] = sample_id + '_T' + df['Timepoint'].astype(str)
+                logger.debug("Created synthetic SampleID column with timepoint")
+            else:
+                df['SampleID'] = sample_id
+                logger.debug("Created synthetic SampleID column without timepoint")
         else:
             # Create a basic index-based SampleID if columns are missing
             df['SampleID'] = [f"Sample_{i+1}" for i in range(len(df))]
@@ -115,36 +116,41 @@ class GenericLabParsingStrategy:
         - "Day 1", "Day 2" (days)
         - "1000hr" (large hour values)
         - Numeric values
+        
+        Each distinct value is parsed once and mapped back onto the rows.
         """
         if 'Timepoint' not in df.columns:
             logger.warning("No Timepoint column found")
             return df
         
-        time_values = []
-        
-        for value in df['Timepoint']:
-            if pd.isna(value):
-                time_values.append(None)
-                continue
-            
-            value_str = str(value).strip()
-            
-            # Use TimeService for comprehensive parsing
-            # Try parse() first for formatted strings with units, then parse_formatted() for numeric values
-            parsed_time = self.time_parser.parse(value_str)
-            if parsed_time is None:
-                parsed_time = self.time_parser.parse_formatted(value_str)
-            
-            time_values.append(parsed_time)
-            
-            if parsed_time is None:
-                logger.warning(f"Could not parse timepoint value: {value_str}")
-        
-        df['Time'] = time_values
-        logger.debug(f"Parsed {len([t for t in time_values if t is not None])} timepoint values")
+        timepoints = df['Timepoint']
+        parsed = {value: self._parse_time_value(value) for value in timepoints.dropna().unique()}
+        df['Time'] = timepoints.map(parsed).astype(float)
+        
+        unparsed = [value for value, hours in parsed.items() if hours is None]
+        if unparsed:
+            shown = ', '.join(repr(str(value).strip()) for value in unparsed[:MAX_UNPARSED_SHOWN])
+            more = f" (+{len(unparsed) - MAX_UNPARSED_SHOWN} more)" if len(unparsed) > MAX_UNPARSED_SHOWN else ""
+            logger.warning(
+                f"Could not parse {len(unparsed)} timepoint value(s) in "
+                f"{int(timepoints.isin(unparsed).sum())} rows: {shown}{more}"
+            )
+        logger.debug(f"Parsed {int(df['Time'].notna().sum())} timepoint values "
+                     f"from {len(parsed)} distinct timepoints")
         
         return df
     
+    def _parse_time_value(self, value: Any) -> Optional[float]:
+        """Parse one timepoint value to hours, or None if it is not recognized."""
+        value_str = str(value).strip()
+        
+        # Use TimeService for comprehensive parsing
+        # Try parse() first for formatted strings with units, then parse_formatted() for numeric values
+        parsed_time = self.time_parser.parse(value_str)
+        if parsed_time is None:
+            parsed_time = self.time_parser.parse_formatted(value_str)
+        return parsed_time
+    
     def _add_animal_column(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Add Animal column for compatibility with export pipeline.
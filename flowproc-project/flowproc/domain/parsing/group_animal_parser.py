@@ -3,6 +3,11 @@ import re
 from typing import Optional, NamedTuple
 import logging
 
+import numpy as np
+import pandas as pd
+
+from .validation_utils import validate_group_animal_values
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,6 +36,17 @@ class GroupAnimalParser:
         re.compile(r'(\d+)_(\d+)'),
     ]
     
+    # All patterns as one anchored alternation for batch parsing. The lazy
+    # (?s:.*?) prefix makes each branch find its leftmost match before the
+    # next branch is tried, so pattern priority is the same as in parse().
+    COMBINED_PATTERN = re.compile(
+        '^(?:' + '|'.join(
+            '(?s:.*?)' + pattern.pattern
+            for pattern in [GROUP_ANIMAL_PATTERN] + ALT_PATTERNS
+        ) + ')',
+        re.IGNORECASE
+    )
+    
     def __init__(self, min_group: int = 1, max_group: int = 999999,
                  min_animal: int = 1, max_animal: int = 999999):
         """
@@ -77,6 +93,60 @@ class GroupAnimalParser:
                     
         return None
         
+    def parse_series(self, texts: pd.Series) -> pd.DataFrame:
+        """
+        Parse group and animal from every value of a Series.
+        
+        Each distinct value is matched once against COMBINED_PATTERN and
+        range-checked with array comparisons. Values whose first match is
+        out of range fall back to parse(), which tries the later patterns.
+        
+        Args:
+            texts: Sample IDs or other text; non-strings never match
+            
+        Returns:
+            DataFrame aligned with texts with nullable Int64 'Group' and
+            'Animal' columns, missing where nothing valid was found
+        """
+        values = pd.Series([v for v in pd.unique(texts) if isinstance(v, str) and v], dtype=object)
+        groups = np.zeros(len(values), dtype=np.int64)
+        animals = np.zeros(len(values), dtype=np.int64)
+        matched = np.zeros(len(values), dtype=bool)
+        valid = np.zeros(len(values), dtype=bool)
+        if len(values):
+            # Column pairs (0, 1), (2, 3), ... hold each branch's group/animal
+            # numbers; a matching row has exactly one pair filled
+            numbers = values.str.extract(self.COMBINED_PATTERN).astype(float).to_numpy()
+            group_cols, animal_cols = numbers[:, 0::2], numbers[:, 1::2]
+            branch = np.argmax(~np.isnan(group_cols), axis=1)
+            rows = np.arange(len(values))
+            group_values = group_cols[rows, branch]
+            animal_values = animal_cols[rows, branch]
+            matched = ~np.isnan(group_values)
+            # Range-check the floats: very long digit runs parse as huge
+            # numbers or inf, which do not fit in int64
+            valid = (matched
+                     & (group_values >= self.min_group) & (group_values <= self.max_group)
+                     & (animal_values >= self.min_animal) & (animal_values <= self.max_animal))
+            groups[valid] = group_values[valid]
+            animals[valid] = animal_values[valid]
+        
+        for i in np.flatnonzero(matched & ~valid):
+            result = self.parse(values.iat[i])
+            if result:
+                groups[i], animals[i] = result
+                valid[i] = True
+        
+        lookup = pd.DataFrame({
+            'Group': pd.array(np.where(valid, groups, 0), dtype='Int64'),
+            'Animal': pd.array(np.where(valid, animals, 0), dtype='Int64'),
+        }, index=values)
+        lookup[~valid] = pd.NA
+        
+        result = lookup.reindex(texts.where(texts.isin(values)))
+        result.index = texts.index
+        return result
+        
     def _extract_values(self, match: re.Match) -> Optional[GroupAnimal]:
         """Extract and validate group/animal values from match."""
         try:
@@ -84,7 +154,6 @@ class GroupAnimalParser:
             animal = int(match.group(2))
             
             # Validate ranges using consolidated validation
-            from .validation_utils import validate_group_animal_values
             if not validate_group_animal_values(group, animal, 
                                                self.min_group, self.max_group,
                                                self.min_animal, self.max_animal):
@@ -129,7 +198,6 @@ class GroupAnimalParser:
         Returns:
             True if valid
         """
-        from .validation_utils import validate_group_animal_values
         return validate_group_animal_values(group, animal, 
                                            self.min_group, self.max_group,
                                            self.min_animal, self.max_animal)
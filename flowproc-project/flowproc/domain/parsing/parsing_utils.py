@@ -10,6 +10,7 @@ from .data_type_detector import DataTypeDetector
 from .generic_lab_strategy import GenericLabParsingStrategy
 from .strategies import DefaultParsingStrategy
 from ...core.constants import DataType
+from ...infrastructure.monitoring.tracing import tracer
 
 logger = logging.getLogger(__name__)
 
@@ -57,36 +58,40 @@ def load_and_parse_df_with_type(file_path: Path) -> Tuple[pd.DataFrame, str, Dat
         data_type_detector = DataTypeDetector()
         transformer = DataTransformer()
         
-        df = reader.read(file_path)
+        with tracer.span("parse.read"):
+            df = reader.read(file_path)
         
         if df.empty:
             logger.warning("Empty DataFrame after loading")
             return df, "SampleID", DataType.FLOW_CYTOMETRY
         
         # Detect data type first
-        data_type = data_type_detector.detect_data_type(df)
+        with tracer.span("parse.detect_type"):
+            data_type = data_type_detector.detect_data_type(df)
         logger.info(f"Detected data type: {data_type.value}")
         
-        # Apply appropriate parsing strategy based on data type
-        if data_type == DataType.GENERIC_LAB:
-            # Use generic lab parsing strategy
-            strategy = GenericLabParsingStrategy()
-            df = strategy.parse(df)
-            sid_col = 'SampleID'
-        else:
-            # Use default flow cytometry parsing
-            # Find sample ID column
-            sid_col = detector.detect_sample_id_column(df)
+        with tracer.span("parse.sample_ids"):
+            # Apply appropriate parsing strategy based on data type
+            if data_type == DataType.GENERIC_LAB:
+                # Use generic lab parsing strategy
+                strategy = GenericLabParsingStrategy()
+                df = strategy.parse(df)
+                sid_col = 'SampleID'
+            else:
+                # Use default flow cytometry parsing
+                # Find sample ID column
+                sid_col = detector.detect_sample_id_column(df)
+                
+                # Rename to standard name
+                df = df.rename(columns={sid_col: 'SampleID'})
+                sid_col = 'SampleID'
             
-            # Rename to standard name
-            df = df.rename(columns={sid_col: 'SampleID'})
-            sid_col = 'SampleID'
-        
-        # Transform the data (pass data_type for conditional handling)
-        df = transformer.transform(df, file_path, data_type=data_type)
+            # Transform the data (pass data_type for conditional handling)
+            df = transformer.transform(df, file_path, data_type=data_type)
         
         # Validate the parsed data
-        validate_parsed_data(df, sid_col)
+        with tracer.span("parse.validate"):
+            validate_parsed_data(df, sid_col)
         
         return df, sid_col, data_type
         
@@ -0,0 +1,220 @@
+"""
+Fast per-file summaries for the file preview table.
+
+The preview shows, for every selected file, how many samples it holds and
+which groups, animals, timepoints and tissues they cover. Running the full
+load_and_parse_df pipeline for that reads and converts every metric column
+of every file. summarize_csv instead reads the header plus a bounded sample
+to find the sample ID column, then scans only that column of the file and
+parses the distinct IDs with the vectorized component parsers.
+
+Summaries are cached by path, size and modification time, so reopening the
+preview for an unchanged selection costs a stat() per file.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional, Tuple, Union
+
+import pandas as pd
+
+from .column_detector import ColumnDetector
+from .csv_reader import CSVReader
+from .data_type_detector import DataTypeDetector
+from .group_animal_parser import GroupAnimalParser
+from .time_service import TimeService
+from .tissue_parser import TissueParser
+from .validation_utils import NEGATIVE_GROUP_ANIMAL_PATTERN
+from ...core.constants import DataType
+from ...core.exceptions import ParsingError as ParseError
+
+logger = logging.getLogger(__name__)
+
+# Rows read to detect the sample ID column and the data type
+PREVIEW_SAMPLE_ROWS = 200
+# Number of file summaries kept
+SUMMARY_CACHE_SIZE = 1024
+
+# Same footer rows CSVReader drops (Mean, SD, ...), matched on the first column
+_FOOTER_PATTERN = 'mean|sd|average|stddev|total'
+
+
+@dataclass(frozen=True)
+class FileSummary:
+    """What the preview table shows for one file."""
+    path: Path
+    samples: int = 0
+    # Sorted distinct values
+    groups: Tuple[int, ...] = ()
+    animals: Tuple[int, ...] = ()
+    timepoints: Tuple[float, ...] = ()
+    tissues: Tuple[str, ...] = ()
+    # Set when the file cannot be summarized
+    error: Optional[str] = None
+
+    @classmethod
+    def from_dataframe(cls, path: Path, df: pd.DataFrame) -> 'FileSummary':
+        """Summarize an already parsed DataFrame."""
+        def distinct(column: str) -> Tuple[Any, ...]:
+            if column not in df.columns:
+                return ()
+            return tuple(sorted(df[column].dropna().unique().tolist()))
+
+        return cls(
+            path=path,
+            samples=len(df),
+            groups=distinct('Group'),
+            animals=distinct('Animal'),
+            timepoints=distinct('Time'),
+            tissues=distinct('Tissue'),
+        )
+
+
+def _read_csv(path: Path, **kwargs) -> pd.DataFrame:
+    """Read with the encodings CSVReader supports, C engine first."""
+    for engine in ('c', 'python'):
+        for encoding in CSVReader.SUPPORTED_ENCODINGS:
+            try:
+                return pd.read_csv(
+                    path,
+                    encoding=encoding,
+                    skipinitialspace=True,
+                    skip_blank_lines=True,
+                    index_col=False,
+                    engine=engine,
+                    **kwargs,
+                )
+            except UnicodeDecodeError:
+                continue
+            except pd.errors.ParserError as e:
+                logger.debug("Preview read of %s failed with %s engine: %s", path, engine, e)
+                break
+    raise ParseError(f"Could not read {path} with any supported encoding")
+
+
+def _scan(path: Path, sample_rows: int) -> FileSummary:
+    """Summarize one file without the caching."""
+    try:
+        head = _read_csv(path, nrows=sample_rows)
+    except pd.errors.EmptyDataError:
+        return FileSummary(path=path)
+
+    # CSVReader names an unnamed first column 'Sample'
+    if len(head.columns) and (head.columns[0] == 'Unnamed: 0' or head.columns[0] == ''):
+        head = head.rename(columns={head.columns[0]: 'Sample'})
+    positions = {name: i for i, name in enumerate(head.columns)}
+
+    detector = ColumnDetector()
+    if detector.id_name_candidates(head.columns):
+        # Only the values of ID-named columns and of the first column are
+        # looked at; the others matter by name and emptiness. Float
+        # placeholders keep both while CSVReader skips converting them.
+        others = [col for col in head.columns[1:] if col not in detector.id_name_candidates([col])]
+        present = head[others].notna()
+        head = pd.concat([head.drop(columns=others), present.where(present).astype(float)], axis=1)
+        head = head[list(positions)]
+    head = CSVReader()._clean_dataframe(head)
+    if head.empty:
+        return FileSummary(path=path)
+
+    if DataTypeDetector().detect_data_type(head) == DataType.GENERIC_LAB:
+        # Lab tables carry Group/Animal/Time as columns; they are small
+        # enough to go through the full pipeline
+        from .parsing_utils import load_and_parse_df
+        df, _ = load_and_parse_df(path)
+        return FileSummary.from_dataframe(path, df)
+
+    sid_col = detector.detect_sample_id_column(head)
+
+    # Full scan of the first column (for footer rows) and the ID column only
+    sid_pos = positions[sid_col]
+    columns = _read_csv(path, usecols=sorted({0, sid_pos}), dtype=str)
+    first = columns.iloc[:, 0]
+    ids = columns.iloc[:, -1] if sid_pos else first
+    ids = ids[~first.str.lower().str.contains(_FOOTER_PATTERN, na=False)].dropna().str.strip()
+
+    if ids.duplicated().any():
+        raise ValueError("Duplicate sample IDs found")
+
+    clean = ids.str.replace(r'\.fcs$', '', case=False, regex=True)
+    parsed = GroupAnimalParser().parse_series(clean)
+    valid = parsed['Group'].notna() & (ids.str.count(NEGATIVE_GROUP_ANIMAL_PATTERN) == 0)
+    if not valid.any():
+        raise ValueError("No valid sample ID column in the file")
+    parsed, clean = parsed[valid], clean[valid]
+
+    times = TimeService().parse_many(clean)
+    if times.isna().any():
+        file_time = TimeService().parse(path.name)
+        if file_time is not None:
+            times = times.fillna(file_time)
+
+    return FileSummary(
+        path=path,
+        samples=int(valid.sum()),
+        groups=tuple(sorted(parsed['Group'].unique().dropna().tolist())),
+        animals=tuple(sorted(parsed['Animal'].unique().dropna().tolist())),
+        timepoints=tuple(sorted(times.dropna().unique().tolist())),
+        tissues=tuple(sorted(TissueParser().parse_series(clean).unique().tolist())),
+    )
+
+
+_summaries: "OrderedDict[Tuple[str, int, int, int], FileSummary]" = OrderedDict()
+_summaries_lock = threading.Lock()
+
+
+def summarize_csv(file_path: Union[str, Path], sample_rows: int = PREVIEW_SAMPLE_ROWS) -> FileSummary:
+    """
+    Summarize a CSV file for the preview table.
+
+    The sample count and the distinct values cover the whole file; only
+    column detection is based on the first sample_rows rows.
+
+    Args:
+        file_path: Path to the CSV file
+        sample_rows: Rows read to detect the sample ID column
+
+    Returns:
+        FileSummary; its error is set when the file is not a readable CSV
+        file or its sample IDs cannot be parsed
+    """
+    path = Path(file_path)
+    if not path.is_file() or path.suffix.lower() != '.csv':
+        return FileSummary(path=path, error="Invalid file")
+
+    stat = path.stat()
+    key = (str(path.resolve()), stat.st_size, stat.st_mtime_ns, sample_rows)
+    with _summaries_lock:
+        summary = _summaries.get(key)
+        if summary is not None:
+            _summaries.move_to_end(key)
+            return summary
+
+    try:
+        summary = _scan(path, sample_rows)
+    except Exception as e:
+        logger.error(f"Summary preview failed for {path}: {e}")
+        summary = FileSummary(path=path, error=f"Failed to parse ({e})")
+
+    with _summaries_lock:
+        _summaries[key] = summary
+        if len(_summaries) > SUMMARY_CACHE_SIZE:
+            _summaries.popitem(last=False)
+    return summary
+
+
+def clear_summary_cache() -> None:
+    """Forget all cached file summaries."""
+    with _summaries_lock:
+        _summaries.clear()
+
+
+__all__ = [
+    'PREVIEW_SAMPLE_ROWS',
+    'FileSummary',
+    'summarize_csv',
+    'clear_summary_cache',
+]
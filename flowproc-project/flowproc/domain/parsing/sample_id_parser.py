@@ -132,7 +132,7 @@ class SampleIDParser:
         # Log if there's significant remaining text
         remaining = remaining.strip('_- ')
         if remaining and len(remaining) > 2:
-            logger.debug(f"Unparsed text in sample ID '{sample_id}': '{remaining}'")
+            logger.debug("Unparsed text in sample ID '%s': '%s'", sample_id, remaining)
             
         return ParsedSampleID(
             group=group_animal.group,
@@ -13,9 +13,12 @@ Provides unified parsing, formatting, and conversion capabilities.
 
 import re
 import logging
+from functools import lru_cache
 from typing import Optional, Dict, Tuple, Union
 from enum import Enum
 
+import pandas as pd
+
 logger = logging.getLogger(__name__)
 
 
@@ -98,6 +101,34 @@ class TimeService:
         )
     }
     
+    # TIMECOURSE, UNIT_FIRST, FILENAME, PREFIX and GENERAL as one alternation.
+    # Every branch but PREFIX starts with a lazy ".*?", so the engine scans the
+    # whole text for a branch before trying the next one. This keeps the
+    # precedence of searching the patterns one after another.
+    _UNITS = r'day|hour|hr|h|minute|min|m|days|hours|minutes'
+    _NUMBER = r'\d+(?:\.\d+)?'
+    COMBINED_PATTERN = re.compile(
+        r'^(?:'
+        rf'.*?(?:^|\s|_)(?P<tc_unit>day)\s*(?P<tc_value>{_NUMBER})(?:\s|_|$)'
+        rf'|.*?(?:^|\s|_)(?P<uf_unit>{_UNITS})\s*_?(?P<uf_value>{_NUMBER})(?:\s|_|$)'
+        rf'|.*?(?:^|\s|_)(?:(?P<fn_value>{_NUMBER})\s*(?P<fn_unit>{_UNITS})'
+        rf'|(?P<fn_unit_first>{_UNITS})\s*(?P<fn_value_last>{_NUMBER}))(?:\s|_|\.|$)'
+        rf'|(?P<px_value>{_NUMBER})\s*(?P<px_unit>[a-z]+)(?:\s|_)'
+        rf'|.*?(?:^|\s|_)(?P<gn_value>{_NUMBER})\s*(?P<gn_unit>[a-z]+)(?:\s|_|$)'
+        r')',
+        re.IGNORECASE | re.DOTALL
+    )
+    
+    # (pattern name, value group, unit group) in precedence order
+    _COMBINED_BRANCHES = (
+        ('TIMECOURSE', 'tc_value', 'tc_unit'),
+        ('UNIT_FIRST', 'uf_value', 'uf_unit'),
+        ('FILENAME', 'fn_value', 'fn_unit'),
+        ('FILENAME', 'fn_value_last', 'fn_unit_first'),
+        ('PREFIX', 'px_value', 'px_unit'),
+        ('GENERAL', 'gn_value', 'gn_unit'),
+    )
+    
     def __init__(self, default_unit: str = 'h', default_format: TimeFormat = TimeFormat.HM):
         """
         Initialize time service.
@@ -129,62 +160,43 @@ class TimeService:
         if not text or not isinstance(text, str):
             return None
             
-        logger.debug(f"Parsing time from text: '{text}'")
-        
-        # Try timecourse pattern first (e.g., "Day 3", "d3")
-        match = self.PATTERNS['TIMECOURSE'].search(text)
-        if match:
-            unit, value_str = match.groups()
-            result = self._convert_to_hours(value_str, unit)
-            logger.debug(f"TIMECOURSE pattern match: unit='{unit}', value='{value_str}', result={result}")
-            return result
-        
-        # Try unit-first pattern (e.g., "day_3", "hour_2")
-        match = self.PATTERNS['UNIT_FIRST'].search(text)
-        if match:
-            unit, value_str = match.groups()
-            result = self._convert_to_hours(value_str, unit)
-            logger.debug(f"UNIT_FIRST pattern match: unit='{unit}', value='{value_str}', result={result}")
-            return result
-        
-        # Try filename time pattern (e.g., "Sample_Study_Day 3.csv")
-        match = self.PATTERNS['FILENAME'].search(text)
-        if match:
-            groups = match.groups()
-            # Handle both "3 Day" and "Day 3" patterns
-            if groups[0] and groups[1]:  # "3 Day" pattern
-                value_str, unit = groups[0], groups[1]
-            elif groups[2] and groups[3]:  # "Day 3" pattern
-                unit, value_str = groups[2], groups[3]
-            else:
-                logger.debug(f"FILENAME pattern matched but groups are invalid: {groups}")
-                value_str, unit = None, None
-                
-            if value_str and unit:
-                result = self._convert_to_hours(value_str, unit)
-                logger.debug(f"FILENAME pattern match: value='{value_str}', unit='{unit}', result={result}")
+        return self._parse_text(text)
+        
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _parse_text(cls, text: str) -> Optional[float]:
+        """Match text against the combined pattern; memoized on the text."""
+        match = cls.COMBINED_PATTERN.match(text)
+        if match is None:
+            logger.debug("No time pattern matched for text: %r", text)
+            return None
+            
+        for name, value_group, unit_group in cls._COMBINED_BRANCHES:
+            value_str = match.group(value_group)
+            if value_str is not None:
+                unit = match.group(unit_group)
+                result = cls._convert_to_hours(value_str, unit)
+                logger.debug("%s pattern match: value=%r, unit=%r, result=%s",
+                             name, value_str, unit, result)
                 return result
+                
+        return None
         
-        # Try time prefix pattern (e.g., "2 hour_SP_...")
-        match = self.PATTERNS['PREFIX'].search(text)
-        if match:
-            value_str, unit = match.groups()
-            result = self._convert_to_hours(value_str, unit)
-            logger.debug(f"PREFIX pattern match: value='{value_str}', unit='{unit}', result={result}")
-            return result
+    def parse_many(self, values: pd.Series) -> pd.Series:
+        """
+        Parse time values for a whole column.
         
-        # Try general time pattern with required units
-        match = self.PATTERNS['GENERAL'].search(text)
-        if match:
-            value_str, unit = match.groups()
-            # Unit is required for general pattern
-            if unit:
-                result = self._convert_to_hours(value_str, unit)
-                logger.debug(f"GENERAL pattern match: value='{value_str}', unit='{unit}', result={result}")
-                return result
+        Each distinct value is parsed once and the results are mapped back,
+        so repeated sample IDs or timepoint labels cost a dictionary lookup.
+        
+        Args:
+            values: Series of texts containing time values
             
-        logger.debug(f"No time pattern matched for text: '{text}'")
-        return None
+        Returns:
+            Float Series of hours aligned with values (NaN where not found)
+        """
+        lookup = {value: self.parse(value) for value in values.dropna().unique()}
+        return values.map(lookup).astype(float)
         
     def parse_formatted(self, time_str: str) -> Optional[float]:
         """
@@ -346,7 +358,8 @@ class TimeService:
         """Format as decimal hours."""
         return f"{hours:.1f}h"
         
-    def _convert_to_hours(self, value_str: str, unit: str) -> Optional[float]:
+    @classmethod
+    def _convert_to_hours(cls, value_str: str, unit: str) -> Optional[float]:
         """Convert time value with unit to hours."""
         # Parse numeric value
         try:
@@ -357,7 +370,7 @@ class TimeService:
             
         # Get unit multiplier
         unit_lower = unit.lower()
-        multiplier = self.UNIT_CONVERSIONS.get(unit_lower)
+        multiplier = cls.UNIT_CONVERSIONS.get(unit_lower)
         
         if multiplier is None:
             logger.warning(f"Unknown time unit: {unit}")
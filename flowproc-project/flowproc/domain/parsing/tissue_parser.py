@@ -1,11 +1,87 @@
 """Parse and map tissue identifiers."""
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterable, List, Optional, Set
 import re
 import logging
 
+import pandas as pd
+
 logger = logging.getLogger(__name__)
 
 
+def _alternation(words: Iterable[str]) -> str:
+    """Regex alternation of literal words, tried in the given order."""
+    escaped = [re.escape(word) for word in words]
+    return '|'.join(escaped) if escaped else '(?!)'
+
+
+class _TissueMatcher:
+    """
+    Precompiled matchers for one snapshot of the tissue mappings.
+    
+    Each lookup step of TissueParser is a single compiled pattern. Steps
+    that accept a match anywhere in the text scan every position with a
+    lookahead alternation and keep the candidate that comes first in
+    mapping order, which is the same result as testing each candidate in
+    turn.
+    """
+    
+    def __init__(self, tissue_map: Dict[str, str],
+                 reverse_map: Dict[str, str],
+                 tissue_patterns: Dict[str, List[re.Pattern]]):
+        codes = list(tissue_map)
+        names = list(reverse_map)
+        
+        self.reverse_map = dict(reverse_map)
+        self.code_rank = {code: rank for rank, code in enumerate(codes)}
+        self.name_rank = {name: rank for rank, name in enumerate(names)}
+        
+        # "SP_..." / "SP ..." at the start of the text
+        self.prefix = re.compile(rf'({_alternation(codes)})[_ ]')
+        # Full tissue names anywhere in the lowercased text
+        self.names = re.compile(rf'(?=({_alternation(names)}))')
+        # Codes between delimiters anywhere, e.g. "2 hours_SP_A1_1.1"
+        self.delimited = re.compile(rf'(?=[_-]({_alternation(codes)})[_-])')
+        
+        # Fallback patterns, one named group per pattern in precedence order
+        self.pattern_codes = []
+        branches = []
+        for code, patterns in tissue_patterns.items():
+            for pattern in patterns:
+                branches.append(f'(?P<p{len(self.pattern_codes)}>{pattern.pattern})')
+                self.pattern_codes.append(code)
+        self.patterns = re.compile(
+            rf'(?=(?:{"|".join(branches) if branches else "(?!)"}))', re.I
+        )
+        
+    def first_code(self, text_upper: str) -> Optional[str]:
+        """Known code followed by '_' or ' ' at the start of the text."""
+        match = self.prefix.match(text_upper)
+        return match.group(1) if match else None
+        
+    def first_name(self, text_lower: str) -> Optional[str]:
+        """Code of the earliest-mapped full name found in the text."""
+        found = {m.group(1) for m in self.names.finditer(text_lower)}
+        if not found:
+            return None
+        return self.reverse_map[min(found, key=self.name_rank.__getitem__)]
+        
+    def first_delimited_code(self, text_upper: str) -> Optional[str]:
+        """Earliest-mapped code surrounded by '_' or '-' delimiters."""
+        found = {m.group(1) for m in self.delimited.finditer(text_upper)}
+        if not found:
+            return None
+        return min(found, key=self.code_rank.__getitem__)
+        
+    def first_pattern_code(self, text: str) -> Optional[str]:
+        """Code of the earliest tissue pattern matching the text."""
+        best = None
+        for match in self.patterns.finditer(text):
+            index = next(i for i, group in enumerate(match.groups()) if group is not None)
+            if best is None or index < best:
+                best = index
+        return None if best is None else self.pattern_codes[best]
+
+
 class TissueParser:
     """Parses and maps tissue identifiers."""
     
@@ -54,6 +130,14 @@ class TissueParser:
         'IN': [re.compile(r'\bintestine\b', re.I)],
     }
     
+    # Parsed IDs remembered per parser before the cache is reset
+    _MAX_CACHE_SIZE: int = 10000
+    
+    # Bumped by add_mapping; the shared matcher is rebuilt when it changes
+    _mapping_version: int = 0
+    _matcher: Optional[_TissueMatcher] = None
+    _matcher_version: int = -1
+    
     def __init__(self, unknown_code: str = 'UNK'):
         """
         Initialize tissue parser.
@@ -63,6 +147,17 @@ class TissueParser:
         """
         self.unknown_code = unknown_code
         self._cache: Dict[str, str] = {}
+        self._cache_version = TissueParser._mapping_version
+        
+    @classmethod
+    def _get_matcher(cls) -> _TissueMatcher:
+        """Return the compiled matcher for the current mappings."""
+        if TissueParser._matcher_version != TissueParser._mapping_version:
+            TissueParser._matcher = _TissueMatcher(
+                cls.TISSUE_MAP, cls.REVERSE_MAP, cls.TISSUE_PATTERNS
+            )
+            TissueParser._matcher_version = TissueParser._mapping_version
+        return TissueParser._matcher
         
     def parse(self, text: str) -> str:
         """
@@ -83,6 +178,11 @@ class TissueParser:
         if not text:
             return self.unknown_code
             
+        # Drop results computed before the mappings last changed
+        if self._cache_version != TissueParser._mapping_version:
+            self._cache.clear()
+            self._cache_version = TissueParser._mapping_version
+            
         # Check cache
         if text in self._cache:
             return self._cache[text]
@@ -95,20 +195,42 @@ class TissueParser:
             code = self._match_patterns(text)
             
         # Cache result
+        if len(self._cache) >= self._MAX_CACHE_SIZE:
+            self._cache.clear()
         self._cache[text] = code
         return code
         
+    def parse_series(self, values: pd.Series) -> pd.Series:
+        """
+        Parse tissue codes for a whole column.
+        
+        Each distinct value is parsed once; missing values map to the
+        unknown code.
+        
+        Args:
+            values: Series of sample ID strings
+            
+        Returns:
+            Series of tissue codes aligned with values
+            
+        Raises:
+            ValueError: If a non-missing value is not a string
+        """
+        lookup = {value: self.parse(value) for value in values.dropna().unique()}
+        return values.map(lookup).fillna(self.unknown_code)
+        
     def _extract_code(self, text: str) -> str:
         """Extract tissue code from text."""
         if not text:
             return self.unknown_code
             
-        # Check if text starts with a known code
+        matcher = self._get_matcher()
         text_upper = text.upper()
         
-        for code in self.TISSUE_MAP:
-            if text_upper.startswith(code + '_') or text_upper.startswith(code + ' '):
-                return code
+        # Check if text starts with a known code
+        code = matcher.first_code(text_upper)
+        if code:
+            return code
                 
         # Check if entire text is a code
         if text_upper in self.TISSUE_MAP:
@@ -119,35 +241,19 @@ class TissueParser:
         if text_lower in self.REVERSE_MAP:
             return self.REVERSE_MAP[text_lower]
             
-        # Check for partial matches in text
-        for full_name, code in self.REVERSE_MAP.items():
-            if full_name in text_lower:
-                return code
-                
-        # Check for partial matches with underscores normalized to spaces
-        text_normalized = text_lower.replace('_', ' ')
-        for full_name, code in self.REVERSE_MAP.items():
-            if full_name in text_normalized:
-                return code
+        # Check for partial matches in text, then with underscores
+        # normalized to spaces
+        code = (matcher.first_name(text_lower)
+                or matcher.first_name(text_lower.replace('_', ' ')))
+        if code:
+            return code
         
         # Look for tissue codes anywhere in the text (for cases like "2 hours_SP_A1_1.1")
-        for code in self.TISSUE_MAP:
-            # Look for tissue code surrounded by delimiters or at word boundaries
-            import re
-            pattern = r'[_-]' + re.escape(code) + r'[_-]'
-            if re.search(pattern, text_upper):
-                return code
-                
-        return self.unknown_code
+        return matcher.first_delimited_code(text_upper) or self.unknown_code
         
     def _match_patterns(self, text: str) -> str:
         """Match tissue patterns in text."""
-        for code, patterns in self.TISSUE_PATTERNS.items():
-            for pattern in patterns:
-                if pattern.search(text):
-                    return code
-                    
-        return self.unknown_code
+        return self._get_matcher().first_pattern_code(text) or self.unknown_code
         
     def get_full_name(self, code: str) -> str:
         """
@@ -175,14 +281,24 @@ class TissueParser:
         """
         self.TISSUE_MAP[code.upper()] = full_name
         self.REVERSE_MAP[full_name.lower()] = code.upper()
-        self._cache.clear()  # Clear cache when mappings change
+        # Invalidate the shared matcher and every parser's cache
+        TissueParser._mapping_version += 1
+
+
+# Global instance for convenience
+_tissue_parser = TissueParser()
 
 
 def extract_tissue(text: str) -> str:
     """Convenience function to parse tissue code from text."""
     if not isinstance(text, str):
         raise ValueError("Sample ID must be a string")
-    return TissueParser().parse(text)
+    return _tissue_parser.parse(text)
+
+
+def extract_tissues(values: pd.Series) -> pd.Series:
+    """Convenience function to parse tissue codes for a column of sample IDs."""
+    return _tissue_parser.parse_series(values)
 
 
 def get_tissue_full_name(code: str) -> str:
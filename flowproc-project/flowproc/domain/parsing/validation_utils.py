@@ -7,11 +7,19 @@ import re
 import logging
 from typing import Optional
 
+import pandas as pd
+from pandas.api.types import is_numeric_dtype
+
 logger = logging.getLogger(__name__)
 
 # Pattern for detecting negative group/animal values
 NEGATIVE_GROUP_ANIMAL_PATTERN = re.compile(r'(_-\d+\.|\.-\d+)')
 
+# Markers that keep a value column as text: asterisk prefixes (*4.51),
+# range signs (<, >, ≤, ≥), out of range (OOR), not detected (ND),
+# limit of detection (LOD) and below limit of quantification (BLQ)
+TEXT_MARKER_PATTERN = re.compile(r'[*<>≤≥]|OOR|ND|LOD|BLQ')
+
 def validate_sample_id_for_negative_values(sample_id: str, strict: bool = False) -> bool:
     """
     Validate sample ID for negative group/animal values.
@@ -65,4 +73,34 @@ def validate_group_animal_values(group: int, animal: int,
         logger.warning(f"Animal {animal} out of range [{min_animal}, {max_animal}]")
         return False
         
-    return True 
\ No newline at end of file
+    return True
+
+
+def has_text_markers(series: pd.Series) -> bool:
+    """
+    Check if a column contains text markers that should be preserved.
+    
+    Numeric columns are skipped. Otherwise the distinct values are joined
+    into one newline-separated string and scanned once with
+    TEXT_MARKER_PATTERN; no marker contains a newline, so a match can
+    never straddle two values.
+    
+    Args:
+        series: pandas Series to check
+        
+    Returns:
+        True if column contains text markers that should remain as text
+    """
+    if series.empty or is_numeric_dtype(series):
+        return False
+        
+    values = series.dropna().unique()
+    if len(values) == 0:
+        return False
+        
+    match = TEXT_MARKER_PATTERN.search('\n'.join(map(str, values)))
+    if match:
+        logger.debug("Found text marker %r in column", match.group())
+        return True
+        
+    return False
@@ -5,6 +5,7 @@ Processing domain module for flow cytometry data processing.
 from .transform import map_replicates
 from .aggregators import AggregationStats, create_aggregation_service, aggregate_for_processing, flow_cytometry_aggregate, aggregate_all_metrics
 from .service import DataProcessingService
+from .filter_index import FilterIndex
 
 __all__ = [
     'map_replicates',
@@ -13,5 +14,6 @@ __all__ = [
     'aggregate_for_processing',
     'flow_cytometry_aggregate',
     'aggregate_all_metrics',
-    'DataProcessingService'
+    'DataProcessingService',
+    'FilterIndex'
 ] 
\ No newline at end of file
@@ -0,0 +1,140 @@
+"""
+Precomputed row positions for filtering a dataset by tissue and timepoint.
+
+The visualization dialog filters the same dataset on every option change.
+Masking object columns with isin() and recomputing unique() each time scales
+with the full dataset; a FilterIndex does that work once, when the dataset
+is loaded. It stores the categorical codes of each filter column and the
+sorted row positions of each value, so any tissue x time selection is an
+integer-array union/intersection followed by a single take().
+"""
+
+import logging
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DataFrame = pd.DataFrame
+
+# Columns the GUI filters on
+FILTER_COLUMNS = ('Tissue', 'Time')
+
+
+class _ColumnIndex:
+    """Codes and per-value row positions of one column."""
+
+    def __init__(self, series: pd.Series):
+        # factorize keeps order of first appearance, like dropna().unique()
+        codes, uniques = pd.factorize(series, use_na_sentinel=True)
+        self.codes = codes
+        self.values: List[Any] = uniques.tolist()
+        self.code_of: Dict[Any, int] = {value: code for code, value in enumerate(self.values)}
+
+        # Stable sort groups the rows by code while keeping each group sorted
+        order = np.argsort(codes, kind='stable')
+        order = order[np.count_nonzero(codes < 0):]
+        counts = np.bincount(codes[codes >= 0], minlength=len(self.values))
+        self.positions: List[np.ndarray] = np.split(order, np.cumsum(counts)[:-1]) if len(self.values) else []
+
+
+class FilterIndex:
+    """Row positions of every tissue and timepoint of a dataset."""
+
+    def __init__(self, df: DataFrame):
+        """
+        Build the index for a loaded dataset.
+
+        Args:
+            df: Parsed dataset; the index is only valid for this DataFrame
+        """
+        self.n_rows = len(df)
+        self._columns: Dict[str, _ColumnIndex] = {
+            column: _ColumnIndex(df[column]) for column in FILTER_COLUMNS if column in df.columns
+        }
+        logger.debug("Built filter index for %d rows: %s", self.n_rows,
+                     {column: len(index.values) for column, index in self._columns.items()})
+
+    def has_column(self, column: str) -> bool:
+        """Whether the dataset has the column at all."""
+        return column in self._columns
+
+    def values(self, column: str) -> List[Any]:
+        """Distinct non-null values of a column, in order of first appearance."""
+        index = self._columns.get(column)
+        return list(index.values) if index is not None else []
+
+    def has_data(self, column: str) -> bool:
+        """Whether the column exists and has at least one non-null value."""
+        return bool(self.values(column))
+
+    def has_real_tissue_data(self) -> bool:
+        """Whether any tissue other than the 'UNK' placeholder is present."""
+        return any(tissue != 'UNK' for tissue in self.values('Tissue'))
+
+    def count(self, column: str, value: Any) -> int:
+        """Number of rows with the given value."""
+        index = self._columns.get(column)
+        code = index.code_of.get(value) if index is not None else None
+        return 0 if code is None else len(index.positions[code])
+
+    def rows(self, column: str, values: Iterable[Any]) -> np.ndarray:
+        """
+        Sorted positions of the rows whose column is one of values.
+
+        Equivalent to np.flatnonzero(df[column].isin(values)).
+        """
+        index = self._columns.get(column)
+        if index is None:
+            return np.empty(0, dtype=np.intp)
+        codes = {index.code_of[value] for value in values if value in index.code_of}
+        if not codes:
+            return np.empty(0, dtype=np.intp)
+        if len(codes) == 1:
+            return index.positions[codes.pop()]
+        return np.sort(np.concatenate([index.positions[code] for code in codes]))
+
+    def rows_excluding(self, column: str, value: Any) -> np.ndarray:
+        """Sorted positions of the rows whose column is not value (nulls included)."""
+        index = self._columns.get(column)
+        code = index.code_of.get(value) if index is not None else None
+        if code is None:
+            return np.arange(self.n_rows)
+        return np.flatnonzero(index.codes != code)
+
+    def matches(self, df: DataFrame) -> bool:
+        """Cheap check that the index was built for a DataFrame of this shape."""
+        return len(df) == self.n_rows and all(column in df.columns for column in self._columns)
+
+    @staticmethod
+    def take(df: DataFrame, positions: Optional[np.ndarray]) -> DataFrame:
+        """
+        Select rows by position.
+
+        Args:
+            df: Dataset the index was built for
+            positions: Sorted row positions, or None for all rows
+
+        Returns:
+            The selected rows. For all rows, a shallow copy that shares the
+            data but not the column set, so the full dataset is never copied.
+        """
+        if positions is None or len(positions) == df.shape[0]:
+            return df.copy(deep=False)
+        return df.take(positions)
+
+
+def intersect_rows(left: Optional[np.ndarray], right: np.ndarray) -> np.ndarray:
+    """Intersect sorted row positions; None stands for all rows."""
+    if left is None:
+        return right
+    return np.intersect1d(left, right, assume_unique=True)
+
+
+__all__ = [
+    'FILTER_COLUMNS',
+    'FilterIndex',
+    'intersect_rows',
+]
@@ -3,7 +3,7 @@ import pandas as pd
 from typing import List, Tuple, Optional, Dict, Union
 import numpy as np
 
-from flowproc.domain.parsing import extract_tissue, Constants
+from flowproc.domain.parsing import extract_tissues, Constants
 
 logger = logging.getLogger(__name__)
 
@@ -142,7 +142,8 @@ def reshape_pair(
     group_first: bool = False,
 ) -> Tuple[List[List[Union[float, str]]], List[List[str]], List[Union[Tuple[str, int], str]], List[int], List[Optional[float]]]:
     """Reshape data into paired value/ID blocks for Excel output."""
-    logger.debug(f"Reshaping data for columns: {mcols}, replicates: {n}, use_tissue: {use_tissue}, include_time: {include_time}, group_first: {group_first}")
+    logger.debug("Reshaping data for columns: %s, replicates: %s, use_tissue: %s, include_time: %s, group_first: %s",
+                 mcols, n, use_tissue, include_time, group_first)
     
     # Create subset with required columns
     required_cols = [sid_col, 'Group', 'Replicate'] + mcols
@@ -151,13 +152,13 @@ def reshape_pair(
     sub = df[required_cols].dropna(subset=mcols, how='all').copy()
     
     if use_tissue:
-        sub['Tissue'] = sub[sid_col].apply(extract_tissue)
+        sub['Tissue'] = extract_tissues(sub[sid_col])
     
     # Ensure Group and Replicate are present
     sub = sub.dropna(subset=['Group', 'Replicate'])
     
     if sub.empty:
-        logger.warning(f"No valid data for {mcols}")
+        logger.warning("No valid data for %s", mcols)
         return [], [], [], [], []
 
     # Get unique values, converting numpy types
@@ -165,7 +166,7 @@ def reshape_pair(
     groups = sorted([int(g) for g in sub['Group'].unique()])
     times = sorted([t for t in sub['Time'].unique() if pd.notna(t)]) if 'Time' in sub.columns else [None]
     
-    logger.debug(f"Tissues: {tissues}, Groups: {groups}, Times: {times}")
+    logger.debug("Tissues: %s, Groups: %s, Times: %s", tissues, groups, times)
 
     val_blocks: List[List[float]] = []
     id_blocks: List[List[str]] = []
@@ -291,5 +292,5 @@ def reshape_pair(
                         group_numbers.append(group)
                         time_values.append(None)
     
-    logger.debug(f"Generated {len(val_blocks)} blocks for {mcols}")
+    logger.debug("Generated %d blocks for %s", len(val_blocks), mcols)
     return val_blocks, id_blocks, tissue_row_counts, group_numbers, time_values
\ No newline at end of file
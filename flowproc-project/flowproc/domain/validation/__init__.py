@@ -9,6 +9,7 @@ from .input_validator import (
     InputValidator,
     InputValidationResult,
     InputValidationConfig,
+    ValidationCancelled,
     validate_input_paths,
     validate_output_directory,
     validate_processing_options,
@@ -19,6 +20,7 @@ __all__ = [
     'InputValidator',
     'InputValidationResult', 
     'InputValidationConfig',
+    'ValidationCancelled',
     'validate_input_paths',
     'validate_output_directory',
     'validate_processing_options',
@@ -6,12 +6,26 @@ maintainable service that eliminates code duplication and provides consistent va
 """
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Union
+from typing import Callable, List, Optional, Dict, Any, Sequence, Tuple, TypeVar, Union
 from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar('T')
+R = TypeVar('R')
+
+# Called with (path, result) as each file's validation completes
+FileCallback = Callable[[str, 'InputValidationResult'], None]
+# Called between files; raises (e.g. ValidationCancelled) to abandon the run
+Checkpoint = Callable[[], None]
+
+
+class ValidationCancelled(Exception):
+    """Raised by a checkpoint when the paths being validated are no longer wanted."""
+
 
 @dataclass
 class InputValidationResult:
@@ -61,6 +75,9 @@ class InputValidationConfig:
     # Performance settings
     check_disk_space: bool = True
     min_disk_space_mb: int = 100
+    # Threads for stat()/directory listing; file system calls on network
+    # mounts are latency-bound, so they overlap well
+    max_workers: int = 16
 
 
 class InputValidator:
@@ -87,6 +104,8 @@ class InputValidator:
         groups: Optional[List[int]] = None,
         replicates: Optional[List[int]] = None,
         time_course_mode: bool = False,
+        on_file: Optional[FileCallback] = None,
+        checkpoint: Optional[Checkpoint] = None,
         **kwargs
     ) -> InputValidationResult:
         """
@@ -98,6 +117,8 @@ class InputValidator:
             groups: List of group numbers
             replicates: List of replicate numbers
             time_course_mode: Whether time course mode is enabled
+            on_file: Receives each file's result as soon as it is known
+            checkpoint: Called while validating; may raise to cancel
             **kwargs: Additional validation parameters
             
         Returns:
@@ -106,7 +127,7 @@ class InputValidator:
         result = InputValidationResult(is_valid=True)
         
         # Step 1: Validate input paths
-        paths_result = self.validate_input_paths(input_paths)
+        paths_result = self.validate_input_paths(input_paths, on_file=on_file, checkpoint=checkpoint)
         result.errors.extend(paths_result.errors)
         result.warnings.extend(paths_result.warnings)
         result.file_count = paths_result.file_count
@@ -149,12 +170,24 @@ class InputValidator:
         
         return result
     
-    def validate_input_paths(self, paths: List[str]) -> InputValidationResult:
+    def validate_input_paths(
+        self,
+        paths: List[str],
+        on_file: Optional[FileCallback] = None,
+        checkpoint: Optional[Checkpoint] = None
+    ) -> InputValidationResult:
         """
         Validate input file/directory paths.
         
+        Paths are inspected, directories listed and files checked on a
+        thread pool; results are merged in the order of paths.
+        
         Args:
             paths: List of paths to validate
+            on_file: Receives each file's result as soon as it is known,
+                in completion order
+            checkpoint: Called as results arrive; an exception it raises
+                cancels the remaining work and propagates
             
         Returns:
             InputValidationResult containing validation results
@@ -165,31 +198,30 @@ class InputValidator:
             result.add_error("No input files or directories specified")
             return result
         
-        for path_str in paths:
-            if not path_str.strip():
-                result.add_error("Empty path specified")
-                continue
-            
-            path = Path(path_str)
-            
-            # Check if path exists
-            if not path.exists():
-                result.add_error(f"Path does not exist: {path_str}")
-                continue
-            
-            # Validate based on path type
-            if path.is_file():
-                file_result = self._validate_file(path)
+        # Classify every path and list directories concurrently, then
+        # check all files found in one batch
+        inspected = self._map(self._inspect_path, paths, checkpoint=checkpoint)
+        files: List[Tuple[str, Path]] = [(path_str, path) for path_str, (kind, path, _) in zip(paths, inspected)
+                                          if kind == 'file']
+        for kind, dir_path, listing in inspected:
+            if kind == 'dir' and isinstance(listing, list):
+                files.extend((str(file_path), file_path) for file_path in listing)
+        file_results = self._validate_files(files, on_file, checkpoint)
+        
+        for path_str, (kind, path, detail) in zip(paths, inspected):
+            if kind == 'error':
+                result.add_error(detail)
+            elif kind == 'file':
+                file_result = file_results[path_str]
                 if file_result.is_valid:
                     result.file_count += 1
-                    result.total_size += path.stat().st_size
+                    result.total_size += file_result.total_size
                     result.valid_paths.append(path_str)
                 else:
                     result.errors.extend(file_result.errors)
                 result.warnings.extend(file_result.warnings)
-                
-            elif path.is_dir():
-                dir_result = self._validate_directory(path)
+            else:
+                dir_result = self._merge_directory(path, detail, file_results)
                 if dir_result.is_valid:
                     result.file_count += dir_result.file_count
                     result.total_size += dir_result.total_size
@@ -197,9 +229,6 @@ class InputValidator:
                 else:
                     result.errors.extend(dir_result.errors)
                 result.warnings.extend(dir_result.warnings)
-                
-            else:
-                result.add_error(f"Path is neither file nor directory: {path_str}")
         
         # Check if any valid files were found
         if result.file_count == 0:
@@ -324,8 +353,104 @@ class InputValidator:
         
         return result
     
+    def _map(self, func: Callable[[T], R], items: Sequence[T],
+             on_result: Optional[Callable[[T, R], None]] = None,
+             checkpoint: Optional[Checkpoint] = None) -> List[R]:
+        """
+        Apply func to items on a thread pool, returning results in order.
+        
+        Args:
+            func: Function of one item
+            items: Items to process
+            on_result: Called with (item, result) in completion order
+            checkpoint: Called before each item and as results arrive; if it
+                raises, queued items are cancelled and the exception propagates
+            
+        Returns:
+            Results aligned with items
+        """
+        workers = max(1, min(self.config.max_workers, len(items)))
+        if workers == 1:
+            results = []
+            for item in items:
+                if checkpoint:
+                    checkpoint()
+                results.append(func(item))
+                if on_result:
+                    on_result(item, results[-1])
+            return results
+        
+        def task(item: T) -> R:
+            # Items picked up after cancellation exit before touching the filesystem
+            if checkpoint:
+                checkpoint()
+            return func(item)
+        
+        results: List[Any] = [None] * len(items)
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='validate')
+        try:
+            futures = {executor.submit(task, item): i for i, item in enumerate(items)}
+            for future in as_completed(futures):
+                if checkpoint:
+                    checkpoint()
+                i = futures[future]
+                results[i] = future.result()
+                if on_result:
+                    on_result(items[i], results[i])
+        finally:
+            # On cancellation, drop queued work instead of waiting for it
+            executor.shutdown(wait=True, cancel_futures=True)
+        return results
+    
+    def _inspect_path(self, path_str: str) -> Tuple[str, Optional[Path], Any]:
+        """
+        Classify one input path.
+        
+        Returns:
+            ('file', path, None), ('dir', path, files or an error message),
+            or ('error', path, message)
+        """
+        if not path_str.strip():
+            return 'error', None, "Empty path specified"
+        
+        path = Path(path_str)
+        
+        # Check if path exists
+        if not path.exists():
+            return 'error', path, f"Path does not exist: {path_str}"
+        if path.is_file():
+            return 'file', path, None
+        if path.is_dir():
+            return 'dir', path, self._list_directory(path)
+        return 'error', path, f"Path is neither file nor directory: {path_str}"
+    
+    def _list_directory(self, dir_path: Path) -> Union[List[Path], str]:
+        """
+        Files in a directory with an allowed extension, in one listing pass.
+        
+        Returns:
+            The files, or an error message if the directory cannot be read
+        """
+        extensions = tuple(self.config.allowed_extensions)
+        try:
+            with os.scandir(dir_path) as entries:
+                return [dir_path / entry.name for entry in entries if entry.name.endswith(extensions)]
+        except PermissionError:
+            return f"Permission denied accessing directory: {dir_path}"
+        except Exception as e:
+            return f"Error validating directory {dir_path}: {e}"
+    
+    def _validate_files(self, files: List[Tuple[str, Path]], on_file: Optional[FileCallback],
+                        checkpoint: Optional[Checkpoint]) -> Dict[str, InputValidationResult]:
+        """Validate files concurrently, keyed by their path string."""
+        files = list(dict.fromkeys(files))
+        notify = (lambda item, file_result: on_file(item[0], file_result)) if on_file else None
+        results = self._map(lambda item: self._validate_file(item[1]), files,
+                            on_result=notify, checkpoint=checkpoint)
+        return {path_str: file_result for (path_str, _), file_result in zip(files, results)}
+    
     def _validate_file(self, file_path: Path) -> InputValidationResult:
-        """Validate a single file."""
+        """Validate a single file; a valid result carries its size in total_size."""
         result = InputValidationResult(is_valid=True)
         
         # Check file extension
@@ -342,45 +467,46 @@ class InputValidator:
                 result.add_warning(
                     f"Large file detected ({file_size / 1024 / 1024:.1f} MB): {file_path}"
                 )
+            result.total_size = file_size
         except OSError as e:
             result.add_error(f"Cannot access file {file_path}: {e}")
         
         return result
     
-    def _validate_directory(self, dir_path: Path) -> InputValidationResult:
+    def _validate_directory(self, dir_path: Path, on_file: Optional[FileCallback] = None,
+                            checkpoint: Optional[Checkpoint] = None) -> InputValidationResult:
         """Validate a directory and its contents."""
+        listing = self._list_directory(dir_path)
+        files = [(str(file_path), file_path) for file_path in listing] if isinstance(listing, list) else []
+        return self._merge_directory(dir_path, listing, self._validate_files(files, on_file, checkpoint))
+    
+    def _merge_directory(self, dir_path: Path, listing: Union[List[Path], str],
+                         file_results: Dict[str, InputValidationResult]) -> InputValidationResult:
+        """Combine the results of a directory's files."""
         result = InputValidationResult(is_valid=True)
         
-        try:
-            # Find files with allowed extensions
-            valid_files = []
-            for ext in self.config.allowed_extensions:
-                valid_files.extend(dir_path.glob(f"*{ext}"))
-            
-            if not valid_files and not self.config.allow_empty_directories:
-                result.add_error(f"No valid files found in directory: {dir_path}")
-                return result
-            
-            if len(valid_files) > self.config.max_files_per_directory:
-                result.add_warning(
-                    f"Many files in directory ({len(valid_files)}): {dir_path}"
-                )
-            
-            # Validate each file
-            for file_path in valid_files:
-                file_result = self._validate_file(file_path)
-                if file_result.is_valid:
-                    result.file_count += 1
-                    result.total_size += file_path.stat().st_size
-                    result.valid_paths.append(str(file_path))
-                else:
-                    result.errors.extend(file_result.errors)
-                result.warnings.extend(file_result.warnings)
-                
-        except PermissionError:
-            result.add_error(f"Permission denied accessing directory: {dir_path}")
-        except Exception as e:
-            result.add_error(f"Error validating directory {dir_path}: {e}")
+        if isinstance(listing, str):
+            result.add_error(listing)
+            return result
+        
+        if not listing and not self.config.allow_empty_directories:
+            result.add_error(f"No valid files found in directory: {dir_path}")
+            return result
+        
+        if len(listing) > self.config.max_files_per_directory:
+            result.add_warning(
+                f"Many files in directory ({len(listing)}): {dir_path}"
+            )
+        
+        for file_path in listing:
+            file_result = file_results[str(file_path)]
+            if file_result.is_valid:
+                result.file_count += 1
+                result.total_size += file_result.total_size
+                result.valid_paths.append(str(file_path))
+            else:
+                result.errors.extend(file_result.errors)
+            result.warnings.extend(file_result.warnings)
         
         return result
     
@@ -4,8 +4,12 @@ Column detection and utility functions for flow cytometry visualization.
 
 import logging
 import pandas as pd
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, List, Any, Optional, Tuple, Union
 
+from ..parsing.column_catalog import FLOW_CATEGORIES, get_column_catalog
+
 logger = logging.getLogger(__name__)
 
 # Type aliases for simplicity
@@ -22,50 +26,10 @@ def detect_flow_columns(df: DataFrame) -> Dict[str, List[str]]:
     Returns:
         Dictionary mapping column types to lists of column names
     """
-    columns = list(df.columns)
-    
-    # Find frequency columns - be more flexible about detection
-    freq_cols = []
-    for col in columns:
-        col_lower = col.lower()
-        # Look for frequency indicators
-        if any(indicator in col_lower for indicator in ['freq', 'frequency', '%']):
-            freq_cols.append(col)
-    
-    # Find median columns
-    median_cols = [col for col in columns if 'Median' in col]
-    
-    # Find geometric mean columns first (longer pattern)
-    geo_mean_cols = []
-    for col in columns:
-        if any(indicator in col for indicator in ['Geometric Mean', 'Geo Mean', 'GeoMean']):
-            geo_mean_cols.append(col)
-    
-    # Find mean columns (but exclude geometric mean columns)
-    mean_cols = []
-    for col in columns:
-        if 'Mean' in col and col not in geo_mean_cols:
-            mean_cols.append(col)
-    
-    # Find count columns
-    count_cols = [col for col in columns if 'Count' in col]
-    
-    # Find CV columns
-    cv_cols = [col for col in columns if 'CV' in col]
-    
-    # Find MAD columns
-    mad_cols = [col for col in columns if 'MAD' in col]
-    
-    return {
-        'frequencies': freq_cols,
-        'medians': median_cols,
-        'means': mean_cols,
-        'counts': count_cols,
-        'geometric_means': geo_mean_cols,
-        'cvs': cv_cols,
-        'mads': mad_cols,
-        'all_metrics': freq_cols + median_cols + mean_cols + count_cols + geo_mean_cols + cv_cols + mad_cols
-    }
+    catalog = get_column_catalog(df)
+    flow_cols = {category: list(catalog.flow_columns(category)) for category in FLOW_CATEGORIES}
+    flow_cols['all_metrics'] = [col for category in FLOW_CATEGORIES for col in flow_cols[category]]
+    return flow_cols
 
 
 def extract_cell_type_name(column_name: str) -> str:
@@ -147,6 +111,54 @@ def build_unique_cell_type_labels(column_names: List[str]) -> Dict[str, str]:
     return labels
 
 
+@dataclass(frozen=True)
+class CellTypeLabels:
+    """Display labels of a set of flow columns, resolved once."""
+    # Column -> disambiguated leaf label (build_unique_cell_type_labels)
+    base: Dict[str, str]
+    # Column -> label with GFP context (enhance_cell_type_name); used as trace names
+    enhanced: Dict[str, str]
+    # Enhanced or base label -> column, for matching traces back to columns
+    by_label: Dict[str, str]
+
+    def column_for(self, trace_name: str) -> Optional[str]:
+        """Column a trace named with one of these labels was built from."""
+        column = self.by_label.get(trace_name)
+        if column is None:
+            # Traces may also be named after the raw column
+            column = next((col for col in self.base if col in trace_name), None)
+        return column
+
+
+@lru_cache(maxsize=256)
+def _resolve_cell_type_labels(columns: Tuple[str, ...]) -> CellTypeLabels:
+    base = build_unique_cell_type_labels(list(columns))
+    enhanced = {col: enhance_cell_type_name(label, col) for col, label in base.items()}
+    by_label: Dict[str, str] = {}
+    # Enhanced labels take precedence over base labels
+    for labels in (enhanced, base):
+        for col, label in labels.items():
+            by_label.setdefault(label, col)
+    return CellTypeLabels(base=base, enhanced=enhanced, by_label=by_label)
+
+
+def resolve_cell_type_labels(columns: List[str]) -> CellTypeLabels:
+    """
+    Resolve the cell type labels of a set of flow columns.
+
+    Headers are fixed per dataset, so the result is memoized per column set
+    and shared by the aggregation, plotting and overlay code. Treat it as
+    read-only.
+
+    Args:
+        columns: Flow column names, in plot order
+
+    Returns:
+        CellTypeLabels for the columns
+    """
+    return _resolve_cell_type_labels(tuple(columns))
+
+
 def extract_population_leaf(column_name: str) -> str:
     """
     Return the leaf population label from a FlowJo gating path.
@@ -383,13 +395,14 @@ def create_comprehensive_plot_title(df: DataFrame, metric_type: str = None, cell
     return title
 
 
-def analyze_data_size(df: DataFrame, value_cols: List[str]) -> Dict[str, Any]:
+def analyze_data_size(df: DataFrame, value_cols: List[str], width: Optional[int] = None) -> Dict[str, Any]:
     """
     Analyze data size and suggest performance optimizations.
     
     Args:
         df: Input DataFrame
         value_cols: List of value columns to analyze
+        width: Figure width in pixels; sets the suggested points per series
         
     Returns:
         Dictionary with analysis results and recommendations
@@ -417,17 +430,20 @@ def analyze_data_size(df: DataFrame, value_cols: List[str]) -> Dict[str, Any]:
     if complexity == "high":
         recommendations.append("High complexity detected - applying aggressive optimizations")
         suggested_max_cell_types = min(5, num_cell_types)
-        suggested_sample_size = 500
     elif complexity == "medium":
         recommendations.append("Medium complexity detected - applying moderate optimizations")
         suggested_max_cell_types = min(10, num_cell_types)
-        suggested_sample_size = 1000
+    
+    if complexity != "low":
+        # As many raw points per series as the plot has pixels to show
+        from .downsampling import point_budget
+        suggested_sample_size = point_budget(width)
     
     if num_cell_types > suggested_max_cell_types:
         recommendations.append(f"Limiting cell types from {num_cell_types} to {suggested_max_cell_types}")
     
     if suggested_sample_size and total_rows > suggested_sample_size * num_cell_types:
-        recommendations.append(f"Sampling {suggested_sample_size} points per cell type")
+        recommendations.append(f"Downsampling raw points to {suggested_sample_size} per cell type")
     
     return {
         "total_rows": total_rows,
@@ -489,34 +505,7 @@ def detect_available_metric_types(df: DataFrame) -> List[str]:
     Returns:
         List of available metric type names
     """
-    available_metrics = []
-    columns = [col.lower() for col in df.columns]
-    
-    # Check for frequency metrics
-    if any('freq. of parent' in col for col in columns):
-        available_metrics.append('Freq. of Parent')
-    if any('freq. of live' in col for col in columns):
-        available_metrics.append('Freq. of Live')
-    if any('freq. of total' in col for col in columns):
-        available_metrics.append('Freq. of Total')
-    
-    # Check for other metrics
-    if any('median' in col and 'geometric' not in col for col in columns):
-        available_metrics.append('Median')
-    if any('mean' in col and 'geometric' not in col for col in columns):
-        available_metrics.append('Mean')
-    if any('geometric mean' in col for col in columns):
-        available_metrics.append('Geometric Mean')
-    if any('count' in col for col in columns):
-        available_metrics.append('Count')
-    if any('cv' in col for col in columns):
-        available_metrics.append('CV')
-    if any('mad' in col for col in columns):
-        available_metrics.append('MAD')
-    if any('mode' in col for col in columns):
-        available_metrics.append('Mode')
-    
-    return available_metrics
+    return list(get_column_catalog(df).metric_types)
 
 
 def get_matching_columns_for_metric(df: DataFrame, metric_type: str) -> List[str]:
@@ -530,33 +519,7 @@ def get_matching_columns_for_metric(df: DataFrame, metric_type: str) -> List[str
     Returns:
         List of column names that match the metric type
     """
-    matching_cols = []
-    
-    if metric_type == "Freq. of Parent":
-        matching_cols = [col for col in df.columns if 'freq. of parent' in col.lower()]
-    elif metric_type == "Freq. of Live":
-        matching_cols = [col for col in df.columns if 'freq. of live' in col.lower()]
-    elif metric_type == "Freq. of Total":
-        matching_cols = [col for col in df.columns if 'freq. of total' in col.lower()]
-    elif metric_type == "Mean":
-        matching_cols = [col for col in df.columns if 'mean' in col.lower() and 'geometric mean' not in col.lower()]
-    elif metric_type == "Median":
-        matching_cols = [col for col in df.columns if 'median' in col.lower()]
-    elif metric_type == "Geometric Mean":
-        matching_cols = [col for col in df.columns if 'geometric mean' in col.lower()]
-    elif metric_type == "Count":
-        matching_cols = [col for col in df.columns if 'count' in col.lower()]
-    elif metric_type == "CV":
-        matching_cols = [col for col in df.columns if 'cv' in col.lower()]
-    elif metric_type == "MAD":
-        matching_cols = [col for col in df.columns if 'mad' in col.lower()]
-    elif metric_type == "Mode":
-        matching_cols = [col for col in df.columns if 'mode' in col.lower()]
-    else:
-        # Fallback to generic matching
-        matching_cols = [col for col in df.columns if metric_type.lower() in col.lower()]
-    
-    return matching_cols 
+    return list(get_column_catalog(df).columns_for_metric(metric_type))
 
 
 def create_population_shortname(column_name: str) -> str:
@@ -60,12 +60,10 @@ def aggregate_multiple_metrics_by_group(df: DataFrame, freq_cols: List[str], gro
         value_name='Value',
     )
 
-    # Preserve existing label enhancements
-    from .column_utils import build_unique_cell_type_labels, enhance_cell_type_name
-    label_map = build_unique_cell_type_labels(freq_cols)
-    combined_df['Cell Type'] = combined_df['Cell Type'].map(
-        lambda original: enhance_cell_type_name(label_map.get(original, original), original)
-    )
+    # Preserve existing label enhancements; labels are resolved once per column set
+    from .column_utils import resolve_cell_type_labels
+    labels = resolve_cell_type_labels(freq_cols)
+    combined_df['Cell Type'] = combined_df['Cell Type'].map(labels.enhanced).fillna(combined_df['Cell Type'])
 
     return combined_df
 
@@ -109,41 +107,52 @@ def aggregate_flow_cytometry_data(
 
 
 def sample_data_if_large(df: DataFrame, sample_size: Optional[int] = None, 
-                        total_rows_threshold: int = 5000) -> DataFrame:
+                        total_rows_threshold: int = 5000,
+                        y: Optional[str] = None,
+                        x: Optional[str] = None,
+                        by: Optional[Union[str, Sequence[str]]] = None,
+                        width: Optional[int] = None) -> DataFrame:
     """
-    Sample data if the dataset is large to improve performance.
+    Downsample raw points if the dataset is large to improve performance.
+    
+    Rows are chosen with min-max bucketing (or LTTB when x is given), so the
+    extremes of each series survive. Use this on raw-point layers only:
+    aggregate statistics on the full data.
     
     Args:
-        df: DataFrame to potentially sample
-        sample_size: Number of samples to take (if None, auto-determined)
-        total_rows_threshold: Threshold above which to apply sampling
+        df: DataFrame to potentially reduce
+        sample_size: Points to keep per series (if None, derived from the figure width)
+        total_rows_threshold: Threshold above which to downsample automatically
+        y: Value column whose shape is preserved (default: first numeric column)
+        x: Column the series is ordered by; enables LTTB
+        by: Column(s) identifying separate series, e.g. 'Group'
+        width: Figure width in pixels used for the automatic budget
         
     Returns:
-        Sampled DataFrame or original DataFrame if no sampling needed
+        Downsampled DataFrame or original DataFrame if no reduction needed
     """
+    from .downsampling import downsample_frame, point_budget
+    
     total_rows = len(df)
     
-    # Auto-apply sampling for large datasets if not explicitly set
+    # Auto-apply downsampling for large datasets if not explicitly set
     if sample_size is None and total_rows > total_rows_threshold:
-        # Use analysis recommendations or default
-        from .column_utils import analyze_data_size
-        # Get all numeric columns for analysis
-        numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
-        if numeric_cols:
-            analysis = analyze_data_size(df, numeric_cols)
-            if analysis['suggested_sample_size']:
-                sample_size = analysis['suggested_sample_size']
-                logger.info(f"Auto-applying sample size: {sample_size}")
-            else:
-                sample_size = 1000
-                logger.info(f"Auto-applying default sample size: {sample_size}")
+        sample_size = point_budget(width)
+        logger.info(f"Auto-applying point budget: {sample_size} per series")
+    
+    if not sample_size or total_rows <= sample_size:
+        return df
     
-    # Apply sampling if needed
-    if sample_size and total_rows > sample_size:
-        logger.info(f"Sampling data: {total_rows} rows -> {sample_size}")
-        df = df.sample(n=sample_size, random_state=42)
+    if y is None:
+        numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+        if not numeric_cols:
+            return df
+        y = numeric_cols[0]
     
-    return df
+    result = downsample_frame(df, y, x=x, by=by, max_points=sample_size,
+                              method='lttb' if x is not None else 'minmax')
+    logger.info(f"Downsampled data: {total_rows} rows -> {len(result)}")
+    return result
 
 
 def prepare_data_for_plotting(df: DataFrame, base_columns: List[str], value_col: str) -> DataFrame:
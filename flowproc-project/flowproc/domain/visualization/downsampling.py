@@ -0,0 +1,182 @@
+"""
+Shape-preserving downsampling of raw points for plotting.
+
+Random sampling drops exactly the points that matter visually: outliers,
+peaks and the ends of a timecourse. The reducers here keep them:
+
+- LTTB (largest-triangle-three-buckets) for ordered series such as raw
+  timecourse lines; keeps the points that best preserve the line's shape
+- min-max bucketing for point clouds and individual-point overlays; keeps
+  the lowest and highest point of every bucket, so the range is exact
+
+Budgets follow the plot area: there is no use drawing more points per
+series than the plot has pixels to show them. Only raw-point layers are
+reduced; aggregated statistics are always computed on the full data.
+"""
+
+import logging
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from .plot_config import DEFAULT_WIDTH, MARGIN, POINTS_PER_PIXEL, MIN_POINTS_PER_SERIES
+
+logger = logging.getLogger(__name__)
+
+DataFrame = pd.DataFrame
+
+
+def point_budget(extent: Optional[int] = None, margin: Optional[int] = None,
+                 points_per_pixel: int = POINTS_PER_PIXEL) -> int:
+    """
+    Maximum raw points per series for a plot dimension.
+
+    Args:
+        extent: Figure width (or height, for points spread vertically) in pixels
+        margin: Pixels taken by margins on that axis; defaults to the left + right MARGIN
+        points_per_pixel: Points kept per pixel column (2 = its min and max)
+
+    Returns:
+        Number of points per series
+    """
+    extent = extent or DEFAULT_WIDTH
+    margin = MARGIN['l'] + MARGIN['r'] if margin is None else margin
+    return max((extent - margin) * points_per_pixel, MIN_POINTS_PER_SERIES)
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Select points with largest-triangle-three-buckets.
+
+    The first and last points are always kept. The rest are split into
+    n_out - 2 buckets; from each, the point forming the largest triangle
+    with the previously kept point and the next bucket's mean is kept.
+
+    Args:
+        x: X values, sorted ascending
+        y: Y values
+        n_out: Number of points to keep
+
+    Returns:
+        Sorted positions of the kept points
+    """
+    n = len(y)
+    if n_out >= n:
+        return np.arange(n)
+    if n_out < 3:
+        return np.array([0, n - 1])[:max(n_out, 0)]
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+
+    kept = np.empty(n_out, dtype=np.int64)
+    kept[0], kept[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_x, next_y = x[end:edges[i + 2]].mean(), y[end:edges[i + 2]].mean()
+        else:
+            next_x, next_y = x[-1], y[-1]
+        areas = np.abs(
+            (x[a] - next_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (next_y - y[a])
+        )
+        a = start + int(np.argmax(areas))
+        kept[i + 1] = a
+    return kept
+
+
+def minmax_indices(y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Select the minimum and maximum of each of n_out // 2 equal-size buckets.
+
+    Args:
+        y: Y values in plotting order
+        n_out: Number of points to keep (at most)
+
+    Returns:
+        Sorted positions of the kept points
+    """
+    n = len(y)
+    if n_out >= n:
+        return np.arange(n)
+
+    n_buckets = max(n_out // 2, 1)
+    bucket = np.arange(n) * n_buckets // n
+    # Within each bucket, order by y: the bucket's first entry is its min, its last its max
+    order = np.lexsort((np.asarray(y, dtype=float), bucket))
+    starts = np.flatnonzero(np.r_[True, bucket[order][1:] != bucket[order][:-1]])
+    ends = np.r_[starts[1:], n] - 1
+    return np.unique(np.concatenate([order[starts], order[ends]]))
+
+
+def downsample_frame(
+    df: DataFrame,
+    y: str,
+    x: Optional[str] = None,
+    by: Optional[Union[str, Sequence[str]]] = None,
+    max_points: Optional[int] = None,
+    method: str = 'minmax'
+) -> DataFrame:
+    """
+    Reduce each series of a frame to at most max_points rows.
+
+    Rows with a missing y value are dropped, since they are not drawn. When
+    x is given each series is ordered by it, as a line would be drawn.
+
+    Args:
+        df: Raw data
+        y: Value column
+        x: Column the series is ordered by (required for 'lttb')
+        by: Column(s) identifying the series, e.g. the group column
+        max_points: Points kept per series; defaults to point_budget()
+        method: 'lttb' or 'minmax'
+
+    Returns:
+        The kept rows, with the original index
+    """
+    if method not in ('lttb', 'minmax'):
+        raise ValueError(f"Unknown downsampling method '{method}'; expected 'lttb' or 'minmax'")
+    if method == 'lttb' and x is None:
+        raise ValueError("LTTB downsampling needs an x column")
+    max_points = max_points or point_budget()
+
+    data = df[df[y].notna()]
+    if x is not None:
+        data = data[data[x].notna()].sort_values(x, kind='stable')
+    if len(data) <= max_points:
+        return data
+
+    by_cols: List[str] = [by] if isinstance(by, str) else list(by or [])
+    if by_cols:
+        series = data.groupby(by_cols, sort=False, dropna=False).indices.values()
+    else:
+        series = [np.arange(len(data))]
+
+    y_values = data[y].to_numpy(dtype=float)
+    x_values = data[x].to_numpy(dtype=float) if method == 'lttb' else None
+    kept = []
+    for positions in series:
+        if len(positions) <= max_points:
+            kept.append(positions)
+        elif method == 'lttb':
+            kept.append(positions[lttb_indices(x_values[positions], y_values[positions], max_points)])
+        else:
+            kept.append(positions[minmax_indices(y_values[positions], max_points)])
+
+    positions = np.sort(np.concatenate(kept)) if kept else np.array([], dtype=np.int64)
+    if len(positions) < len(data):
+        logger.debug("Downsampled %s from %d to %d points (%s, %d per series)",
+                     y, len(data), len(positions), method, max_points)
+    return data.iloc[positions]
+
+
+__all__ = [
+    'point_budget',
+    'lttb_indices',
+    'minmax_indices',
+    'downsample_frame',
+]
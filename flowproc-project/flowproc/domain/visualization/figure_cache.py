@@ -0,0 +1,171 @@
+"""
+Memoized figures for redisplaying views the user has already seen.
+
+Toggling between options (bar vs. box, tissue A vs. B) would otherwise
+rebuild identical Plotly figures from scratch. Entries are keyed by a
+fingerprint of the filtered data plus a canonical hash of everything else
+that shapes the figure (visualization options, user group labels), so a
+cached figure is only reused for exactly the same input. The cache is an
+LRU bounded by an approximate byte budget rather than an entry count,
+since one large timecourse can outweigh dozens of small bar charts.
+"""
+
+import dataclasses
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import pandas as pd
+
+from .plot_config import FIGURE_CACHE_MAX_BYTES
+
+logger = logging.getLogger(__name__)
+
+DataFrame = pd.DataFrame
+
+
+def dataframe_fingerprint(df: DataFrame) -> str:
+    """
+    Content hash of a DataFrame: values, index, column names and dtypes.
+
+    Args:
+        df: Data to fingerprint
+
+    Returns:
+        Hex digest that changes whenever any of the above does
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((list(df.columns), [str(t) for t in df.dtypes], df.shape)).encode())
+    if len(df):
+        # Vectorized per-row hashes; much faster than serializing the frame
+        digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def canonical_hash(*parts: Any) -> str:
+    """
+    Order-independent hash of options objects, dicts and plain values.
+
+    Dataclasses (such as VisualizationOptions) are hashed by their fields,
+    with dict keys sorted, so equal settings always give the same hash.
+
+    Args:
+        *parts: Values to hash together
+
+    Returns:
+        Hex digest
+    """
+    def normalize(value: Any) -> Any:
+        if dataclasses.is_dataclass(value) and not isinstance(value, type):
+            return {f.name: normalize(getattr(value, f.name)) for f in dataclasses.fields(value)}
+        if isinstance(value, dict):
+            return {str(k): normalize(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [normalize(v) for v in value]
+        return value
+
+    payload = json.dumps([normalize(p) for p in parts], sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+class FigureCache:
+    """Thread-safe LRU cache bounded by the approximate size of its entries."""
+
+    def __init__(self, max_bytes: int = FIGURE_CACHE_MAX_BYTES):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_bytes: Total size of the entries kept; least recently used
+                entries are evicted beyond it
+        """
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(df: DataFrame, *parts: Any) -> str:
+        """
+        Cache key for a figure built from df and the given settings.
+
+        Args:
+            df: The (filtered) data the figure is built from
+            *parts: Everything else the figure depends on, e.g. the
+                VisualizationOptions and user group labels
+
+        Returns:
+            Key combining the data fingerprint and the settings hash
+        """
+        return f"{dataframe_fingerprint(df)}:{canonical_hash(*parts)}"
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None, marking it recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, key: str, value: Any, size: int) -> None:
+        """
+        Store a value, evicting least recently used entries to stay in budget.
+
+        Values larger than the whole budget are not cached.
+
+        Args:
+            key: Key from make_key
+            value: Figure, HTML or render result to keep
+            size: Approximate size in bytes, e.g. the length of the figure JSON
+        """
+        if size > self.max_bytes:
+            logger.debug("Figure of %d bytes exceeds the cache budget; not cached", size)
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+
+    def clear(self) -> None:
+        """Drop all entries and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._hits = 0
+            self._misses = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """Entry count, bytes used, and hit/miss counts."""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self._hits,
+                'misses': self._misses,
+            }
+
+
+# Shared by the visualization dialog and the processing coordinator
+figure_cache = FigureCache()
+
+
+__all__ = [
+    'dataframe_fingerprint',
+    'canonical_hash',
+    'FigureCache',
+    'figure_cache',
+]
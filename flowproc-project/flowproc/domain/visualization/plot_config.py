@@ -24,6 +24,19 @@ MAX_CELL_TYPES: Final[int] = 8
 SUBPLOT_HEIGHT_PER_ROW: Final[int] = 200
 MAX_SUBPLOTS_PER_ROW: Final[int] = 2  # Allow up to 2 subplots per row to reduce bunching
 
+# WebGL rendering: figures whose scatter/line traces exceed either limit are
+# drawn with Scattergl, which stays interactive where SVG traces bog down
+WEBGL_POINT_THRESHOLD: Final[int] = 5000  # points across all scatter traces
+WEBGL_TRACE_THRESHOLD: Final[int] = 50  # scatter traces in the figure
+
+# Raw-point downsampling: points kept per series for each pixel of plot area
+# (a min and a max per pixel column), and a floor for very small figures
+POINTS_PER_PIXEL: Final[int] = 2
+MIN_POINTS_PER_SERIES: Final[int] = 100
+
+# Memory budget for rendered figures kept for instant redisplay (figure_cache)
+FIGURE_CACHE_MAX_BYTES: Final[int] = 64 * 1024 * 1024
+
 # Aspect ratio configuration
 TARGET_ASPECT_RATIO: Final[float] = 1.7  # Reduced from 2.0 to accommodate legend better
 ASPECT_TOLERANCE: Final[float] = 0.2  # Allow 20% variation from target ratio
@@ -56,6 +69,11 @@ __all__ = [
     'MAX_CELL_TYPES',
     'SUBPLOT_HEIGHT_PER_ROW',
     'MAX_SUBPLOTS_PER_ROW',
+    'WEBGL_POINT_THRESHOLD',
+    'WEBGL_TRACE_THRESHOLD',
+    'POINTS_PER_PIXEL',
+    'MIN_POINTS_PER_SERIES',
+    'FIGURE_CACHE_MAX_BYTES',
     'TARGET_ASPECT_RATIO',
     'ASPECT_TOLERANCE',
     'DEFAULT_TRACE_CONFIG',
@@ -13,15 +13,21 @@ import numpy as np
 from .legend_config import configure_legend
 from .plot_factory import build_plot_from_df
 from .data_aggregation import aggregate_by_group_with_sem, aggregate_multiple_metrics_by_group
-from .column_utils import extract_cell_type_name, extract_metric_name, create_comprehensive_plot_title, resolve_metric_selection
+from .column_utils import (
+    extract_cell_type_name, extract_metric_name, create_comprehensive_plot_title, resolve_metric_selection,
+    resolve_cell_type_labels
+)
 from .plot_config import (
     DEFAULT_WIDTH, DEFAULT_HEIGHT, MARGIN, VERTICAL_SPACING, HORIZONTAL_SPACING,
     MAX_CELL_TYPES
 )
 from .plot_utils import (
     format_time_title, validate_plot_data, limit_cell_types, calculate_subplot_dimensions, 
-    calculate_aspect_ratio_dimensions, select_legend_title, apply_common_layout, apply_group_tick_labels
+    calculate_aspect_ratio_dimensions, select_legend_title, apply_common_layout, apply_group_tick_labels,
+    apply_webgl_rendering, needs_webgl, add_consolidated_overlay_traces
 )
+from .downsampling import downsample_frame, point_budget
+from ..parsing.column_catalog import get_column_catalog
 from ..aggregation import timecourse_group_stats, timecourse_group_stats_multi
 
 logger = logging.getLogger(__name__)
@@ -115,7 +121,8 @@ def create_single_metric_plot(df: DataFrame, y_col: str, plot_type: str, filter_
     # Ensure all x-axis ticks are shown with customized labels if available
     fig = apply_group_tick_labels(fig, df, user_group_labels, width, height)
     
-    return fig
+    # Large figures render with WebGL so they stay interactive
+    return apply_webgl_rendering(fig)
 
 
 def _add_individual_points_overlay(fig: Figure, df: DataFrame, y_col: str, plot_type: str):
@@ -176,33 +183,36 @@ def _add_individual_points_overlay(fig: Figure, df: DataFrame, y_col: str, plot_
                     group_to_color[group] = color
                 trace_index += 1
     
-    # Add scatter points for each group - match group color with black outline
-    for group in df['Group'].unique():
-        group_data = df[df['Group'] == group]
-        if group_data.empty:
-            continue
-        
-        # Get color for this group, fallback to black if not found
-        point_color = group_to_color.get(group, 'black')
-        
-        # For bar plots, use group as x directly (centered on bar)
-        # For scatter/line plots, also use group as x
-        x_positions = [group] * len(group_data)
-        
-        fig.add_trace(go.Scatter(
-            x=x_positions,
-            y=group_data[y_col],
-            mode='markers',
-            marker=dict(
-                size=4,
-                color=point_color,
-                opacity=0.7,
-                line=dict(width=1, color='black')
-            ),
-            showlegend=False,
-            hoverinfo='y',
-            name=f'Individual Points (Group {group})'
-        ))
+    # One trace for all groups - per-point colors match each group's trace, with black outline.
+    # Points of a group stack vertically, so the plot height bounds how many can be told apart.
+    points = downsample_frame(
+        df[df['Group'].notna()], y_col, by='Group',
+        max_points=point_budget(fig.layout.height or DEFAULT_HEIGHT, margin=MARGIN['t'] + MARGIN['b'])
+    )
+    if points.empty:
+        return
+    
+    # For bar plots, use group as x directly (centered on bar)
+    # For scatter/line plots, also use group as x
+    fig.add_trace(go.Scatter(
+        x=points['Group'],
+        y=points[y_col],
+        mode='markers',
+        marker=dict(
+            size=4,
+            color=_point_colors(points['Group'], group_to_color),
+            opacity=0.7,
+            line=dict(width=1, color='black')
+        ),
+        showlegend=False,
+        hoverinfo='y',
+        name='Individual Points'
+    ))
+
+
+def _point_colors(keys: pd.Series, key_to_color: Dict) -> List:
+    """Per-point marker colors looked up from each point's group, black if unmatched."""
+    return keys.map(key_to_color).fillna('black').tolist()
 
 
 def create_cell_type_comparison_plot(df: DataFrame, freq_cols: List[str], plot_type: str, filter_options=None, **kwargs):
@@ -246,8 +256,7 @@ def create_cell_type_comparison_plot(df: DataFrame, freq_cols: List[str], plot_t
         # For box plots, use original data
         melted_df = df.melt(id_vars=['Group'], value_vars=freq_cols, 
                            var_name='Cell Type', value_name='Frequency')
-        from .column_utils import build_unique_cell_type_labels
-        label_map = build_unique_cell_type_labels(freq_cols)
+        label_map = resolve_cell_type_labels(freq_cols).base
         melted_df['Cell Type'] = melted_df['Cell Type'].map(label_map).fillna(melted_df['Cell Type'])
         fig = build_plot_from_df("box", melted_df, x='Group', y='Frequency', color='Cell Type', **kwargs)
         logger.debug(f"Created box plot with {len(fig.data)} traces")
@@ -255,8 +264,7 @@ def create_cell_type_comparison_plot(df: DataFrame, freq_cols: List[str], plot_t
         # For histograms, use original data melted by cell type
         melted_df = df.melt(id_vars=['Group'], value_vars=freq_cols, 
                            var_name='Cell Type', value_name='Frequency')
-        from .column_utils import build_unique_cell_type_labels
-        label_map = build_unique_cell_type_labels(freq_cols)
+        label_map = resolve_cell_type_labels(freq_cols).base
         melted_df['Cell Type'] = melted_df['Cell Type'].map(label_map).fillna(melted_df['Cell Type'])
         fig = build_plot_from_df("histogram", melted_df, x='Frequency', color='Cell Type', **kwargs)
         logger.debug(f"Created histogram plot with {len(fig.data)} traces")
@@ -311,7 +319,7 @@ def create_cell_type_comparison_plot(df: DataFrame, freq_cols: List[str], plot_t
     logger.debug(f"Final figure layout: width={fig.layout.width}, height={fig.layout.height}")
     logger.debug(f"Final figure has {len(fig.data)} traces")
     
-    return fig
+    return apply_webgl_rendering(fig)
 
 
 def _add_timecourse_individual_points_overlay(fig: Figure, df: DataFrame, time_col: str, value_col: str, group_col: Optional[str]):
@@ -374,29 +382,28 @@ def _add_timecourse_individual_points_overlay(fig: Figure, df: DataFrame, time_c
                         group_to_color[group] = color
                     trace_index += 1
         
-        # Add points for each group - match group color with black outline
-        for group in df[group_col].unique():
-            group_data = df[df[group_col] == group]
-            if group_data.empty:
-                continue
-            
-            # Get color for this group, fallback to black if not found
-            point_color = group_to_color.get(group, 'black')
-            
-            fig.add_trace(go.Scatter(
-                x=group_data[time_col],
-                y=group_data[value_col],
-                mode='markers',
-                marker=dict(
-                    size=4,
-                    color=point_color,
-                    opacity=0.7,
-                    line=dict(width=1, color='black')
-                ),
-                showlegend=False,
-                hoverinfo='x+y',
-                name=f'Individual Points (Group {group})'
-            ))
+        # One trace for all groups - per-point colors match each group's trace, with black outline
+        points = downsample_frame(
+            df[df[group_col].notna()], value_col, x=time_col, by=group_col,
+            max_points=point_budget(fig.layout.width)
+        )
+        if points.empty:
+            return
+        
+        fig.add_trace(go.Scatter(
+            x=points[time_col],
+            y=points[value_col],
+            mode='markers',
+            marker=dict(
+                size=4,
+                color=_point_colors(points[group_col], group_to_color),
+                opacity=0.7,
+                line=dict(width=1, color='black')
+            ),
+            showlegend=False,
+            hoverinfo='x+y',
+            name='Individual Points'
+        ))
     else:
         # No group column, add all points with default color
         # Try to get color from first trace if available
@@ -411,9 +418,10 @@ def _add_timecourse_individual_points_overlay(fig: Figure, df: DataFrame, time_c
             elif hasattr(trace, 'line') and trace.line and hasattr(trace.line, 'color'):
                 point_color = trace.line.color
         
+        points = downsample_frame(df, value_col, x=time_col, max_points=point_budget(fig.layout.width))
         fig.add_trace(go.Scatter(
-            x=df[time_col],
-            y=df[value_col],
+            x=points[time_col],
+            y=points[value_col],
             mode='markers',
             marker=dict(
                 size=4,
@@ -427,6 +435,19 @@ def _add_timecourse_individual_points_overlay(fig: Figure, df: DataFrame, time_c
         ))
 
 
+def _trace_color(trace) -> Optional[str]:
+    """Marker color of a trace (first one if per-point), else its line color."""
+    color = None
+    if hasattr(trace, 'marker') and trace.marker and hasattr(trace.marker, 'color'):
+        color = trace.marker.color
+        if isinstance(color, (list, tuple)) and len(color) > 0:
+            color = color[0]
+    # Line traces leave the marker color unset
+    if color is None and hasattr(trace, 'line') and trace.line and hasattr(trace.line, 'color'):
+        color = trace.line.color
+    return color
+
+
 def _add_cell_type_individual_points_overlay(fig: Figure, df: DataFrame, freq_cols: List[str], plot_type: str):
     """
     Add individual data points as an overlay for cell type comparison plots.
@@ -441,67 +462,23 @@ def _add_cell_type_individual_points_overlay(fig: Figure, df: DataFrame, freq_co
     if 'Group' not in df.columns:
         return
     
-    # Get cell type order from figure traces (to match bar positions)
-    from .column_utils import build_unique_cell_type_labels, enhance_cell_type_name
-    label_map = build_unique_cell_type_labels(freq_cols)
+    # Trace names use the enhanced labels of aggregate_multiple_metrics_by_group;
+    # the memoized label set maps them straight back to their columns
+    labels = resolve_cell_type_labels(freq_cols)
     
-    # Build mapping from cell type label to trace index and color
-    # Trace names use enhanced labels (from aggregate_multiple_metrics_by_group),
-    # so we need to enhance our labels for proper matching
+    # Build mapping from cell type column to trace index and color
     cell_type_to_index = {}
     cell_type_to_color = {}
-    trace_names = []
     for i, trace in enumerate(fig.data):
         if hasattr(trace, 'name') and trace.name:
-            trace_names.append(trace.name)
-            # Try to match trace name to cell type label
-            # Trace names are enhanced labels, so enhance our labels for comparison
-            for freq_col, label in label_map.items():
-                # Enhance the label to match what's in the trace name
-                enhanced_label = enhance_cell_type_name(label, freq_col)
-                # Match using enhanced label, or fallback to basic label or column name
-                if enhanced_label == trace.name or label == trace.name or freq_col in trace.name:
-                    cell_type_to_index[freq_col] = i
-                    # Extract color from trace
-                    if hasattr(trace, 'marker') and trace.marker and hasattr(trace.marker, 'color'):
-                        color = trace.marker.color
-                        if isinstance(color, (list, tuple)) and len(color) > 0:
-                            color = color[0]
-                        cell_type_to_color[freq_col] = color
-                    elif hasattr(trace, 'line') and trace.line and hasattr(trace.line, 'color'):
-                        color = trace.line.color
-                        cell_type_to_color[freq_col] = color
-                    break
-    
-    # If we couldn't match by name, try to match by comparing enhanced labels with trace names
-    # This handles cases where exact matching failed
-    if len(cell_type_to_index) < len(freq_cols):
-        from .column_utils import enhance_cell_type_name
-        # Build a reverse map from enhanced labels to freq_cols
-        enhanced_to_freq_col = {}
-        for freq_col, label in label_map.items():
-            enhanced_label = enhance_cell_type_name(label, freq_col)
-            enhanced_to_freq_col[enhanced_label] = freq_col
-        
-        # Try matching remaining traces
-        for i, trace in enumerate(fig.data):
-            if hasattr(trace, 'name') and trace.name:
-                trace_name = trace.name
-                # Check if this trace name matches any enhanced label
-                if trace_name in enhanced_to_freq_col:
-                    freq_col = enhanced_to_freq_col[trace_name]
-                    if freq_col not in cell_type_to_index:
-                        cell_type_to_index[freq_col] = i
-                        # Extract color from trace
-                        if hasattr(trace, 'marker') and trace.marker and hasattr(trace.marker, 'color'):
-                            color = trace.marker.color
-                            if isinstance(color, (list, tuple)) and len(color) > 0:
-                                color = color[0]
-                            cell_type_to_color[freq_col] = color
-                        elif hasattr(trace, 'line') and trace.line and hasattr(trace.line, 'color'):
-                            cell_type_to_color[freq_col] = trace.line.color
-    
-    # Final fallback: use order in freq_cols if still unmatched
+            freq_col = labels.column_for(trace.name)
+            if freq_col is not None:
+                cell_type_to_index[freq_col] = i
+                color = _trace_color(trace)
+                if color is not None:
+                    cell_type_to_color[freq_col] = color
+    
+    # Fallback: use order in freq_cols if still unmatched
     if len(cell_type_to_index) < len(freq_cols):
         logger.warning(f"Could not match all cell types to traces. Matched {len(cell_type_to_index)}/{len(freq_cols)}")
         for i, freq_col in enumerate(freq_cols):
@@ -511,14 +488,9 @@ def _add_cell_type_individual_points_overlay(fig: Figure, df: DataFrame, freq_co
                 cell_type_to_index[freq_col] = trace_idx
                 # Try to get color from trace at this index
                 if trace_idx < len(fig.data):
-                    trace = fig.data[trace_idx]
-                    if hasattr(trace, 'marker') and trace.marker and hasattr(trace.marker, 'color'):
-                        color = trace.marker.color
-                        if isinstance(color, (list, tuple)) and len(color) > 0:
-                            color = color[0]
+                    color = _trace_color(fig.data[trace_idx])
+                    if color is not None:
                         cell_type_to_color[freq_col] = color
-                    elif hasattr(trace, 'line') and trace.line and hasattr(trace.line, 'color'):
-                        cell_type_to_color[freq_col] = trace.line.color
     
     num_cell_types = len(freq_cols)
     
@@ -528,46 +500,48 @@ def _add_cell_type_individual_points_overlay(fig: Figure, df: DataFrame, freq_co
     total_group_width = 0.8  # 1 - default bargap
     individual_bar_width = total_group_width / num_cell_types
     
-    # Add points for each cell type and group combination
+    points = df[df['Group'].notna()]
+    budget = point_budget(fig.layout.height or DEFAULT_HEIGHT, margin=MARGIN['t'] + MARGIN['b'])
+    # Numeric group labels are offset to their cell type's bar; anything else is placed on the category
+    numeric_groups = points['Group'].map(
+        lambda g: float(g) if isinstance(g, (int, float, str)) and str(g).replace('.', '').isdigit() else None
+    )
+    
+    # Points of every cell type and group combination in one trace
+    x_parts, y_parts, color_parts = [], [], []
     for freq_col in freq_cols:
-        cell_type_label = label_map.get(freq_col, freq_col)
+        if freq_col not in df.columns:
+            continue
         cell_type_index = cell_type_to_index.get(freq_col, freq_cols.index(freq_col))
         
-        # Get color for this cell type, fallback to black if not found
-        point_color = cell_type_to_color.get(freq_col, 'black')
-        
         # Calculate x offset for this cell type's bar position
         # Center the bars: first bar starts at -total_group_width/2 + individual_bar_width/2
         offset = -total_group_width/2 + individual_bar_width/2 + (cell_type_index * individual_bar_width)
         
-        for group in df['Group'].unique():
-            group_data = df[df['Group'] == group]
-            if group_data.empty or freq_col not in group_data.columns:
-                continue
-            
-            # Calculate x positions: group value + offset for this cell type
-            try:
-                # Convert group to numeric if possible for positioning
-                group_numeric = float(group) if isinstance(group, (int, float, str)) and str(group).replace('.', '').isdigit() else group
-                x_positions = [group_numeric + offset] * len(group_data)
-            except (ValueError, TypeError):
-                # Fallback: use group as-is (may not position correctly for non-numeric groups)
-                x_positions = [group] * len(group_data)
-            
-            fig.add_trace(go.Scatter(
-                x=x_positions,
-                y=group_data[freq_col],
-                mode='markers',
-                marker=dict(
-                    size=4,
-                    color=point_color,
-                    opacity=0.7,
-                    line=dict(width=1, color='black')
-                ),
-                showlegend=False,
-                hoverinfo='y',
-                name=f'Individual Points ({cell_type_label})'
-            ))
+        shown = downsample_frame(points, freq_col, by='Group', max_points=budget)
+        numeric = numeric_groups.loc[shown.index]
+        x_parts.append((numeric + offset).where(numeric.notna(), shown['Group']))
+        y_parts.append(shown[freq_col])
+        # Get color for this cell type, fallback to black if not found
+        color_parts.append([cell_type_to_color.get(freq_col, 'black')] * len(shown))
+    
+    if not x_parts:
+        return
+    
+    fig.add_trace(go.Scatter(
+        x=pd.concat(x_parts, ignore_index=True),
+        y=pd.concat(y_parts, ignore_index=True),
+        mode='markers',
+        marker=dict(
+            size=4,
+            color=[color for part in color_parts for color in part],
+            opacity=0.7,
+            line=dict(width=1, color='black')
+        ),
+        showlegend=False,
+        hoverinfo='y',
+        name='Individual Points'
+    ))
 
 
 # create_time_course_single_plot function has been moved to time_plots.py as part of the unified timecourse system
@@ -636,7 +610,7 @@ def create_basic_plot(df: DataFrame, x: str, y: str, plot_type: str, filter_opti
     if x == 'Group' and 'Group' in df.columns:
         fig = apply_group_tick_labels(fig, df, user_group_labels, width, height)
     
-    return fig
+    return apply_webgl_rendering(fig)
 
 
 # Export available functions
@@ -693,7 +667,7 @@ def create_timecourse_visualization(
         plot_type: Plot type ("line", "scatter", "area")
         aggregation: Data aggregation method ("mean_sem", "median_iqr", "raw")
         max_cell_types: Maximum number of cell types to include
-        sample_size: Sample size for large datasets
+        sample_size: Maximum raw points drawn per series (default: derived from the figure width)
         filter_options: Filtering options for data
         population_filter: Specific population to filter for (None for all populations)
         save_html: Optional path to save HTML file
@@ -710,6 +684,8 @@ def create_timecourse_visualization(
     # Pass display options to plot creation functions
     kwargs['show_individual_points'] = show_individual_points
     kwargs['error_bars'] = error_bars
+    # Statistics use the full data; only raw points are downsampled
+    kwargs['max_points'] = sample_size
     
     # Determine visualization strategy
     if len(value_cols) == 1:
@@ -723,6 +699,9 @@ def create_timecourse_visualization(
             aggregation, filter_options, **kwargs
         )
     
+    # Large figures render with WebGL so they stay interactive
+    fig = apply_webgl_rendering(fig)
+    
     # Save if requested
     if save_html:
         _save_timecourse_visualization(fig, save_html)
@@ -756,11 +735,6 @@ def _prepare_timecourse_data(
     # Handle metric selection and get value columns
     value_cols = _detect_value_columns(df, metric, max_cell_types)
     
-    # Apply sampling if needed
-    if sample_size and len(df) > sample_size:
-        df = df.sample(n=sample_size, random_state=42)
-        logger.info(f"Applied sampling: {sample_size} data points")
-    
     # Apply population filter if provided
     if population_filter:
         # Filter value columns to only include those matching the selected population
@@ -833,15 +807,13 @@ def _detect_group_column(df: DataFrame, group_by: Optional[str]) -> Optional[str
 
 def _detect_value_columns(df: DataFrame, metric: Optional[str], max_cell_types: int) -> list[str]:
     """Detect value columns for plotting."""
-    from .column_utils import detect_flow_columns, detect_available_metric_types, get_matching_columns_for_metric
+    catalog = get_column_catalog(df)
     
     if metric:
         # Check if metric is a metric type (like "Freq. of Parent") or a specific column
-        metric_types = detect_available_metric_types(df)
-        
-        if metric in metric_types:
+        if metric in catalog.metric_types:
             # Find all columns matching this metric type
-            matching_cols = get_matching_columns_for_metric(df, metric)
+            matching_cols = catalog.columns_for_metric(metric)
             if matching_cols:
                 # Limit to max_cell_types
                 return matching_cols[:max_cell_types]
@@ -853,22 +825,17 @@ def _detect_value_columns(df: DataFrame, metric: Optional[str], max_cell_types:
         else:
             logger.warning(f"Metric '{metric}' not found in data")
     
-    # Auto-detect flow cytometry columns
-    flow_cols = detect_flow_columns(df)
+    # Auto-detect flow cytometry columns, prioritizing frequency columns
+    for category in ('frequencies', 'medians', 'means'):
+        flow_cols = catalog.flow_columns(category)
+        if flow_cols:
+            return flow_cols[:max_cell_types]
     
-    # Prioritize frequency columns
-    if flow_cols['frequencies']:
-        return flow_cols['frequencies'][:max_cell_types]
-    elif flow_cols['medians']:
-        return flow_cols['medians'][:max_cell_types]
-    elif flow_cols['means']:
-        return flow_cols['means'][:max_cell_types]
-    else:
-        # Fallback to numeric columns (excluding time and group columns)
-        numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
-        # Filter out potential time/group columns
-        filtered_cols = [col for col in numeric_cols if not any(keyword in col.lower() for keyword in ['time', 'day', 'hour', 'group', 'sample'])]
-        return filtered_cols[:max_cell_types]
+    # Fallback to numeric columns (excluding time and group columns)
+    numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+    # Filter out potential time/group columns
+    filtered_cols = [col for col in numeric_cols if not any(keyword in col.lower() for keyword in ['time', 'day', 'hour', 'group', 'sample'])]
+    return filtered_cols[:max_cell_types]
 
 
 def _create_single_timecourse(
@@ -885,6 +852,7 @@ def _create_single_timecourse(
     # Extract display options (can be enabled independently)
     show_individual_points = kwargs.pop('show_individual_points', False)
     error_bars = kwargs.pop('error_bars', True)
+    max_points = kwargs.pop('max_points', None) or point_budget(kwargs.get('width'))
     
     # Debug logging
     logger.info(f"Creating single metric timecourse for column: {value_col}")
@@ -906,7 +874,7 @@ def _create_single_timecourse(
         logger.info(f"Aggregated data shape: {plot_df.shape}")
         logger.info(f"Aggregated data columns: {list(plot_df.columns)}")
     else:
-        plot_df = df
+        plot_df = downsample_frame(df, value_col, x=time_col, by=group_col, max_points=max_points, method='lttb')
         y_col = value_col
         error_y = None
         logger.info(f"Using raw data, shape: {plot_df.shape}")
@@ -996,6 +964,7 @@ def _create_overlay_timecourse(
     # Extract display options (can be enabled independently)
     show_individual_points = kwargs.pop('show_individual_points', False)
     error_bars = kwargs.pop('error_bars', True)
+    max_points = kwargs.pop('max_points', None) or point_budget(kwargs.get('width'))
     
     fig = go.Figure()
     
@@ -1019,8 +988,14 @@ def _create_overlay_timecourse(
         y_col = None
         error_y = None
     
-    # Add traces for each metric
-    for value_col in value_cols:
+    # Add traces for each metric, or one per group when that would be too many traces
+    n_groups = plot_df[group_col].nunique() if group_col and group_col in plot_df.columns else 0
+    consolidate = plot_type == "line" and n_groups and needs_webgl(0, n_groups * len(value_cols))
+    if consolidate:
+        add_consolidated_overlay_traces(fig, plot_df, time_col, value_cols, group_col, y_col, error_y,
+                                        max_points=max_points)
+    
+    for value_col in ([] if consolidate else value_cols):
         if plot_type == "line":
             if group_col and group_col in plot_df.columns:
                 # Get data for this specific value column
@@ -1028,8 +1003,9 @@ def _create_overlay_timecourse(
                     # Using aggregated data
                     col_data = plot_df[plot_df['value_col'] == value_col]
                 else:
-                    # Using raw data
-                    col_data = plot_df
+                    # Using raw data, one line per group
+                    col_data = downsample_frame(plot_df, value_col, x=time_col, by=group_col,
+                                                max_points=max_points, method='lttb')
                 
                 for group in col_data[group_col].unique():
                     group_data = col_data[col_data[group_col] == group]
@@ -1062,7 +1038,7 @@ def _create_overlay_timecourse(
                     col_data = plot_df[plot_df['value_col'] == value_col]
                 else:
                     # Using raw data
-                    col_data = plot_df
+                    col_data = downsample_frame(plot_df, value_col, x=time_col, max_points=max_points, method='lttb')
                 
                 # Add error bars if available
                 error_y_data = None
@@ -7,7 +7,9 @@ from typing import List, Union, Optional, Dict, Any
 import pandas as pd
 import numpy as np
 
-from .plot_config import TIME_THRESHOLDS, DEFAULT_WIDTH, DEFAULT_HEIGHT, MARGIN
+from .plot_config import (
+    TIME_THRESHOLDS, DEFAULT_WIDTH, DEFAULT_HEIGHT, MARGIN, WEBGL_POINT_THRESHOLD, WEBGL_TRACE_THRESHOLD
+)
 
 logger = logging.getLogger(__name__)
 
@@ -394,6 +396,120 @@ def apply_common_layout(
     return fig
 
 
+def needs_webgl(n_points: int, n_traces: int,
+                point_threshold: int = WEBGL_POINT_THRESHOLD,
+                trace_threshold: int = WEBGL_TRACE_THRESHOLD) -> bool:
+    """Whether a figure of this size should be rendered with WebGL scatter traces."""
+    return n_points > point_threshold or n_traces > trace_threshold
+
+
+def apply_webgl_rendering(
+    fig,
+    point_threshold: int = WEBGL_POINT_THRESHOLD,
+    trace_threshold: int = WEBGL_TRACE_THRESHOLD
+):
+    """
+    Switch scatter/line traces to Scattergl when the figure is large.
+
+    Properties Scattergl does not support (e.g. spline line shapes) are
+    dropped; everything else, including error bars, carries over.
+
+    Args:
+        fig: Plotly Figure
+        point_threshold: Total scatter points above which WebGL is used
+        trace_threshold: Scatter trace count above which WebGL is used
+
+    Returns:
+        The figure, with its scatter traces replaced if it was large
+    """
+    import plotly.graph_objects as go
+
+    scatter_traces = [trace for trace in fig.data if isinstance(trace, go.Scatter)]
+    n_points = sum(len(trace.y) if trace.y is not None else 0 for trace in scatter_traces)
+    if not needs_webgl(n_points, len(scatter_traces), point_threshold, trace_threshold):
+        return fig
+
+    traces = []
+    for trace in fig.data:
+        if isinstance(trace, go.Scatter):
+            spec = trace.to_plotly_json()
+            spec.pop('type', None)
+            trace = go.Scattergl(spec, skip_invalid=True)
+        traces.append(trace)
+    fig.data = ()
+    fig.add_traces(traces)
+    logger.debug("Rendering %d scatter traces (%d points) with WebGL", len(scatter_traces), n_points)
+    return fig
+
+
+def add_consolidated_overlay_traces(
+    fig,
+    plot_df: DataFrame,
+    time_col: str,
+    value_cols: List[str],
+    group_col: str,
+    y_col: Optional[str],
+    error_y: Optional[str],
+    max_points: Optional[int] = None
+) -> None:
+    """
+    Add one line trace per group covering every metric.
+
+    Each metric is a separate segment of the group's line, broken by a gap
+    and marked with its own marker color; hover text names the metric.
+    Raw (unaggregated) segments are downsampled to max_points with LTTB.
+    """
+    import plotly.graph_objects as go
+    from plotly.colors import qualitative
+    from .column_utils import create_population_shortname
+    from .downsampling import downsample_frame
+
+    if 'value_col' in plot_df.columns:
+        # Aggregated data is already long: one row per group, metric and time
+        long_df = plot_df.rename(columns={y_col: '_value'})
+    else:
+        long_df = plot_df.melt(
+            id_vars=[time_col, group_col], value_vars=value_cols,
+            var_name='value_col', value_name='_value'
+        )
+        long_df = downsample_frame(long_df, '_value', x=time_col, by=[group_col, 'value_col'],
+                                   max_points=max_points, method='lttb')
+    long_df = long_df[long_df['value_col'].isin(value_cols)]
+    order = {value_col: i for i, value_col in enumerate(value_cols)}
+    long_df = long_df.assign(_order=long_df['value_col'].map(order)).sort_values(
+        ['_order', time_col], kind='stable'
+    )
+
+    palette = qualitative.Dark24
+    metric_colors = {value_col: palette[i % len(palette)] for i, value_col in enumerate(value_cols)}
+    shortnames = {value_col: create_population_shortname(value_col) for value_col in value_cols}
+
+    for group, group_data in long_df.groupby(group_col, sort=False):
+        # Break the line where the metric changes
+        metric = group_data['value_col'].to_numpy()
+        breaks = np.flatnonzero(metric[1:] != metric[:-1]) + 1
+
+        def with_gaps(values, gap=None):
+            return np.insert(np.asarray(values, dtype=object), breaks, gap).tolist()
+
+        error_y_data = None
+        if error_y and error_y in group_data.columns:
+            error_y_data = dict(type='data', array=with_gaps(group_data[error_y]), visible=True)
+
+        fig.add_trace(go.Scatter(
+            x=with_gaps(group_data[time_col]),
+            y=with_gaps(group_data['_value']),
+            name=f"Group {group}",
+            legendgroup=f"Group {group}",
+            mode='lines+markers',
+            line=dict(width=2),
+            marker=dict(size=6, color=with_gaps(group_data['value_col'].map(metric_colors), 'black')),
+            hovertext=with_gaps(group_data['value_col'].map(shortnames), ''),
+            hovertemplate='%{hovertext}<br>%{x}: %{y}<extra>%{fullData.name}</extra>',
+            error_y=error_y_data
+        ))
+
+
 def apply_group_tick_labels(
     fig,
     df: DataFrame,
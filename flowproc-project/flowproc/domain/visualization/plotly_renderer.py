@@ -14,15 +14,19 @@ logger = logging.getLogger(__name__)
 
 # Import browser manager for caching
 from .browser_manager import browser_manager
+from .static_renderer import UnsupportedGlyphError, write_static_image
 
 class PlotlyRenderer:
-    """Renderer for Plotly figures with Selenium-based image export."""
+    """
+    Renderer for Plotly figures.
+
+    SVG and PDF are drawn natively by static_renderer; PNG export (and the
+    'selenium' engine for SVG/PDF) uses a cached browser, started on first use.
+    """
     
     def __init__(self):
         """Initialize the renderer."""
         self._setup_plotly_config()
-        # Pre-initialize browser for better performance
-        self._preinitialize_browser()
     
     def _preinitialize_browser(self):
         """Pre-initialize browser in background to avoid delays on first export."""
@@ -576,16 +580,17 @@ class PlotlyRenderer:
             return ""
     
     def export_to_image(self, fig: go.Figure, filepath: str, 
-                       format: str = 'png', width: int = 800, height: int = 600) -> None:
-        """Export figure to image file using Selenium."""
+                       format: str = 'png', width: int = 800, height: int = 600,
+                       engine: str = 'native') -> None:
+        """Export figure to image file (PNG via Selenium, SVG/PDF natively by default)."""
         format = format.lower()
         
         if format == 'png':
             self.export_to_png_selenium(fig, filepath, width, height)
         elif format == 'svg':
-            self.export_to_svg_selenium(fig, filepath, width, height)
+            self.export_to_svg(fig, filepath, width, height, engine=engine)
         elif format == 'pdf':
-            self.export_to_pdf_selenium(fig, filepath, width, height)
+            self.export_to_pdf(fig, filepath, width, height, engine=engine)
         else:
             raise ValueError(f"Unsupported format: {format}. Supported formats: png, svg, pdf")
     
@@ -677,12 +682,24 @@ class PlotlyRenderer:
         return capabilities
 
     def export_to_pdf(self, fig: go.Figure, filepath: str, 
-                     width: int = 1800, height: int = 600, scale: int = 1) -> None:
+                     width: int = 1800, height: int = 600, scale: int = 1,
+                     engine: str = 'native') -> None:
         """
-        Export figure to PDF format using Selenium-based browser export.
+        Export figure to PDF format.
         
-        This method provides direct control over the browser process for reliable PDF generation.
+        The native engine draws the figure directly, without a browser. The
+        'selenium' engine prints it from a browser, for figures using features
+        the native renderer does not draw; it is also used when labels contain
+        characters the native engine's standard PDF fonts cannot show.
         """
+        if engine == 'native':
+            try:
+                write_static_image(fig, filepath, 'pdf', width, height)
+                logger.info(f"PDF export successful: {filepath}")
+                return
+            except UnsupportedGlyphError as e:
+                logger.warning(f"{e}; exporting the PDF from a browser instead")
+        
         # Check capabilities first
         capabilities = self.check_pdf_capabilities()
         
@@ -701,8 +718,12 @@ class PlotlyRenderer:
         self.export_to_pdf_selenium(fig, filepath, width, height, scale)
     
     def export_to_svg(self, fig: go.Figure, filepath: str, 
-                     width: int = 800, height: int = 600) -> None:
-        """Export figure to SVG format using Selenium."""
+                     width: int = 800, height: int = 600, engine: str = 'native') -> None:
+        """Export figure to SVG format, natively or (engine='selenium') from a browser."""
+        if engine == 'native':
+            write_static_image(fig, filepath, 'svg', width, height)
+            logger.info(f"SVG export successful: {filepath}")
+            return
         self.export_to_svg_selenium(fig, filepath, width, height)
     
     def get_figure_info(self, fig: go.Figure) -> Dict[str, Any]:
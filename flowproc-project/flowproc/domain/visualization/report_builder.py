@@ -0,0 +1,268 @@
+"""
+Study reports: many figures in one HTML document or one paginated PDF.
+
+Writing one HTML file per plot embeds plotly.js (several MB) in every file
+and leaves the reviewer opening files one by one. A StudyReport instead
+writes a single document that:
+
+- embeds plotly.js, and each distinct layout template, once
+- stores every figure as JSON and only draws it when it scrolls into view,
+  so opening a report with hundreds of figures stays fast
+- groups figures into sections (e.g. per tissue or timepoint) with a
+  table of contents
+
+Figures can be built concurrently with add_figures; each worker also
+serializes its figure, using plotly's JSON engine (orjson when installed).
+The PDF variant renders each figure natively on its own page.
+"""
+
+import html
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import plotly.graph_objects as go
+from plotly.io.json import to_json_plotly
+from plotly.offline import get_plotlyjs
+from plotly.offline.offline import get_plotlyjs_version
+
+from .static_renderer import figures_to_pdf
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 4
+# Start drawing a figure this far before it scrolls into view
+LAZY_RENDER_MARGIN = '300px'
+
+_LAZY_RENDER_JS = """
+(function () {
+  function render(el) {
+    var spec = JSON.parse(document.getElementById(el.dataset.figure).textContent);
+    var layout = spec.layout || {};
+    if (el.dataset.template) {
+      layout.template = JSON.parse(document.getElementById(el.dataset.template).textContent);
+    }
+    Plotly.newPlot(el, spec.data, layout, {responsive: true, displaylogo: false});
+  }
+  var figures = document.querySelectorAll('.report-figure');
+  if (!('IntersectionObserver' in window)) {
+    figures.forEach(render);
+    return;
+  }
+  var observer = new IntersectionObserver(function (entries) {
+    entries.forEach(function (entry) {
+      if (entry.isIntersecting) {
+        observer.unobserve(entry.target);
+        render(entry.target);
+      }
+    });
+  }, {rootMargin: '%(margin)s 0px'});
+  figures.forEach(function (el) { observer.observe(el); });
+})();
+"""
+
+_STYLE = """
+body { font-family: "Open Sans", verdana, arial, sans-serif; color: #2a3f5f; margin: 0 auto; max-width: 1300px; padding: 0 24px; }
+nav ul { columns: 2; }
+.report-figure { margin: 8px 0 32px; }
+h2 { border-bottom: 1px solid #EBF0F8; padding-bottom: 4px; }
+"""
+
+
+@dataclass
+class ReportFigure:
+    """One figure of a report and its serialized form."""
+    title: str
+    figure: go.Figure
+    section: str = ''
+    # Figure JSON without its template, and the template JSON (filled lazily)
+    figure_json: Optional[str] = field(default=None, repr=False)
+    template_json: Optional[str] = field(default=None, repr=False)
+
+    def serialize(self) -> Tuple[str, Optional[str]]:
+        """Serialize the figure, splitting off its template so it can be shared."""
+        if self.figure_json is None:
+            spec = self.figure.to_plotly_json()
+            layout = dict(spec.get('layout') or {})
+            template = layout.pop('template', None)
+            self.figure_json = to_json_plotly({'data': spec.get('data', []), 'layout': layout})
+            self.template_json = to_json_plotly(template) if template else None
+        return self.figure_json, self.template_json
+
+    @property
+    def height(self) -> int:
+        return int(self.figure.layout.height or 450)
+
+
+# A figure to build: (title, section, zero-argument function returning the figure)
+FigureSpec = Tuple[str, str, Callable[[], go.Figure]]
+
+
+class StudyReport:
+    """Collects figures and writes them as one HTML or PDF report."""
+
+    def __init__(self, title: str = 'Study Report'):
+        """
+        Initialize an empty report.
+
+        Args:
+            title: Report title, used as the document heading
+        """
+        self.title = title
+        self.figures: List[ReportFigure] = []
+
+    def add_figure(self, figure: go.Figure, title: Optional[str] = None, section: str = '') -> ReportFigure:
+        """
+        Add a figure that has already been created.
+
+        Args:
+            figure: Plotly figure
+            title: Entry in the table of contents; defaults to the figure title
+            section: Section heading the figure is listed under
+
+        Returns:
+            The report entry
+        """
+        if title is None:
+            title = figure.layout.title.text or f"Figure {len(self.figures) + 1}"
+        entry = ReportFigure(title=title, figure=figure, section=section)
+        self.figures.append(entry)
+        return entry
+
+    def add_figures(self, specs: Sequence[FigureSpec], max_workers: Optional[int] = None) -> List[str]:
+        """
+        Build and serialize figures concurrently, keeping their order.
+
+        A spec that fails is left out of the report; its error is logged
+        and returned.
+
+        Args:
+            specs: (title, section, build function) for each figure
+            max_workers: Worker threads; defaults to DEFAULT_MAX_WORKERS
+
+        Returns:
+            Error messages of the specs that failed
+        """
+        def build(spec: FigureSpec) -> ReportFigure:
+            title, section, create = spec
+            entry = ReportFigure(title=title, figure=create(), section=section)
+            entry.serialize()
+            return entry
+
+        workers = max(1, min(max_workers or DEFAULT_MAX_WORKERS, len(specs) or 1, os.cpu_count() or 1))
+        errors: List[str] = []
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='report') as executor:
+            futures = [executor.submit(build, spec) for spec in specs]
+            for spec, future in zip(specs, futures):
+                try:
+                    self.figures.append(future.result())
+                except Exception as e:
+                    error_msg = f"Failed to create figure '{spec[0]}': {e}"
+                    logger.error(error_msg)
+                    errors.append(error_msg)
+        logger.info(f"Built {len(specs) - len(errors)} of {len(specs)} report figures with {workers} workers")
+        return errors
+
+    def _sections(self) -> Dict[str, List[Tuple[int, ReportFigure]]]:
+        """Figures grouped by section, in order of first appearance."""
+        sections: Dict[str, List[Tuple[int, ReportFigure]]] = {}
+        for index, entry in enumerate(self.figures):
+            sections.setdefault(entry.section, []).append((index, entry))
+        return sections
+
+    def to_html(self, include_plotlyjs: Union[bool, str] = True) -> str:
+        """
+        Render the report as a single HTML document.
+
+        Args:
+            include_plotlyjs: True to embed plotly.js (works offline),
+                'cdn' to load it from the plotly CDN, False to leave it out
+
+        Returns:
+            HTML document
+        """
+        if include_plotlyjs == 'cdn':
+            plotly_script = f'<script src="https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js"></script>'
+        elif include_plotlyjs:
+            plotly_script = f'<script type="text/javascript">{get_plotlyjs()}</script>'
+        else:
+            plotly_script = ''
+
+        templates: Dict[str, str] = {}
+        toc: List[str] = []
+        body: List[str] = []
+        for section_index, (section, entries) in enumerate(self._sections().items()):
+            if section:
+                body.append(f'<h2 id="section-{section_index}">{html.escape(section)}</h2>')
+                toc.append(f'<li><a href="#section-{section_index}">{html.escape(section)}</a></li>')
+            for index, entry in entries:
+                figure_json, template_json = entry.serialize()
+                template_attr = ''
+                if template_json is not None:
+                    template_id = templates.setdefault(template_json, f'template-{len(templates)}')
+                    template_attr = f' data-template="{template_id}"'
+                body.append(
+                    f'<div class="report-figure" id="figure-{index}" data-figure="figure-{index}-json"'
+                    f'{template_attr} style="height: {entry.height}px"'
+                    f' aria-label="{html.escape(entry.title)}"></div>'
+                    f'<script type="application/json" id="figure-{index}-json">{_script_safe(figure_json)}</script>'
+                )
+        shared = ''.join(
+            f'<script type="application/json" id="{template_id}">{_script_safe(template_json)}</script>'
+            for template_json, template_id in templates.items()
+        )
+        nav = f'<nav><ul>{"".join(toc)}</ul></nav>' if len(toc) > 1 else ''
+        return (
+            '<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n'
+            f'<title>{html.escape(self.title)}</title>\n<style>{_STYLE}</style>\n{plotly_script}\n</head>\n'
+            f'<body>\n<h1>{html.escape(self.title)}</h1>\n{nav}\n{shared}\n' + '\n'.join(body)
+            + f'\n<script type="text/javascript">{_LAZY_RENDER_JS % {"margin": LAZY_RENDER_MARGIN}}</script>\n'
+            '</body>\n</html>\n'
+        )
+
+    def write_html(self, filepath: Union[str, Path], include_plotlyjs: Union[bool, str] = True) -> None:
+        """Write the report as a single HTML file (see to_html)."""
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(self.to_html(include_plotlyjs))
+        logger.info(f"HTML report written: {filepath} ({len(self.figures)} figures)")
+
+    def to_pdf(self, width: Optional[int] = None, height: Optional[int] = None) -> bytes:
+        """
+        Render the report as a PDF with one page per figure.
+
+        Each page is headed with the report title, section and figure title.
+
+        Args:
+            width: Width for every figure; defaults to each figure's layout width
+            height: Height for every figure; defaults to each figure's layout height
+
+        Returns:
+            PDF document as bytes
+        """
+        headers = [' - '.join(part for part in (self.title, entry.section, entry.title) if part)
+                   for entry in self.figures]
+        return figures_to_pdf([entry.figure for entry in self.figures], headers, width, height)
+
+    def write_pdf(self, filepath: Union[str, Path], width: Optional[int] = None,
+                  height: Optional[int] = None) -> None:
+        """Write the report as a paginated PDF file (see to_pdf)."""
+        # Render before opening the file so a failed render leaves no empty file
+        pdf = self.to_pdf(width, height)
+        with open(filepath, 'wb') as f:
+            f.write(pdf)
+        logger.info(f"PDF report written: {filepath} ({len(self.figures)} pages)")
+
+
+def _script_safe(text: str) -> str:
+    """Escape JSON for embedding in a <script> element."""
+    return text.replace('</', '<\\/')
+
+
+__all__ = [
+    'ReportFigure',
+    'FigureSpec',
+    'StudyReport',
+]
@@ -0,0 +1,1358 @@
+"""
+Browser-free SVG and PDF rendering of Plotly figures.
+
+Draws the figure dict produced by ``plot`` and ``create_timecourse_visualization``
+directly to SVG markup or a single-page PDF, so static export needs neither
+Selenium nor a browser and takes milliseconds per figure.
+
+Covered: bar traces (grouped, stacked/relative, overlay) with error bars,
+scatter/scattergl lines and markers (per-point colors, gaps, error bars),
+box and histogram traces, axis titles and tick labels, legends, titles and
+annotations. Only the primary x/y axes are drawn; other trace types are
+skipped with a warning.
+
+PDF text uses the standard Helvetica fonts, with Greek letters and common
+math symbols (γδ, ≥, →) drawn in the standard Symbol font. Text with other
+characters raises UnsupportedGlyphError rather than printing "?".
+"""
+
+import base64
+import html
+import logging
+import math
+import re
+import zlib
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+Color = Tuple[float, float, float, float]
+
+# Plotly defaults, used when neither the figure nor its template sets a value
+DEFAULT_SIZE = (700, 500)
+DEFAULT_MARGIN = {'l': 80, 'r': 80, 't': 100, 'b': 80}
+DEFAULT_COLORWAY = [
+    '#636efa', '#EF553B', '#00cc96', '#ab63fa', '#FFA15A',
+    '#19d3f3', '#FF6692', '#B6E880', '#FF97FF', '#FECB52',
+]
+DEFAULT_FONT_COLOR = '#444'
+DEFAULT_FONT_SIZE = 12
+SVG_FONT_FAMILY = '"Open Sans", verdana, arial, sans-serif'
+BAR_GAP = 0.2
+BOX_GAP = 0.3
+AXIS_PAD = 0.05
+TICK_LABEL_PAD = 6
+LEGEND_SYMBOL_WIDTH = 40
+PDF_HEADER_HEIGHT = 28
+MAX_MARGIN_FRACTION = 0.8
+
+SUPPORTED_TRACE_TYPES = ('bar', 'scatter', 'scattergl', 'box', 'histogram')
+
+# Helvetica advance widths (1/1000 em) for printable ASCII, from the Adobe AFM
+_HELVETICA_WIDTHS = dict(zip(
+    (chr(c) for c in range(32, 127)),
+    [278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+     556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+     1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+     667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+     333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+     556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584],
+))
+
+# Symbol font code and advance width (1/1000 em) of characters missing from
+# WinAnsiEncoding (Greek letters and math symbols), from the Adobe AFM
+_SYMBOL_GLYPHS = {
+    **{ch: (ord(code), width) for ch, code, width in zip(
+        'ΑΒΧΔΕΦΓΗΙϑΚΛΜΝΟΠΘΡΣΤΥςΩΞΨΖαβχδεφγηιϕκλμνοπθρστυϖωξψζ',
+        'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz',
+        [722, 667, 722, 612, 611, 763, 603, 722, 333, 631, 722, 686, 889, 722, 722, 768, 741,
+         556, 592, 611, 690, 439, 768, 645, 795, 611,
+         631, 549, 549, 494, 439, 521, 411, 603, 329, 603, 549, 549, 576, 521, 549, 549, 521,
+         549, 603, 439, 576, 713, 686, 493, 686, 494],
+    )},
+    '∆': (0x44, 612), 'Ω': (0x57, 768), '−': (0x2D, 549), '′': (0xA2, 247), '″': (0xB2, 411),
+    '≤': (0xA3, 549), '≥': (0xB3, 549), '≠': (0xB9, 549), '≈': (0xBB, 549), '∞': (0xA5, 713),
+    '↔': (0xAB, 1042), '←': (0xAC, 987), '↑': (0xAD, 603), '→': (0xAE, 987), '↓': (0xAF, 603),
+    '÷': (0xB8, 549), '∂': (0xB6, 494), '√': (0xD6, 549), '∑': (0xE5, 713), '∈': (0xCE, 713),
+}
+
+_NAMED_COLORS = {
+    'black': (0, 0, 0), 'white': (255, 255, 255), 'gray': (128, 128, 128),
+    'grey': (128, 128, 128), 'lightgray': (211, 211, 211), 'lightgrey': (211, 211, 211),
+    'darkgray': (169, 169, 169), 'darkgrey': (169, 169, 169), 'red': (255, 0, 0),
+    'green': (0, 128, 0), 'blue': (0, 0, 255), 'orange': (255, 165, 0),
+    'purple': (128, 0, 128), 'yellow': (255, 255, 0), 'navy': (0, 0, 128),
+    'teal': (0, 128, 128), 'brown': (165, 42, 42), 'pink': (255, 192, 203),
+    'cyan': (0, 255, 255), 'magenta': (255, 0, 255),
+}
+
+_BR_RE = re.compile(r'<br\s*/?>', re.IGNORECASE)
+_TAG_RE = re.compile(r'<[^>]+>')
+_RGB_RE = re.compile(r'rgba?\(([^)]*)\)', re.IGNORECASE)
+
+
+# --------------------------------------------------------------------------
+# Value helpers
+# --------------------------------------------------------------------------
+
+def _lookup(mapping: Optional[Dict[str, Any]], path: str, default: Any = None) -> Any:
+    """Get a nested value by dotted path, e.g. 'xaxis.title.text'."""
+    value: Any = mapping
+    for key in path.split('.'):
+        if not isinstance(value, dict) or key not in value:
+            return default
+        value = value[key]
+    return default if value is None else value
+
+
+def _merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+    """Recursively merge override into a copy of base."""
+    merged = dict(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict) and 'bdata' not in value:
+            merged[key] = _merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def _values(value: Any) -> Optional[np.ndarray]:
+    """Decode a trace array: a list, an ndarray or Plotly's base64 'bdata' encoding."""
+    if value is None:
+        return None
+    if isinstance(value, dict) and 'bdata' in value:
+        array = np.frombuffer(base64.b64decode(value['bdata']), dtype=np.dtype(value['dtype']))
+        if 'shape' in value:
+            array = array.reshape([int(s) for s in str(value['shape']).split(',')])
+        return array
+    if isinstance(value, (str, bytes)) or np.isscalar(value):
+        return None
+    return np.asarray(list(value), dtype=object) if not isinstance(value, np.ndarray) else value
+
+
+def _numeric(values: Optional[np.ndarray]) -> np.ndarray:
+    """Convert values to floats; anything non-numeric becomes NaN."""
+    if values is None:
+        return np.array([], dtype=float)
+    if values.dtype.kind in 'iufb':
+        return values.astype(float)
+    return pd.to_numeric(pd.Series(values), errors='coerce').to_numpy(dtype=float)
+
+
+def _is_numeric(values: np.ndarray) -> bool:
+    """Whether every present value is a number."""
+    if values.dtype.kind in 'iufb':
+        return True
+    present = pd.Series(values).dropna()
+    return bool(present.map(lambda v: isinstance(v, (int, float, np.number)) and not isinstance(v, bool)).all())
+
+
+def _text_lines(text: Any) -> List[str]:
+    """Split Plotly rich text on <br> and strip the remaining tags."""
+    if text is None or text == '':
+        return []
+    lines = _BR_RE.split(str(text))
+    return [html.unescape(_TAG_RE.sub('', line)) for line in lines]
+
+
+def _text_width(text: str, size: float) -> float:
+    """Approximate width of a line of text in Helvetica (and Symbol)."""
+    return size * sum(
+        _HELVETICA_WIDTHS.get(ch) or (_SYMBOL_GLYPHS[ch][1] if ch in _SYMBOL_GLYPHS else 556)
+        for ch in text
+    ) / 1000.0
+
+
+def _parse_color(color: Any) -> Optional[Color]:
+    """Parse a CSS/Plotly color string to RGBA floats in [0, 1]."""
+    if not isinstance(color, str):
+        return None
+    color = color.strip().lower()
+    if color in ('', 'none', 'transparent'):
+        return (0.0, 0.0, 0.0, 0.0)
+    if color.startswith('#'):
+        digits = color[1:]
+        if len(digits) in (3, 4):
+            digits = ''.join(ch * 2 for ch in digits)
+        try:
+            channels = [int(digits[i:i + 2], 16) / 255.0 for i in range(0, len(digits), 2)]
+        except ValueError:
+            return None
+        if len(channels) == 3:
+            channels.append(1.0)
+        return tuple(channels) if len(channels) == 4 else None
+    match = _RGB_RE.fullmatch(color)
+    if match:
+        parts = [p.strip() for p in match.group(1).split(',')]
+        try:
+            rgb = [float(p.rstrip('%')) * (2.55 if p.endswith('%') else 1) / 255.0 for p in parts[:3]]
+            alpha = float(parts[3]) if len(parts) > 3 else 1.0
+        except (ValueError, IndexError):
+            return None
+        return (*rgb, alpha)
+    if color in _NAMED_COLORS:
+        return (*(c / 255.0 for c in _NAMED_COLORS[color]), 1.0)
+    return None
+
+
+def _format_number(value: float, step: float, magnitude: float) -> str:
+    """Format a tick value with the precision its tick step needs (10000 -> '10k')."""
+    if abs(value) < step * 1e-9:
+        return '0'
+    scale, suffix = next(((s, x) for s, x in ((1e9, 'G'), (1e6, 'M'), (1e3, 'k')) if magnitude >= s * 10), (1.0, ''))
+    scaled_step = step / scale
+    decimals = max(0, -int(math.floor(math.log10(scaled_step) + 1e-9))) if scaled_step > 0 else 0
+    text = f"{value / scale:.{decimals}f}"
+    if '.' in text:
+        text = text.rstrip('0').rstrip('.')
+    return text + suffix
+
+
+def _nice_ticks(lo: float, hi: float, target: int) -> Tuple[np.ndarray, float]:
+    """Round tick positions covering [lo, hi], about target of them."""
+    span = hi - lo
+    if not np.isfinite(span) or span <= 0:
+        return np.array([lo]), 1.0
+    raw = span / max(target, 1)
+    magnitude = 10 ** math.floor(math.log10(raw))
+    step = next(m * magnitude for m in (1, 2, 5, 10) if m * magnitude >= raw)
+    first = math.ceil(lo / step - 1e-9) * step
+    return np.arange(first, hi + step * 1e-9, step), step
+
+
+# --------------------------------------------------------------------------
+# Canvases
+# --------------------------------------------------------------------------
+
+def _num(value: float) -> str:
+    """Compact number formatting for SVG/PDF output."""
+    text = f"{value:.2f}".rstrip('0').rstrip('.')
+    return '0' if text == '-0' else text
+
+
+class _SvgCanvas:
+    """Collects drawing operations as SVG elements."""
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self._parts: List[str] = []
+        self._clip_count = 0
+
+    @staticmethod
+    def _paint(attr: str, color: Any, opacity: float = 1.0) -> str:
+        rgba = _parse_color(color)
+        if rgba is None:
+            return f' {attr}="{html.escape(str(color))}"' if color else f' {attr}="none"'
+        alpha = rgba[3] * opacity
+        if alpha <= 0:
+            return f' {attr}="none"'
+        rgb = ','.join(str(int(round(c * 255))) for c in rgba[:3])
+        text = f' {attr}="rgb({rgb})"'
+        if alpha < 1:
+            text += f' {attr}-opacity="{_num(alpha)}"'
+        return text
+
+    def rect(self, x: float, y: float, w: float, h: float, fill: Any = None,
+             stroke: Any = None, stroke_width: float = 1.0, opacity: float = 1.0) -> None:
+        stroke_attrs = (self._paint('stroke', stroke, opacity) + f' stroke-width="{_num(stroke_width)}"'
+                        if stroke and stroke_width > 0 else '')
+        self._parts.append(
+            f'<rect x="{_num(x)}" y="{_num(y)}" width="{_num(w)}" height="{_num(h)}"'
+            f'{self._paint("fill", fill, opacity)}{stroke_attrs}/>'
+        )
+
+    def polyline(self, points: Sequence[Tuple[float, float]], stroke: Any,
+                 width: float = 1.0, opacity: float = 1.0) -> None:
+        if len(points) < 2:
+            return
+        coords = ' '.join(f"{_num(x)},{_num(y)}" for x, y in points)
+        self._parts.append(
+            f'<polyline points="{coords}" fill="none"{self._paint("stroke", stroke, opacity)}'
+            f' stroke-width="{_num(width)}" stroke-linejoin="round" stroke-linecap="round"/>'
+        )
+
+    def circle(self, cx: float, cy: float, r: float, fill: Any, stroke: Any = None,
+               stroke_width: float = 0.0, opacity: float = 1.0) -> None:
+        stroke_attrs = (self._paint('stroke', stroke, opacity) + f' stroke-width="{_num(stroke_width)}"'
+                        if stroke and stroke_width > 0 else '')
+        self._parts.append(
+            f'<circle cx="{_num(cx)}" cy="{_num(cy)}" r="{_num(r)}"'
+            f'{self._paint("fill", fill, opacity)}{stroke_attrs}/>'
+        )
+
+    def text(self, x: float, y: float, text: str, size: float, color: Any,
+             anchor: str = 'start', angle: float = 0.0, bold: bool = False) -> None:
+        transform = f' transform="rotate({_num(angle)},{_num(x)},{_num(y)})"' if angle else ''
+        weight = ' font-weight="bold"' if bold else ''
+        self._parts.append(
+            f'<text x="{_num(x)}" y="{_num(y)}" font-size="{_num(size)}"{weight}'
+            f' text-anchor="{anchor}"{self._paint("fill", color)}{transform}'
+            f' style="white-space: pre">{html.escape(text)}</text>'
+        )
+
+    def begin_clip(self, x: float, y: float, w: float, h: float) -> None:
+        self._clip_count += 1
+        clip_id = f"clip{self._clip_count}"
+        self._parts.append(
+            f'<defs><clipPath id="{clip_id}"><rect x="{_num(x)}" y="{_num(y)}"'
+            f' width="{_num(w)}" height="{_num(h)}"/></clipPath></defs><g clip-path="url(#{clip_id})">'
+        )
+
+    def end_clip(self) -> None:
+        self._parts.append('</g>')
+
+    def finish(self) -> str:
+        return (
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{self.width}" height="{self.height}"'
+            f' viewBox="0 0 {self.width} {self.height}" font-family=\'{SVG_FONT_FAMILY}\'>\n'
+            + '\n'.join(self._parts) + '\n</svg>\n'
+        )
+
+
+class UnsupportedGlyphError(ValueError):
+    """Raised when PDF text contains characters the standard fonts cannot show."""
+
+
+def _pdf_runs(text: str) -> List[Tuple[bool, bytes]]:
+    """
+    Split text into runs encoded for Helvetica (WinAnsi) or the Symbol font.
+
+    Returns:
+        (is_symbol, encoded bytes) per run
+
+    Raises:
+        UnsupportedGlyphError: If a character is in neither encoding
+    """
+    try:
+        return [(False, text.encode('cp1252'))]
+    except UnicodeEncodeError:
+        pass
+    runs: List[Tuple[bool, bytearray]] = []
+    missing = []
+    for ch in text:
+        try:
+            symbol, code = False, ch.encode('cp1252')
+        except UnicodeEncodeError:
+            if ch not in _SYMBOL_GLYPHS:
+                missing.append(ch)
+                continue
+            symbol, code = True, bytes([_SYMBOL_GLYPHS[ch][0]])
+        if runs and runs[-1][0] == symbol:
+            runs[-1][1].extend(code)
+        else:
+            runs.append((symbol, bytearray(code)))
+    if missing:
+        raise UnsupportedGlyphError(
+            f"Cannot draw {''.join(dict.fromkeys(missing))!r} in {text!r} with the standard PDF fonts"
+        )
+    return [(symbol, bytes(code)) for symbol, code in runs]
+
+
+class _PdfCanvas:
+    """Collects drawing operations as the content stream of one PDF page."""
+
+    # Control points for a quarter circle drawn as a cubic Bezier curve
+    _KAPPA = 0.5523
+
+    def __init__(self, width: int, height: int, header: str = ''):
+        self.width = width
+        self.height = height + (PDF_HEADER_HEIGHT if header else 0)
+        # Flip the y axis so all drawing uses top-left pixel coordinates
+        self._ops: List[str] = [f"1 0 0 -1 0 {self.height} cm", "1 j 1 J"]
+        self._alphas: Dict[str, str] = {}
+        if header:
+            self.text(PDF_HEADER_HEIGHT / 2, PDF_HEADER_HEIGHT * 0.65, header, 11, DEFAULT_FONT_COLOR)
+            # The figure is drawn below the header band
+            self._ops.append(f"1 0 0 1 0 {PDF_HEADER_HEIGHT} cm")
+
+    def _state(self, fill: Optional[Color] = None, stroke: Optional[Color] = None,
+               opacity: float = 1.0) -> None:
+        alpha = min(c[3] for c in (fill, stroke) if c is not None) * opacity
+        if alpha < 1:
+            key = _num(alpha)
+            name = self._alphas.setdefault(key, f"GS{len(self._alphas)}")
+            self._ops.append(f"/{name} gs")
+        if fill is not None:
+            self._ops.append(' '.join(_num(c) for c in fill[:3]) + ' rg')
+        if stroke is not None:
+            self._ops.append(' '.join(_num(c) for c in stroke[:3]) + ' RG')
+
+    @staticmethod
+    def _color(color: Any) -> Optional[Color]:
+        if color is None:
+            return None
+        rgba = _parse_color(color)
+        if rgba is None:
+            logger.debug("Unsupported color %r drawn as black in PDF", color)
+            return (0.0, 0.0, 0.0, 1.0)
+        return rgba if rgba[3] > 0 else None
+
+    def rect(self, x: float, y: float, w: float, h: float, fill: Any = None,
+             stroke: Any = None, stroke_width: float = 1.0, opacity: float = 1.0) -> None:
+        fill_c = self._color(fill)
+        stroke_c = self._color(stroke) if stroke_width > 0 else None
+        if fill_c is None and stroke_c is None:
+            return
+        self._ops.append('q')
+        self._state(fill_c, stroke_c, opacity)
+        if stroke_c is not None:
+            self._ops.append(f"{_num(stroke_width)} w")
+        paint = 'B' if fill_c and stroke_c else ('f' if fill_c else 'S')
+        self._ops.append(f"{_num(x)} {_num(y)} {_num(w)} {_num(h)} re {paint} Q")
+
+    def polyline(self, points: Sequence[Tuple[float, float]], stroke: Any,
+                 width: float = 1.0, opacity: float = 1.0) -> None:
+        stroke_c = self._color(stroke)
+        if len(points) < 2 or stroke_c is None:
+            return
+        self._ops.append('q')
+        self._state(stroke=stroke_c, opacity=opacity)
+        path = [f"{_num(points[0][0])} {_num(points[0][1])} m"]
+        path.extend(f"{_num(x)} {_num(y)} l" for x, y in points[1:])
+        self._ops.append(f"{_num(width)} w " + ' '.join(path) + ' S Q')
+
+    def circle(self, cx: float, cy: float, r: float, fill: Any, stroke: Any = None,
+               stroke_width: float = 0.0, opacity: float = 1.0) -> None:
+        fill_c = self._color(fill)
+        stroke_c = self._color(stroke) if stroke_width > 0 else None
+        if fill_c is None and stroke_c is None:
+            return
+        k = r * self._KAPPA
+        path = (
+            f"{_num(cx + r)} {_num(cy)} m "
+            f"{_num(cx + r)} {_num(cy + k)} {_num(cx + k)} {_num(cy + r)} {_num(cx)} {_num(cy + r)} c "
+            f"{_num(cx - k)} {_num(cy + r)} {_num(cx - r)} {_num(cy + k)} {_num(cx - r)} {_num(cy)} c "
+            f"{_num(cx - r)} {_num(cy - k)} {_num(cx - k)} {_num(cy - r)} {_num(cx)} {_num(cy - r)} c "
+            f"{_num(cx + k)} {_num(cy - r)} {_num(cx + r)} {_num(cy - k)} {_num(cx + r)} {_num(cy)} c"
+        )
+        self._ops.append('q')
+        self._state(fill_c, stroke_c, opacity)
+        if stroke_c is not None:
+            self._ops.append(f"{_num(stroke_width)} w")
+        paint = 'B' if fill_c and stroke_c else ('f' if fill_c else 'S')
+        self._ops.append(f"{path} {paint} Q")
+
+    def text(self, x: float, y: float, text: str, size: float, color: Any,
+             anchor: str = 'start', angle: float = 0.0, bold: bool = False) -> None:
+        fill_c = self._color(color)
+        if fill_c is None or not text:
+            return
+        cos, sin = math.cos(math.radians(angle)), math.sin(math.radians(angle))
+        shift = {'start': 0.0, 'middle': -0.5, 'end': -1.0}.get(anchor, 0.0) * _text_width(text, size)
+        x, y = x + shift * cos, y + shift * sin
+        shows = []
+        for symbol, encoded in _pdf_runs(text):
+            escaped = (encoded.replace(b'\\', b'\\\\').replace(b'(', b'\\(').replace(b')', b'\\)')
+                       .decode('latin-1'))
+            # Each Tj advances the text position, so runs continue on the same line
+            font = 'F3' if symbol else ('F2' if bold else 'F1')
+            shows.append(f"/{font} {_num(size)} Tf ({escaped}) Tj")
+        self._ops.append('q')
+        self._state(fill=fill_c)
+        self._ops.append(
+            f"BT {_num(cos)} {_num(sin)} {_num(sin)} {_num(-cos)} {_num(x)} {_num(y)} Tm "
+            + ' '.join(shows) + " ET Q"
+        )
+
+    def begin_clip(self, x: float, y: float, w: float, h: float) -> None:
+        self._ops.append(f"q {_num(x)} {_num(y)} {_num(w)} {_num(h)} re W n")
+
+    def end_clip(self) -> None:
+        self._ops.append('Q')
+
+    def finish(self) -> bytes:
+        return _pdf_document([self])
+
+
+def _pdf_document(pages: Sequence[_PdfCanvas]) -> bytes:
+    """Assemble page canvases into a PDF file sharing one set of fonts."""
+    fonts = "/F1 3 0 R /F2 4 0 R /F3 5 0 R"
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        ("<< /Type /Pages /Kids [%s] /Count %d >>" % (
+            ' '.join(f"{6 + 2 * i} 0 R" for i in range(len(pages))), len(pages))).encode('latin-1'),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>",
+        # Built-in encoding: Greek letters and math symbols
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Symbol >>",
+    ]
+    for i, page in enumerate(pages):
+        content = zlib.compress('\n'.join(page._ops).encode('latin-1'))
+        states = ' '.join(f"/{name} << /ca {alpha} /CA {alpha} >>" for alpha, name in page._alphas.items())
+        objects.append(
+            (f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {page.width} {page.height}] "
+             f"/Resources << /Font << {fonts} >> /ExtGState << {states} >> >> "
+             f"/Contents {7 + 2 * i} 0 R >>").encode('latin-1')
+        )
+        objects.append(b"<< /Length %d /Filter /FlateDecode >>\nstream\n" % len(content) + content + b"\nendstream")
+
+    out = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b''.join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+Canvas = Union[_SvgCanvas, _PdfCanvas]
+
+
+# --------------------------------------------------------------------------
+# Axes
+# --------------------------------------------------------------------------
+
+class _Axis:
+    """Maps data values to pixels along one axis."""
+
+    def __init__(self, lo: float, hi: float, start_px: float, end_px: float,
+                 categories: Optional[List[Any]] = None):
+        self.lo, self.hi = lo, hi
+        self.start_px, self.end_px = start_px, end_px
+        self.categories = categories
+        self._index = {c: i for i, c in enumerate(categories)} if categories is not None else None
+
+    @property
+    def is_categorical(self) -> bool:
+        return self.categories is not None
+
+    def positions(self, values: Optional[np.ndarray]) -> np.ndarray:
+        """Data coordinates of raw values (category index on categorical axes)."""
+        if values is None:
+            return np.array([], dtype=float)
+        if self._index is not None:
+            return np.array([self._index.get(_category_key(v), np.nan) for v in values], dtype=float)
+        return _numeric(values)
+
+    def to_px(self, coords: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """Pixel position of data coordinates."""
+        span = self.hi - self.lo or 1.0
+        return self.start_px + (np.asarray(coords, dtype=float) - self.lo) / span * (self.end_px - self.start_px)
+
+    def ticks(self, axis_layout: Dict[str, Any], target: int) -> List[Tuple[float, str]]:
+        """Tick positions (data coordinates) and labels inside the range."""
+        tickvals = _values(axis_layout.get('tickvals'))
+        if tickvals is not None and len(tickvals):
+            ticktext = _values(axis_layout.get('ticktext'))
+            coords = self.positions(tickvals)
+            labels = [str(t) for t in (ticktext if ticktext is not None else tickvals)]
+            ticks = [(c, labels[i] if i < len(labels) else '') for i, c in enumerate(coords)]
+        elif self.categories is not None:
+            ticks = [(float(i), str(c)) for i, c in enumerate(self.categories)]
+        else:
+            coords, step = _nice_ticks(min(self.lo, self.hi), max(self.lo, self.hi), target)
+            magnitude = float(np.abs(coords).max()) if len(coords) else 0.0
+            ticks = [(c, _format_number(c, step, magnitude)) for c in coords]
+        low, high = min(self.lo, self.hi), max(self.lo, self.hi)
+        slack = (high - low) * 1e-9
+        return [(c, label) for c, label in ticks if np.isfinite(c) and low - slack <= c <= high + slack]
+
+
+def _category_key(value: Any) -> Any:
+    """Hashable category key; numbers and their string forms stay distinct only when both occur."""
+    if isinstance(value, (np.generic,)):
+        value = value.item()
+    return value
+
+
+# --------------------------------------------------------------------------
+# Figure layout and drawing
+# --------------------------------------------------------------------------
+
+class _Trace:
+    """A trace normalized for drawing."""
+
+    def __init__(self, index: int, data: Dict[str, Any], kind: str, color: str):
+        self.index = index
+        self.data = data
+        self.kind = kind
+        self.color = color
+        self.name = data.get('name')
+        self.x = _values(data.get('x'))
+        self.y = _values(data.get('y'))
+        self.opacity = float(data.get('opacity', 1.0))
+        # Filled in during layout
+        self.centers = np.array([], dtype=float)
+        self.bases = np.array([], dtype=float)
+        self.tops = np.array([], dtype=float)
+        self.width = 0.0
+        self.boxes: List[Dict[str, Any]] = []
+
+
+class _FigureRenderer:
+    """Lays out a Plotly figure dict and draws it on a canvas."""
+
+    def __init__(self, figure: Dict[str, Any], width: Optional[int] = None, height: Optional[int] = None):
+        layout = dict(figure.get('layout') or {})
+        template = layout.pop('template', None) or {}
+        self.layout = _merge(template.get('layout') or {}, layout)
+        self.width = int(width or self.layout.get('width') or DEFAULT_SIZE[0])
+        self.height = int(height or self.layout.get('height') or DEFAULT_SIZE[1])
+
+        margin = {**DEFAULT_MARGIN, **{k: v for k, v in (self.layout.get('margin') or {}).items()
+                                       if k in DEFAULT_MARGIN and v is not None}}
+        # Like Plotly, shrink margins that would leave almost no room for the plot
+        x_scale = min(1.0, MAX_MARGIN_FRACTION * self.width / max(margin['l'] + margin['r'], 1))
+        y_scale = min(1.0, MAX_MARGIN_FRACTION * self.height / max(margin['t'] + margin['b'], 1))
+        self.left = float(margin['l']) * x_scale
+        self.right = self.width - float(margin['r']) * x_scale
+        self.top = float(margin['t']) * y_scale
+        self.bottom = self.height - float(margin['b']) * y_scale
+
+        self.font_size = float(_lookup(self.layout, 'font.size', DEFAULT_FONT_SIZE))
+        self.font_color = _lookup(self.layout, 'font.color', DEFAULT_FONT_COLOR)
+        colorway = self.layout.get('colorway') or DEFAULT_COLORWAY
+        self.traces = self._normalize_traces(figure.get('data') or [], template.get('data') or {}, colorway)
+
+        self.xaxis_layout = self.layout.get('xaxis') or {}
+        self.yaxis_layout = self.layout.get('yaxis') or {}
+        self._layout_bars()
+        self._layout_boxes()
+        self.xaxis, self.yaxis = self._build_axes()
+
+    # -- Trace preparation -------------------------------------------------
+
+    def _normalize_traces(self, data: Sequence[Dict[str, Any]], template_data: Dict[str, Any],
+                          colorway: Sequence[str]) -> List[_Trace]:
+        traces = []
+        for index, raw in enumerate(data):
+            trace_type = raw.get('type', 'scatter')
+            defaults = (template_data.get(trace_type) or [{}])[0]
+            trace = _merge(defaults, raw)
+            if trace.get('visible', True) in (False, 'legendonly'):
+                continue
+            if trace_type not in SUPPORTED_TRACE_TYPES:
+                logger.warning(f"Static renderer skips unsupported trace type '{trace_type}'")
+                continue
+            if trace.get('orientation') == 'h':
+                logger.warning(f"Static renderer skips horizontal {trace_type} trace '{trace.get('name', '')}'")
+                continue
+
+            color = _lookup(trace, 'marker.color')
+            if not isinstance(color, str):
+                color = _lookup(trace, 'line.color')
+            if not isinstance(color, str):
+                color = colorway[index % len(colorway)]
+            kind = 'scatter' if trace_type == 'scattergl' else trace_type
+            traces.append(_Trace(index, trace, kind, color))
+        self._histograms_to_bars([t for t in traces if t.kind == 'histogram'])
+        return traces
+
+    def _histograms_to_bars(self, histograms: List[_Trace]) -> None:
+        """Bin histogram traces on shared edges, as Plotly does, and draw them as bars."""
+        if not histograms:
+            return
+        samples = [_numeric(t.x) for t in histograms]
+        pooled = np.concatenate(samples)
+        pooled = pooled[np.isfinite(pooled)]
+        n_bins = max(int(t.data.get('nbinsx') or 0) for t in histograms) or 'auto'
+        edges = np.histogram_bin_edges(pooled, bins=n_bins) if len(pooled) else np.array([0.0, 1.0])
+        # Histogram bars touch unless the figure sets a gap
+        self.layout.setdefault('bargap', 0.0)
+        for trace, values in zip(histograms, samples):
+            counts, _ = np.histogram(values[np.isfinite(values)], bins=edges)
+            trace.kind = 'bar'
+            trace.x = (edges[:-1] + edges[1:]) / 2
+            trace.y = counts.astype(float)
+
+    def _is_categorical_x(self) -> bool:
+        if self.xaxis_layout.get('type') == 'category':
+            return True
+        if self.xaxis_layout.get('type') in ('linear', 'log', 'date'):
+            return False
+        for trace in self.traces:
+            if trace.x is None:
+                if trace.kind == 'box':
+                    return True
+                continue
+            if not _is_numeric(trace.x):
+                return True
+        return False
+
+    def _x_categories(self) -> Optional[List[Any]]:
+        if not self._is_categorical_x():
+            return None
+        order = self.xaxis_layout.get('categoryarray') if self.xaxis_layout.get('categoryorder') == 'array' else None
+        categories: List[Any] = [_category_key(c) for c in (_values(order) if order is not None else [])]
+        seen = set(categories)
+        for trace in self.traces:
+            values = trace.x if trace.x is not None else np.array([self._box_name(trace)], dtype=object)
+            for value in values:
+                key = _category_key(value)
+                if key is not None and key not in seen and not (isinstance(key, float) and math.isnan(key)):
+                    seen.add(key)
+                    categories.append(key)
+        return categories
+
+    @staticmethod
+    def _box_name(trace: _Trace) -> str:
+        return trace.name if trace.name not in (None, '') else f"trace {trace.index}"
+
+    def _x_coords(self, trace: _Trace) -> np.ndarray:
+        if trace.x is None:
+            n = len(trace.y) if trace.y is not None else 0
+            if trace.kind == 'box' and self._categories is not None:
+                return np.full(n, float(self._categories.index(self._box_name(trace))))
+            return np.arange(n, dtype=float)
+        if self._categories is not None:
+            index = {c: i for i, c in enumerate(self._categories)}
+            return np.array([index.get(_category_key(v), np.nan) for v in trace.x], dtype=float)
+        return _numeric(trace.x)
+
+    @staticmethod
+    def _spacing(coords: np.ndarray) -> float:
+        unique = np.unique(coords[np.isfinite(coords)])
+        return float(np.diff(unique).min()) if len(unique) > 1 else 1.0
+
+    def _layout_bars(self) -> None:
+        self._categories = self._x_categories()
+        bars = [t for t in self.traces if t.kind == 'bar']
+        if not bars:
+            return
+        barmode = self.layout.get('barmode', 'group')
+        coords = [self._x_coords(t) for t in bars]
+        spacing = self._spacing(np.concatenate(coords)) if coords else 1.0
+        group_width = spacing * (1 - float(self.layout.get('bargap', BAR_GAP)))
+
+        slots: List[Any] = []
+        if barmode == 'group':
+            for trace in bars:
+                key = trace.data.get('offsetgroup') or f"trace{trace.index}"
+                if key not in slots:
+                    slots.append(key)
+        n_slots = max(len(slots), 1)
+
+        pos_base: Dict[float, float] = {}
+        neg_base: Dict[float, float] = {}
+        for trace, x in zip(bars, coords):
+            y = _numeric(trace.y)
+            trace.width = group_width / n_slots
+            offset = 0.0
+            if barmode == 'group':
+                slot = slots.index(trace.data.get('offsetgroup') or f"trace{trace.index}")
+                offset = -group_width / 2 + trace.width * (slot + 0.5)
+            trace.centers = x + offset
+            if barmode in ('stack', 'relative'):
+                bases = np.empty_like(y)
+                for i, (xi, yi) in enumerate(zip(x, y)):
+                    store = pos_base if yi >= 0 or barmode == 'stack' else neg_base
+                    bases[i] = store.get(xi, 0.0)
+                    if np.isfinite(yi):
+                        store[xi] = bases[i] + yi
+                trace.bases, trace.tops = bases, bases + y
+            else:
+                trace.bases, trace.tops = np.zeros_like(y), y
+
+    def _layout_boxes(self) -> None:
+        boxes = [t for t in self.traces if t.kind == 'box']
+        if not boxes:
+            return
+        coords = [self._x_coords(t) for t in boxes]
+        spacing = self._spacing(np.concatenate(coords)) if coords else 1.0
+        group_width = spacing * (1 - float(self.layout.get('boxgap', BOX_GAP)))
+        grouped = self.layout.get('boxmode') == 'group'
+        slots: List[Any] = []
+        for trace in boxes:
+            key = trace.data.get('offsetgroup') or f"trace{trace.index}"
+            if grouped and key not in slots:
+                slots.append(key)
+        n_slots = max(len(slots), 1)
+
+        for trace, x in zip(boxes, coords):
+            y = _numeric(trace.y)
+            trace.width = group_width / n_slots
+            offset = 0.0
+            if grouped:
+                slot = slots.index(trace.data.get('offsetgroup') or f"trace{trace.index}")
+                offset = -group_width / 2 + trace.width * (slot + 0.5)
+            valid = np.isfinite(x) & np.isfinite(y)
+            for position in np.unique(x[valid]):
+                values = np.sort(y[valid & (x == position)])
+                q1, median, q3 = np.percentile(values, [25, 50, 75])
+                iqr = q3 - q1
+                inside = values[(values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)]
+                trace.boxes.append({
+                    'center': position + offset, 'q1': q1, 'median': median, 'q3': q3,
+                    'low': inside.min(), 'high': inside.max(),
+                    'outliers': values[(values < inside.min()) | (values > inside.max())],
+                    'values': values,
+                })
+
+    # -- Axes ------------------------------------------------------------------
+
+    def _extents(self) -> Tuple[List[float], List[float], bool, bool]:
+        xs: List[float] = []
+        ys: List[float] = []
+        x_padded = y_padded = False
+        for trace in self.traces:
+            if trace.kind == 'bar':
+                xs.extend((trace.centers - trace.width / 2).tolist() + (trace.centers + trace.width / 2).tolist())
+                ys.extend(trace.bases.tolist() + trace.tops.tolist())
+                err = self._error_bounds(trace, trace.tops)
+                if err is not None:
+                    ys.extend(err[0].tolist() + err[1].tolist())
+            elif trace.kind == 'box':
+                for box in trace.boxes:
+                    xs.extend([box['center'] - trace.width / 2, box['center'] + trace.width / 2])
+                    ys.extend([box['values'].min(), box['values'].max()])
+                y_padded = True
+            else:
+                x = self._x_coords(trace)
+                y = _numeric(trace.y)
+                xs.extend(x.tolist())
+                ys.extend(y.tolist())
+                err = self._error_bounds(trace, y)
+                if err is not None:
+                    ys.extend(err[0].tolist() + err[1].tolist())
+                if 'markers' in self._mode(trace):
+                    x_padded = True
+                y_padded = True
+        return xs, ys, x_padded, y_padded
+
+    @staticmethod
+    def _range(values: List[float], padded: bool, axis_layout: Dict[str, Any]) -> Tuple[float, float]:
+        explicit = axis_layout.get('range')
+        if explicit is not None and len(explicit) == 2 and None not in explicit:
+            return float(explicit[0]), float(explicit[1])
+        finite = np.array([v for v in values if v is not None], dtype=float)
+        finite = finite[np.isfinite(finite)]
+        if not len(finite):
+            return -1.0, 6.0
+        lo, hi = float(finite.min()), float(finite.max())
+        if axis_layout.get('rangemode') == 'tozero':
+            lo, hi = min(lo, 0.0), max(hi, 0.0)
+        if hi == lo:
+            return lo - 1.0, hi + 1.0
+        pad = (hi - lo) * AXIS_PAD if padded else 0.0
+        return lo - pad, hi + pad
+
+    def _build_axes(self) -> Tuple[_Axis, _Axis]:
+        xs, ys, x_padded, y_padded = self._extents()
+        if self._categories is not None and self.xaxis_layout.get('range') is None:
+            xs = xs + [-0.5, len(self._categories) - 0.5]
+        x_lo, x_hi = self._range(xs, x_padded, self.xaxis_layout)
+
+        has_bars = any(t.kind == 'bar' for t in self.traces)
+        y_lo, y_hi = self._range(ys, y_padded, self.yaxis_layout)
+        if has_bars and self.yaxis_layout.get('range') is None and not y_padded:
+            # Bars grow from zero: pad only away from the baseline
+            pad = (y_hi - y_lo) * AXIS_PAD
+            y_lo, y_hi = (y_lo if y_lo >= 0 else y_lo - pad), (y_hi if y_hi <= 0 else y_hi + pad)
+        if self.xaxis_layout.get('autorange') == 'reversed':
+            x_lo, x_hi = x_hi, x_lo
+        if self.yaxis_layout.get('autorange') == 'reversed':
+            y_lo, y_hi = y_hi, y_lo
+        return (_Axis(x_lo, x_hi, self.left, self.right, self._categories),
+                _Axis(y_lo, y_hi, self.bottom, self.top))
+
+    # -- Trace helpers -----------------------------------------------------------
+
+    @staticmethod
+    def _mode(trace: _Trace) -> str:
+        mode = trace.data.get('mode')
+        if mode:
+            return mode
+        n = len(trace.y) if trace.y is not None else 0
+        return 'lines+markers' if n < 20 else 'lines'
+
+    @staticmethod
+    def _error_bounds(trace: _Trace, y: np.ndarray) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        error = trace.data.get('error_y') or {}
+        # Template defaults (e.g. a color) alone do not switch error bars on
+        visible = error.get('visible', error.get('array') is not None or 'value' in error)
+        if not visible:
+            return None
+        error_type = error.get('type', 'data' if error.get('array') is not None else 'percent')
+        if error_type == 'data':
+            plus = _numeric(_values(error.get('array')))
+            if len(plus) != len(y):
+                return None
+            minus = plus
+            if not error.get('symmetric', True) or error.get('arrayminus') is not None:
+                arrayminus = _numeric(_values(error.get('arrayminus')))
+                minus = arrayminus if len(arrayminus) == len(y) else plus
+        elif error_type == 'constant':
+            plus = minus = np.full(len(y), float(error.get('value', 10)))
+        elif error_type == 'percent':
+            plus = minus = np.abs(y) * float(error.get('value', 10)) / 100
+        elif error_type == 'sqrt':
+            plus = minus = np.sqrt(np.abs(y))
+        else:
+            return None
+        return y - minus, y + plus
+
+    def _draw_error_bars(self, canvas: Canvas, trace: _Trace, x: np.ndarray, y: np.ndarray) -> None:
+        bounds = self._error_bounds(trace, y)
+        if bounds is None:
+            return
+        error = trace.data.get('error_y') or {}
+        color = error.get('color') or trace.color
+        thickness = float(error.get('thickness', 2))
+        half_cap = float(error.get('width', 4))
+        px = self.xaxis.to_px(x)
+        lows, highs = self.yaxis.to_px(bounds[0]), self.yaxis.to_px(bounds[1])
+        for xi, lo, hi in zip(px, lows, highs):
+            if not (np.isfinite(xi) and np.isfinite(lo) and np.isfinite(hi)):
+                continue
+            canvas.polyline([(xi, lo), (xi, hi)], color, thickness, trace.opacity)
+            if half_cap > 0:
+                canvas.polyline([(xi - half_cap, lo), (xi + half_cap, lo)], color, thickness, trace.opacity)
+                canvas.polyline([(xi - half_cap, hi), (xi + half_cap, hi)], color, thickness, trace.opacity)
+
+    # -- Drawing -------------------------------------------------------------------
+
+    def draw(self, canvas: Canvas) -> None:
+        canvas.rect(0, 0, self.width, self.height, fill=self.layout.get('paper_bgcolor', 'white'))
+        canvas.rect(self.left, self.top, self.right - self.left, self.bottom - self.top,
+                    fill=self.layout.get('plot_bgcolor', 'white'))
+        x_ticks = self.xaxis.ticks(self.xaxis_layout, max(2, int((self.right - self.left) / 80)))
+        y_ticks = self.yaxis.ticks(self.yaxis_layout, max(2, int((self.bottom - self.top) / 50)))
+        self._draw_grid(canvas, x_ticks, y_ticks)
+
+        canvas.begin_clip(self.left, self.top, self.right - self.left, self.bottom - self.top)
+        for kind, draw in (('bar', self._draw_bar), ('box', self._draw_box), ('scatter', self._draw_scatter)):
+            for trace in self.traces:
+                if trace.kind == kind:
+                    draw(canvas, trace)
+        canvas.end_clip()
+
+        self._draw_axis_lines(canvas)
+        self._draw_axis_labels(canvas, x_ticks, y_ticks)
+        self._draw_title(canvas)
+        self._draw_legend(canvas)
+        self._draw_annotations(canvas)
+
+    def _draw_grid(self, canvas: Canvas, x_ticks: List[Tuple[float, str]], y_ticks: List[Tuple[float, str]]) -> None:
+        for axis_layout, ticks, axis, horizontal in ((self.xaxis_layout, x_ticks, self.xaxis, False),
+                                                      (self.yaxis_layout, y_ticks, self.yaxis, True)):
+            if axis_layout.get('showgrid', True):
+                color = axis_layout.get('gridcolor', '#eee')
+                width = float(axis_layout.get('gridwidth', 1))
+                for coord, _ in ticks:
+                    p = float(axis.to_px(coord))
+                    points = [(self.left, p), (self.right, p)] if horizontal else [(p, self.top), (p, self.bottom)]
+                    canvas.polyline(points, color, width)
+            if axis_layout.get('zeroline', True) and not axis.is_categorical:
+                low, high = sorted((axis.lo, axis.hi))
+                if low < 0 < high:
+                    p = float(axis.to_px(0.0))
+                    points = [(self.left, p), (self.right, p)] if horizontal else [(p, self.top), (p, self.bottom)]
+                    canvas.polyline(points, axis_layout.get('zerolinecolor', '#444'),
+                                    float(axis_layout.get('zerolinewidth', 1)))
+
+    def _draw_axis_lines(self, canvas: Canvas) -> None:
+        if self.xaxis_layout.get('showline'):
+            canvas.polyline([(self.left, self.bottom), (self.right, self.bottom)],
+                            self.xaxis_layout.get('linecolor', '#444'), float(self.xaxis_layout.get('linewidth', 1)))
+        if self.yaxis_layout.get('showline'):
+            canvas.polyline([(self.left, self.top), (self.left, self.bottom)],
+                            self.yaxis_layout.get('linecolor', '#444'), float(self.yaxis_layout.get('linewidth', 1)))
+
+    def _draw_bar(self, canvas: Canvas, trace: _Trace) -> None:
+        colors = _values(_lookup(trace.data, 'marker.color'))
+        line_color = _lookup(trace.data, 'marker.line.color')
+        line_width = float(_lookup(trace.data, 'marker.line.width', 0))
+        opacity = trace.opacity * float(_lookup(trace.data, 'marker.opacity', 1.0))
+        for i, (center, base, top) in enumerate(zip(trace.centers, trace.bases, trace.tops)):
+            if not (np.isfinite(center) and np.isfinite(base) and np.isfinite(top)) or base == top:
+                continue
+            x0 = float(self.xaxis.to_px(center - trace.width / 2))
+            x1 = float(self.xaxis.to_px(center + trace.width / 2))
+            y0, y1 = sorted((float(self.yaxis.to_px(base)), float(self.yaxis.to_px(top))))
+            fill = colors[i] if colors is not None and i < len(colors) and isinstance(colors[i], str) else trace.color
+            canvas.rect(min(x0, x1), y0, abs(x1 - x0), y1 - y0, fill=fill,
+                        stroke=line_color, stroke_width=line_width, opacity=opacity)
+        self._draw_error_bars(canvas, trace, trace.centers, trace.tops)
+
+    def _draw_box(self, canvas: Canvas, trace: _Trace) -> None:
+        line_color = _lookup(trace.data, 'line.color', trace.color)
+        line_width = float(_lookup(trace.data, 'line.width', 2))
+        fill = trace.data.get('fillcolor')
+        fill_opacity = trace.opacity if fill else trace.opacity * 0.5
+        fill = fill or line_color
+        boxpoints = trace.data.get('boxpoints', 'outliers')
+        marker_size = float(_lookup(trace.data, 'marker.size', 6))
+        for box in trace.boxes:
+            x0 = float(self.xaxis.to_px(box['center'] - trace.width / 2))
+            x1 = float(self.xaxis.to_px(box['center'] + trace.width / 2))
+            xc = float(self.xaxis.to_px(box['center']))
+            q1, q3 = float(self.yaxis.to_px(box['q1'])), float(self.yaxis.to_px(box['q3']))
+            canvas.rect(min(x0, x1), min(q1, q3), abs(x1 - x0), abs(q3 - q1), fill=fill, opacity=fill_opacity)
+            canvas.rect(min(x0, x1), min(q1, q3), abs(x1 - x0), abs(q3 - q1), stroke=line_color,
+                        stroke_width=line_width, opacity=trace.opacity)
+            median = float(self.yaxis.to_px(box['median']))
+            canvas.polyline([(x0, median), (x1, median)], line_color, line_width, trace.opacity)
+            low, high = float(self.yaxis.to_px(box['low'])), float(self.yaxis.to_px(box['high']))
+            quarter = (x1 - x0) / 4
+            canvas.polyline([(xc, q1), (xc, low)], line_color, line_width, trace.opacity)
+            canvas.polyline([(xc, q3), (xc, high)], line_color, line_width, trace.opacity)
+            canvas.polyline([(xc - quarter, low), (xc + quarter, low)], line_color, line_width, trace.opacity)
+            canvas.polyline([(xc - quarter, high), (xc + quarter, high)], line_color, line_width, trace.opacity)
+            if boxpoints is False:
+                continue
+            points = box['values'] if boxpoints == 'all' else box['outliers']
+            for value in points:
+                canvas.circle(xc, float(self.yaxis.to_px(value)), marker_size / 2, trace.color,
+                              opacity=trace.opacity)
+
+    def _draw_scatter(self, canvas: Canvas, trace: _Trace) -> None:
+        x = self._x_coords(trace)
+        y = _numeric(trace.y)
+        n = min(len(x), len(y))
+        x, y = x[:n], y[:n]
+        px, py = self.xaxis.to_px(x), self.yaxis.to_px(y)
+        mode = self._mode(trace)
+
+        if 'lines' in mode:
+            line_color = _lookup(trace.data, 'line.color', trace.color)
+            line_width = float(_lookup(trace.data, 'line.width', 2))
+            valid = np.isfinite(px) & np.isfinite(py)
+            if trace.data.get('connectgaps'):
+                runs = [np.flatnonzero(valid)]
+            else:
+                # Break the line at missing values, as Plotly does without connectgaps
+                breaks = np.flatnonzero(~valid)
+                runs = [r[valid[r]] for r in np.split(np.arange(n), breaks)]
+            for run in runs:
+                canvas.polyline(list(zip(px[run].tolist(), py[run].tolist())), line_color, line_width, trace.opacity)
+
+        self._draw_error_bars(canvas, trace, x, y)
+
+        if 'markers' in mode:
+            marker = trace.data.get('marker') or {}
+            colors = _values(marker.get('color'))
+            sizes = _values(marker.get('size'))
+            size = float(marker.get('size', 6)) if sizes is None else 6.0
+            opacity = trace.opacity * float(marker.get('opacity', 1.0) if np.isscalar(marker.get('opacity', 1.0)) else 1.0)
+            line_color = _lookup(marker, 'line.color')
+            line_width = float(_lookup(marker, 'line.width', 0)) if line_color else 0.0
+            for i in range(n):
+                if not (np.isfinite(px[i]) and np.isfinite(py[i])):
+                    continue
+                color = colors[i] if colors is not None and i < len(colors) and isinstance(colors[i], str) else trace.color
+                radius = (float(sizes[i]) if sizes is not None and i < len(sizes) else size) / 2
+                canvas.circle(float(px[i]), float(py[i]), radius, color, line_color, line_width, opacity)
+
+    def _text_block(self, canvas: Canvas, lines: List[str], x: float, y: float, size: float, color: Any,
+                    anchor: str = 'start', valign: str = 'baseline', angle: float = 0.0, bold: bool = False) -> None:
+        """Draw lines of text; y is the block's top, middle, bottom or first baseline."""
+        if not lines:
+            return
+        line_height = size * 1.3
+        block = line_height * (len(lines) - 1)
+        first = {
+            'top': size * 0.8,
+            'middle': -block / 2 + size * 0.35,
+            'bottom': -block - size * 0.2,
+        }.get(valign, 0.0)
+        cos, sin = math.cos(math.radians(angle)), math.sin(math.radians(angle))
+        for i, line in enumerate(lines):
+            # Offsets run along the rotated 'down' direction (-sin, cos)
+            shift = first + i * line_height
+            canvas.text(x - shift * sin, y + shift * cos, line, size, color, anchor, angle, bold)
+
+    def _draw_axis_labels(self, canvas: Canvas, x_ticks: List[Tuple[float, str]],
+                          y_ticks: List[Tuple[float, str]]) -> None:
+        tick_size = float(_lookup(self.xaxis_layout, 'tickfont.size', self.font_size))
+        tick_color = _lookup(self.xaxis_layout, 'tickfont.color', self.font_color)
+        x_angle = self.xaxis_layout.get('tickangle')
+        widths = [_text_width(label, tick_size) for _, label in x_ticks]
+        if x_angle in (None, 'auto') and len(x_ticks) > 1:
+            spacing = (self.right - self.left) / len(x_ticks)
+            x_angle = -30 if max(widths, default=0) > spacing - 4 else 0
+        x_angle = float(x_angle or 0)
+        labels_y = self.bottom + TICK_LABEL_PAD
+        if self.xaxis_layout.get('showticklabels', True):
+            for coord, label in x_ticks:
+                p = float(self.xaxis.to_px(coord))
+                if x_angle:
+                    self._text_block(canvas, [label], p, labels_y, tick_size, tick_color,
+                                     'end', 'middle', x_angle)
+                else:
+                    self._text_block(canvas, _text_lines(label), p, labels_y, tick_size, tick_color,
+                                     'middle', 'top')
+        label_height = (max(widths, default=0) * abs(math.sin(math.radians(x_angle))) + tick_size
+                        if x_angle else tick_size * 1.3 * max((len(_text_lines(l)) for _, l in x_ticks), default=1))
+
+        y_size = float(_lookup(self.yaxis_layout, 'tickfont.size', self.font_size))
+        y_color = _lookup(self.yaxis_layout, 'tickfont.color', self.font_color)
+        y_labels_width = 0.0
+        if self.yaxis_layout.get('showticklabels', True):
+            for coord, label in y_ticks:
+                self._text_block(canvas, [label], self.left - TICK_LABEL_PAD, float(self.yaxis.to_px(coord)),
+                                 y_size, y_color, 'end', 'middle')
+                y_labels_width = max(y_labels_width, _text_width(label, y_size))
+
+        x_title = _text_lines(_lookup(self.xaxis_layout, 'title.text'))
+        title_size = float(_lookup(self.xaxis_layout, 'title.font.size', self.font_size * 14 / 12))
+        title_color = _lookup(self.xaxis_layout, 'title.font.color', self.font_color)
+        title_y = min(labels_y + label_height + 8, self.height - title_size * 1.3 * len(x_title) - 2)
+        self._text_block(canvas, x_title, (self.left + self.right) / 2, title_y, title_size, title_color,
+                         'middle', 'top')
+
+        y_title = _text_lines(_lookup(self.yaxis_layout, 'title.text'))
+        title_size = float(_lookup(self.yaxis_layout, 'title.font.size', self.font_size * 14 / 12))
+        title_color = _lookup(self.yaxis_layout, 'title.font.color', self.font_color)
+        title_x = max(self.left - TICK_LABEL_PAD - y_labels_width - 10, title_size * 1.3 * len(y_title))
+        self._text_block(canvas, y_title, title_x, (self.top + self.bottom) / 2, title_size, title_color,
+                         'middle', 'bottom', -90)
+
+    def _draw_title(self, canvas: Canvas) -> None:
+        title = self.layout.get('title')
+        text = title.get('text') if isinstance(title, dict) else title
+        lines = _text_lines(text)
+        if not lines:
+            return
+        title = title if isinstance(title, dict) else {}
+        size = float(_lookup(title, 'font.size', self.font_size * 17 / 12))
+        color = _lookup(title, 'font.color', self.font_color)
+        x = float(title.get('x', 0.5))
+        if title.get('xref') == 'paper':
+            x_px = self.left + x * (self.right - self.left)
+        else:
+            x_px = x * self.width
+        anchor = self._anchor(title.get('xanchor', 'auto'), x)
+        y = title.get('y', 'auto')
+        y_px = self.top / 2 if y == 'auto' else (1 - float(y)) * self.height
+        self._text_block(canvas, lines, x_px, y_px, size, color, anchor, 'middle')
+
+    @staticmethod
+    def _anchor(xanchor: str, x: float) -> str:
+        """SVG text-anchor for a Plotly xanchor ('auto' follows the position)."""
+        if xanchor == 'auto':
+            xanchor = 'left' if x <= 1 / 3 else ('right' if x >= 2 / 3 else 'center')
+        return {'left': 'start', 'center': 'middle', 'right': 'end'}.get(xanchor, 'start')
+
+    def _legend_entries(self) -> List[_Trace]:
+        entries = []
+        seen = set()
+        for trace in self.traces:
+            if trace.data.get('showlegend') is False or trace.name in (None, ''):
+                continue
+            key = (trace.data.get('legendgroup'), trace.name)
+            if key in seen:
+                continue
+            seen.add(key)
+            entries.append(trace)
+        if 'reversed' in str(_lookup(self.layout, 'legend.traceorder', '')):
+            entries.reverse()
+        showlegend = self.layout.get('showlegend')
+        if showlegend is False or (showlegend is None and len(entries) < 2):
+            return []
+        return entries
+
+    def _draw_legend(self, canvas: Canvas) -> None:
+        entries = self._legend_entries()
+        if not entries:
+            return
+        legend = self.layout.get('legend') or {}
+        size = float(_lookup(legend, 'font.size', self.font_size))
+        color = _lookup(legend, 'font.color', self.font_color)
+        title = _text_lines(_lookup(legend, 'title.text'))
+        title_size = float(_lookup(legend, 'title.font.size', size))
+        title_color = _lookup(legend, 'title.font.color', color)
+        row = max(size * 1.6, 19.0)
+        border = float(legend.get('borderwidth', 0))
+
+        names = [' '.join(_text_lines(t.name)) for t in entries]
+        text_width = max([_text_width(n, size) for n in names] + [_text_width(t, title_size) - LEGEND_SYMBOL_WIDTH
+                                                                  for t in title])
+        box_w = LEGEND_SYMBOL_WIDTH + text_width + 10
+        title_h = title_size * 1.3 * len(title) + (4 if title else 0)
+        box_h = title_h + row * len(entries) + 6
+
+        x = float(legend.get('x', 1.02))
+        y = float(legend.get('y', 1.0))
+        x_px = self.left + x * (self.right - self.left)
+        y_px = self.top + (1 - y) * (self.bottom - self.top)
+        xanchor = legend.get('xanchor', 'left')
+        if xanchor == 'auto':
+            xanchor = 'left' if x <= 1 / 3 else ('right' if x >= 2 / 3 else 'center')
+        yanchor = legend.get('yanchor', 'auto')
+        if yanchor == 'auto':
+            yanchor = 'top' if y >= 2 / 3 else ('bottom' if y <= 1 / 3 else 'middle')
+        x0 = x_px - {'left': 0.0, 'center': box_w / 2, 'right': box_w}.get(xanchor, 0.0)
+        y0 = y_px - {'top': 0.0, 'middle': box_h / 2, 'bottom': box_h}.get(yanchor, 0.0)
+
+        canvas.rect(x0, y0, box_w, box_h, fill=legend.get('bgcolor', self.layout.get('paper_bgcolor', 'white')),
+                    stroke=legend.get('bordercolor', '#444'), stroke_width=border)
+        self._text_block(canvas, title, x0 + 5, y0 + 4, title_size, title_color, 'start', 'top')
+        for i, (trace, name) in enumerate(zip(entries, names)):
+            cy = y0 + title_h + row * (i + 0.5) + 3
+            self._draw_legend_symbol(canvas, trace, x0, cy)
+            canvas.text(x0 + LEGEND_SYMBOL_WIDTH, cy + size * 0.35, name, size, color)
+
+    def _draw_legend_symbol(self, canvas: Canvas, trace: _Trace, x0: float, cy: float) -> None:
+        if trace.kind in ('bar', 'box', 'histogram'):
+            fill = trace.color if trace.kind == 'bar' else _lookup(trace.data, 'line.color', trace.color)
+            canvas.rect(x0 + 14, cy - 6, 12, 12, fill=fill, opacity=trace.opacity * (0.5 if trace.kind == 'box' else 1))
+            return
+        mode = self._mode(trace)
+        if 'lines' in mode:
+            canvas.polyline([(x0 + 5, cy), (x0 + 35, cy)], _lookup(trace.data, 'line.color', trace.color),
+                            min(float(_lookup(trace.data, 'line.width', 2)), 5), trace.opacity)
+        if 'markers' in mode:
+            colors = _values(_lookup(trace.data, 'marker.color'))
+            color = colors[0] if colors is not None and len(colors) and isinstance(colors[0], str) else trace.color
+            size = _lookup(trace.data, 'marker.size', 6)
+            radius = min(float(size) if np.isscalar(size) else 6.0, 12.0) / 2
+            canvas.circle(x0 + 20, cy, radius, color, opacity=trace.opacity)
+
+    def _draw_annotations(self, canvas: Canvas) -> None:
+        for note in self.layout.get('annotations') or []:
+            if note.get('visible') is False:
+                continue
+            lines = _text_lines(note.get('text'))
+            if not lines:
+                continue
+            x, y = note.get('x', 0.5), note.get('y', 0.5)
+            if str(note.get('xref', 'x')).startswith('paper'):
+                x_px = self.left + float(x) * (self.right - self.left)
+            else:
+                x_px = float(self.xaxis.to_px(self.xaxis.positions(np.array([x], dtype=object))[0]))
+            if str(note.get('yref', 'y')).startswith('paper'):
+                y_px = self.top + (1 - float(y)) * (self.bottom - self.top)
+            else:
+                y_px = float(self.yaxis.to_px(self.yaxis.positions(np.array([y], dtype=object))[0]))
+            if not (np.isfinite(x_px) and np.isfinite(y_px)):
+                continue
+            size = float(_lookup(note, 'font.size', self.font_size))
+            color = _lookup(note, 'font.color', self.font_color)
+            xanchor, yanchor = note.get('xanchor', 'auto'), note.get('yanchor', 'auto')
+            if note.get('showarrow', True):
+                tail_x = x_px + float(note.get('ax', -10))
+                tail_y = y_px + float(note.get('ay', -30))
+                canvas.polyline([(x_px, y_px), (tail_x, tail_y)], note.get('arrowcolor', color),
+                                float(note.get('arrowwidth', 1)))
+                x_px, y_px = tail_x, tail_y
+                xanchor = 'center' if xanchor == 'auto' else xanchor
+                yanchor = 'middle' if yanchor == 'auto' else yanchor
+            anchor = self._anchor(xanchor, float(x) if str(note.get('xref', 'x')).startswith('paper') else 0.5)
+            valign = {'top': 'top', 'bottom': 'bottom'}.get(yanchor, 'middle')
+            self._text_block(canvas, lines, x_px, y_px, size, color, anchor, valign)
+
+
+# --------------------------------------------------------------------------
+# Public API
+# --------------------------------------------------------------------------
+
+def _figure_dict(fig: Any) -> Dict[str, Any]:
+    """Plain dict form of a go.Figure or figure dict."""
+    if hasattr(fig, 'to_plotly_json'):
+        fig = fig.to_plotly_json()
+    if not isinstance(fig, dict):
+        raise TypeError(f"Expected a Plotly figure or figure dict, got {type(fig).__name__}")
+    return fig
+
+
+def _render(fig: Any, canvas_type: type, width: Optional[int], height: Optional[int]) -> Any:
+    renderer = _FigureRenderer(_figure_dict(fig), width, height)
+    canvas = canvas_type(renderer.width, renderer.height)
+    renderer.draw(canvas)
+    return canvas.finish()
+
+
+def figure_to_svg(fig: Any, width: Optional[int] = None, height: Optional[int] = None) -> str:
+    """
+    Render a Plotly figure to SVG markup.
+
+    Args:
+        fig: go.Figure or figure dict (as from fig.to_dict())
+        width: Width in pixels; defaults to the figure's layout width
+        height: Height in pixels; defaults to the figure's layout height
+
+    Returns:
+        SVG document as a string
+    """
+    return _render(fig, _SvgCanvas, width, height)
+
+
+def figure_to_pdf(fig: Any, width: Optional[int] = None, height: Optional[int] = None) -> bytes:
+    """
+    Render a Plotly figure to a single-page PDF (one pixel per point).
+
+    Args:
+        fig: go.Figure or figure dict (as from fig.to_dict())
+        width: Page width; defaults to the figure's layout width
+        height: Page height; defaults to the figure's layout height
+
+    Returns:
+        PDF document as bytes
+
+    Raises:
+        UnsupportedGlyphError: If text uses characters the standard PDF fonts lack
+    """
+    return _render(fig, _PdfCanvas, width, height)
+
+
+def figures_to_pdf(figs: Sequence[Any], headers: Optional[Sequence[str]] = None,
+                   width: Optional[int] = None, height: Optional[int] = None) -> bytes:
+    """
+    Render Plotly figures to a PDF with one page per figure.
+
+    Args:
+        figs: go.Figure objects or figure dicts
+        headers: Optional line of text printed above each figure
+        width: Width for every figure; defaults to each figure's layout width
+        height: Height for every figure; defaults to each figure's layout height
+
+    Returns:
+        PDF document as bytes
+
+    Raises:
+        UnsupportedGlyphError: If text uses characters the standard PDF fonts lack
+    """
+    headers = list(headers) if headers is not None else [''] * len(figs)
+    pages = []
+    for fig, header in zip(figs, headers):
+        renderer = _FigureRenderer(_figure_dict(fig), width, height)
+        canvas = _PdfCanvas(renderer.width, renderer.height, header)
+        renderer.draw(canvas)
+        pages.append(canvas)
+    return _pdf_document(pages)
+
+
+def write_static_image(fig: Any, filepath: str, format: Optional[str] = None,
+                       width: Optional[int] = None, height: Optional[int] = None) -> None:
+    """
+    Write a Plotly figure to an SVG or PDF file.
+
+    Args:
+        fig: go.Figure or figure dict
+        filepath: Output path
+        format: 'svg' or 'pdf'; defaults to the file extension
+        width: Width in pixels; defaults to the figure's layout width
+        height: Height in pixels; defaults to the figure's layout height
+
+    Raises:
+        UnsupportedGlyphError: If PDF text uses characters the standard fonts lack
+    """
+    format = (format or filepath.rsplit('.', 1)[-1]).lower()
+    # Render before opening the file so a failed render leaves no empty file
+    if format == 'svg':
+        svg = figure_to_svg(fig, width, height)
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(svg)
+    elif format == 'pdf':
+        pdf = figure_to_pdf(fig, width, height)
+        with open(filepath, 'wb') as f:
+            f.write(pdf)
+    else:
+        raise ValueError(f"Unsupported static format: {format}. Supported formats: svg, pdf")
+    logger.debug("Rendered %s without a browser: %s", format.upper(), filepath)
+
+
+__all__ = [
+    'UnsupportedGlyphError',
+    'figure_to_svg',
+    'figure_to_pdf',
+    'figures_to_pdf',
+    'write_static_image',
+]
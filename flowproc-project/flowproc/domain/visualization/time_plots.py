@@ -14,20 +14,21 @@ from pathlib import Path
 from typing import Optional, Union, List, Dict, Any, Tuple
 
 from .column_utils import (
-    detect_flow_columns, 
     analyze_data_size, 
-    detect_available_metric_types, 
-    get_matching_columns_for_metric,
     extract_metric_name,
     create_comprehensive_plot_title,
     create_timecourse_plot_title,
     create_population_shortname
 )
 from .legend_config import configure_legend
-from .plot_utils import get_group_label_map
+from .plot_utils import (
+    get_group_label_map, apply_webgl_rendering, needs_webgl, add_consolidated_overlay_traces
+)
 from .data_aggregation import aggregate_by_group_with_sem
 from ..aggregation import timecourse_group_stats, timecourse_group_stats_multi
 from .plot_factory import build_plot_from_df
+from .downsampling import downsample_frame, point_budget
+from ..parsing.column_catalog import get_column_catalog
 
 logger = logging.getLogger(__name__)
 
@@ -60,7 +61,7 @@ def create_timecourse_visualization(
         plot_type: Plot type ("line", "scatter", "area")
         aggregation: Data aggregation method ("mean_sem", "median_iqr", "raw")
         max_cell_types: Maximum number of cell types to include
-        sample_size: Sample size for large datasets
+        sample_size: Maximum raw points drawn per series (default: derived from the figure width)
         filter_options: Filtering options for data
         population_filter: Specific population to filter for (None for all populations)
         save_html: Optional path to save HTML file
@@ -87,12 +88,18 @@ def create_timecourse_visualization(
         data, time_column, metric, group_by, max_cell_types, sample_size, population_filter
     )
     
+    # Statistics use the full data; only raw points are downsampled
+    kwargs['max_points'] = sample_size
+    
     # Determine visualization strategy
     fig = _create_single_timecourse(
         df, time_col, value_cols, group_col, plot_type, 
         aggregation, filter_options, **kwargs
     )
     
+    # Large figures render with WebGL so they stay interactive
+    fig = apply_webgl_rendering(fig)
+    
     # Save if requested
     if save_html:
         _save_visualization(fig, save_html)
@@ -126,11 +133,6 @@ def _prepare_data(
     # Handle metric selection and get value columns
     value_cols = _detect_value_columns(df, metric, max_cell_types)
     
-    # Apply sampling if needed
-    if sample_size and len(df) > sample_size:
-        df = df.sample(n=sample_size, random_state=42)
-        logger.info(f"Applied sampling: {sample_size} data points")
-    
     # Apply population filter if provided
     if population_filter:
         # Filter value columns to only include those matching the selected population
@@ -205,11 +207,11 @@ def _detect_group_column(df: DataFrame, group_by: Optional[str]) -> Optional[str
 
 def _detect_value_columns(df: DataFrame, metric: Optional[str], max_cell_types: int) -> List[str]:
     """Detect value columns based on metric type or fallback to flow cytometry columns."""
+    catalog = get_column_catalog(df)
     if metric:
         # Check if it's a metric type (like "Freq. of Parent")
-        metric_types = detect_available_metric_types(df)
-        if metric in metric_types:
-            matching_cols = get_matching_columns_for_metric(df, metric)
+        if metric in catalog.metric_types:
+            matching_cols = list(catalog.columns_for_metric(metric))
             logger.info(f"Found {len(matching_cols)} columns for metric '{metric}'")
             
             # Apply cell type limiting
@@ -224,20 +226,19 @@ def _detect_value_columns(df: DataFrame, metric: Optional[str], max_cell_types:
             logger.warning(f"Metric '{metric}' not found, falling back to auto-detection")
     
     # Fallback to flow cytometry column detection
-    flow_cols = detect_flow_columns(df)
-    if flow_cols['frequencies']:
-        # Prioritize "Freq. of Parent" and "Freq. of Live"
-        freq_parent_cols = [col for col in flow_cols['frequencies'] 
-                           if 'freq. of parent' in col.lower()]
-        freq_live_cols = [col for col in flow_cols['frequencies'] 
-                          if 'freq. of live' in col.lower()]
+    freq_cols = catalog.flow_columns('frequencies')
+    if freq_cols:
+        # Prioritize "Freq. of Parent" and "Freq. of Live"; both are
+        # frequency columns by construction
+        freq_parent_cols = catalog.columns_for_metric('Freq. of Parent')
+        freq_live_cols = catalog.columns_for_metric('Freq. of Live')
         
         if freq_parent_cols:
             return freq_parent_cols[:max_cell_types]
         elif freq_live_cols:
             return freq_live_cols[:max_cell_types]
         else:
-            return flow_cols['frequencies'][:max_cell_types]
+            return freq_cols[:max_cell_types]
     
     # Last resort: use second column
     if len(df.columns) > 1:
@@ -293,8 +294,9 @@ def _create_single_metric_timecourse(
     **kwargs
 ) -> go.Figure:
     """Create timecourse plot for a single metric."""
-    # Extract internal-only option so it isn't passed to Plotly
+    # Extract internal-only options so they aren't passed to Plotly
     user_group_labels = kwargs.pop('user_group_labels', None)
+    max_points = kwargs.pop('max_points', None) or point_budget(kwargs.get('width'))
     # Debug logging
     logger.info(f"Creating single metric timecourse for column: {value_col}")
     logger.info(f"Data shape: {df.shape}")
@@ -312,7 +314,7 @@ def _create_single_metric_timecourse(
         logger.info(f"Aggregated data shape: {plot_df.shape}")
         logger.info(f"Aggregated data columns: {list(plot_df.columns)}")
     else:
-        plot_df = df
+        plot_df = downsample_frame(df, value_col, x=time_col, by=group_col, max_points=max_points, method='lttb')
         y_col = value_col
         error_y = None
         logger.info(f"Using raw data, shape: {plot_df.shape}")
@@ -458,8 +460,9 @@ def _create_overlay_timecourse(
     **kwargs
 ) -> go.Figure:
     """Create timecourse plot with multiple metrics overlaid."""
-    # Extract internal-only option so it isn't passed to Plotly
+    # Extract internal-only options so they aren't passed to Plotly
     user_group_labels = kwargs.pop('user_group_labels', None)
+    max_points = kwargs.pop('max_points', None) or point_budget(kwargs.get('width'))
     fig = go.Figure()
     
     # Apply aggregation if requested
@@ -479,8 +482,14 @@ def _create_overlay_timecourse(
         y_col = None
         error_y = None
     
-    # Add traces for each metric
-    for value_col in value_cols:
+    # Add traces for each metric, or one per group when that would be too many traces
+    n_groups = plot_df[group_col].nunique() if group_col and group_col in plot_df.columns else 0
+    consolidate = plot_type == "line" and n_groups and needs_webgl(0, n_groups * len(value_cols))
+    if consolidate:
+        add_consolidated_overlay_traces(fig, plot_df, time_col, value_cols, group_col, y_col, error_y,
+                                        max_points=max_points)
+    
+    for value_col in ([] if consolidate else value_cols):
         if plot_type == "line":
             if group_col and group_col in plot_df.columns:
                 # Get data for this specific value column
@@ -488,8 +497,9 @@ def _create_overlay_timecourse(
                     # Using aggregated data
                     col_data = plot_df[plot_df['value_col'] == value_col]
                 else:
-                    # Using raw data
-                    col_data = plot_df
+                    # Using raw data, one line per group
+                    col_data = downsample_frame(plot_df, value_col, x=time_col, by=group_col,
+                                                max_points=max_points, method='lttb')
                 
                 for group in col_data[group_col].unique():
                     group_data = col_data[col_data[group_col] == group]
@@ -522,7 +532,7 @@ def _create_overlay_timecourse(
                     col_data = plot_df[plot_df['value_col'] == value_col]
                 else:
                     # Using raw data
-                    col_data = plot_df
+                    col_data = downsample_frame(plot_df, value_col, x=time_col, max_points=max_points, method='lttb')
                 
                 # Add error bars if available
                 error_y_data = None
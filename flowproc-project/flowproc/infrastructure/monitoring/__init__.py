@@ -3,6 +3,13 @@ Infrastructure monitoring module for flow cytometry processing.
 """
 
 from .metrics import MetricsCollector, SystemMonitor, PerformanceMetrics, metrics_collector, system_monitor
+from .tracing import Tracer, Span, LatencyHistogram, tracer
+from .exporters import (
+    RunMetrics, MetricsSnapshot, MetricsSink, PrometheusTextfileSink, JsonLinesSink,
+    MetricsHTTPServer, run_metrics, add_sink, configure_sinks, publish_metrics,
+    begin_run, end_run
+)
+from .profiling import ProfileConfig, FileProfile, StackSampler, configure_profiling, profile_file
 from .health import HealthChecker, HealthMonitor, HealthCheck, health_checker, health_monitor
 
 __all__ = [
@@ -11,6 +18,27 @@ __all__ = [
     'PerformanceMetrics',
     'metrics_collector',
     'system_monitor',
+    'Tracer',
+    'Span',
+    'LatencyHistogram',
+    'tracer',
+    'RunMetrics',
+    'MetricsSnapshot',
+    'MetricsSink',
+    'PrometheusTextfileSink',
+    'JsonLinesSink',
+    'MetricsHTTPServer',
+    'run_metrics',
+    'add_sink',
+    'configure_sinks',
+    'publish_metrics',
+    'begin_run',
+    'end_run',
+    'ProfileConfig',
+    'FileProfile',
+    'StackSampler',
+    'configure_profiling',
+    'profile_file',
     'HealthChecker',
     'HealthMonitor',
     'HealthCheck',
@@ -0,0 +1,442 @@
+"""
+Metric sinks for batch processing runs.
+
+RunMetrics accumulates throughput counters, cache statistics and peak
+memory for the current process. Snapshots of it, together with the
+tracer's per-stage latency histograms, are published to pluggable sinks:
+a Prometheus textfile-collector file, a JSON-lines log, or a local HTTP
+``/metrics`` endpoint.
+
+Sinks can be configured explicitly or through environment variables:
+
+- ``FLOWPROC_METRICS_TEXTFILE``: path of the ``.prom`` file to rewrite
+- ``FLOWPROC_METRICS_JSONL``: path of the JSON-lines file to append to
+- ``FLOWPROC_METRICS_PORT``: port for the local ``/metrics`` endpoint
+
+Runners bracket a batch with begin_run() and end_run(): the outermost
+run resets the counters and publishes when it ends, so a directory
+processed as part of a larger GUI batch is counted in that batch.
+"""
+
+import json
+from abc import ABC, abstractmethod
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, List, Mapping, Optional, Tuple, Union
+
+import psutil
+
+from .tracing import LatencyHistogram, Tracer, tracer as default_tracer
+
+logger = logging.getLogger(__name__)
+
+ENV_TEXTFILE = 'FLOWPROC_METRICS_TEXTFILE'
+ENV_JSONL = 'FLOWPROC_METRICS_JSONL'
+ENV_PORT = 'FLOWPROC_METRICS_PORT'
+
+# Counter name -> help text
+COUNTERS = {
+    'files_processed': "Input files processed successfully",
+    'files_failed': "Input files that failed to process",
+    'rows_processed': "Data rows parsed from input files",
+    'bytes_read': "Bytes read from input files",
+    'bytes_written': "Bytes written to output files",
+}
+
+
+@dataclass
+class MetricsSnapshot:
+    """Point-in-time view of the run metrics."""
+    timestamp: float
+    elapsed_seconds: float
+    counters: Dict[str, int]
+    peak_rss_bytes: int
+    cache_hit_ratios: Dict[str, float] = field(default_factory=dict)
+    latencies: Dict[str, LatencyHistogram] = field(default_factory=dict)
+
+    @property
+    def files_per_second(self) -> float:
+        """Successfully processed files per second of run time."""
+        return self.counters['files_processed'] / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        """Parsed rows per second of run time."""
+        return self.counters['rows_processed'] / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def to_dict(self) -> Dict[str, object]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            'timestamp': self.timestamp,
+            'elapsed_seconds': self.elapsed_seconds,
+            **self.counters,
+            'files_per_second': self.files_per_second,
+            'rows_per_second': self.rows_per_second,
+            'peak_rss_bytes': self.peak_rss_bytes,
+            'cache_hit_ratios': self.cache_hit_ratios,
+            'stage_latency_seconds': {name: h.summary() for name, h in self.latencies.items()},
+        }
+
+
+class RunMetrics:
+    """Thread-safe throughput counters for the current process."""
+
+    def __init__(self, tracer: Optional[Tracer] = None):
+        """
+        Initialize the run metrics.
+
+        Args:
+            tracer: Tracer whose latency histograms are included in snapshots
+        """
+        self.tracer = tracer or default_tracer
+        self._lock = threading.Lock()
+        self._process = psutil.Process()
+        self._caches: Dict[str, Callable[[], Tuple[int, int]]] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        """Zero all counters and restart the run clock."""
+        with self._lock:
+            self._counters = dict.fromkeys(COUNTERS, 0)
+            self._started = time.perf_counter()
+            self._peak_rss = 0
+        self.sample_memory()
+
+    def record_file(self, rows: int = 0, bytes_read: int = 0, bytes_written: int = 0) -> None:
+        """
+        Record a successfully processed file.
+
+        Args:
+            rows: Number of data rows parsed
+            bytes_read: Size of the input
+            bytes_written: Total size of the outputs
+        """
+        with self._lock:
+            self._counters['files_processed'] += 1
+            self._counters['rows_processed'] += rows
+            self._counters['bytes_read'] += bytes_read
+            self._counters['bytes_written'] += bytes_written
+        self.sample_memory()
+
+    def record_failure(self) -> None:
+        """Record a file that failed to process."""
+        with self._lock:
+            self._counters['files_failed'] += 1
+
+    def register_cache(self, name: str, stats: Callable[[], Tuple[int, int]]) -> None:
+        """
+        Report a cache's hit ratio in snapshots.
+
+        Args:
+            name: Cache name used as the metric label
+            stats: Callable returning the cache's (hits, misses)
+        """
+        with self._lock:
+            self._caches[name] = stats
+
+    def sample_memory(self) -> int:
+        """Update and return the peak resident set size in bytes."""
+        rss = self._process.memory_info().rss
+        with self._lock:
+            self._peak_rss = max(self._peak_rss, rss)
+            return self._peak_rss
+
+    def snapshot(self) -> MetricsSnapshot:
+        """Capture the current metrics."""
+        peak_rss = self.sample_memory()
+        with self._lock:
+            counters = dict(self._counters)
+            elapsed = time.perf_counter() - self._started
+            caches = dict(self._caches)
+
+        hit_ratios = {}
+        for name, stats in caches.items():
+            try:
+                hits, misses = stats()
+            except Exception as e:
+                logger.debug(f"Failed to read cache stats for {name}: {e}")
+                continue
+            total = hits + misses
+            hit_ratios[name] = hits / total if total else 0.0
+
+        return MetricsSnapshot(
+            timestamp=time.time(),
+            elapsed_seconds=elapsed,
+            counters=counters,
+            peak_rss_bytes=peak_rss,
+            cache_hit_ratios=hit_ratios,
+            latencies=self.tracer.get_histograms(),
+        )
+
+
+def file_size(path: Union[str, Path]) -> int:
+    """Size of a file in bytes, or 0 if it cannot be read."""
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def _escape_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def render_prometheus(snapshot: MetricsSnapshot, prefix: str = 'flowproc') -> str:
+    """
+    Render a snapshot in the Prometheus text exposition format.
+
+    Args:
+        snapshot: Metrics to render
+        prefix: Metric name prefix
+
+    Returns:
+        Exposition text ending with a newline
+    """
+    lines: List[str] = []
+
+    def metric(name: str, kind: str, help_text: str, value: float) -> None:
+        lines.append(f"# HELP {prefix}_{name} {help_text}")
+        lines.append(f"# TYPE {prefix}_{name} {kind}")
+        lines.append(f"{prefix}_{name} {value}")
+
+    for name, help_text in COUNTERS.items():
+        metric(f"{name}_total", 'counter', help_text, snapshot.counters[name])
+    metric('files_per_second', 'gauge', "Files processed per second of run time", snapshot.files_per_second)
+    metric('rows_per_second', 'gauge', "Rows parsed per second of run time", snapshot.rows_per_second)
+    metric('peak_rss_bytes', 'gauge', "Peak resident set size", snapshot.peak_rss_bytes)
+    metric('run_duration_seconds', 'gauge', "Time since the run metrics were reset", snapshot.elapsed_seconds)
+
+    if snapshot.cache_hit_ratios:
+        lines.append(f"# HELP {prefix}_cache_hit_ratio Fraction of cache lookups that hit")
+        lines.append(f"# TYPE {prefix}_cache_hit_ratio gauge")
+        for cache, ratio in sorted(snapshot.cache_hit_ratios.items()):
+            lines.append(f'{prefix}_cache_hit_ratio{{cache="{_escape_label(cache)}"}} {ratio}')
+
+    if snapshot.latencies:
+        name = f"{prefix}_stage_latency_seconds"
+        lines.append(f"# HELP {name} Latency of traced processing stages")
+        lines.append(f"# TYPE {name} histogram")
+        for stage, histogram in sorted(snapshot.latencies.items()):
+            label = f'stage="{_escape_label(stage)}"'
+            cumulative = 0
+            for bound, count in zip(histogram.buckets, histogram.bucket_counts):
+                cumulative += count
+                lines.append(f'{name}_bucket{{{label},le="{bound}"}} {cumulative}')
+            lines.append(f'{name}_bucket{{{label},le="+Inf"}} {histogram.count}')
+            lines.append(f'{name}_sum{{{label}}} {histogram.total}')
+            lines.append(f'{name}_count{{{label}}} {histogram.count}')
+
+    return '\n'.join(lines) + '\n'
+
+
+class MetricsSink(ABC):
+    """Destination for metric snapshots."""
+
+    @abstractmethod
+    def emit(self, snapshot: MetricsSnapshot) -> None:
+        """Publish a snapshot."""
+
+    def close(self) -> None:
+        """Release any resources held by the sink."""
+
+
+class PrometheusTextfileSink(MetricsSink):
+    """Rewrites a file for the node exporter's textfile collector."""
+
+    def __init__(self, path: Union[str, Path], prefix: str = 'flowproc'):
+        self.path = Path(path)
+        self.prefix = prefix
+
+    def emit(self, snapshot: MetricsSnapshot) -> None:
+        # Write then rename so the collector never reads a partial file
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        tmp_path.write_text(render_prometheus(snapshot, self.prefix), encoding='utf-8')
+        os.replace(tmp_path, self.path)
+
+
+class JsonLinesSink(MetricsSink):
+    """Appends one JSON object per snapshot."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def emit(self, snapshot: MetricsSnapshot) -> None:
+        line = json.dumps(snapshot.to_dict(), sort_keys=True)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, open(self.path, 'a', encoding='utf-8') as f:
+            f.write(line + '\n')
+
+
+class MetricsHTTPServer(MetricsSink):
+    """
+    Serves live metrics at ``/metrics`` from a background thread.
+
+    Every scrape renders a fresh snapshot, so emit() is a no-op.
+    """
+
+    def __init__(self, port: int, host: str = '127.0.0.1',
+                 metrics: Optional[RunMetrics] = None, prefix: str = 'flowproc'):
+        metrics = metrics or run_metrics
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?', 1)[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = render_prometheus(metrics.snapshot(), prefix).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug("metrics endpoint: " + format, *args)
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"Serving metrics on http://{host}:{self.port}/metrics")
+
+    @property
+    def port(self) -> int:
+        """Port the server is bound to."""
+        return self._server.server_address[1]
+
+    def emit(self, snapshot: MetricsSnapshot) -> None:
+        pass
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+
+# Global instances
+run_metrics = RunMetrics()
+_sinks: List[MetricsSink] = []
+_sinks_lock = threading.Lock()
+_env_configured = False
+_run_depth = 0
+_run_lock = threading.Lock()
+
+
+def add_sink(sink: MetricsSink) -> MetricsSink:
+    """Register a sink for publish_metrics."""
+    with _sinks_lock:
+        _sinks.append(sink)
+    return sink
+
+
+def clear_sinks() -> None:
+    """Close and unregister all sinks."""
+    with _sinks_lock:
+        sinks = list(_sinks)
+        _sinks.clear()
+    for sink in sinks:
+        sink.close()
+
+
+def configure_sinks(textfile: Optional[Union[str, Path]] = None,
+                    jsonl: Optional[Union[str, Path]] = None,
+                    port: Optional[int] = None,
+                    environ: Optional[Mapping[str, str]] = None) -> List[MetricsSink]:
+    """
+    Register sinks from explicit settings, falling back to the environment.
+
+    Args:
+        textfile: Prometheus textfile path
+        jsonl: JSON-lines file path
+        port: Port for the local HTTP endpoint
+        environ: Environment to read (defaults to os.environ)
+
+    Returns:
+        The sinks that were registered; sinks that cannot be set up (an
+        invalid port, a port already in use) are logged and skipped
+    """
+    global _env_configured
+    # Set up front so a bad setting is reported once, not on every run
+    _env_configured = True
+    env = os.environ if environ is None else environ
+    textfile = textfile or env.get(ENV_TEXTFILE)
+    jsonl = jsonl or env.get(ENV_JSONL)
+    if port is None and env.get(ENV_PORT):
+        try:
+            port = int(env[ENV_PORT])
+        except ValueError:
+            logger.warning(f"Ignoring {ENV_PORT}={env[ENV_PORT]!r}: not a port number")
+
+    factories: List[Tuple[str, Callable[[], MetricsSink]]] = []
+    if textfile:
+        factories.append(('textfile', lambda: PrometheusTextfileSink(textfile)))
+    if jsonl:
+        factories.append(('JSON-lines', lambda: JsonLinesSink(jsonl)))
+    if port is not None:
+        factories.append(('HTTP', lambda: MetricsHTTPServer(port)))
+
+    sinks: List[MetricsSink] = []
+    for kind, factory in factories:
+        try:
+            sinks.append(add_sink(factory()))
+        except Exception as e:
+            logger.warning(f"Failed to set up {kind} metrics sink: {e}")
+    return sinks
+
+
+def publish_metrics() -> Optional[MetricsSnapshot]:
+    """
+    Send a snapshot of run_metrics to every registered sink.
+
+    Sinks from the environment are registered on first use if none were
+    configured. Sink failures are logged and never raised.
+
+    Returns:
+        The published snapshot, or None when no sinks are registered
+    """
+    if not _env_configured:
+        configure_sinks()
+
+    with _sinks_lock:
+        sinks = list(_sinks)
+    if not sinks:
+        return None
+
+    snapshot = run_metrics.snapshot()
+    for sink in sinks:
+        try:
+            sink.emit(snapshot)
+        except Exception as e:
+            logger.warning(f"Failed to publish metrics to {type(sink).__name__}: {e}")
+    return snapshot
+
+
+def begin_run() -> None:
+    """Start a processing run; the outermost run resets run_metrics."""
+    global _run_depth
+    with _run_lock:
+        _run_depth += 1
+        outermost = _run_depth == 1
+    if outermost:
+        run_metrics.reset()
+
+
+def end_run() -> Optional[MetricsSnapshot]:
+    """
+    Finish a processing run started with begin_run.
+
+    Returns:
+        The snapshot published when the outermost run ends, otherwise None
+    """
+    global _run_depth
+    with _run_lock:
+        _run_depth = max(_run_depth - 1, 0)
+        outermost = _run_depth == 0
+    return publish_metrics() if outermost else None
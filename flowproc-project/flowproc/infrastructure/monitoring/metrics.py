@@ -5,11 +5,15 @@ Performance metrics and monitoring for flow cytometry processing.
 import time
 import psutil
 import logging
-from typing import Dict, Any, Optional, List
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, List, Deque, Iterator, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 import threading
 
+from .tracing import Span, Tracer, tracer as default_tracer
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,20 +24,42 @@ class PerformanceMetrics:
     start_time: float
     end_time: Optional[float] = None
     duration: Optional[float] = None
-    memory_usage_mb: Optional[float] = None
-    cpu_usage_percent: Optional[float] = None
+    memory_usage_mb: Optional[float] = None  # Process RSS when the operation ended
+    cpu_usage_percent: Optional[float] = None  # Process CPU time over the duration
     success: bool = True
     error_message: Optional[str] = None
+    memory_delta_mb: Optional[float] = None
+    parent_id: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
 class MetricsCollector:
-    """Collects and manages performance metrics."""
+    """
+    Collects and manages performance metrics.
+
+    Operations are recorded as spans on the shared tracer, so each
+    operation id closes exactly the operation it was returned for and
+    nested operations are linked to their parent.
+    """
     
-    def __init__(self):
-        """Initialize the metrics collector."""
-        self.metrics: List[PerformanceMetrics] = []
+    def __init__(self, tracer: Optional[Tracer] = None, max_metrics: int = 1000):
+        """
+        Initialize the metrics collector.
+        
+        Args:
+            tracer: Tracer used to record operations (defaults to the global one)
+            max_metrics: Number of completed metrics kept in memory
+        """
+        self.tracer = tracer or default_tracer
+        self.metrics: Deque[PerformanceMetrics] = deque(maxlen=max_metrics)
+        # Open operations with the process CPU time at their start
+        self._open: Dict[str, Tuple[PerformanceMetrics, float]] = {}
         self._lock = threading.Lock()
+        self._process = psutil.Process()
+
+    def _cpu_seconds(self) -> float:
+        times = self._process.cpu_times()
+        return times.user + times.system
         
     def start_operation(self, operation_name: str, metadata: Optional[Dict[str, Any]] = None) -> str:
         """
@@ -46,18 +72,20 @@ class MetricsCollector:
         Returns:
             Operation ID for tracking
         """
-        operation_id = f"{operation_name}_{int(time.time() * 1000)}"
+        span = self.tracer.start_span(operation_name, metadata, activate=True)
+        operation_id = span.span_id
         
         metric = PerformanceMetrics(
             operation_name=operation_name,
             start_time=time.time(),
-            metadata=metadata or {}
+            metadata=span.metadata
         )
         
+        cpu_start = self._cpu_seconds()
         with self._lock:
-            self.metrics.append(metric)
+            self._open[operation_id] = (metric, cpu_start)
         
-        logger.debug(f"Started tracking operation: {operation_id}")
+        logger.debug(f"Started tracking operation: {operation_name} ({operation_id})")
         return operation_id
     
     def end_operation(self, operation_id: str, success: bool = True, 
@@ -70,21 +98,40 @@ class MetricsCollector:
             success: Whether the operation was successful
             error_message: Error message if operation failed
         """
+        span = self.tracer.end_span(operation_id, success=success, error_message=error_message)
+        cpu_end = self._cpu_seconds()
         with self._lock:
-            # Find the metric by operation name and start time
-            for metric in self.metrics:
-                if metric.end_time is None:  # Not yet ended
-                    metric.end_time = time.time()
-                    metric.duration = metric.end_time - metric.start_time
-                    metric.success = success
-                    metric.error_message = error_message
-                    
-                    # Collect system metrics
-                    metric.memory_usage_mb = psutil.virtual_memory().used / (1024 * 1024)
-                    metric.cpu_usage_percent = psutil.cpu_percent()
-                    
-                    logger.debug(f"Ended tracking operation: {operation_id}")
-                    break
+            opened = self._open.pop(operation_id, None)
+            if opened is None or span is None:
+                logger.debug(f"No open operation with ID: {operation_id}")
+                return
+            
+            metric, cpu_start = opened
+            metric.end_time = metric.start_time + span.duration
+            metric.duration = span.duration
+            metric.success = success
+            metric.error_message = error_message
+            metric.memory_usage_mb = span.start_rss_mb + span.rss_delta_mb
+            metric.memory_delta_mb = span.rss_delta_mb
+            metric.parent_id = span.parent_id
+            if span.duration > 0:
+                # Like psutil's Process.cpu_percent, busy threads can exceed 100
+                metric.cpu_usage_percent = 100.0 * (cpu_end - cpu_start) / span.duration
+            self.metrics.append(metric)
+        
+        logger.debug(f"Ended tracking operation: {operation_id}")
+    
+    @contextmanager
+    def track(self, operation_name: str, /, **metadata: Any) -> Iterator[Span]:
+        """
+        Track a block as an operation nested under the active span.
+        
+        Args:
+            operation_name: Name of the operation
+            **metadata: Additional metadata
+        """
+        with self.tracer.span(operation_name, **metadata) as span:
+            yield span
     
     def get_metrics(self, operation_name: Optional[str] = None) -> List[PerformanceMetrics]:
         """
@@ -99,7 +146,7 @@ class MetricsCollector:
         with self._lock:
             if operation_name:
                 return [m for m in self.metrics if m.operation_name == operation_name]
-            return self.metrics.copy()
+            return list(self.metrics)
     
     def get_summary(self) -> Dict[str, Any]:
         """Get summary statistics of collected metrics."""
@@ -107,7 +154,7 @@ class MetricsCollector:
             if not self.metrics:
                 return {}
             
-            completed_metrics = [m for m in self.metrics if m.end_time is not None]
+            completed_metrics = list(self.metrics)
             
             if not completed_metrics:
                 return {}
@@ -117,7 +164,7 @@ class MetricsCollector:
             cpu_usage = [m.cpu_usage_percent for m in completed_metrics if m.cpu_usage_percent is not None]
             
             summary = {
-                'total_operations': len(self.metrics),
+                'total_operations': len(self.metrics) + len(self._open),
                 'completed_operations': len(completed_metrics),
                 'successful_operations': len([m for m in completed_metrics if m.success]),
                 'failed_operations': len([m for m in completed_metrics if not m.success]),
@@ -0,0 +1,333 @@
+"""
+Per-file profiling of the CSV processing stages.
+
+While a file is profiled, the tracer spans opened by the pipeline (read,
+type detection, sample-ID parsing, replicate mapping, reshape, workbook
+build, save) are collected into a per-file stage report. Optionally the
+file is also run under cProfile or a stack sampler. Each profiled file
+produces, in the profile directory:
+
+- ``<name>.profile.txt``: stage timings (and top functions for cProfile)
+- ``<name>.collapsed``: collapsed stacks for flamegraph.pl, speedscope or
+  inferno; stage paths weighted by self time in microseconds, or sampled
+  Python stacks weighted by sample count
+- ``<name>.pstats``: raw cProfile data (cProfile mode only)
+
+Profiling is enabled with ``flowproc-cli --profile`` or, for the GUI, with
+environment variables:
+
+- ``FLOWPROC_PROFILE``: ``stages``, ``cprofile`` or ``sample``
+- ``FLOWPROC_PROFILE_DIR``: where reports are written
+"""
+
+import cProfile
+import io
+import logging
+import os
+import pstats
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple, Union
+
+from .tracing import Span, Tracer, tracer as default_tracer
+
+logger = logging.getLogger(__name__)
+
+ENV_PROFILE = 'FLOWPROC_PROFILE'
+ENV_PROFILE_DIR = 'FLOWPROC_PROFILE_DIR'
+
+PROFILE_MODES = ('stages', 'cprofile', 'sample')
+DEFAULT_PROFILE_DIR = Path(tempfile.gettempdir()) / 'flowproc_profiles'
+
+
+@dataclass
+class ProfileConfig:
+    """How files are profiled."""
+    mode: str = 'stages'
+    output_dir: Path = DEFAULT_PROFILE_DIR
+    sample_interval: float = 0.005
+    top_functions: int = 30
+
+    def __post_init__(self):
+        if self.mode not in PROFILE_MODES:
+            raise ValueError(f"Unknown profile mode '{self.mode}'; expected one of {', '.join(PROFILE_MODES)}")
+        self.output_dir = Path(self.output_dir)
+
+
+@dataclass
+class StageTiming:
+    """Aggregated timing of one stage path."""
+    path: Tuple[str, ...]
+    calls: int = 0
+    total: float = 0.0
+    self_time: float = 0.0
+    rss_delta_mb: float = 0.0
+
+    @property
+    def name(self) -> str:
+        return self.path[-1]
+
+    @property
+    def depth(self) -> int:
+        return len(self.path) - 1
+
+
+@dataclass
+class FileProfile:
+    """Profile of one processed file, filled in when profiling ends."""
+    input_file: Path
+    mode: str
+    duration: float = 0.0
+    success: bool = True
+    stages: List[StageTiming] = field(default_factory=list)
+    collapsed: Dict[str, float] = field(default_factory=dict)
+    function_stats: Optional[str] = None
+    report_path: Optional[Path] = None
+    collapsed_path: Optional[Path] = None
+    pstats_path: Optional[Path] = None
+
+    def render(self) -> str:
+        """Render the plain-text report."""
+        lines = [
+            f"Profile of {self.input_file}",
+            f"Mode: {self.mode}  Total: {self.duration:.3f}s  Status: {'ok' if self.success else 'failed'}",
+            "",
+            f"{'Stage':<48} {'Calls':>6} {'Total (s)':>10} {'Self (s)':>10} {'%':>6} {'RSS Δ (MB)':>11}",
+        ]
+        for stage in self.stages:
+            share = stage.total / self.duration * 100 if self.duration else 0.0
+            label = '  ' * stage.depth + stage.name
+            lines.append(
+                f"{label:<48} {stage.calls:>6} {stage.total:>10.4f} {stage.self_time:>10.4f} "
+                f"{share:>6.1f} {stage.rss_delta_mb:>11.1f}"
+            )
+        if self.function_stats:
+            lines += ["", "Top functions by cumulative time:", self.function_stats]
+        return "\n".join(lines) + "\n"
+
+
+class StackSampler:
+    """
+    Sampling profiler for one thread.
+
+    A daemon thread records the target thread's Python stack at a fixed
+    interval, so overhead is bounded regardless of how many calls are made.
+    """
+
+    def __init__(self, thread_id: int, interval: float = 0.005):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="flowproc-stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> Counter:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        return self.samples
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                self.samples[';'.join(reversed(stack))] += 1
+
+
+def collect_stages(root: Span, spans: List[Span]) -> List[StageTiming]:
+    """
+    Aggregate the spans below root by their path of span names.
+
+    Args:
+        root: The span that encloses the profiled work
+        spans: Finished spans to consider
+
+    Returns:
+        Stage timings in first-seen order, parents before children
+    """
+    by_id = {s.span_id: s for s in spans}
+    by_id[root.span_id] = root
+    paths: Dict[str, Tuple[str, ...]] = {root.span_id: (root.name,)}
+
+    def path_of(span: Span) -> Optional[Tuple[str, ...]]:
+        if span.span_id in paths:
+            return paths[span.span_id]
+        parent = by_id.get(span.parent_id) if span.parent_id else None
+        parent_path = path_of(parent) if parent is not None else None
+        path = parent_path + (span.name,) if parent_path is not None else None
+        paths[span.span_id] = path
+        return path
+
+    stages: Dict[Tuple[str, ...], StageTiming] = {}
+    for span in sorted(by_id.values(), key=lambda s: s.start_time):
+        path = path_of(span)
+        if path is None or span.duration is None:
+            continue
+        stage = stages.setdefault(path, StageTiming(path))
+        stage.calls += 1
+        stage.total += span.duration
+        stage.self_time += span.duration
+        stage.rss_delta_mb += span.rss_delta_mb or 0.0
+        if len(path) > 1:
+            stages[path[:-1]].self_time -= span.duration
+    return list(stages.values())
+
+
+def _stage_stacks(stages: List[StageTiming]) -> Dict[str, float]:
+    """Collapsed stacks of stage paths weighted by self time in microseconds."""
+    return {
+        ';'.join(stage.path): round(max(stage.self_time, 0.0) * 1e6)
+        for stage in stages
+    }
+
+
+def _function_stats(profiler: cProfile.Profile, limit: int) -> str:
+    stream = io.StringIO()
+    pstats.Stats(profiler, stream=stream).sort_stats('cumulative').print_stats(limit)
+    return stream.getvalue().strip()
+
+
+def _write_outputs(profile: FileProfile, config: ProfileConfig,
+                   profiler: Optional[cProfile.Profile]) -> None:
+    config.output_dir.mkdir(parents=True, exist_ok=True)
+    now = time.time()
+    stamp = time.strftime('%Y%m%d-%H%M%S', time.localtime(now))
+    stem = f"{profile.input_file.stem}.{stamp}-{int(now * 1000) % 1000:03d}"
+
+    profile.report_path = config.output_dir / f"{stem}.profile.txt"
+    profile.report_path.write_text(profile.render(), encoding='utf-8')
+
+    profile.collapsed_path = config.output_dir / f"{stem}.collapsed"
+    with open(profile.collapsed_path, 'w', encoding='utf-8') as f:
+        for stack, weight in profile.collapsed.items():
+            f.write(f"{stack} {int(weight)}\n")
+
+    if profiler is not None:
+        profile.pstats_path = config.output_dir / f"{stem}.pstats"
+        profiler.dump_stats(str(profile.pstats_path))
+
+
+@contextmanager
+def profile_file(input_file: Union[str, Path], config: Optional[ProfileConfig] = None,
+                 tracer: Optional[Tracer] = None) -> Iterator[Optional[FileProfile]]:
+    """
+    Profile the processing of one file.
+
+    Does nothing unless a config is given or profiling has been configured.
+    Report files are written even if the block raises.
+
+    Args:
+        input_file: File being processed (names the report files)
+        config: Profiling settings; defaults to the configured ones
+        tracer: Tracer the pipeline records its spans on
+
+    Yields:
+        The FileProfile, completed once the block exits, or None when
+        profiling is disabled
+    """
+    config = config or get_profile_config()
+    if config is None:
+        yield None
+        return
+
+    tracer = tracer or default_tracer
+    profile = FileProfile(Path(input_file), config.mode)
+    profiler = cProfile.Profile() if config.mode == 'cprofile' else None
+    sampler = StackSampler(threading.get_ident(), config.sample_interval) if config.mode == 'sample' else None
+
+    root: Optional[Span] = None
+    samples: Optional[Counter] = None
+    # Collected rather than read from the ring buffer, which a large file can overrun
+    with tracer.collect() as spans:
+        try:
+            with tracer.span("profile", input_file=str(input_file)) as root:
+                if sampler is not None:
+                    sampler.start()
+                if profiler is not None:
+                    profiler.enable()
+                try:
+                    yield profile
+                except BaseException:
+                    profile.success = False
+                    raise
+                finally:
+                    if profiler is not None:
+                        profiler.disable()
+                    if sampler is not None:
+                        samples = sampler.stop()
+        finally:
+            # The root span is closed and recorded once the with block exits
+            profile.duration = root.duration or 0.0
+            profile.stages = collect_stages(root, spans)
+            profile.collapsed = dict(samples) if samples is not None else _stage_stacks(profile.stages)
+            if profiler is not None:
+                profile.function_stats = _function_stats(profiler, config.top_functions)
+            try:
+                _write_outputs(profile, config, profiler)
+                logger.info(f"Wrote profile of {profile.input_file.name} to {profile.report_path}")
+            except OSError as e:
+                logger.warning(f"Failed to write profile for {profile.input_file}: {e}")
+
+
+# Active configuration, set by configure_profiling or read from the environment on first use
+_config: Optional[ProfileConfig] = None
+_env_configured = False
+
+
+def configure_profiling(mode: Optional[str] = None,
+                        output_dir: Optional[Union[str, Path]] = None,
+                        environ: Optional[Mapping[str, str]] = None) -> Optional[ProfileConfig]:
+    """
+    Enable or disable profiling from explicit settings, falling back to the environment.
+
+    Args:
+        mode: One of PROFILE_MODES; ``None`` reads FLOWPROC_PROFILE
+            (``1``/``true`` mean ``stages``, empty or ``0`` disables)
+        output_dir: Report directory; ``None`` reads FLOWPROC_PROFILE_DIR
+        environ: Environment to read (defaults to os.environ)
+
+    Returns:
+        The active configuration, or None when profiling is disabled
+    """
+    global _config, _env_configured
+    env = os.environ if environ is None else environ
+    if mode is None:
+        mode = env.get(ENV_PROFILE, '').strip().lower()
+        if mode in ('1', 'true', 'yes', 'on'):
+            mode = 'stages'
+        elif mode in ('', '0', 'false', 'no', 'off'):
+            mode = None
+    output_dir = output_dir or env.get(ENV_PROFILE_DIR) or DEFAULT_PROFILE_DIR
+
+    _config = ProfileConfig(mode=mode, output_dir=Path(output_dir)) if mode else None
+    _env_configured = True
+    if _config is not None:
+        logger.info(f"Profiling enabled ({_config.mode}); reports go to {_config.output_dir}")
+    return _config
+
+
+def get_profile_config() -> Optional[ProfileConfig]:
+    """Get the active profiling configuration, reading the environment on first use."""
+    global _env_configured
+    if not _env_configured:
+        try:
+            configure_profiling()
+        except ValueError as e:
+            logger.warning(f"Ignoring {ENV_PROFILE}: {e}")
+            _env_configured = True
+    return _config
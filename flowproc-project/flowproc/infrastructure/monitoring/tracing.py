@@ -0,0 +1,331 @@
+"""
+Span-based hierarchical profiling for flow cytometry processing.
+
+A span times one named operation. Spans opened while another span is
+active in the same thread or task become its children, so nested work such
+as ``process_batch`` around ``process_file`` is attributed correctly while
+other threads record their own spans concurrently. Finished
+spans are kept in a bounded ring buffer and folded into per-operation
+latency histograms.
+"""
+
+import functools
+import itertools
+import logging
+import math
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+import psutil
+
+from ...logging_config import PERFORMANCE
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) of the latency histogram buckets
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0
+)
+
+_current_span: ContextVar[Optional['Span']] = ContextVar('flowproc_current_span', default=None)
+
+
+@dataclass
+class Span:
+    """A single timed operation."""
+    name: str
+    span_id: str
+    parent_id: Optional[str]
+    start_time: float
+    start_rss_mb: float
+    end_time: Optional[float] = None
+    duration: Optional[float] = None
+    rss_delta_mb: Optional[float] = None
+    success: bool = True
+    error_message: Optional[str] = None
+    thread_id: int = 0
+    process_id: int = 0
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def finished(self) -> bool:
+        """Whether the span has been ended."""
+        return self.end_time is not None
+
+
+class LatencyHistogram:
+    """
+    Latency distribution for one operation.
+
+    Cumulative-friendly bucket counts cover every observation; percentiles
+    are computed exactly over a bounded window of the most recent samples.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS, window: int = 1024):
+        self.buckets = tuple(sorted(buckets))
+        self.bucket_counts = [0] * (len(self.buckets) + 1)  # Last slot is +Inf
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._recent: Deque[float] = deque(maxlen=window)
+
+    def observe(self, value: float) -> None:
+        """Record one duration in seconds."""
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+        self.bucket_counts[index] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+        self._recent.append(value)
+
+    def percentile(self, q: float) -> float:
+        """
+        Nearest-rank percentile over the recent sample window.
+
+        Args:
+            q: Percentile in the range 0-100
+
+        Returns:
+            Duration in seconds, or 0.0 if nothing was observed
+        """
+        if not self._recent:
+            return 0.0
+        ordered = sorted(self._recent)
+        rank = min(len(ordered), max(1, math.ceil(q / 100.0 * len(ordered))))
+        return ordered[rank - 1]
+
+    def summary(self) -> Dict[str, float]:
+        """Get count, mean, max and p50/p95/p99 latencies."""
+        return {
+            'count': self.count,
+            'mean': self.total / self.count if self.count else 0.0,
+            'max': self.max,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'p99': self.percentile(99),
+        }
+
+
+class Tracer:
+    """
+    Records spans and aggregates their latencies.
+
+    Thread-safe; span ids embed the process id and the state is reset in
+    forked children, so worker processes never report a parent's spans.
+    """
+
+    def __init__(self, max_spans: int = 2048, buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS):
+        """
+        Initialize the tracer.
+
+        Args:
+            max_spans: Number of finished spans kept in the ring buffer
+            buckets: Latency histogram bucket bounds in seconds
+        """
+        self.max_spans = max_spans
+        self.buckets = buckets
+        self._reset()
+
+    def _reset(self) -> None:
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._process = psutil.Process()
+        self._pid = os.getpid()
+        self._open: Dict[str, Span] = {}
+        self._finished: Deque[Span] = deque(maxlen=self.max_spans)
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        # Lists receiving every finished span, see collect()
+        self._collectors: List[List[Span]] = []
+
+    def _rss_mb(self) -> float:
+        return self._process.memory_info().rss / (1024 * 1024)
+
+    def start_span(self, name: str, metadata: Optional[Dict[str, Any]] = None,
+                   parent_id: Optional[str] = None, activate: bool = False) -> Span:
+        """
+        Open a span that stays open until end_span is called with its id.
+
+        Args:
+            name: Operation name
+            metadata: Additional metadata
+            parent_id: Explicit parent; defaults to the currently active span
+            activate: Make the span the parent of spans started after it in
+                this thread until it ends
+
+        Returns:
+            The new span; pass its id to end_span
+        """
+        if parent_id is None:
+            current = _current_span.get()
+            parent_id = current.span_id if current is not None else None
+
+        span = Span(
+            name=name,
+            span_id=f"{self._pid}-{next(self._ids)}",
+            parent_id=parent_id,
+            start_time=time.perf_counter(),
+            start_rss_mb=self._rss_mb(),
+            thread_id=threading.get_ident(),
+            process_id=self._pid,
+            metadata=metadata or {},
+        )
+        with self._lock:
+            self._open[span.span_id] = span
+        if activate:
+            _current_span.set(span)
+        return span
+
+    def end_span(self, span_id: str, success: bool = True,
+                 error_message: Optional[str] = None) -> Optional[Span]:
+        """
+        Close a span by id.
+
+        Args:
+            span_id: Id returned by start_span
+            success: Whether the operation was successful
+            error_message: Error message if the operation failed
+
+        Returns:
+            The finished span, or None if the id is unknown or already ended
+        """
+        end_time = time.perf_counter()
+        rss_mb = self._rss_mb()
+        with self._lock:
+            span = self._open.pop(span_id, None)
+            if span is None:
+                logger.debug("Ignoring end of unknown span %s", span_id)
+                return None
+            span.end_time = end_time
+            span.duration = end_time - span.start_time
+            span.rss_delta_mb = rss_mb - span.start_rss_mb
+            span.success = success
+            span.error_message = error_message
+            self._finished.append(span)
+            for collector in self._collectors:
+                collector.append(span)
+            histogram = self._histograms.get(span.name)
+            if histogram is None:
+                histogram = self._histograms[span.name] = LatencyHistogram(self.buckets)
+            histogram.observe(span.duration)
+            parent = self._open.get(span.parent_id) if span.parent_id else None
+        if _current_span.get() is span:
+            _current_span.set(parent)
+        if logger.isEnabledFor(PERFORMANCE):
+            logger.log(PERFORMANCE, "%s took %.4fs (RSS %+.1f MB)%s", span.name, span.duration,
+                       span.rss_delta_mb, "" if success else " [failed]")
+        return span
+
+    @contextmanager
+    def span(self, name: str, /, **metadata: Any) -> Iterator[Span]:
+        """
+        Time a block as a child of the currently active span.
+
+        Args:
+            name: Operation name
+            **metadata: Additional metadata stored on the span
+
+        Yields:
+            The active span; metadata may be added to it inside the block
+        """
+        span = self.start_span(name, metadata)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            self.end_span(span.span_id, success=False, error_message=str(e))
+            raise
+        else:
+            self.end_span(span.span_id)
+        finally:
+            _current_span.reset(token)
+
+    @contextmanager
+    def collect(self) -> Iterator[List[Span]]:
+        """
+        Gather every span that finishes inside the block.
+
+        Unlike get_spans, nothing is evicted, so a long block sees all of
+        its spans however small the ring buffer is.
+
+        Yields:
+            List that finished spans are appended to, in finishing order
+        """
+        spans: List[Span] = []
+        with self._lock:
+            self._collectors.append(spans)
+        try:
+            yield spans
+        finally:
+            with self._lock:
+                self._collectors = [c for c in self._collectors if c is not spans]
+
+    def trace(self, name: Optional[str] = None) -> Callable:
+        """
+        Decorator that runs each call of a function inside a span.
+
+        Args:
+            name: Span name; defaults to the function's qualified name
+        """
+        def decorator(func: Callable) -> Callable:
+            span_name = name or func.__qualname__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(span_name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def current_span(self) -> Optional[Span]:
+        """Get the span active in the calling context."""
+        return _current_span.get()
+
+    def get_spans(self, name: Optional[str] = None) -> List[Span]:
+        """
+        Get recently finished spans, oldest first.
+
+        Args:
+            name: Filter by operation name
+        """
+        with self._lock:
+            if name:
+                return [s for s in self._finished if s.name == name]
+            return list(self._finished)
+
+    def get_open_spans(self) -> List[Span]:
+        """Get spans that have been started but not yet ended."""
+        with self._lock:
+            return list(self._open.values())
+
+    def get_latency_summary(self) -> Dict[str, Dict[str, float]]:
+        """Get latency statistics keyed by operation name."""
+        with self._lock:
+            return {name: h.summary() for name, h in self._histograms.items()}
+
+    def get_histograms(self) -> Dict[str, LatencyHistogram]:
+        """Get the per-operation latency histograms."""
+        with self._lock:
+            return dict(self._histograms)
+
+    def clear(self) -> None:
+        """Drop finished spans and histograms; open spans are kept."""
+        with self._lock:
+            self._finished.clear()
+            self._histograms.clear()
+
+
+# Global instance
+tracer = Tracer()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=tracer._reset)
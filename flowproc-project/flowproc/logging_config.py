@@ -1,30 +1,99 @@
 # flowproc/logging_config.py
 import logging
+import logging.handlers
 import os
+import queue
 import shutil
 from pathlib import Path
 from datetime import datetime
 import sys
 import atexit
-from typing import Literal, Optional
+from typing import Literal, Optional, Union
 from .resource_utils import get_data_path, ensure_writable_dir
 
+# Between DEBUG and INFO: stage timings and other performance diagnostics
+# that are useful in production without the volume of DEBUG output.
+PERFORMANCE = 15
+logging.addLevelName(PERFORMANCE, 'PERF')
+
+# Overrides the default INFO level, e.g. FLOWPROC_LOG_LEVEL=DEBUG or =PERF
+ENV_LOG_LEVEL = 'FLOWPROC_LOG_LEVEL'
+
+# Handlers fed from the queue by a background thread, so processing threads
+# only enqueue records and never wait on console or disk I/O.
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def resolve_log_level(level: Optional[Union[int, str]] = None) -> int:
+    """
+    Resolve a level name or number, falling back to FLOWPROC_LOG_LEVEL and then INFO.
+
+    Args:
+        level: Level number or name such as 'DEBUG', 'PERF' or 'INFO'
+
+    Returns:
+        Numeric logging level
+    """
+    if level is None:
+        level = os.getenv(ENV_LOG_LEVEL) or logging.INFO
+    if isinstance(level, str):
+        name = level.strip().upper()
+        resolved = PERFORMANCE if name in ('PERF', 'PERFORMANCE') else logging.getLevelName(name)
+        return resolved if isinstance(resolved, int) else logging.INFO
+    return int(level)
+
+
+def flush_logging() -> None:
+    """Block until every queued record has been written by the log listener."""
+    listener = _listener
+    if listener is not None:
+        # The listener marks each record done once its handlers have run
+        listener.queue.join()
+
+
+def shutdown_logging() -> None:
+    """Drain the log queue, then stop the listener and close its handlers."""
+    global _queue_handler, _listener
+    root = logging.getLogger()
+    if _queue_handler is not None:
+        root.removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None:
+        # Started in setup_logging; stopping drains the queue
+        _listener.stop()
+        for handler in _listener.handlers:
+            try:
+                handler.close()
+            except (OSError, ValueError):
+                # Handler might already be closed, ignore the error
+                pass
+        _listener = None
+
+
 def setup_logging(
     filemode: Literal['a', 'w'] = 'a',
     max_size_mb: int = 10,
     keep_backups: int = 3,
     project_root: Optional[Path] = None,
-    simulate_raise: bool = False  # Added for testing: Simulate OSError in mkdir
+    simulate_raise: bool = False,  # Added for testing: Simulate OSError in mkdir
+    level: Optional[Union[int, str]] = None
 ) -> bool:
     """
     Setup logging with console and file handlers, ensuring logs are written to disk.
 
+    Records are handed to a queue and written by a background listener
+    thread, so callers never block on I/O. Call flush_logging() to wait
+    for pending records; the queue is drained at interpreter exit.
+
     Args:
         filemode (Literal['a', 'w']): File mode for logging ('w' for write, 'a' for append). Defaults to 'a'.
         max_size_mb (int): Maximum log file size in MB before clearing. Defaults to 10.
         keep_backups (int): Number of backup log files to keep. Defaults to 3.
         project_root (Optional[Path]): Optional override for project root (for testing).
         simulate_raise (bool): Simulate OSError in mkdir for testing. Defaults to False.
+        level (Optional[Union[int, str]]): Root level; defaults to FLOWPROC_LOG_LEVEL or INFO.
+            DEBUG diagnostics are only written when this is DEBUG.
 
     Returns:
         bool: True if setup succeeds.
@@ -32,21 +101,23 @@ def setup_logging(
     Raises:
         OSError: If log directory creation or file operations fail (or simulated).
     """
+    global _queue_handler, _listener
     root = logging.getLogger()
-    if any(isinstance(h, logging.FileHandler) for h in root.handlers):
+    if _queue_handler is not None and _queue_handler in root.handlers:
         return True  # Already configured
+    if any(isinstance(h, logging.FileHandler) for h in root.handlers):
+        return True  # Configured elsewhere
+    shutdown_logging()  # Handlers were removed by someone else; start over
+
+    # Respect an existing level unless one is requested explicitly
+    if level is not None or os.getenv(ENV_LOG_LEVEL) or root.level == logging.NOTSET:
+        root.setLevel(resolve_log_level(level))
 
-    # Respect existing level if set; default to INFO, elevate to DEBUG only for development
-    if root.level == logging.NOTSET:
-        root.setLevel(logging.INFO)
-    # Do not blindly clear all handlers; add ours alongside console handler
+    fmt = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
     # Console handler
     console = logging.StreamHandler(sys.stderr)
-    console.setLevel(logging.DEBUG)
-    fmt = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     console.setFormatter(fmt)
-    root.addHandler(console)
 
     try:
         project_root_str = os.getenv('FLOWPROC_LOG_ROOT')
@@ -64,9 +135,7 @@ def setup_logging(
 
         log_file = log_path / 'processing.log'
 
-        root.debug(f"Resolved log directory: {log_path}")
-        root.debug(f"Resolved log file path: {log_file}")
-
+        cleared_message = None
         if log_file.exists():
             file_size_mb = log_file.stat().st_size / (1024 * 1024)
             if file_size_mb > max_size_mb:
@@ -75,56 +144,27 @@ def setup_logging(
                 shutil.copy2(log_file, backup_file)
                 with open(log_file, 'w') as f:
                     pass
-                root.debug(f"Log file cleared (was {file_size_mb:.1f}MB) - backup saved as {backup_file.name}")
+                cleared_message = f"Log file cleared (was {file_size_mb:.1f}MB) - backup saved as {backup_file.name}"
 
         file_handler = logging.FileHandler(log_file, mode=filemode, encoding='utf-8')
-        file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(fmt)
-        root.addHandler(file_handler)
-
-        def custom_flush():
-            try:
-                for handler in root.handlers:
-                    if isinstance(handler, logging.FileHandler):
-                        try:
-                            handler.flush()
-                            with open(log_file, 'a') as f:
-                                f.flush()
-                                os.fsync(f.fileno())
-                        except (OSError, ValueError) as e:
-                            # File handler might be closed, ignore the error
-                            pass
-                root.debug("Forced flush of file handler")
-                print("Forced flush of file handler", file=sys.stderr)
-            except Exception as e:
-                # Ignore any errors during flush
-                pass
-
-        custom_flush()
-
-        def on_shutdown():
-            try:
-                custom_flush()
-                for handler in root.handlers[:]:
-                    if isinstance(handler, logging.FileHandler):
-                        try:
-                            handler.close()
-                            root.removeHandler(handler)
-                        except (OSError, ValueError) as e:
-                            # Handler might already be closed, ignore the error
-                            pass
-                root.debug("Shutdown logging handlers closed")
-                print("Shutdown logging handlers closed", file=sys.stderr)
-            except Exception as e:
-                # Ignore any errors during shutdown
-                pass
-
-        atexit.register(on_shutdown)
 
-        root.debug("Logging initialized ✅")
-        print("Logging initialized ✅", file=sys.stderr)
+        # queue.Queue rather than SimpleQueue so flush_logging can join() it
+        log_queue: queue.Queue = queue.Queue()
+        _listener = logging.handlers.QueueListener(log_queue, console, file_handler, respect_handler_level=True)
+        _queue_handler = logging.handlers.QueueHandler(log_queue)
+        root.addHandler(_queue_handler)
+        _listener.start()
+        atexit.register(shutdown_logging)
+
+        root.debug("Resolved log file path: %s", log_file)
+        if cleared_message:
+            root.info(cleared_message)
+        root.info("Logging initialized (level %s)", logging.getLevelName(root.level))
+        flush_logging()
         return True
     except OSError as e:
-        logging.basicConfig(level=logging.DEBUG, stream=sys.stderr)
+        # Report synchronously: there is no listener to hand the record to
+        root.addHandler(console)
         logging.error(f"Failed to set up file logging: {e}", exc_info=True)
-        raise
\ No newline at end of file
+        raise
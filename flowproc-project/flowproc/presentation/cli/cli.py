@@ -3,14 +3,12 @@ import argparse
 from pathlib import Path
 from ..gui.main import main as gui_main  # Updated import path
 from ...domain.export import process_csv, process_directory  # Updated import path
-from ...logging_config import setup_logging  # Updated import path
+from ...logging_config import setup_logging, ENV_LOG_LEVEL  # Updated import path
+from ...infrastructure.monitoring.exporters import configure_sinks, ENV_TEXTFILE, ENV_JSONL, ENV_PORT
+from ...infrastructure.monitoring.profiling import configure_profiling, PROFILE_MODES, ENV_PROFILE_DIR
 import logging
 
 def main():
-    # Setup logging
-    setup_logging(filemode='a', max_size_mb=10, keep_backups=3)
-    logging.debug("CLI started")
-
     # Temporarily comment out ensure_setup call until implemented
     # from .setup import ensure_setup
     # ensure_setup()
@@ -21,11 +19,29 @@ def main():
     parser.add_argument('--output-dir', type=str, help="Output directory for processed Excel files")
     parser.add_argument('--recursive', action='store_true', help="Process subdirectories")
     parser.add_argument('--time-course-mode', action='store_true', help="Enable Time Course output format")
+    parser.add_argument('--metrics-textfile', type=str,
+                        help=f"Write Prometheus textfile metrics to this path (or set {ENV_TEXTFILE})")
+    parser.add_argument('--metrics-jsonl', type=str,
+                        help=f"Append JSON-lines metrics to this path (or set {ENV_JSONL})")
+    parser.add_argument('--metrics-port', type=int,
+                        help=f"Serve metrics at http://127.0.0.1:PORT/metrics (or set {ENV_PORT})")
+    parser.add_argument('--profile', nargs='?', const='stages', choices=PROFILE_MODES,
+                        help="Write a per-file stage report and collapsed-stack file; "
+                             "'cprofile' or 'sample' also profile function calls (default: stages)")
+    parser.add_argument('--profile-dir', type=str,
+                        help=f"Directory for profile reports (default: <output-dir>/profiles, or set {ENV_PROFILE_DIR})")
+    parser.add_argument('--log-level', type=str.upper, choices=('DEBUG', 'PERF', 'INFO', 'WARNING'),
+                        help=f"Log verbosity; PERF adds stage timings, DEBUG adds diagnostics "
+                             f"(default: INFO, or set {ENV_LOG_LEVEL})")
 
     args = parser.parse_args()
 
-    # If no arguments are provided, launch GUI
-    if not any(vars(args).values()):
+    # Setup logging
+    setup_logging(filemode='a', max_size_mb=10, keep_backups=3, level=args.log_level)
+    logging.debug("CLI started")
+
+    # If no processing arguments are provided, launch GUI
+    if not any(v for k, v in vars(args).items() if k != 'log_level'):
         logging.info("No CLI arguments provided, launching GUI")
         gui_main()  # Call gui.main directly
     else:
@@ -33,6 +49,16 @@ def main():
         if not args.input_dir or not args.output_dir:
             logging.error("Both --input-dir and --output-dir are required for CLI mode")
             parser.error("Both --input-dir and --output-dir are required")
+        configure_sinks(
+            textfile=args.metrics_textfile,
+            jsonl=args.metrics_jsonl,
+            port=args.metrics_port
+        )
+        if args.profile:
+            configure_profiling(
+                mode=args.profile,
+                output_dir=args.profile_dir or Path(args.output_dir) / "profiles"
+            )
         process_directory(
             Path(args.input_dir),
             Path(args.output_dir),
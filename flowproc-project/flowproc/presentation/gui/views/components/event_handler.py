@@ -6,18 +6,21 @@ Event handling for the main window.
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Callable, List, Optional
 from pathlib import Path
 
-from PySide6.QtCore import QObject, Slot
-from PySide6.QtWidgets import QMessageBox, QFileDialog, QTableWidget, QTableWidgetItem, QHeaderView, QMainWindow, QDialog, QSizePolicy
+from PySide6.QtCore import QObject, Qt, Slot
+from PySide6.QtWidgets import QMessageBox, QFileDialog, QMainWindow, QDialog
 
 from ..dialogs import GroupLabelsDialog
 from ..dialogs.manual_groups_dialog import ManualGroupsDialog
+from ..widgets.preview_summary_model import PreviewSummaryModel, create_preview_view
 from ...workers.processing_worker import ProcessingResult
+from ...workers.validation_worker import ValidationWorker, ValidationResult
 from ...config_handler import save_last_output_dir
 from flowproc.config import parse_range_or_list, USER_GROUPS, USER_REPLICATES, AUTO_PARSE_GROUPS, USER_GROUP_LABELS
 from flowproc.core.constants import KEYWORDS
+from flowproc.domain.validation import InputValidationResult
 
 if TYPE_CHECKING:
     from ..main_window import MainWindow
@@ -47,6 +50,15 @@ class EventHandler(QObject):
         self.state_manager = state_manager
         self.file_manager = file_manager
         self.processing_coordinator = processing_coordinator
+        # Model of the most recently opened summary preview
+        self._preview_model: Optional[PreviewSummaryModel] = None
+        # Entries of the path field, in the order they were selected
+        self._selection: List[str] = []
+        
+        # Worker validating the current selection, None once its results are in
+        self.validation_worker: Optional[ValidationWorker] = None
+        # Button action waiting for the current selection to be validated
+        self._pending_action: Optional[Callable[[], None]] = None
 
     def connect_all_signals(self) -> None:
         """Connect all UI signals to their handlers."""
@@ -69,19 +81,119 @@ class EventHandler(QObject):
 
     @Slot()
     def update_preview_paths(self) -> None:
-        """Update the list of previewable CSV paths."""
+        """
+        Update the list of previewable CSV paths.
+        
+        The selection is validated in the background; files are added to the
+        preview paths as their results arrive. A new selection cancels the
+        validation of the previous one without waiting for it to exit.
+        """
         ui_builder = self.main_window.ui_builder
         file_paths = ui_builder.get_widget('path_entry').text().split("; ")
-        self.state_manager.preview_paths = [
-            p for p in file_paths 
-            if p and Path(p).is_file() and Path(p).suffix.lower() == '.csv' and Path(p).exists()
-        ]
+        self._selection = list(dict.fromkeys(p for p in file_paths if p))
+        self.state_manager.preview_paths = []
+        self.state_manager.last_csv = None
         
-        if self.state_manager.preview_paths:
-            self.state_manager.last_csv = Path(self.state_manager.preview_paths[0])
-            logger.info(f"Set last_csv to {self.state_manager.last_csv}")
+        # Stop summarizing files of a preview that no longer matches the selection
+        selected = {Path(p) for p in self._selection}
+        if self._preview_model is not None and not set(self._preview_model.paths) <= selected:
+            self._preview_model.cancel()
+        
+        if self.validation_worker is not None:
+            # Its queued results are dropped by the slots below
+            self.validation_worker.cancel_validation()
+            self.validation_worker = None
+        
+        if self._selection:
+            # A running QThread cannot be restarted, so each selection gets its own worker
+            worker = ValidationWorker(self)
+            worker.file_validated.connect(self._on_file_validated)
+            worker.validation_completed.connect(self._on_validation_completed)
+            worker.validation_error.connect(self._on_selection_validation_error)
+            worker.finished.connect(worker.deleteLater)
+            self.validation_worker = worker
+            worker.validate_paths([Path(p) for p in self._selection])
         else:
-            self.state_manager.last_csv = None
+            self._run_pending_action()
+    
+    def _is_current_validation(self) -> bool:
+        """Check whether a validation signal comes from the current selection."""
+        return self.validation_worker is not None and self.sender() is self.validation_worker
+    
+    @Slot(str, object)
+    def _on_file_validated(self, path_str: str, result: InputValidationResult) -> None:
+        """Add a selected CSV file to the preview paths once it has validated."""
+        if not self._is_current_validation():
+            return
+        # Files found inside selected folders are not previewed
+        if path_str not in self._selection or path_str in self.state_manager.preview_paths:
+            return
+        if not result.is_valid or Path(path_str).suffix.lower() != '.csv':
+            return
+        
+        # Keep the preview paths in selection order
+        order = {p: i for i, p in enumerate(self._selection)}
+        self.state_manager.preview_paths = sorted(
+            self.state_manager.preview_paths + [path_str], key=order.__getitem__
+        )
+        self.state_manager.last_csv = Path(self.state_manager.preview_paths[0])
+        self.state_manager.update_status(
+            f"Checked {len(self.state_manager.preview_paths)} of {len(self._selection)} selected files"
+        )
+    
+    @Slot(object)
+    def _on_validation_completed(self, result: ValidationResult) -> None:
+        """Report the outcome of validating the selection."""
+        if not self._is_current_validation():
+            return
+        self.validation_worker = None
+        if result.is_valid:
+            self.state_manager.update_status(f"{len(self.state_manager.preview_paths)} CSV files ready")
+        else:
+            logger.warning(f"Selection has invalid inputs: {result.errors}")
+            self.state_manager.update_status(f"Invalid inputs: {'; '.join(result.errors)}")
+        if self.state_manager.last_csv:
+            logger.info(f"Set last_csv to {self.state_manager.last_csv}")
+        self._run_pending_action()
+    
+    @Slot(str)
+    def _on_selection_validation_error(self, error_message: str) -> None:
+        """Report a failure to validate the selection."""
+        if not self._is_current_validation():
+            return
+        self.validation_worker = None
+        logger.error(error_message)
+        self.state_manager.update_status(error_message)
+        self._run_pending_action()
+    
+    def _defer_until_validated(self, action: Callable[[], None]) -> bool:
+        """
+        Postpone a button action while the selection is being validated.
+        
+        Args:
+            action: Slot to run once the validation results are in
+            
+        Returns:
+            True if the action was postponed and the caller should return
+        """
+        if self.validation_worker is None:
+            return False
+        self._pending_action = action
+        self.state_manager.update_status("Checking the selected files...")
+        return True
+    
+    def _run_pending_action(self) -> None:
+        """Run the button action postponed by _defer_until_validated."""
+        action, self._pending_action = self._pending_action, None
+        if action is not None:
+            action()
+    
+    def cleanup(self) -> None:
+        """Cancel validation of the selection and wait for the workers to exit."""
+        self._pending_action = None
+        for worker in self.findChildren(ValidationWorker):
+            worker.cancel_validation()
+            worker.wait()
 
     @Slot()
     def browse_input(self) -> None:
@@ -116,8 +228,8 @@ class EventHandler(QObject):
     @Slot()
     def preview_csv(self) -> None:
         """Display a preview table for selected CSV files."""
-        from flowproc.domain.parsing.parsing_utils import load_and_parse_df
-        
+        if self._defer_until_validated(self.preview_csv):
+            return
         if not self.state_manager.preview_paths:
             QMessageBox.warning(
                 self.main_window, 
@@ -126,111 +238,13 @@ class EventHandler(QObject):
             )
             return
             
-        table = QTableWidget(len(self.state_manager.preview_paths), 6)
-        table.setHorizontalHeaderLabels(["File", "Samples", "Groups", "Animal Range", "Timepoint", "Tissue"])
-        table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        table.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        
-        row = 0
+        # Rows are summarized as they are displayed
+        table = create_preview_view(self.state_manager.preview_paths)
+        self._preview_model = table.model()
         
-        for selected_path in self.state_manager.preview_paths:
-            path_obj = Path(selected_path)
-            if not path_obj.exists() or not path_obj.is_file() or path_obj.suffix.lower() != '.csv':
-                table.setItem(row, 0, QTableWidgetItem(f"{path_obj.name} - Error: Invalid file"))
-                row += 1
-                continue
-                
-            try:
-                # Use the correct parsing function
-                df, _ = load_and_parse_df(path_obj)
-                num_samples = len(df)
-                
-                # Check for various possible column names and combinations
-                group_col = None
-                animal_col = None
-                time_col = None
-                tissue_col = None
-                
-                # Look for group columns
-                for col in df.columns:
-                    col_lower = col.lower()
-                    if 'group' in col_lower or 'treatment' in col_lower or 'condition' in col_lower:
-                        group_col = col
-                        break
-                
-                # Look for animal columns
-                for col in df.columns:
-                    col_lower = col.lower()
-                    if 'animal' in col_lower or 'mouse' in col_lower or 'subject' in col_lower:
-                        animal_col = col
-                        break
-                
-                # Look for time columns
-                for col in df.columns:
-                    col_lower = col.lower()
-                    if 'time' in col_lower or 'timepoint' in col_lower or 'hour' in col_lower or 'day' in col_lower:
-                        time_col = col
-                        break
-                
-                # Look for tissue columns
-                for col in df.columns:
-                    col_lower = col.lower()
-                    if 'tissue' in col_lower or 'organ' in col_lower:
-                        tissue_col = col
-                        break
-                
-                # Extract unique values for each column type
-                unique_groups = "N/A"
-                if group_col and group_col in df.columns and not df[group_col].isna().all():
-                    groups = sorted(df[group_col].dropna().unique())
-                    if len(groups) > 0:
-                        if len(groups) == 1:
-                            unique_groups = str(groups[0])
-                        else:
-                            unique_groups = f"{len(groups)}: {min(groups)} - {max(groups)}"
-                
-                unique_animals = "N/A"
-                if animal_col and animal_col in df.columns and not df[animal_col].isna().all():
-                    animals = sorted(df[animal_col].dropna().unique())
-                    if len(animals) > 0:
-                        if len(animals) == 1:
-                            unique_animals = str(animals[0])
-                        else:
-                            unique_animals = f"{len(animals)}: {min(animals)} - {max(animals)}"
-                
-                unique_timepoints = "N/A"
-                if time_col and time_col in df.columns and not df[time_col].isna().all():
-                    timepoints = sorted(df[time_col].dropna().unique())
-                    if len(timepoints) > 0:
-                        if len(timepoints) == 1:
-                            unique_timepoints = str(timepoints[0])
-                        else:
-                            unique_timepoints = f"{len(timepoints)}: {min(timepoints)} - {max(timepoints)}"
-                
-                unique_tissues = "N/A"
-                if tissue_col and tissue_col in df.columns and not df[tissue_col].isna().all():
-                    tissues = df[tissue_col].dropna().unique()
-                    if len(tissues) > 0:
-                        unique_tissues = f"{len(tissues)}: {', '.join(map(str, sorted(tissues)))}"
-                
-                # Populate table row
-                table.setItem(row, 0, QTableWidgetItem(path_obj.name))
-                table.setItem(row, 1, QTableWidgetItem(str(num_samples)))
-                table.setItem(row, 2, QTableWidgetItem(unique_groups))
-                table.setItem(row, 3, QTableWidgetItem(unique_animals))
-                table.setItem(row, 4, QTableWidgetItem(unique_timepoints))
-                table.setItem(row, 5, QTableWidgetItem(unique_tissues))
-                row += 1
-                
-            except Exception as e:
-                logger.error(f"Summary preview failed for {selected_path}: {str(e)}", exc_info=True)
-                table.setItem(row, 0, QTableWidgetItem(f"{path_obj.name} - Error: Failed to parse ({str(e)})"))
-                # Set other columns to error state
-                for col in range(1, 6):
-                    table.setItem(row, col, QTableWidgetItem("Error"))
-                row += 1
-                
         preview_window = QMainWindow(self.main_window)
+        # Deleting the window on close cancels the summaries still queued
+        preview_window.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
         preview_window.setWindowTitle("Combined Summary Preview")
         preview_window.setMinimumSize(400, 300)
         preview_window.setCentralWidget(table)
@@ -262,6 +276,8 @@ class EventHandler(QObject):
     @Slot()
     def process_data(self) -> None:
         """Handle process data button click."""
+        if self._defer_until_validated(self.process_data):
+            return
         input_paths = [Path(p.strip()) for p in self.main_window.ui_builder.get_widget('path_entry').text().split("; ") if p.strip()]
         output_dir = Path(self.main_window.ui_builder.get_widget('out_dir_entry').text().strip() or ".")
         
@@ -297,6 +313,8 @@ class EventHandler(QObject):
     @Slot()
     def visualize_results(self) -> None:
         """Handle visualize results button click."""
+        if self._defer_until_validated(self.visualize_results):
+            return
         if not self.state_manager.last_csv:
             QMessageBox.warning(
                 self.main_window,
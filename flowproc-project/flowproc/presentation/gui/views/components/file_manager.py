@@ -9,10 +9,9 @@ import logging
 from pathlib import Path
 from typing import TYPE_CHECKING, List, Optional
 
-from PySide6.QtWidgets import (
-    QFileDialog, QMainWindow, QTableWidget, QTableWidgetItem,
-    QHeaderView, QSizePolicy, QMessageBox
-)
+from PySide6.QtWidgets import QFileDialog, QMainWindow, QMessageBox, QTableView
+
+from ..widgets.preview_summary_model import create_preview_view
 
 if TYPE_CHECKING:
     from .state_manager import StateManager
@@ -64,8 +63,6 @@ class FileManager:
             file_paths: List of CSV file paths to preview
         """
         try:
-            from ....parsing import load_and_parse_df
-            
             # Get the main window as parent for proper dialog hierarchy
             main_window = self.state_manager.main_window if hasattr(self.state_manager, 'main_window') else None
             
@@ -128,77 +125,16 @@ class FileManager:
         
         return valid_paths
 
-    def _create_preview_table(self, file_paths: List[str]) -> QTableWidget:
+    def _create_preview_table(self, file_paths: List[str]) -> QTableView:
         """
-        Create a preview table widget for the CSV files.
+        Create a preview table for the CSV files.
         
-        Args:
-            file_paths: List of CSV file paths
-            
-        Returns:
-            Configured QTableWidget with preview data
-        """
-        from ....parsing import load_and_parse_df
-        
-        table = QTableWidget(len(file_paths), 6)
-        table.setHorizontalHeaderLabels([
-            "File", "Samples", "Groups", "Animal Range", "Timepoint", "Tissue"
-        ])
-        table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        table.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        
-        for row, file_path in enumerate(file_paths):
-            path_obj = Path(file_path)
-            
-            if not path_obj.exists() or not path_obj.is_file() or path_obj.suffix.lower() != '.csv':
-                table.setItem(row, 0, QTableWidgetItem(f"{path_obj.name} - Error: Invalid file"))
-                continue
-            
-            try:
-                df, _ = load_and_parse_df(path_obj)
-                
-                # Extract summary information
-                num_samples = len(df)
-                unique_groups = self._get_unique_values(df, "Group")
-                unique_animals = self._get_unique_values(df, "Animal")
-                unique_timepoints = self._get_unique_values(df, "Time")
-                unique_tissues = self._get_unique_values(df, "Tissue")
-                
-                # Populate table row
-                table.setItem(row, 0, QTableWidgetItem(path_obj.name))
-                table.setItem(row, 1, QTableWidgetItem(str(num_samples)))
-                table.setItem(row, 2, QTableWidgetItem(unique_groups))
-                table.setItem(row, 3, QTableWidgetItem(unique_animals))
-                table.setItem(row, 4, QTableWidgetItem(unique_timepoints))
-                table.setItem(row, 5, QTableWidgetItem(unique_tissues))
-                
-            except Exception as e:
-                logger.error(f"Failed to parse {file_path}: {str(e)}", exc_info=True)
-                table.setItem(
-                    row, 0, 
-                    QTableWidgetItem(f"{path_obj.name} - Error: Failed to parse ({str(e)})")
-                )
-        
-        return table
-
-    def _get_unique_values(self, df, column_name: str) -> str:
-        """
-        Get unique values from a DataFrame column as a string.
+        Files are summarized as their rows are displayed.
         
         Args:
-            df: DataFrame to process
-            column_name: Name of the column to extract values from
+            file_paths: List of CSV file paths
             
         Returns:
-            Comma-separated string of unique values or "N/A"
+            QTableView with one summary row per file
         """
-        if column_name not in df.columns or df[column_name].isna().all():
-            return "N/A"
-            
-        unique_values = df[column_name].dropna().unique()
-        if len(unique_values) == 0:
-            return "N/A"
-            
-        # Sort and join values
-        sorted_values = sorted(map(str, unique_values))
-        return ", ".join(sorted_values)
\ No newline at end of file
+        return create_preview_view(file_paths)
@@ -13,6 +13,8 @@ import pandas as pd
 from PySide6.QtCore import QObject, Signal, Slot
 from PySide6.QtWidgets import QMessageBox
 
+from flowproc.domain.processing.filter_index import FilterIndex, intersect_rows
+
 from ...workers.processing_worker import ProcessingManager, ProcessingResult, ProcessingState
 
 if TYPE_CHECKING:
@@ -126,20 +128,27 @@ class ProcessingCoordinator(QObject):
         return self.processing_manager.is_processing()
 
     @staticmethod
-    def apply_filters(df: pd.DataFrame, options) -> pd.DataFrame:
+    def apply_filters(df: pd.DataFrame, options, index: Optional[FilterIndex] = None) -> pd.DataFrame:
         """
         Apply filters to data based on visualization options.
         When no filters are selected, returns an empty DataFrame.
         
+        Selection runs on a FilterIndex of the data: row positions per tissue
+        and timepoint are combined as integer arrays and taken once, instead
+        of copying the data and masking object columns on every call.
+        
         Args:
             df: DataFrame to filter
             options: VisualizationOptions object with filter settings
+            index: FilterIndex built for df when it was loaded; built here if
+                not given (or if it does not match df)
             
         Returns:
             Filtered DataFrame (empty if no filters selected)
         """
-        filtered_df = df.copy()
-        original_rows = len(filtered_df)
+        if index is None or not index.matches(df):
+            index = FilterIndex(df)
+        original_rows = len(df)
         
         # Check if any filters are selected
         # None means "show all" (filter is hidden), empty list means "no selection" (filter is visible but nothing checked)
@@ -147,23 +156,22 @@ class ProcessingCoordinator(QObject):
         has_time_filter = hasattr(options, 'selected_times') and options.selected_times is not None and len(options.selected_times) > 0
         
         # Check if data has filterable columns
-        has_tissue_data = 'Tissue' in filtered_df.columns and not filtered_df['Tissue'].isna().all()
-        has_time_data = 'Time' in filtered_df.columns and not filtered_df['Time'].isna().all()
+        has_tissue_data = index.has_data('Tissue')
+        has_time_data = index.has_data('Time')
         
         # Check if we have real tissue data (not just UNK)
-        has_real_tissue_data = False
-        if has_tissue_data:
-            unique_tissues = filtered_df['Tissue'].dropna().unique()
-            real_tissues = [t for t in unique_tissues if t != 'UNK']
-            has_real_tissue_data = len(real_tissues) > 0
+        has_real_tissue_data = index.has_real_tissue_data()
         
-        # Debug logging
-        logger.info(f"Filter analysis - has_tissue_filter: {has_tissue_filter}, has_time_filter: {has_time_filter}")
-        logger.info(f"Data analysis - has_tissue_data: {has_tissue_data}, has_time_data: {has_time_data}, has_real_tissue_data: {has_real_tissue_data}")
-        if has_tissue_data:
-            logger.info(f"Tissue values: {unique_tissues}")
-        if has_time_data:
-            logger.info(f"Time values: {filtered_df['Time'].dropna().unique()}")
+        # Debug logging; runs on every plot update, so skip building the
+        # value listings unless they will actually be written
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Filter analysis - has_tissue_filter: %s, has_time_filter: %s", has_tissue_filter, has_time_filter)
+            logger.debug("Data analysis - has_tissue_data: %s, has_time_data: %s, has_real_tissue_data: %s",
+                         has_tissue_data, has_time_data, has_real_tissue_data)
+            if has_tissue_data:
+                logger.debug("Tissue values: %s", index.values('Tissue'))
+            if has_time_data:
+                logger.debug("Time values: %s", index.values('Time'))
         
         # Handle the case where filters are hidden (None) vs. no selection (empty list)
         # None means "show all", empty list means "no selection"
@@ -172,48 +180,52 @@ class ProcessingCoordinator(QObject):
         
         # If filters are hidden (None), show all data
         if tissue_filter_hidden and time_filter_hidden:
-            logger.info("All filters are hidden - showing all data")
-            return filtered_df
+            logger.debug("All filters are hidden - showing all data")
+            return FilterIndex.take(df, None)
         
         # If no filters are selected (empty lists) but data has filterable columns, show all data
         # This handles the case where filters are visible but nothing is checked
         if not has_tissue_filter and not has_time_filter:
             if has_tissue_data or has_time_data:
-                logger.info("No filters explicitly selected but data has filterable columns - showing all data")
-                return filtered_df  # Return all data
+                logger.debug("No filters explicitly selected but data has filterable columns - showing all data")
+                return FilterIndex.take(df, None)  # Return all data
             else:
-                logger.info("No filters selected and no filterable data - returning empty DataFrame")
-                return filtered_df.iloc[0:0]  # Return empty DataFrame with same structure
+                logger.debug("No filters selected and no filterable data - returning empty DataFrame")
+                return df.iloc[0:0]  # Return empty DataFrame with same structure
+        
+        # Row positions selected so far; None means all rows
+        rows = None
         
         # Apply tissue filter
-        if has_tissue_filter and 'Tissue' in filtered_df.columns:
-            filtered_df = filtered_df[filtered_df['Tissue'].isin(options.selected_tissues)]
-            logger.info(f"After tissue filter: {len(filtered_df)} rows (was {original_rows})")
+        if has_tissue_filter and index.has_column('Tissue'):
+            rows = index.rows('Tissue', options.selected_tissues)
+            logger.debug("After tissue filter: %d rows (was %d)", len(rows), original_rows)
         elif tissue_filter_hidden:
             # Tissue filter is hidden (None) - show all tissue data
-            logger.info("Tissue filter is hidden - showing all tissue data")
+            logger.debug("Tissue filter is hidden - showing all tissue data")
         elif has_tissue_data and not has_real_tissue_data:
             # No tissue filter selected but we have tissue data (only UNK)
             # Filter out UNK tissues to show only meaningful data
-            filtered_df = filtered_df[filtered_df['Tissue'] != 'UNK']
-            logger.info(f"Auto-filtered out UNK tissues: {len(filtered_df)} rows (was {original_rows})")
+            rows = index.rows_excluding('Tissue', 'UNK')
+            logger.debug("Auto-filtered out UNK tissues: %d rows (was %d)", len(rows), original_rows)
         elif has_tissue_data and has_real_tissue_data and not has_tissue_filter:
             # No tissue filter selected but we have real tissue data
             # Don't filter by tissue - show all tissue data
-            logger.info("No tissue filter selected but real tissue data available - showing all tissue data")
+            logger.debug("No tissue filter selected but real tissue data available - showing all tissue data")
             # Ensure we keep all tissue data when no filter is applied
             # This handles the case where tissue filter is visible but nothing is checked
         
         # Apply time filter
-        if has_time_filter and 'Time' in filtered_df.columns:
-            pre_time_rows = len(filtered_df)
-            filtered_df = filtered_df[filtered_df['Time'].isin(options.selected_times)]
-            logger.info(f"After time filter: {len(filtered_df)} rows (was {pre_time_rows})")
+        if has_time_filter and index.has_column('Time'):
+            pre_time_rows = original_rows if rows is None else len(rows)
+            rows = intersect_rows(rows, index.rows('Time', options.selected_times))
+            logger.debug("After time filter: %d rows (was %d)", len(rows), pre_time_rows)
         elif time_filter_hidden:
             # Time filter is hidden (None) - show all time data
-            logger.info("Time filter is hidden - showing all time data")
+            logger.debug("Time filter is hidden - showing all time data")
         
-        logger.info(f"Filter summary: {original_rows} -> {len(filtered_df)} rows")
+        filtered_df = FilterIndex.take(df, rows)
+        logger.debug("Filter summary: %d -> %d rows", original_rows, len(filtered_df))
         return filtered_df
 
     def visualize_data_with_options(self, csv_path: Path, options, output_html: Optional[Path] = None) -> Optional[Path]:
@@ -248,6 +260,15 @@ class ProcessingCoordinator(QObject):
                 with tempfile.NamedTemporaryFile(delete=False, suffix='.html') as tmp_file:
                     output_html = Path(tmp_file.name)
             
+            # Reuse the HTML of a view already generated for this data and options
+            from flowproc.domain.visualization.figure_cache import figure_cache
+            cache_key = figure_cache.make_key(filtered_df, 'html', options)
+            cached_html = figure_cache.get(cache_key)
+            if cached_html is not None:
+                Path(output_html).write_text(cached_html, encoding='utf-8')
+                logger.info(f"Visualization for {csv_path} served from cache")
+                return output_html
+
             # Use the flow cytometry visualizer with filtered data
             from flowproc.domain.visualization.flow_cytometry_visualizer import plot
             from flowproc.domain.visualization.time_plots import create_timecourse_visualization
@@ -269,6 +290,10 @@ class ProcessingCoordinator(QObject):
                     save_html=output_html,
                     filter_options=options
                 )
+
+            html = Path(output_html).read_text(encoding='utf-8') if Path(output_html).exists() else ''
+            if html:
+                figure_cache.put(cache_key, html, len(html))
             
             logger.info(f"Visualization created for {csv_path} with options: {options}")
             return output_html
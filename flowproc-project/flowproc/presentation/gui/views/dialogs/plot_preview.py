@@ -0,0 +1,133 @@
+"""
+Persistent Plotly preview page for the visualization dialog.
+
+The page loads plotly.js once and then receives figures as JSON over a
+QWebChannel. Each update is applied with ``Plotly.react``, which diffs
+against the current plot, so option changes redraw in place instead of
+writing a new HTML file and reloading the whole page.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Optional, Tuple
+
+from PySide6.QtCore import QObject, QUrl, Signal, Slot
+
+logger = logging.getLogger(__name__)
+
+# Same display options used for exported HTML plots
+PREVIEW_CONFIG = {
+    'displayModeBar': True,
+    'displaylogo': False,
+    'modeBarButtonsToRemove': ['pan2d', 'lasso2d', 'select2d'],
+    'responsive': True,
+}
+
+_PREVIEW_PAGE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<script src="qrc:///qtwebchannel/qwebchannel.js"></script>
+<script src="plotly.min.js"></script>
+<style>
+    html, body { margin: 0; height: 100%; background-color: #0F0F0F; color: #F0F0F0; font-family: Arial, sans-serif; }
+    #plot { width: 100%; height: 100%; }
+    #message { display: none; height: 100%; justify-content: center; align-items: center; text-align: center; }
+</style>
+</head>
+<body>
+<div id="plot"></div>
+<div id="message"></div>
+<script>
+    var config = __CONFIG__;
+    new QWebChannel(qt.webChannelTransport, function (channel) {
+        var bridge = channel.objects.bridge;
+        var plot = document.getElementById('plot');
+        var message = document.getElementById('message');
+        bridge.figure_changed.connect(function (figureJson) {
+            var figure = JSON.parse(figureJson);
+            message.style.display = 'none';
+            plot.style.display = 'block';
+            Plotly.react(plot, figure.data || [], figure.layout || {}, config);
+        });
+        bridge.message_changed.connect(function (html) {
+            Plotly.purge(plot);
+            plot.style.display = 'none';
+            message.innerHTML = html;
+            message.style.display = 'flex';
+        });
+        bridge.page_ready();
+    });
+</script>
+</body>
+</html>
+"""
+
+
+class PlotPreviewBridge(QObject):
+    """
+    QWebChannel endpoint shared with the preview page.
+
+    Updates sent before the page has finished loading are held back and
+    only the most recent one is delivered once the page reports ready.
+    """
+
+    # Signals consumed by the page's JavaScript
+    figure_changed = Signal(str)   # Plotly figure JSON
+    message_changed = Signal(str)  # HTML shown instead of a plot
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._ready = False
+        self._pending: Optional[Tuple[Signal, str]] = None
+
+    @Slot()
+    def page_ready(self) -> None:
+        """Called from the page once its channel is connected."""
+        self._ready = True
+        if self._pending is not None:
+            signal, payload = self._pending
+            self._pending = None
+            signal.emit(payload)
+
+    def show_figure(self, figure_json: str) -> None:
+        """Display a figure serialized with ``Figure.to_json``."""
+        self._send(self.figure_changed, figure_json)
+
+    def show_message(self, html: str) -> None:
+        """Replace the plot with an HTML message."""
+        self._send(self.message_changed, html)
+
+    def _send(self, signal: Signal, payload: str) -> None:
+        if self._ready:
+            signal.emit(payload)
+        else:
+            self._pending = (signal, payload)
+
+
+def attach_plot_preview(web_view) -> PlotPreviewBridge:
+    """
+    Load the persistent preview page into a web view.
+
+    Args:
+        web_view: QWebEngineView that will host the page
+
+    Returns:
+        Bridge used to push figures and messages to the page
+    """
+    import plotly
+    from PySide6.QtWebChannel import QWebChannel
+
+    bridge = PlotPreviewBridge(web_view)
+    channel = QWebChannel(web_view)
+    channel.registerObject('bridge', bridge)
+    web_view.page().setWebChannel(channel)
+
+    # plotly.min.js is resolved relative to plotly's bundled package data,
+    # so the library is read straight from the installed package
+    package_data = Path(plotly.__file__).parent / 'package_data'
+    page = _PREVIEW_PAGE.replace('__CONFIG__', json.dumps(PREVIEW_CONFIG))
+    web_view.setHtml(page, QUrl.fromLocalFile(str(package_data) + '/'))
+    logger.debug("Loaded plot preview page with plotly.js from %s", package_data)
+    return bridge
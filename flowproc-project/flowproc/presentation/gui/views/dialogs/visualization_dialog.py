@@ -6,9 +6,10 @@ button click to final visualization display without intermediate dialogs.
 """
 
 import logging
-import tempfile
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QGroupBox, QLabel, 
@@ -16,11 +17,14 @@ from PySide6.QtWidgets import (
     QWidget, QSplitter, QSizePolicy, QApplication,
     QFileDialog, QListWidget, QListWidgetItem
 )
-from PySide6.QtCore import Signal, Qt, QThread, Slot
+from PySide6.QtCore import Signal, Qt, QThread, QTimer, Slot
 import pandas as pd
 
 from flowproc.domain.parsing import load_and_parse_df
+from flowproc.domain.processing.filter_index import FilterIndex
+from flowproc.presentation.gui.workers.plot_worker import PlotRenderWorker
 # Import moved to where it's used to avoid circular imports
+from .plot_preview import PlotPreviewBridge, attach_plot_preview
 from .visualization_options import VisualizationOptions
 from .visualization_filters import (
     detect_population_options,
@@ -32,7 +36,187 @@ from .visualization_filters import (
 logger = logging.getLogger(__name__)
 
 
- 
+@dataclass
+class PlotRenderResult:
+    """Outcome of a background plot render."""
+    fig: Optional[object] = None
+    figure_json: Optional[str] = None
+    status_text: str = ""
+    error_message: Optional[str] = None
+
+
+def render_visualization(
+    csv_path: Path,
+    df: Optional[pd.DataFrame],
+    options: VisualizationOptions,
+    user_group_labels: Optional[list],
+    checkpoint: Callable[[], None],
+    filter_index: Optional[FilterIndex] = None,
+) -> PlotRenderResult:
+    """
+    Filter the data and build the figure for a set of visualization options.
+
+    Runs on the plot worker thread, so it must not touch any widgets.
+
+    Args:
+        csv_path: Source CSV, parsed only if no preloaded data is given
+        df: Data already parsed by the dialog, or None
+        options: Snapshot of the dialog's visualization options
+        user_group_labels: Group labels set by the user, or None
+        checkpoint: Raises RenderSuperseded once a newer request exists
+        filter_index: FilterIndex built when df was loaded, or None
+
+    Returns:
+        PlotRenderResult with the figure and its JSON, or an error message
+    """
+    from flowproc.presentation.gui.views.components.processing_coordinator import ProcessingCoordinator
+    from flowproc.domain.visualization.figure_cache import figure_cache
+    from flowproc.domain.visualization.flow_cytometry_visualizer import plot
+    from flowproc.domain.visualization.time_plots import create_timecourse_visualization
+
+    if df is None:
+        df, _ = load_and_parse_df(csv_path)
+        checkpoint()
+
+    if df is None or df.empty:
+        return PlotRenderResult(error_message="No data found in CSV file")
+
+    if filter_index is None or not filter_index.matches(df):
+        filter_index = FilterIndex(df)
+
+    # Apply filters using coordinator's static method
+    filtered_df = ProcessingCoordinator.apply_filters(df, options, filter_index)
+    logger.debug("Filtered data: %d of %d rows", len(filtered_df), len(df))
+    checkpoint()
+
+    if filtered_df.empty:
+        return PlotRenderResult(error_message=_describe_empty_selection(filter_index, options))
+
+    # Revisiting a previous view (e.g. toggling bar/box) reuses its figure
+    cache_key = figure_cache.make_key(filtered_df, 'dialog', options, user_group_labels)
+    cached = figure_cache.get(cache_key)
+    if cached is not None:
+        fig, figure_json = cached
+        logger.debug("Using cached figure for current options")
+        return PlotRenderResult(
+            fig=fig,
+            figure_json=figure_json,
+            status_text=_describe_plot_status(filter_index, filtered_df, options),
+        )
+
+    if options.time_course_mode:
+        # Detect the actual time column from the data
+        time_column = detect_time_column(filtered_df)
+        if time_column not in filtered_df.columns:
+            logger.warning(f"Detected time column '{time_column}' not present in filtered data columns.")
+        logger.debug("Using time column: %s", time_column)
+
+        fig = create_timecourse_visualization(
+            data=filtered_df,
+            time_column=time_column,
+            metric=options.y_axis,
+            population_filter=options.selected_population,
+            filter_options=options,  # Pass all filter options for title generation
+            show_individual_points=options.show_individual_points,
+            error_bars=options.error_bars,
+            width=options.width,
+            height=options.height,
+        )
+    else:
+        fig = plot(
+            data=filtered_df,
+            x='Group',
+            y=options.y_axis,
+            plot_type=options.plot_type,
+            filter_options=options,  # Pass filter options for title generation
+            user_group_labels=user_group_labels,
+            show_individual_points=options.show_individual_points,
+            error_bars=options.error_bars,
+            fixed_layout=True,
+            width=options.width,
+            height=options.height,
+        )
+    checkpoint()
+
+    if not fig:
+        return PlotRenderResult(error_message="Failed to generate plot. Please check your data and filters.")
+
+    # Serialize here so the UI thread only has to hand the JSON to the page
+    figure_json = fig.to_json()
+    figure_cache.put(cache_key, (fig, figure_json), len(figure_json))
+    return PlotRenderResult(
+        fig=fig,
+        figure_json=figure_json,
+        status_text=_describe_plot_status(filter_index, filtered_df, options),
+    )
+
+
+def _describe_empty_selection(index: FilterIndex, options: VisualizationOptions) -> str:
+    """Explain why the current filter selection produced no rows."""
+    # None means "show all" (filter is hidden), empty list means "no selection" (filter is visible but nothing checked)
+    has_tissue_filter = options.selected_tissues is not None and len(options.selected_tissues) > 0
+    has_time_filter = options.selected_times is not None and len(options.selected_times) > 0
+    has_time_data = index.has_data('Time')
+    has_tissue_data = index.has_data('Tissue')
+
+    # Check if we have real tissue data (not just UNK)
+    has_real_tissue_data = index.has_real_tissue_data()
+
+    if not has_tissue_filter and not has_time_filter and (has_time_data or has_real_tissue_data):
+        error_msg = "No filters selected. Please select at least one tissue or time filter to display data."
+        if has_real_tissue_data:
+            available_tissues = [t for t in index.values('Tissue') if t != 'UNK']
+            error_msg += f"\n\nAvailable tissues: {', '.join(available_tissues)}"
+        if has_time_data:
+            available_times = index.values('Time')
+            error_msg += f"\nAvailable times: {', '.join(map(str, available_times))}"
+    elif not has_tissue_filter and not has_time_data and not has_real_tissue_data:
+        error_msg = "No real tissue data detected and no time data available. Please check your data."
+        if has_tissue_data:
+            available_tissues = index.values('Tissue')
+            error_msg += f"\n\nDetected tissue codes: {', '.join(available_tissues)}"
+    elif not has_tissue_filter and not has_time_data:
+        error_msg = "No tissue filter selected. Please select at least one tissue to display data."
+        if has_real_tissue_data:
+            available_tissues = [t for t in index.values('Tissue') if t != 'UNK']
+            error_msg += f"\n\nAvailable tissues: {', '.join(available_tissues)}"
+    elif has_time_filter and has_time_data and not has_tissue_filter:
+        # Time filter is selected but no tissue filter - this might be the issue
+        error_msg = "Time filter selected but no tissue filter selected. Please select at least one tissue to display data."
+        if has_real_tissue_data:
+            available_tissues = [t for t in index.values('Tissue') if t != 'UNK']
+            error_msg += f"\n\nAvailable tissues: {', '.join(available_tissues)}"
+        if has_time_data:
+            available_times = index.values('Time')
+            error_msg += f"\nAvailable times: {', '.join(map(str, available_times))}"
+    else:
+        error_msg = "No data matches the current filter selection."
+        if options.selected_tissues is not None:
+            available_tissues = index.values('Tissue')
+            error_msg += f"\nAvailable tissues: {', '.join(available_tissues)}"
+        if options.selected_times is not None:
+            available_times = index.values('Time')
+            error_msg += f"\nAvailable times: {', '.join(map(str, available_times))}"
+        error_msg += "\nPlease adjust your filters."
+    return error_msg
+
+
+def _describe_plot_status(index: FilterIndex, filtered_df: pd.DataFrame, options: VisualizationOptions) -> str:
+    """Build the status line shown after a successful render."""
+    status_text = f"Plot generated successfully - {len(filtered_df)} of {index.n_rows} rows displayed"
+
+    # Check if we have real tissue data
+    has_real_tissue_data = index.has_real_tissue_data()
+
+    if options.selected_tissues is not None and len(options.selected_tissues) < len(index.values('Tissue')):
+        status_text += " (filtered by tissue)"
+    elif not has_real_tissue_data and index.has_column('Tissue'):
+        status_text += " (auto-filtered UNK tissues)"
+
+    if options.selected_times is not None and len(options.selected_times) < len(index.values('Time')):
+        status_text += " (filtered by time)"
+
+    return status_text
 
 
 class VisualizationDialog(QDialog):
@@ -46,13 +230,31 @@ class VisualizationDialog(QDialog):
     # Signals
     plot_generated = Signal()
     
+    # Quiet period after the last option change before a plot is rendered
+    PLOT_DEBOUNCE_MS = 150
+    
     def __init__(self, parent=None, csv_path: Optional[Path] = None):
         super().__init__(parent)
         self.csv_path = csv_path
-        self.temp_html_file: Optional[Path] = None
         self.current_fig: Optional[object] = None
         self._export_thread: Optional[QThread] = None
         
+        # Parsed CSV, loaded once in _analyze_data and shared with plot renders
+        self._source_df: Optional[pd.DataFrame] = None
+        # Row positions per tissue/timepoint of _source_df, for fast filtering
+        self._filter_index: Optional[FilterIndex] = None
+        
+        # Plots render on a worker thread; option changes are debounced so a
+        # burst of clicks produces a single render of the final state
+        self._plot_request_id = 0
+        self._plot_worker = PlotRenderWorker(self)
+        self._plot_worker.render_completed.connect(self._on_plot_rendered)
+        self._plot_worker.render_failed.connect(self._on_plot_failed)
+        self._plot_debounce_timer = QTimer(self)
+        self._plot_debounce_timer.setSingleShot(True)
+        self._plot_debounce_timer.setInterval(self.PLOT_DEBOUNCE_MS)
+        self._plot_debounce_timer.timeout.connect(self._generate_plot)
+        
         # UI Components
         self.plot_type_combo: Optional[QComboBox] = None
         self.y_axis_combo: Optional[QComboBox] = None
@@ -63,6 +265,7 @@ class VisualizationDialog(QDialog):
         self.time_filter: Optional[QListWidget] = None
         self.population_filter: Optional[QComboBox] = None  # New: population dropdown
         self.web_view: Optional[object] = None
+        self._plot_preview: Optional[PlotPreviewBridge] = None
         self.status_label: Optional[QLabel] = None
         
         self.setWindowTitle("Flow Cytometry Visualization")
@@ -287,6 +490,8 @@ class VisualizationDialog(QDialog):
                 self.web_view = QWebEngineView()
                 self.web_view.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
                 plot_layout.addWidget(self.web_view)
+                # Persistent page: plotly.js loads once, figures arrive as JSON
+                self._plot_preview = attach_plot_preview(self.web_view)
             except Exception:
                 # Fallback placeholder to avoid crashes in environments without WebEngine
                 placeholder = QLabel("Web engine unavailable; plot preview disabled in this environment")
@@ -420,13 +625,17 @@ class VisualizationDialog(QDialog):
                 self.status_label.setText("Error: CSV file not found")
                 return
             
-            # Load data for analysis only (not stored)
             df, _ = load_and_parse_df(self.csv_path)
             
             if df is None or df.empty:
                 self.status_label.setText("Error: No data found in CSV file")
                 return
             
+            # Keep the parsed data so option changes don't re-read the CSV,
+            # indexed once so each option change filters without rescanning
+            self._source_df = df
+            self._filter_index = FilterIndex(df)
+            
             # Populate column options
             self._populate_column_options(df)
             
@@ -437,25 +646,18 @@ class VisualizationDialog(QDialog):
             QApplication.processEvents()
             
             # Auto-generate initial plot if filters are available
-            has_tissue_data = 'Tissue' in df.columns and not df['Tissue'].isna().all()
-            has_time_data = 'Time' in df.columns and len(df['Time'].dropna().unique()) > 0
+            has_time_data = self._filter_index.has_data('Time')
             
             # Check if we have real tissue data (not just UNK)
-            has_real_tissue_data = False
-            if has_tissue_data:
-                unique_tissues = df['Tissue'].dropna().unique()
-                real_tissues = [t for t in unique_tissues if t != 'UNK']
-                has_real_tissue_data = len(real_tissues) > 0
+            has_real_tissue_data = self._filter_index.has_real_tissue_data()
             
             if has_real_tissue_data or has_time_data:
-                # Use a small delay to ensure UI is fully updated before generating plot
-                from PySide6.QtCore import QTimer
-                QTimer.singleShot(100, self._generate_plot)
+                # Debounced so the UI is fully updated before generating plot
+                self._schedule_plot()
             else:
                 self.status_label.setText("No real tissue or time data detected. Generating plot with available data.")
-                # Use a small delay to ensure UI is fully updated before generating plot
-                from PySide6.QtCore import QTimer
-                QTimer.singleShot(100, self._generate_plot)
+                # Debounced so the UI is fully updated before generating plot
+                self._schedule_plot()
             
         except Exception as e:
             logger.error(f"Failed to analyze data: {e}")
@@ -500,7 +702,7 @@ class VisualizationDialog(QDialog):
         
         # Populate tissue filter with unique tissue values
         has_real_tissue_data = False
-        entries, has_real_tissue_data = build_tissue_entries(df)
+        entries, has_real_tissue_data = build_tissue_entries(df, self._filter_index)
         for entry in entries:
             item = QListWidgetItem(entry['display'])
             item.setData(Qt.ItemDataRole.UserRole, entry['value'])
@@ -514,7 +716,7 @@ class VisualizationDialog(QDialog):
         
         # Populate time filter with unique time values  
         has_time_data = False
-        time_entries, has_time_data = build_time_entries(df)
+        time_entries, has_time_data = build_time_entries(df, self._filter_index)
         logger.info(f"Populating time filter with {len(time_entries)} time points")
         for entry in time_entries:
             item = QListWidgetItem(entry['display'])
@@ -579,30 +781,25 @@ class VisualizationDialog(QDialog):
     def _on_display_option_changed(self):
         """Handle display option changes (can be enabled independently)."""
         # Both options can be enabled simultaneously
-        self._generate_plot()
+        self._schedule_plot()
     
     def _on_option_changed(self):
         """Handle option changes."""
         # If y-axis changed and we're in timecourse mode, repopulate population options
         if (self.time_course_checkbox and self.time_course_checkbox.isChecked() and 
-            self.csv_path and self.csv_path.exists()):
+                self._source_df is not None):
             try:
-                from flowproc.domain.parsing import load_and_parse_df
-                df, _ = load_and_parse_df(self.csv_path)
-                if df is not None and not df.empty:
-                    self._populate_population_options(df)
+                self._populate_population_options(self._source_df)
             except Exception as e:
                 logger.warning(f"Failed to repopulate population options: {e}")
         
-        self._generate_plot()
+        self._schedule_plot()
     
     def _on_filter_changed(self):
         """Handle filter changes."""
-        # Debug: Log current filter state
-        options = self.get_current_options()
-        logger.info(f"Filter changed - selected tissues: {options.selected_tissues}, selected times: {options.selected_times}")
-        logger.info("Filter changed - regenerating plot")
-        self._generate_plot()
+        # The selected options are logged when the debounced render starts
+        logger.debug("Filter changed - regenerating plot")
+        self._schedule_plot()
     
     def _on_time_course_toggled(self, checked: bool):
         """Handle time course mode toggle."""
@@ -617,12 +814,9 @@ class VisualizationDialog(QDialog):
                 self.population_filter.setVisible(True)
                 
                 # Repopulate population options if we have data
-                if self.csv_path and self.csv_path.exists():
+                if self._source_df is not None:
                     try:
-                        from flowproc.domain.parsing import load_and_parse_df
-                        df, _ = load_and_parse_df(self.csv_path)
-                        if df is not None and not df.empty:
-                            self._populate_population_options(df)
+                        self._populate_population_options(self._source_df)
                     except Exception as e:
                         logger.warning(f"Failed to repopulate population options: {e}")
         else:
@@ -633,7 +827,7 @@ class VisualizationDialog(QDialog):
                 self.population_filter_label.setVisible(False)
                 self.population_filter.setVisible(False)
         
-        self._generate_plot()
+        self._schedule_plot()
     
     def get_current_options(self) -> VisualizationOptions:
         """Get current visualization options including filters."""
@@ -665,11 +859,6 @@ class VisualizationDialog(QDialog):
             # Set selected_times to None to indicate "show all" rather than empty list
             selected_times = None
         
-        # Debug logging for filter selection
-        logger.info(f"Filter selection - tissue_filter visible: {self.tissue_filter and self.tissue_filter.isVisible()}, count: {self.tissue_filter.count() if self.tissue_filter else 0}")
-        logger.info(f"Filter selection - time_filter visible: {self.time_filter and self.time_filter.isVisible()}, count: {self.time_filter.count() if self.time_filter else 0}")
-        logger.info(f"Filter selection - selected tissues: {selected_tissues}, selected times: {selected_times}")
-        
         # Get selected population (only relevant in timecourse mode)
         selected_population = None
         if (self.population_filter and self.population_filter.isVisible() and 
@@ -682,29 +871,14 @@ class VisualizationDialog(QDialog):
             # Use the mapping to get the full column name for filtering
             if hasattr(self, '_population_mapping') and shortname in self._population_mapping:
                 selected_population = self._population_mapping[shortname]
-                logger.debug(f"Population filter: shortname '{shortname}' maps to column '{selected_population}'")
+                logger.debug("Population filter: shortname '%s' maps to column '%s'", shortname, selected_population)
             else:
                 # Fallback to using the shortname directly if no mapping available
                 selected_population = shortname
                 logger.warning(f"No population mapping found for '{shortname}', using shortname directly")
         
-        logger.info(f"Filter selection - selected population: {selected_population}")
-        
-        # Additional debugging for widget states
-        if self.tissue_filter and self.tissue_filter.isVisible():
-            logger.debug("Tissue filter items and states:")
-            for i in range(self.tissue_filter.count()):
-                item = self.tissue_filter.item(i)
-                logger.debug(f"  Item {i}: '{item.text()}' - checked: {item.checkState() == Qt.CheckState.Checked}")
-        
-        if self.time_filter and self.time_filter.isVisible():
-            logger.debug("Time filter items and states:")
-            for i in range(self.time_filter.count()):
-                item = self.time_filter.item(i)
-                logger.debug(f"  Item {i}: '{item.text()}' - checked: {item.checkState() == Qt.CheckState.Checked}")
-        
-        if self.population_filter and self.population_filter.isVisible():
-            logger.debug(f"Population filter current text: '{self.population_filter.currentText()}'")
+        logger.debug("Filter selection - selected tissues: %s, selected times: %s, selected population: %s",
+                     selected_tissues, selected_times, selected_population)
         
         # Both options can be enabled independently
         show_individual_points = self.show_individual_points_checkbox.isChecked() if self.show_individual_points_checkbox else False
@@ -723,332 +897,96 @@ class VisualizationDialog(QDialog):
     
     def _ensure_filter_synchronization(self):
         """Ensure all filter options are properly synchronized before generating plots."""
-        logger.info("Ensuring filter synchronization...")
+        # Purely diagnostic: walks every filter item, so only when DEBUG is on
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        logger.debug("Ensuring filter synchronization...")
         
         # Check tissue filter synchronization
         if self.tissue_filter and self.tissue_filter.isVisible():
             logger.debug("Tissue filter synchronization check:")
             for i in range(self.tissue_filter.count()):
                 item = self.tissue_filter.item(i)
-                logger.debug(f"  Item {i}: '{item.text()}' - checked: {item.checkState() == Qt.CheckState.Checked}")
+                logger.debug("  Item %d: '%s' - checked: %s", i, item.text(), item.checkState() == Qt.CheckState.Checked)
         
         # Check time filter synchronization
         if self.time_filter and self.time_filter.isVisible():
             logger.debug("Time filter synchronization check:")
             for i in range(self.time_filter.count()):
                 item = self.time_filter.item(i)
-                logger.debug(f"  Item {i}: '{item.text()}' - checked: {item.checkState() == Qt.CheckState.Checked}")
+                logger.debug("  Item %d: '%s' - checked: %s", i, item.text(), item.checkState() == Qt.CheckState.Checked)
         
         # Check population filter synchronization
         if self.population_filter and self.population_filter.isVisible():
-            logger.debug(f"Population filter synchronization check: '{self.population_filter.currentText()}'")
+            logger.debug("Population filter synchronization check: '%s'", self.population_filter.currentText())
         
         # Check Y-axis synchronization
         if self.y_axis_combo and self.y_axis_combo.count() > 0:
-            logger.debug(f"Y-axis synchronization check: '{self.y_axis_combo.currentText()}'")
+            logger.debug("Y-axis synchronization check: '%s'", self.y_axis_combo.currentText())
         
-        logger.info("Filter synchronization check completed")
+        logger.debug("Filter synchronization check completed")
+
+    def _schedule_plot(self):
+        """Request a plot refresh, coalescing bursts of option changes."""
+        self.status_label.setText("Generating plot...")
+        self._plot_debounce_timer.start()
 
     def _generate_plot(self):
-        """Generate the plot using the coordinator's unified method."""
-        try:
-            if not self.csv_path:
-                self.status_label.setText("Error: No data available")
-                return
-            
-            # Ensure all filter options are properly synchronized before generating the plot
-            self._ensure_filter_synchronization()
-            
-            # Get current options including filters
-            options = self.get_current_options()
-            
-            # Debug logging for filter options
-            logger.info(f"Current options - tissues: {options.selected_tissues}, times: {options.selected_times}, time_course: {options.time_course_mode}")
-            
-            # Validate that we have the necessary options for plotting
-            if not options.y_axis:
-                logger.warning("No Y-axis metric selected, this may cause plot generation issues")
-            
-            # Log filter validation
-            if options.selected_tissues is None:
-                logger.info("No tissue filtering applied (showing all tissues)")
-            elif len(options.selected_tissues) == 0:
-                logger.warning("No tissues selected for filtering - this may result in empty plots")
-            
-            if options.selected_times is None:
-                logger.info("No time filtering applied (showing all time points)")
-            elif len(options.selected_times) == 0:
-                logger.warning("No time points selected for filtering - this may result in empty plots")
-            
-            if options.time_course_mode and not options.selected_population:
-                logger.info("Time course mode: no specific population selected (showing all populations)")
-            
-            # Create temporary HTML file
-            if self.temp_html_file and self.temp_html_file.exists():
-                self.temp_html_file.unlink()
-            
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.html') as tmp_file:
-                self.temp_html_file = Path(tmp_file.name)
-            
-            self.status_label.setText("Generating plot...")
-            
-            # Use the coordinator's unified visualization method
-            from flowproc.presentation.gui.views.components.processing_coordinator import ProcessingCoordinator
-            
-            # Load data and apply filters using coordinator's static method
-            from flowproc.domain.parsing import load_and_parse_df
-            df, _ = load_and_parse_df(self.csv_path)
-            
-            if df is None or df.empty:
-                self._show_error_message("No data found in CSV file")
-                return
-            
-            # Debug logging for data structure
-            logger.info(f"Data loaded - rows: {len(df)}, columns: {list(df.columns)}")
-            if 'Tissue' in df.columns:
-                logger.info(f"Tissue data - unique values: {df['Tissue'].dropna().unique()}")
-            if 'Time' in df.columns:
-                logger.info(f"Time data - unique values: {df['Time'].dropna().unique()}")
-            
-            # Apply filters using coordinator's static method
-            filtered_df = ProcessingCoordinator.apply_filters(df, options)
-            
-            # Additional debugging for filtered data
-            logger.info(f"Filtered data - rows: {len(filtered_df)}, columns: {list(filtered_df.columns)}")
-            logger.info("Filtered data sample:")
-            logger.info(f"  First few rows: {filtered_df.head(3).to_dict('records')}")
-            
-            # Check for time-related columns
-            time_cols = [col for col in filtered_df.columns if any(keyword in col.lower() for keyword in ['time', 'day', 'hour', 'week', 'minute'])]
-            logger.info(f"Time-related columns found: {time_cols}")
-            
-            # Check for value columns (numeric columns that might be metrics)
-            numeric_cols = filtered_df.select_dtypes(include=['number']).columns.tolist()
-            logger.info(f"Numeric columns (potential metrics): {numeric_cols}")
-            
-            # Check for group columns
-            group_cols = [col for col in filtered_df.columns if any(keyword in col.lower() for keyword in ['group', 'treatment', 'condition', 'sample'])]
-            logger.info(f"Group-related columns found: {group_cols}")
-            
-            # Provide detailed feedback about filtering
-            filter_message = f"Filtered data: {len(filtered_df)} of {len(df)} rows"
-            if options.selected_tissues is not None:
-                filter_message += f" (tissues: {', '.join(options.selected_tissues)})"
-            if options.selected_times is not None:
-                filter_message += f" (times: {', '.join(map(str, options.selected_times))})"
-            logger.info(filter_message)
-            
-            if filtered_df.empty:
-                # Check if no filters are selected
-                # None means "show all" (filter is hidden), empty list means "no selection" (filter is visible but nothing checked)
-                has_tissue_filter = options.selected_tissues is not None and len(options.selected_tissues) > 0
-                has_time_filter = options.selected_times is not None and len(options.selected_times) > 0
-                has_time_data = 'Time' in df.columns and len(df['Time'].dropna().unique()) > 0
-                has_tissue_data = 'Tissue' in df.columns and not df['Tissue'].isna().all()
-                
-                # Check if we have real tissue data (not just UNK)
-                has_real_tissue_data = False
-                if has_tissue_data:
-                    unique_tissues = df['Tissue'].dropna().unique()
-                    real_tissues = [t for t in unique_tissues if t != 'UNK']
-                    has_real_tissue_data = len(real_tissues) > 0
-                
-                # Note: visibility flags are not used below; skip assignments to avoid linter warnings
-                
-                if not has_tissue_filter and not has_time_filter and (has_time_data or has_real_tissue_data):
-                    error_msg = "No filters selected. Please select at least one tissue or time filter to display data."
-                    if has_real_tissue_data:
-                        available_tissues = [t for t in df['Tissue'].dropna().unique() if t != 'UNK']
-                        error_msg += f"\n\nAvailable tissues: {', '.join(available_tissues)}"
-                    if has_time_data:
-                        available_times = df['Time'].dropna().unique()
-                        error_msg += f"\nAvailable times: {', '.join(map(str, available_times))}"
-                elif not has_tissue_filter and not has_time_data and not has_real_tissue_data:
-                    error_msg = "No real tissue data detected and no time data available. Please check your data."
-                    if has_tissue_data:
-                        available_tissues = df['Tissue'].dropna().unique()
-                        error_msg += f"\n\nDetected tissue codes: {', '.join(available_tissues)}"
-                elif not has_tissue_filter and not has_time_data:
-                    error_msg = "No tissue filter selected. Please select at least one tissue to display data."
-                    if has_real_tissue_data:
-                        available_tissues = [t for t in df['Tissue'].dropna().unique() if t != 'UNK']
-                        error_msg += f"\n\nAvailable tissues: {', '.join(available_tissues)}"
-                elif has_time_filter and has_time_data and not has_tissue_filter:
-                    # Time filter is selected but no tissue filter - this might be the issue
-                    error_msg = "Time filter selected but no tissue filter selected. Please select at least one tissue to display data."
-                    if has_real_tissue_data:
-                        available_tissues = [t for t in df['Tissue'].dropna().unique() if t != 'UNK']
-                        error_msg += f"\n\nAvailable tissues: {', '.join(available_tissues)}"
-                    if has_time_data:
-                        available_times = df['Time'].dropna().unique()
-                        error_msg += f"\nAvailable times: {', '.join(map(str, available_times))}"
-                else:
-                    error_msg = "No data matches the current filter selection."
-                    if options.selected_tissues is not None:
-                        available_tissues = df['Tissue'].dropna().unique() if 'Tissue' in df.columns else []
-                        error_msg += f"\nAvailable tissues: {', '.join(available_tissues)}"
-                    if options.selected_times is not None:
-                        available_times = df['Time'].dropna().unique() if 'Time' in df.columns else []
-                        error_msg += f"\nAvailable times: {', '.join(map(str, available_times))}"
-                    error_msg += "\nPlease adjust your filters."
-                self._show_error_message(error_msg)
-                return
-            
-            # Generate plot with filtered data
-            from flowproc.domain.visualization.flow_cytometry_visualizer import plot
-            from flowproc.domain.visualization.time_plots import create_timecourse_visualization
-            
-            # Reset current figure before generation
-            self.current_fig = None
+        """Submit a render of the current options to the background worker."""
+        self._plot_debounce_timer.stop()
+        if not self.csv_path:
+            self.status_label.setText("Error: No data available")
+            return
 
-            if options.time_course_mode:
-                # Create filter options including population filter
-                # Pass the options object directly since create_comprehensive_plot_title expects an object with attributes
-                filter_options = options
-                # Add population filter as a separate parameter since it's not part of the options object structure
-                population_filter = options.selected_population
-                
-                # Debug: Log filter options being passed
-                logger.info(f"Timecourse mode - filter_options: {filter_options}")
-                logger.info(f"Timecourse mode - selected_tissues: {filter_options.selected_tissues}")
-                logger.info(f"Timecourse mode - selected_times: {filter_options.selected_times}")
-                logger.info(f"Timecourse mode - population_filter: {population_filter}")
-                
-                # Additional debugging for attribute access
-                logger.info(f"Timecourse mode - filter_options type: {type(filter_options)}")
-                logger.info(f"Timecourse mode - hasattr selected_population: {hasattr(filter_options, 'selected_population')}")
-                logger.info(f"Timecourse mode - hasattr selected_tissues: {hasattr(filter_options, 'selected_tissues')}")
-                logger.info(f"Timecourse mode - hasattr selected_times: {hasattr(filter_options, 'selected_times')}")
-                
-                # Try to access attributes directly to see if there are any issues
-                try:
-                    logger.info(f"Timecourse mode - direct access selected_population: {getattr(filter_options, 'selected_population', 'NOT_FOUND')}")
-                    logger.info(f"Timecourse mode - direct access selected_tissues: {getattr(filter_options, 'selected_tissues', 'NOT_FOUND')}")
-                    logger.info(f"Timecourse mode - direct access selected_times: {getattr(filter_options, 'selected_times', 'NOT_FOUND')}")
-                except Exception as e:
-                    logger.error(f"Timecourse mode - Error accessing filter options attributes: {e}")
-                
-                # Detect the actual time column from the data
-                time_column = detect_time_column(filtered_df)
-                if time_column not in filtered_df.columns:
-                    logger.warning(f"Detected time column '{time_column}' not present in filtered data columns.")
-                
-                logger.info(f"Using time column: {time_column}")
-                
-                fig = create_timecourse_visualization(
-                    data=filtered_df,
-                    time_column=time_column,  # Use detected time column
-                    metric=options.y_axis,
-                    population_filter=population_filter,  # Pass population filter
-                    filter_options=filter_options,  # Pass all filter options
-                    show_individual_points=options.show_individual_points,
-                    error_bars=options.error_bars,
-                    width=options.width,
-                    height=options.height,
-                    save_html=self.temp_html_file
-                )
-            else:
-                # Debug: Log filter options being passed for non-timecourse mode
-                logger.info(f"Standard mode - filter_options: {options}")
-                logger.info(f"Standard mode - selected_tissues: {options.selected_tissues}")
-                logger.info(f"Standard mode - selected_times: {options.selected_times}")
-                
-                # Additional debugging for attribute access in standard mode
-                logger.info(f"Standard mode - filter_options type: {type(options)}")
-                logger.info(f"Standard mode - hasattr selected_population: {hasattr(options, 'selected_population')}")
-                logger.info(f"Standard mode - hasattr selected_tissues: {hasattr(options, 'selected_tissues')}")
-                logger.info(f"Standard mode - hasattr selected_times: {hasattr(options, 'selected_times')}")
-                
-                # Try to access attributes directly to see if there are any issues
-                try:
-                    logger.info(f"Standard mode - direct access selected_population: {getattr(options, 'selected_population', 'NOT_FOUND')}")
-                    logger.info(f"Standard mode - direct access selected_tissues: {getattr(options, 'selected_tissues', 'NOT_FOUND')}")
-                    logger.info(f"Standard mode - direct access selected_times: {getattr(options, 'selected_times', 'NOT_FOUND')}")
-                except Exception as e:
-                    logger.error(f"Standard mode - Error accessing filter options attributes: {e}")
-                
-                fig = plot(
-                    data=filtered_df,
-                    x='Group',
-                    y=options.y_axis,
-                    plot_type=options.plot_type,
-                    filter_options=options,  # Pass filter options for title generation
-                    # Pass user group labels only if explicitly set by user via state
-                    user_group_labels=getattr(self.parent(), 'current_group_labels', []) or None,
-                    show_individual_points=options.show_individual_points,
-                    error_bars=options.error_bars,
-                    fixed_layout=True,
-                    width=options.width,
-                    height=options.height,
-                    save_html=self.temp_html_file
-                )
-            
-            result_path = self.temp_html_file
-            # Store figure for export
-            self.current_fig = fig
-            
-            # Debug: Check the figure title
-            if fig and hasattr(fig, 'layout') and hasattr(fig.layout, 'title'):
-                if hasattr(fig.layout.title, 'text'):
-                    logger.info(f"Figure title: {fig.layout.title.text}")
-                else:
-                    logger.info("Figure has title but no text attribute")
-            else:
-                logger.info("Figure has no title or layout")
-            
-            if fig and result_path:
-                # Debug: Check the generated HTML content
-                if self.temp_html_file.exists():
-                    try:
-                        with open(self.temp_html_file, 'r', encoding='utf-8') as f:
-                            html_content = f.read()
-                            logger.info(f"Generated HTML file size: {len(html_content)} characters")
-                            if 'title' in html_content.lower():
-                                title_start = html_content.find('<title>')
-                                title_end = html_content.find('</title>')
-                                if title_start != -1 and title_end != -1:
-                                    title_text = html_content[title_start + 7:title_end]
-                                    logger.info(f"HTML title found: {title_text}")
-                                else:
-                                    logger.info("No HTML title tags found")
-                            else:
-                                logger.info("No title content found in HTML")
-                    except Exception as e:
-                        logger.warning(f"Failed to read HTML content for debugging: {e}")
-                
-                # Load in web view if available (skip during tests where web_view may be absent)
-                from PySide6.QtCore import QUrl
-                file_url = QUrl.fromLocalFile(str(self.temp_html_file))
-                logger.info(f"Loading web view with URL: {file_url}")
-                if self.web_view is not None and hasattr(self.web_view, 'load'):
-                    self.web_view.load(file_url)
-                
-                # Update status with filter information
-                status_text = f"Plot generated successfully - {len(filtered_df)} of {len(df)} rows displayed"
-                
-                # Check if we have real tissue data
-                has_real_tissue_data = False
-                if 'Tissue' in df.columns:
-                    unique_tissues = df['Tissue'].dropna().unique()
-                    real_tissues = [t for t in unique_tissues if t != 'UNK']
-                    has_real_tissue_data = len(real_tissues) > 0
-                
-                if options.selected_tissues is not None and len(options.selected_tissues) < len(df['Tissue'].dropna().unique()):
-                    status_text += " (filtered by tissue)"
-                elif not has_real_tissue_data and 'Tissue' in df.columns:
-                    status_text += " (auto-filtered UNK tissues)"
-                
-                if options.selected_times is not None and len(options.selected_times) < len(df['Time'].dropna().unique()):
-                    status_text += " (filtered by time)"
-                
-                self.status_label.setText(status_text)
-                self.plot_generated.emit()
-            else:
-                self._show_error_message("Failed to generate plot. Please check your data and filters.")
-            
-        except Exception as e:
-            logger.error(f"Failed to generate plot: {e}")
-            self._show_error_message(f"Failed to generate plot: {str(e)}")
+        # Ensure all filter options are properly synchronized before generating the plot
+        self._ensure_filter_synchronization()
+
+        # Snapshot everything the render needs while still on the UI thread
+        options = self.get_current_options()
+        logger.debug("Current options - tissues: %s, times: %s, time_course: %s",
+                     options.selected_tissues, options.selected_times, options.time_course_mode)
+        if not options.y_axis:
+            logger.warning("No Y-axis metric selected, this may cause plot generation issues")
+
+        # Pass user group labels only if explicitly set by user via state
+        user_group_labels = getattr(self.parent(), 'current_group_labels', []) or None
+        task = partial(
+            render_visualization,
+            self.csv_path,
+            self._source_df,
+            options,
+            user_group_labels,
+            filter_index=self._filter_index,
+        )
+
+        self.status_label.setText("Generating plot...")
+        self._plot_request_id = self._plot_worker.submit(task)
+
+    @Slot(int, object)
+    def _on_plot_rendered(self, request_id: int, result: PlotRenderResult):
+        """Display a finished render unless a newer request overtook it."""
+        if request_id != self._plot_request_id:
+            return
+
+        if result.error_message:
+            self._show_error_message(result.error_message)
+            return
+
+        # Store figure for export
+        self.current_fig = result.fig
+
+        # Update the preview in place (unavailable during tests)
+        if self._plot_preview is not None:
+            self._plot_preview.show_figure(result.figure_json)
+
+        self.status_label.setText(result.status_text)
+        self.plot_generated.emit()
+
+    @Slot(int, str)
+    def _on_plot_failed(self, request_id: int, message: str):
+        """Report a render failure for the latest request."""
+        if request_id == self._plot_request_id:
+            self._show_error_message(f"Failed to generate plot: {message}")
     
     def _save_visualization(self):
         """Save the current visualization to a user-selected location as PDF (non-blocking)."""
@@ -1086,6 +1024,8 @@ class VisualizationDialog(QDialog):
         # Use current data if available, otherwise load from CSV
         if hasattr(self, 'current_data') and self.current_data is not None:
             data = self.current_data
+        elif self._source_df is not None:
+            data = self._source_df
         elif self.csv_path and self.csv_path.exists():
             # Load data from CSV for naming purposes
             from flowproc.domain.parsing import load_and_parse_df
@@ -1164,7 +1104,7 @@ class VisualizationDialog(QDialog):
                     from flowproc.domain.visualization.plotly_renderer import PlotlyRenderer
                     renderer = PlotlyRenderer()
                     
-                    # Use Selenium-based export method for reliable image generation
+                    # Native PDF export: no browser needed
                     if self._width is not None and self._height is not None:
                         renderer.export_to_pdf(self._fig, self._out_path, width=self._width, height=self._height, scale=1)
                     else:
@@ -1211,25 +1151,21 @@ class VisualizationDialog(QDialog):
         self._error_handler = _on_error
     
     def _show_error_message(self, message: str):
-        """Show an error message in the web view."""
+        """Show an error message in place of the plot."""
         error_html = f"""
-        <html>
-        <body style="background-color: #0F0F0F; color: #F0F0F0; font-family: Arial, sans-serif; display: flex; justify-content: center; align-items: center; height: 100vh; margin: 0;">
-            <div style="text-align: center;">
+            <div>
                 <h3 style="color: #ff6b6b;">Visualization Error</h3>
                 <p>{message}</p>
                 <p>Please check your data and try again.</p>
             </div>
-        </body>
-        </html>
         """
-        # In test mode, web_view may be unavailable; guard the call
-        if self.web_view is not None and hasattr(self.web_view, 'setHtml'):
-            self.web_view.setHtml(error_html)
+        # In test mode, the preview page is unavailable; guard the call
+        if self._plot_preview is not None:
+            self._plot_preview.show_message(error_html)
         self.status_label.setText("Error generating plot")
     
     def closeEvent(self, event):
-        """Handle close event and cleanup temporary files and threads."""
+        """Handle close event and cleanup threads."""
         # Check if PDF export is running and ask user if they want to cancel it
         if self.is_pdf_export_running():
             reply = QMessageBox.question(
@@ -1252,6 +1188,10 @@ class VisualizationDialog(QDialog):
                 return
         
         try:
+            # Stop pending and in-flight plot renders
+            self._plot_debounce_timer.stop()
+            self._stop_plot_worker()
+            
             # Clean up any running PDF export thread
             if self._export_thread is not None:
                 if self._export_thread.isRunning():
@@ -1263,15 +1203,17 @@ class VisualizationDialog(QDialog):
                     self._export_thread.stop()
                 self._export_thread.deleteLater()
                 self._export_thread = None
-            
-            # Clean up temporary HTML file
-            if self.temp_html_file and self.temp_html_file.exists():
-                self.temp_html_file.unlink()
         except Exception as e:
             logger.warning(f"Failed to cleanup during dialog close: {e}")
         
         super().closeEvent(event)
     
+    def _stop_plot_worker(self, timeout_ms: int = 5000):
+        """Stop the plot worker, detaching it if a render outlives the dialog."""
+        if not self._plot_worker.stop(timeout_ms):
+            logger.warning("Plot render still running at close; letting it finish in the background")
+            self._plot_worker.detach()
+
     def hideEvent(self, event):
         """Handle hide event to ensure thread safety."""
         super().hideEvent(event)
@@ -1331,6 +1273,11 @@ class VisualizationDialog(QDialog):
     
     def __del__(self):
         """Destructor to ensure thread cleanup."""
+        try:
+            if self._plot_worker.isRunning():
+                self._stop_plot_worker(0)
+        except Exception as e:
+            logger.warning(f"Failed to cleanup plot worker in destructor: {e}")
         try:
             if self._export_thread is not None:
                 if self._export_thread.isRunning():
@@ -2,6 +2,8 @@ from typing import Optional, Tuple, List, Dict, Any
 
 import pandas as pd
 
+from flowproc.domain.processing.filter_index import FilterIndex
+
 
 def extract_population_name(column_name: str, metric: Optional[str] = None) -> str:
     """Extract a population name from a column.
@@ -76,13 +78,15 @@ def detect_population_options(df: pd.DataFrame, metric: Optional[str]) -> Tuple[
     return available_populations, population_mapping
 
 
-def build_tissue_entries(df: pd.DataFrame) -> Tuple[List[Dict[str, Any]], bool]:
+def build_tissue_entries(df: pd.DataFrame, index: Optional[FilterIndex] = None) -> Tuple[List[Dict[str, Any]], bool]:
     """Build display entries for tissues and whether real tissue data exists."""
     entries: List[Dict[str, Any]] = []
     has_real_tissue_data = False
+    if index is None or not index.matches(df):
+        index = FilterIndex(df)
 
-    if 'Tissue' in df.columns:
-        unique_tissues = df['Tissue'].dropna().unique()
+    if index.has_column('Tissue'):
+        unique_tissues = index.values('Tissue')
         real_tissues = [t for t in unique_tissues if t != 'UNK']
         has_real_tissue_data = len(real_tissues) > 0
 
@@ -91,7 +95,7 @@ def build_tissue_entries(df: pd.DataFrame) -> Tuple[List[Dict[str, Any]], bool]:
             tissue_parser = TissueParser()
 
             for tissue_code in sorted(unique_tissues):
-                tissue_count = len(df[df['Tissue'] == tissue_code])
+                tissue_count = index.count('Tissue', tissue_code)
                 if tissue_code == 'UNK':
                     display_text = f"UNK (Unknown) [{tissue_count} samples]"
                 else:
@@ -106,13 +110,15 @@ def build_tissue_entries(df: pd.DataFrame) -> Tuple[List[Dict[str, Any]], bool]:
     return entries, has_real_tissue_data
 
 
-def build_time_entries(df: pd.DataFrame) -> Tuple[List[Dict[str, Any]], bool]:
+def build_time_entries(df: pd.DataFrame, index: Optional[FilterIndex] = None) -> Tuple[List[Dict[str, Any]], bool]:
     """Build display entries for time filter and whether time data exists."""
     entries: List[Dict[str, Any]] = []
     has_time_data = False
+    if index is None or not index.matches(df):
+        index = FilterIndex(df)
 
-    if 'Time' in df.columns:
-        unique_times = df['Time'].dropna().unique()
+    if index.has_column('Time'):
+        unique_times = index.values('Time')
         if len(unique_times) > 0:
             has_time_data = True
             from flowproc.domain.parsing.time_service import TimeService
@@ -120,7 +126,7 @@ def build_time_entries(df: pd.DataFrame) -> Tuple[List[Dict[str, Any]], bool]:
 
             for time_hours in sorted(unique_times):
                 if pd.notna(time_hours):
-                    time_count = len(df[df['Time'] == time_hours])
+                    time_count = index.count('Time', time_hours)
                     formatted_time = time_service.format(time_hours, format_style='auto')
                     display_text = f"{formatted_time} ({time_hours}h) [{time_count} samples]"
                     entries.append({
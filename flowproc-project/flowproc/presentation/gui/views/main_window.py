@@ -117,6 +117,7 @@ class MainWindow(QMainWindow, StylingMixin, ValidationMixin):
         """Handle window close event with proper cleanup."""
         if self.processing_coordinator.handle_close_request():
             self.processing_coordinator.cleanup()
+            self.event_handler.cleanup()
             event.accept()
         else:
             event.ignore()
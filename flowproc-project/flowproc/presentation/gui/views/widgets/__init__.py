@@ -7,5 +7,6 @@ Qt widgets with additional functionality specific to the application.
 
 from .drop_line_edit import DropLineEdit
 from .progress_widget import ProgressWidget
+from .preview_summary_model import PreviewSummaryModel, create_preview_view
 
-__all__ = ['DropLineEdit', 'ProgressWidget'] 
\ No newline at end of file
+__all__ = ['DropLineEdit', 'ProgressWidget', 'PreviewSummaryModel', 'create_preview_view'] 
\ No newline at end of file
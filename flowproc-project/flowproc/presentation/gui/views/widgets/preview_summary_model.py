@@ -0,0 +1,204 @@
+"""
+Table model for the combined summary preview of selected CSV files.
+
+Rows are summarized on demand: a QTableView only asks for the rows it
+shows, so opening the preview for hundreds of files summarizes just the
+visible ones and the rest follow as the user scrolls. Requested rows are
+summarized on a shared thread pool and fill in as each file completes.
+"""
+
+import logging
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QObject, Qt, Signal
+from PySide6.QtWidgets import QHeaderView, QSizePolicy, QTableView, QWidget
+
+from flowproc.domain.parsing.preview import FileSummary, summarize_csv
+
+logger = logging.getLogger(__name__)
+
+PREVIEW_COLUMNS = ("File", "Samples", "Groups", "Animal Range", "Timepoint", "Tissue")
+PENDING_TEXT = "Loading..."
+# Files summarized at once; reads are mostly I/O-bound
+PREVIEW_MAX_WORKERS = 8
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _shared_executor() -> ThreadPoolExecutor:
+    """Thread pool shared by all preview tables."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=PREVIEW_MAX_WORKERS, thread_name_prefix='preview')
+        return _executor
+
+
+def format_range(values: Sequence[Any]) -> str:
+    """Show sorted values as "count: min - max", or the single value."""
+    if not values:
+        return "N/A"
+    if len(values) == 1:
+        return str(values[0])
+    return f"{len(values)}: {values[0]} - {values[-1]}"
+
+
+def format_list(values: Sequence[Any]) -> str:
+    """Show sorted values as "count: a, b, ..."."""
+    if not values:
+        return "N/A"
+    return f"{len(values)}: {', '.join(map(str, values))}"
+
+
+def format_summary(summary: FileSummary) -> List[str]:
+    """Cell texts of one preview row."""
+    if summary.error:
+        return [f"{summary.path.name} - Error: {summary.error}"] + ["Error"] * (len(PREVIEW_COLUMNS) - 1)
+    return [
+        summary.path.name,
+        str(summary.samples),
+        format_range(summary.groups),
+        format_range(summary.animals),
+        format_range(summary.timepoints),
+        format_list(summary.tissues),
+    ]
+
+
+class PreviewSummaryModel(QAbstractTableModel):
+    """One row per file, summarized the first time the row is displayed."""
+
+    # Delivers a finished row from a pool thread to the model's thread
+    _row_ready = Signal(int, list)
+
+    def __init__(self, file_paths: Sequence[Union[str, Path]], parent: Optional[QObject] = None,
+                 summarize: Callable[[Path], FileSummary] = summarize_csv,
+                 executor: Optional[Executor] = None):
+        """
+        Initialize the model.
+
+        Args:
+            file_paths: Files to preview, one row each
+            parent: Parent object
+            summarize: Function producing the summary of one file
+            executor: Runs the summaries; defaults to a pool shared by all previews
+        """
+        super().__init__(parent)
+        self._paths = [Path(path) for path in file_paths]
+        self._summarize = summarize
+        self._executor = executor
+        self._rows: Dict[int, List[str]] = {}
+        self._pending: Dict[int, Future] = {}
+        self._row_ready.connect(self._store_row)
+
+    @property
+    def paths(self) -> List[Path]:
+        """Files shown by the model, one per row."""
+        return list(self._paths)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._paths)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(PREVIEW_COLUMNS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return PREVIEW_COLUMNS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.row_texts(index.row())[index.column()]
+        if role == Qt.ItemDataRole.ToolTipRole and index.column() == 0:
+            return str(self._paths[index.row()])
+        return None
+
+    def row_texts(self, row: int) -> List[str]:
+        """
+        Cell texts of a row.
+
+        A row that is not summarized yet is queued and shows its file name
+        with placeholders until the summary arrives.
+        """
+        texts = self._rows.get(row)
+        if texts is not None:
+            return texts
+        if row not in self._pending:
+            executor = self._executor or _shared_executor()
+            self._pending[row] = executor.submit(self._summarize_row, row)
+        return [self._paths[row].name] + [PENDING_TEXT] * (len(PREVIEW_COLUMNS) - 1)
+
+    def cancel(self) -> None:
+        """
+        Drop queued summaries, e.g. because the selection changed.
+
+        Summaries already running still complete. Dropped rows are queued
+        again if they are displayed later.
+        """
+        for row, future in list(self._pending.items()):
+            if future.cancel():
+                del self._pending[row]
+
+    def summarized_rows(self) -> int:
+        """Number of files summarized so far."""
+        return len(self._rows)
+
+    def pending_rows(self) -> int:
+        """Number of files queued or being summarized."""
+        return len(self._pending)
+
+    def _summarize_row(self, row: int) -> None:
+        """Summarize one file on a pool thread."""
+        path = self._paths[row]
+        try:
+            summary = self._summarize(path)
+        except Exception as e:
+            summary = FileSummary(path=path, error=f"Failed to parse ({e})")
+        try:
+            self._row_ready.emit(row, format_summary(summary))
+        except RuntimeError:
+            # The preview was closed while the file was being summarized
+            logger.debug("Dropped summary of %s for a deleted preview", path)
+
+    def _store_row(self, row: int, texts: List[str]) -> None:
+        """Show a finished row."""
+        self._rows[row] = texts
+        self._pending.pop(row, None)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(PREVIEW_COLUMNS) - 1))
+
+
+def create_preview_view(file_paths: Sequence[Union[str, Path]], parent: Optional[QWidget] = None) -> QTableView:
+    """
+    Create the combined summary table for the given files.
+
+    Args:
+        file_paths: Files to preview
+        parent: Parent widget
+
+    Returns:
+        QTableView backed by a PreviewSummaryModel
+    """
+    view = QTableView(parent)
+    model = PreviewSummaryModel(file_paths, view)
+    view.setModel(model)
+    # Closing the preview drops the rows still queued
+    view.destroyed.connect(model.cancel)
+    # Stretch (not ResizeToContents) so sizing never reads rows that are not shown
+    view.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+    view.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+    return view
+
+
+__all__ = [
+    'PREVIEW_COLUMNS',
+    'PENDING_TEXT',
+    'PreviewSummaryModel',
+    'create_preview_view',
+    'format_summary',
+]
@@ -7,5 +7,6 @@ tasks to keep the GUI responsive during long-running operations.
 
 from .processing_worker import ProcessingWorker
 from .validation_worker import ValidationWorker
+from .plot_worker import PlotRenderWorker, RenderSuperseded
 
-__all__ = ['ProcessingWorker', 'ValidationWorker'] 
\ No newline at end of file
+__all__ = ['ProcessingWorker', 'ValidationWorker', 'PlotRenderWorker', 'RenderSuperseded'] 
\ No newline at end of file
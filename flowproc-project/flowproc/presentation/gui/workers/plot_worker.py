@@ -0,0 +1,165 @@
+"""
+Background plot rendering with latest-request-wins semantics.
+
+Interactive option changes can arrive faster than figures can be built.
+PlotRenderWorker keeps at most one pending request: submitting a new one
+replaces whatever is queued and marks any render in flight as superseded,
+so the thread never works through a backlog of stale plots.
+"""
+
+import logging
+import warnings
+from typing import Any, Callable, Optional, Set, Tuple
+
+from PySide6.QtCore import QThread, Signal, QObject, QMutex, QMutexLocker, QWaitCondition
+
+logger = logging.getLogger(__name__)
+
+# A render task receives a checkpoint callable and returns the render result.
+# The checkpoint raises RenderSuperseded once a newer request is submitted.
+RenderTask = Callable[[Callable[[], None]], Any]
+
+# Workers detached from their owner, kept alive until their thread exits
+_detached_workers: Set['PlotRenderWorker'] = set()
+
+
+class RenderSuperseded(Exception):
+    """Raised at a checkpoint when the running render is no longer wanted."""
+
+
+class PlotRenderWorker(QThread):
+    """
+    Worker thread that renders the most recently submitted task.
+
+    Tasks run off the UI thread and must not touch widgets; anything they
+    need from the UI is captured when the task is built. Results are
+    delivered through ``render_completed`` tagged with the request id, so
+    receivers can ignore results that were overtaken while in flight.
+    The thread exits after being idle for a while and restarts on demand.
+    """
+
+    # Signals
+    render_completed = Signal(int, object)  # Request id, task result
+    render_failed = Signal(int, str)        # Request id, error message
+
+    IDLE_TIMEOUT_MS = 2000
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._mutex = QMutex()
+        self._wake = QWaitCondition()
+        self._pending: Optional[Tuple[int, RenderTask]] = None
+        self._latest_id = 0
+        self._active = False
+        self._stopping = False
+
+    def submit(self, task: RenderTask) -> int:
+        """
+        Queue a render task, superseding any pending or running one.
+
+        Args:
+            task: Callable invoked on the worker thread with a checkpoint function
+
+        Returns:
+            Id of the new request
+        """
+        with QMutexLocker(self._mutex):
+            self._latest_id += 1
+            request_id = self._latest_id
+            self._pending = (request_id, task)
+            self._stopping = False
+            needs_start = not self._active
+            self._active = True
+            self._wake.wakeOne()
+
+        if needs_start:
+            # A previous run() may still be returning after going idle
+            self.wait()
+            self.start()
+        return request_id
+
+    def cancel(self) -> None:
+        """Drop the pending request and supersede the one in flight."""
+        with QMutexLocker(self._mutex):
+            self._latest_id += 1
+            self._pending = None
+
+    def stop(self, timeout_ms: int = 5000) -> bool:
+        """
+        Cancel outstanding work and wait for the thread to exit.
+
+        Args:
+            timeout_ms: Maximum time to wait for the current render to finish
+
+        Returns:
+            True if the thread has stopped
+        """
+        with QMutexLocker(self._mutex):
+            self._latest_id += 1
+            self._pending = None
+            self._stopping = True
+            self._wake.wakeAll()
+        return self.wait(timeout_ms)
+
+    def detach(self) -> None:
+        """
+        Let a worker that did not stop in time finish without its owner.
+
+        Destroying a QThread that is still running aborts the application,
+        so the worker is disconnected from its receivers, unparented and
+        kept alive until its thread exits, then deleted.
+        """
+        with warnings.catch_warnings():
+            # PySide warns rather than raises when nothing is connected
+            warnings.simplefilter('ignore', RuntimeWarning)
+            self.render_completed.disconnect()
+            self.render_failed.disconnect()
+        self.setParent(None)
+        _detached_workers.add(self)
+        self.destroyed.connect(lambda: _detached_workers.discard(self))
+        self.finished.connect(self.deleteLater)
+        if self.isFinished():
+            self.deleteLater()
+
+    def is_current(self, request_id: int) -> bool:
+        """Check whether a request is still the latest one submitted."""
+        with QMutexLocker(self._mutex):
+            return request_id == self._latest_id
+
+    def _next_request(self) -> Optional[Tuple[int, RenderTask]]:
+        """Wait for the next request, or return None when idle or stopping."""
+        with QMutexLocker(self._mutex):
+            if self._pending is None and not self._stopping:
+                self._wake.wait(self._mutex, self.IDLE_TIMEOUT_MS)
+            if self._pending is None or self._stopping:
+                self._active = False
+                return None
+            request, self._pending = self._pending, None
+            return request
+
+    def run(self) -> None:
+        """Render requests until the worker goes idle or is stopped."""
+        while True:
+            request = self._next_request()
+            if request is None:
+                return
+            self._render(*request)
+
+    def _render(self, request_id: int, task: RenderTask) -> None:
+        """Run a single task and report its outcome."""
+        def checkpoint() -> None:
+            if not self.is_current(request_id):
+                raise RenderSuperseded()
+
+        try:
+            checkpoint()
+            result = task(checkpoint)
+        except RenderSuperseded:
+            logger.debug("Plot request %d superseded before completion", request_id)
+            return
+        except Exception as e:
+            logger.error(f"Plot rendering failed: {e}")
+            self.render_failed.emit(request_id, str(e))
+            return
+
+        self.render_completed.emit(request_id, result)
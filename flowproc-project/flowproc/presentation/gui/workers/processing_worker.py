@@ -17,6 +17,7 @@ from PySide6.QtWidgets import QMessageBox
 from ....config import AUTO_PARSE_GROUPS, USER_GROUPS, USER_REPLICATES, USER_GROUP_LABELS
 from ....domain.export import process_csv, process_directory
 from ....domain.parsing import load_and_parse_df
+from ....infrastructure.monitoring.exporters import run_metrics, begin_run, end_run
 
 logger = logging.getLogger(__name__)
 
@@ -138,6 +139,7 @@ class ProcessingWorker(QThread):
         self._set_state(ProcessingState.RUNNING)
         result = ProcessingResult()
         start_time = time.time()
+        begin_run()
         
         try:
             total_items = len(self._task.input_paths)
@@ -194,6 +196,7 @@ class ProcessingWorker(QThread):
             result.total_time = time.time() - start_time
             self.processing_completed.emit(result)
             self._set_state(ProcessingState.IDLE)
+            end_run()
             
     def _process_single_path(self, input_path: Path) -> tuple[bool, Optional[str], Optional[Path]]:
         """
@@ -249,6 +252,7 @@ class ProcessingWorker(QThread):
         except Exception as e:
             error_msg = f"Error processing {input_path}: {str(e)}"
             logger.error(error_msg, exc_info=True)
+            run_metrics.record_failure()
             return False, error_msg, None
 
 
@@ -12,7 +12,9 @@ from dataclasses import dataclass
 
 from PySide6.QtCore import QThread, Signal, QObject
 
-from flowproc.domain.validation import validate_gui_inputs, InputValidationConfig, InputValidationResult
+from flowproc.domain.validation import (
+    validate_gui_inputs, InputValidator, InputValidationConfig, InputValidationResult, ValidationCancelled
+)
 from ....core.models import ProcessingOptions
 
 logger = logging.getLogger(__name__)
@@ -42,6 +44,10 @@ class ValidationWorker(QThread):
     - File format compatibility
     - Directory structure
     - Processing options
+    
+    Files are checked concurrently and each result is emitted through
+    ``file_validated`` as it arrives. Starting a new validation cancels
+    the one in progress, so a changed selection never waits for a stale one.
     """
     
     # Signals
@@ -49,6 +55,7 @@ class ValidationWorker(QThread):
     validation_progress = Signal(int, str)  # progress, message
     validation_completed = Signal(ValidationResult)
     validation_error = Signal(str)
+    file_validated = Signal(str, object)  # path, InputValidationResult
     
     def __init__(self, parent: Optional[QObject] = None):
         super().__init__(parent)
@@ -62,18 +69,41 @@ class ValidationWorker(QThread):
         options: ProcessingOptions
     ) -> None:
         """
-        Start validation of inputs.
+        Start validation of inputs, cancelling any validation in progress.
         
         Args:
             input_paths: List of input file/directory paths
             output_dir: Output directory path
             options: Processing options to validate
         """
-        self._validation_task = {
+        self._start({
             'input_paths': input_paths,
             'output_dir': output_dir,
             'options': options
-        }
+        })
+        
+    def validate_paths(self, input_paths: List[Path]) -> None:
+        """
+        Start validation of the input paths only, cancelling any validation in progress.
+        
+        Unlike validate_inputs this never touches the output directory, so it
+        can run on every selection change.
+        
+        Args:
+            input_paths: List of input file/directory paths
+        """
+        self._start({
+            'input_paths': input_paths,
+            'output_dir': None,
+            'options': None
+        })
+        
+    def _start(self, task: Dict[str, Any]) -> None:
+        """Run a validation task, cancelling the one in progress first."""
+        if self.isRunning():
+            self._should_cancel = True
+            self.wait()
+        self._validation_task = task
         self._should_cancel = False
         self.start()
         
@@ -99,6 +129,8 @@ class ValidationWorker(QThread):
             if not self._should_cancel:
                 self.validation_completed.emit(result)
                 
+        except ValidationCancelled:
+            logger.debug("Validation cancelled")
         except Exception as e:
             logger.error(f"Validation error: {e}")
             if not self._should_cancel:
@@ -107,15 +139,15 @@ class ValidationWorker(QThread):
     def _perform_validation(
         self,
         input_paths: List[Path],
-        output_dir: Path,
-        options: ProcessingOptions
+        output_dir: Optional[Path],
+        options: Optional[ProcessingOptions]
     ) -> ValidationResult:
         """
         Perform the actual validation using the unified validation service.
         
         Args:
             input_paths: List of input paths to validate
-            output_dir: Output directory to validate
+            output_dir: Output directory to validate; None validates the input paths only
             options: Processing options to validate
             
         Returns:
@@ -123,26 +155,35 @@ class ValidationWorker(QThread):
         """
         # Convert Path objects to strings for the unified validator
         input_path_strings = [str(path) for path in input_paths]
-        output_dir_string = str(output_dir)
         
         # Validate using the unified service
         self.validation_progress.emit(10, "Validating inputs...")
         if self._should_cancel:
             return ValidationResult(False, ["Validation cancelled"], [])
         
-        # Extract processing options for validation
-        groups = getattr(options, 'user_groups', None)
-        replicates = getattr(options, 'user_replicates', None)
-        time_course_mode = getattr(options, 'time_course_mode', False)
-        
-        # Use the unified validation service
-        result = validate_gui_inputs(
-            input_paths=input_path_strings,
-            output_dir=output_dir_string,
-            groups=groups,
-            replicates=replicates,
-            time_course_mode=time_course_mode
-        )
+        if output_dir is None:
+            # Input paths only (selection changes)
+            result = InputValidator().validate_input_paths(
+                input_path_strings,
+                on_file=self.file_validated.emit,
+                checkpoint=self._checkpoint
+            )
+        else:
+            # Extract processing options for validation
+            groups = getattr(options, 'user_groups', None)
+            replicates = getattr(options, 'user_replicates', None)
+            time_course_mode = getattr(options, 'time_course_mode', False)
+            
+            # Use the unified validation service
+            result = validate_gui_inputs(
+                input_paths=input_path_strings,
+                output_dir=str(output_dir),
+                groups=groups,
+                replicates=replicates,
+                time_course_mode=time_course_mode,
+                on_file=self.file_validated.emit,
+                checkpoint=self._checkpoint
+            )
         
         if self._should_cancel:
             return ValidationResult(False, ["Validation cancelled"], [])
@@ -159,5 +200,10 @@ class ValidationWorker(QThread):
             supported_formats=['.csv']
         )
         
+    def _checkpoint(self) -> None:
+        """Abandon the running validation once it has been cancelled."""
+        if self._should_cancel:
+            raise ValidationCancelled()
+        
     # Note: All validation logic has been moved to the unified validation service
     # The following methods are no longer needed as they are handled by the unified service 
\ No newline at end of file
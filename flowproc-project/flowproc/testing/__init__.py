@@ -0,0 +1,17 @@
+"""
+Test-data generation utilities.
+"""
+
+from .synthetic_data import (
+    SyntheticDatasetConfig,
+    generate_synthetic_data,
+    to_flowjo_export,
+    write_synthetic_dataset,
+)
+
+__all__ = [
+    'SyntheticDatasetConfig',
+    'generate_synthetic_data',
+    'to_flowjo_export',
+    'write_synthetic_dataset',
+]
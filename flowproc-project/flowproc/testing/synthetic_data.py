@@ -0,0 +1,264 @@
+"""
+Synthetic flow cytometry exports for benchmarks and stress tests.
+
+Generates seeded data sets in the layout FlowJo table exports use: one row
+per sample named like ``Day 1_SP_A1_1.1.fcs`` (time, tissue, well,
+group.animal), ``population/path | statistic`` measurement headers, optional
+text markers (``OOR``, ``*4.51``) and ``Mean``/``SD`` footer rows, written
+in one of several encodings.
+
+Usage:
+    python -m flowproc.testing.synthetic_data OUTPUT_DIR --files 20 --groups 8
+"""
+
+import argparse
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+TISSUES = ['SP', 'BM', 'LN', 'PB']
+CELL_TYPES = ['CD4+', 'CD8+', 'NK', 'B cells', 'Tregs']
+METRIC_TYPES = ['Count', 'Freq. of Parent', 'Median', 'Mean']
+
+# Populations whose names need a non-ASCII encoding (exercises encoding fallback)
+ACCENTED_POPULATIONS = ['Naïve T', 'Mémoire T']
+
+
+@dataclass
+class SyntheticDatasetConfig:
+    """Shape and content of a generated data set."""
+    n_files: int = 1
+    n_samples: Optional[int] = None
+    n_groups: int = 4
+    n_animals: int = 3
+    n_timepoints: int = 1
+    n_tissues: int = 1
+    n_metrics: int = 8
+    marker_rate: float = 0.0
+    include_footer: bool = True
+    accented_headers: bool = False
+    encodings: Tuple[str, ...] = ('utf-8',)
+    sample_header: str = ''
+    seed: int = 42
+
+
+def generate_synthetic_data(
+    n_samples: Optional[int] = None,
+    n_groups: int = 10,
+    n_animals: int = 5,
+    n_timepoints: int = 5,
+    n_metrics: int = 20,
+    n_tissues: int = 1,
+    seed: int = 42,
+    populations: Optional[Sequence[str]] = None
+) -> pd.DataFrame:
+    """
+    Generate synthetic flow cytometry data.
+
+    Sample IDs follow the FlowJo export convention (``SP_A1_1.1.fcs``) and
+    carry a ``Day <n>_`` prefix when there is more than one time point,
+    so every row parses to a unique group/animal/time/tissue combination.
+    The same arguments always produce the same frame.
+
+    Args:
+        n_samples: Approximate number of rows; overrides n_animals when given
+        n_groups: Number of experimental groups
+        n_animals: Number of animals per group
+        n_timepoints: Number of time points
+        n_metrics: Number of measurement columns
+        n_tissues: Number of tissues (up to 4)
+        seed: Random seed
+        populations: Population names to use before generic ``Pop<n>`` names
+
+    Returns:
+        DataFrame with SampleID, the expected Well/Group/Animal/Time/Tissue/
+        Replicate values and ``Lymphocytes/<population> | <statistic>`` columns
+    """
+    rng = np.random.default_rng(seed)
+    tissues = TISSUES[:max(1, min(n_tissues, len(TISSUES)))]
+    if n_samples is not None:
+        n_animals = max(1, -(-n_samples // (n_groups * n_timepoints * len(tissues))))
+
+    # Generate sample structure
+    samples = []
+    for timepoint in range(n_timepoints):
+        hours = timepoint * 24.0
+        prefix = f"Day {timepoint}_" if n_timepoints > 1 else ""
+        for tissue in tissues:
+            for group in range(1, n_groups + 1):
+                for animal in range(1, n_animals + 1):
+                    # Plate rows A-G only: the parser reads "H<n>" wells as hours
+                    index = len(samples)
+                    well = f"{chr(ord('A') + (index // 12) % 7)}{index % 12 + 1}"
+                    samples.append({
+                        'SampleID': f"{prefix}{tissue}_{well}_{group}.{animal}.fcs",
+                        'Well': well,
+                        'Group': group,
+                        'Animal': animal,
+                        'Time': hours,
+                        'Tissue': tissue,
+                        'Replicate': animal
+                    })
+
+    df = pd.DataFrame(samples)
+
+    # Add metric columns, cycling metric types over as many populations as needed
+    names = list(populations) if populations is not None else list(CELL_TYPES)
+    n_populations = -(-n_metrics // len(METRIC_TYPES))
+    names += [f"Pop{i}" for i in range(len(names) + 1, n_populations + 1)]
+    columns = [(metric_type, cell_type) for cell_type in names for metric_type in METRIC_TYPES]
+    for metric_type, cell_type in columns[:n_metrics]:
+        col_name = f"Lymphocytes/{cell_type} | {metric_type}"
+        if metric_type == 'Count':
+            df[col_name] = rng.integers(100, 10000, len(df))
+        elif metric_type == 'Freq. of Parent':
+            df[col_name] = rng.uniform(0, 100, len(df))
+        else:
+            df[col_name] = rng.uniform(100, 5000, len(df))
+
+    return df
+
+
+def to_flowjo_export(
+    df: pd.DataFrame,
+    marker_rate: float = 0.0,
+    include_footer: bool = True,
+    sample_header: str = '',
+    seed: int = 42
+) -> pd.DataFrame:
+    """
+    Lay out generated data the way a FlowJo table export does.
+
+    Args:
+        df: Output of generate_synthetic_data
+        marker_rate: Fraction of measurement cells replaced by text markers
+        include_footer: Append ``Mean`` and ``SD`` rows
+        sample_header: Header of the sample column (FlowJo leaves it blank)
+        seed: Random seed for marker placement
+
+    Returns:
+        DataFrame with the sample column followed by the measurement columns
+    """
+    rng = np.random.default_rng(seed)
+    metric_cols = [c for c in df.columns if ' | ' in c]
+    values = df[metric_cols].round(2)
+
+    export = values.astype(object)
+    if marker_rate > 0:
+        for col in metric_cols:
+            hits = rng.random(len(values)) < marker_rate
+            starred = hits & (rng.random(len(values)) < 0.5)
+            export.loc[starred, col] = values.loc[starred, col].map(lambda v: f"*{v:.2f}")
+            export.loc[hits & ~starred, col] = 'OOR'
+    export.insert(0, sample_header, df['SampleID'].to_numpy())
+
+    if include_footer:
+        footer = pd.DataFrame([
+            ['Mean'] + values.mean().round(2).tolist(),
+            ['SD'] + values.std().round(2).tolist(),
+        ], columns=export.columns)
+        export = pd.concat([export, footer], ignore_index=True)
+
+    return export
+
+
+def write_synthetic_dataset(output_dir: Path, config: Optional[SyntheticDatasetConfig] = None) -> List[Path]:
+    """
+    Write a directory of synthetic CSV exports.
+
+    File ``i`` uses seed ``config.seed + i`` and the ``i``-th encoding
+    (cycling), so the whole directory is reproducible.
+
+    Args:
+        output_dir: Directory to write into (created if missing)
+        config: Data set shape; defaults to SyntheticDatasetConfig()
+
+    Returns:
+        Paths of the written files
+    """
+    config = config or SyntheticDatasetConfig()
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    populations = ACCENTED_POPULATIONS + CELL_TYPES if config.accented_headers else None
+
+    paths = []
+    for index in range(config.n_files):
+        seed = config.seed + index
+        encoding = config.encodings[index % len(config.encodings)]
+        df = generate_synthetic_data(
+            n_samples=config.n_samples,
+            n_groups=config.n_groups,
+            n_animals=config.n_animals,
+            n_timepoints=config.n_timepoints,
+            n_metrics=config.n_metrics,
+            n_tissues=config.n_tissues,
+            seed=seed,
+            populations=populations
+        )
+        export = to_flowjo_export(
+            df,
+            marker_rate=config.marker_rate,
+            include_footer=config.include_footer,
+            sample_header=config.sample_header,
+            seed=seed
+        )
+        path = output_dir / f"synthetic_{index + 1:04d}.csv"
+        export.to_csv(path, index=False, encoding=encoding)
+        paths.append(path)
+
+    logger.info(f"Wrote {len(paths)} synthetic files to {output_dir}")
+    return paths
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command-line entry point."""
+    defaults = SyntheticDatasetConfig()
+    parser = argparse.ArgumentParser(description="Write synthetic flow cytometry CSV exports.")
+    parser.add_argument('output_dir', type=Path, help="Directory to write the CSV files into")
+    parser.add_argument('--files', type=int, default=defaults.n_files, help="Number of files")
+    parser.add_argument('--rows', type=int, default=defaults.n_samples,
+                        help="Approximate sample rows per file (overrides --animals)")
+    parser.add_argument('--columns', type=int, default=defaults.n_metrics, help="Measurement columns per file")
+    parser.add_argument('--groups', type=int, default=defaults.n_groups, help="Experimental groups")
+    parser.add_argument('--animals', type=int, default=defaults.n_animals, help="Animals per group")
+    parser.add_argument('--timepoints', type=int, default=defaults.n_timepoints, help="Time points")
+    parser.add_argument('--tissues', type=int, default=defaults.n_tissues, help=f"Tissues (up to {len(TISSUES)})")
+    parser.add_argument('--marker-rate', type=float, default=defaults.marker_rate,
+                        help="Fraction of values replaced by OOR/*value text markers")
+    parser.add_argument('--no-footer', action='store_true', help="Omit the Mean/SD footer rows")
+    parser.add_argument('--accented-headers', action='store_true',
+                        help="Include population names that need a non-ASCII encoding")
+    parser.add_argument('--encodings', default=','.join(defaults.encodings),
+                        help="Comma-separated encodings cycled across files, e.g. utf-8,latin-1,utf-8-sig")
+    parser.add_argument('--sample-header', default=defaults.sample_header, help="Header of the sample column")
+    parser.add_argument('--seed', type=int, default=defaults.seed, help="Random seed")
+    args = parser.parse_args(argv)
+
+    config = SyntheticDatasetConfig(
+        n_files=args.files,
+        n_samples=args.rows,
+        n_groups=args.groups,
+        n_animals=args.animals,
+        n_timepoints=args.timepoints,
+        n_tissues=args.tissues,
+        n_metrics=args.columns,
+        marker_rate=args.marker_rate,
+        include_footer=not args.no_footer,
+        accented_headers=args.accented_headers,
+        encodings=tuple(e.strip() for e in args.encodings.split(',') if e.strip()),
+        sample_header=args.sample_header,
+        seed=args.seed
+    )
+    paths = write_synthetic_dataset(args.output_dir, config)
+    print(f"Wrote {len(paths)} files to {args.output_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
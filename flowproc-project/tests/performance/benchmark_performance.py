@@ -8,7 +8,6 @@ import pandas as pd
 import numpy as np
 import gc
 from pathlib import Path
-import matplotlib.pyplot as plt
 from typing import Dict, List, Tuple
 import logging
 
@@ -18,63 +17,11 @@ from flowproc.domain.visualization.flow_cytometry_visualizer import plot
 from flowproc.domain.parsing import load_and_parse_df
 from flowproc.domain.processing.transform import map_replicates
 from flowproc.core.constants import KEYWORDS
+from flowproc.testing import generate_synthetic_data
 
 logger = logging.getLogger(__name__)
 
 
-def generate_synthetic_data(
-    n_samples: int = 1000,
-    n_groups: int = 10,
-    n_animals: int = 5,
-    n_timepoints: int = 5,
-    n_metrics: int = 20
-) -> pd.DataFrame:
-    """
-    Generate synthetic flow cytometry data for benchmarking.
-    
-    Args:
-        n_samples: Number of samples to generate
-        n_groups: Number of experimental groups
-        n_animals: Number of animals per group
-        n_timepoints: Number of time points
-        n_metrics: Number of measurement columns
-        
-    Returns:
-        DataFrame with synthetic data
-    """
-    np.random.seed(42)
-    
-    # Generate sample structure
-    samples = []
-    for group in range(1, n_groups + 1):
-        for animal in range(1, n_animals + 1):
-            for timepoint in range(n_timepoints):
-                sample_id = f"SP_A{group}_{group}.{animal}"
-                samples.append({
-                    'SampleID': sample_id,
-                    'Well': f"A{group}",
-                    'Group': group,
-                    'Animal': animal,
-                    'Time': timepoint * 24.0,
-                    'Replicate': animal
-                })
-    
-    df = pd.DataFrame(samples)
-    
-    # Add metric columns
-    for metric_type in ['Count', 'Freq. of Parent', 'Median', 'Mean']:
-        for cell_type in ['CD4+', 'CD8+', 'NK', 'B cells', 'Tregs']:
-            col_name = f"{metric_type} {cell_type}"
-            if metric_type == 'Count':
-                df[col_name] = np.random.randint(100, 10000, len(df))
-            elif metric_type == 'Freq. of Parent':
-                df[col_name] = np.random.uniform(0, 100, len(df))
-            else:
-                df[col_name] = np.random.uniform(100, 5000, len(df))
-    
-    return df
-
-
 def old_aggregate_implementation(
     df: pd.DataFrame,
     sid_col: str,
@@ -259,6 +206,8 @@ def plot_benchmark_results(
         sample_sizes: List of sample sizes tested
         results_by_size: Results dictionary keyed by sample size
     """
+    import matplotlib.pyplot as plt
+    
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
     
     # Extract data
@@ -0,0 +1,90 @@
+"""
+Fixtures for the benchmark suite.
+
+Data is generated once per session from ``generate_synthetic_data`` at the
+scale selected with ``--bench-scale`` (default: small, so a plain test run
+stays fast). Run ``make bench-save`` to record a baseline and
+``make bench-compare`` to fail on regressions against it.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from flowproc.testing import (
+    SyntheticDatasetConfig, generate_synthetic_data, to_flowjo_export, write_synthetic_dataset
+)
+
+# Arguments for generate_synthetic_data at each benchmark scale
+SCALES = {
+    'small': dict(n_groups=4, n_animals=3, n_timepoints=2, n_tissues=2, n_metrics=8),
+    'medium': dict(n_groups=10, n_animals=6, n_timepoints=4, n_tissues=2, n_metrics=40),
+    'large': dict(n_groups=20, n_animals=8, n_timepoints=6, n_tissues=3, n_metrics=100),
+}
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--bench-scale",
+        action="store",
+        default="small",
+        choices=sorted(SCALES),
+        help="Size of the synthetic data set used by the benchmarks",
+    )
+
+
+@pytest.fixture(scope="session")
+def bench_scale(request) -> str:
+    """Name of the selected benchmark scale."""
+    return request.config.getoption("--bench-scale", default="small")
+
+
+@pytest.fixture(scope="session")
+def synthetic_frame(bench_scale):
+    """Seeded synthetic data including the expected Group/Animal/Time/Tissue columns."""
+    return generate_synthetic_data(**SCALES[bench_scale])
+
+
+@pytest.fixture(scope="session")
+def metric_columns(synthetic_frame):
+    """FlowJo-style measurement columns of the synthetic data."""
+    return [c for c in synthetic_frame.columns if ' | ' in c]
+
+
+@pytest.fixture(scope="session")
+def synthetic_csv(synthetic_frame, tmp_path_factory) -> Path:
+    """The synthetic data written as a FlowJo CSV export with Mean/SD footer rows."""
+    path = tmp_path_factory.mktemp("bench") / "synthetic.csv"
+    to_flowjo_export(synthetic_frame).to_csv(path, index=False)
+    return path
+
+
+@pytest.fixture(scope="session")
+def synthetic_directory(bench_scale, tmp_path_factory) -> Path:
+    """A directory of FlowJo exports with text markers and mixed encodings."""
+    directory = tmp_path_factory.mktemp("bench_batch")
+    config = SyntheticDatasetConfig(
+        n_files=4,
+        marker_rate=0.02,
+        accented_headers=True,
+        encodings=('utf-8', 'latin-1', 'utf-8-sig'),
+        **SCALES[bench_scale]
+    )
+    write_synthetic_dataset(directory, config)
+    return directory
+
+
+@pytest.fixture(scope="session")
+def parsed_frame(synthetic_csv):
+    """The synthetic CSV loaded and parsed, as (DataFrame, sample ID column)."""
+    from flowproc.domain.parsing import load_and_parse_df
+    return load_and_parse_df(synthetic_csv)
+
+
+@pytest.fixture(scope="session")
+def replicate_frame(parsed_frame):
+    """The parsed data with replicates mapped, as (DataFrame, sample ID column, replicate count)."""
+    from flowproc.domain.processing.transform import map_replicates
+    df, sid_col = parsed_frame
+    mapped, replicate_count = map_replicates(df.copy())
+    return mapped, sid_col, replicate_count
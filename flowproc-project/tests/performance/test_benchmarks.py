@@ -0,0 +1,115 @@
+"""
+Benchmarks for the CSV-to-Excel pipeline and plot generation.
+
+Each stage is timed on the same seeded synthetic data set; see conftest.py
+for the available scales.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from flowproc.domain.aggregation import AggregationService
+from flowproc.domain.export import process_csv, process_directory
+from flowproc.domain.parsing import load_and_parse_df
+from flowproc.domain.parsing.csv_reader import CSVReader
+from flowproc.domain.parsing.sample_id_parser import SampleIDParser
+from flowproc.domain.processing.transform import map_replicates, reshape_pair
+from flowproc.domain.visualization.flow_cytometry_visualizer import plot
+
+
+@pytest.mark.benchmark(group="parsing")
+class TestParsingBenchmarks:
+    """Benchmark reading and parsing the raw export."""
+
+    def test_csv_reader_read(self, benchmark, synthetic_csv, synthetic_frame):
+        df = benchmark(CSVReader().read, synthetic_csv)
+
+        assert len(df) == len(synthetic_frame)
+
+    def test_sample_id_parser(self, benchmark, synthetic_frame):
+        sample_ids = synthetic_frame['SampleID'].tolist()
+
+        def parse_all():
+            # Fresh parser per round so its result cache never short-circuits parsing
+            parser = SampleIDParser()
+            return [parser.parse(sample_id) for sample_id in sample_ids]
+
+        parsed = benchmark(parse_all)
+
+        assert all(p is not None for p in parsed)
+
+    def test_load_and_parse_df(self, benchmark, synthetic_csv, synthetic_frame):
+        df, sid_col = benchmark(load_and_parse_df, synthetic_csv)
+
+        assert sid_col == 'SampleID'
+        assert df['Group'].nunique() == synthetic_frame['Group'].nunique()
+
+
+@pytest.mark.benchmark(group="processing")
+class TestProcessingBenchmarks:
+    """Benchmark replicate mapping, reshaping and aggregation."""
+
+    def test_map_replicates(self, benchmark, parsed_frame):
+        df, _ = parsed_frame
+
+        _, replicate_count = benchmark(lambda: map_replicates(df.copy()))
+
+        assert replicate_count > 0
+
+    def test_reshape_pair(self, benchmark, replicate_frame, metric_columns):
+        df, sid_col, replicate_count = replicate_frame
+
+        val_blocks, *_ = benchmark(
+            reshape_pair, df, sid_col, metric_columns, replicate_count,
+            use_tissue=True, include_time=True, group_first=True
+        )
+
+        assert val_blocks
+
+    def test_aggregate_all_metrics(self, benchmark, replicate_frame):
+        df, sid_col, _ = replicate_frame
+
+        def aggregate():
+            service = AggregationService(df.copy(), sid_col)
+            try:
+                return service.aggregate_all_metrics()
+            finally:
+                service.cleanup()
+
+        result = benchmark(aggregate)
+
+        assert result.dataframes
+
+
+@pytest.mark.benchmark(group="end-to-end")
+class TestEndToEndBenchmarks:
+    """Benchmark full CSV-to-Excel processing and plot generation."""
+
+    def test_process_csv(self, benchmark, synthetic_csv, tmp_path):
+        output = tmp_path / "synthetic.xlsx"
+
+        benchmark.pedantic(process_csv, args=(synthetic_csv, output), rounds=3, iterations=1)
+
+        assert output.exists()
+
+    def test_process_directory(self, benchmark, synthetic_directory, tmp_path):
+        output_dir = tmp_path / "out"
+        output_dir.mkdir()
+
+        processed = benchmark.pedantic(
+            process_directory, args=(synthetic_directory, output_dir), rounds=1, iterations=1
+        )
+
+        assert processed == 4
+
+    def test_plot_html(self, benchmark, replicate_frame, metric_columns):
+        df, _, _ = replicate_frame
+
+        def render():
+            fig = plot(df, y=metric_columns[1], plot_type='bar')
+            return fig.to_html(full_html=False, include_plotlyjs=False)
+
+        html = benchmark(render)
+
+        assert '<div' in html
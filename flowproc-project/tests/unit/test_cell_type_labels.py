@@ -0,0 +1,55 @@
+"""
+Unit tests for memoized cell type label resolution.
+"""
+
+import numpy as np
+import pandas as pd
+
+from flowproc.domain.visualization.column_utils import resolve_cell_type_labels
+from flowproc.domain.visualization.data_aggregation import aggregate_multiple_metrics_by_group
+from flowproc.domain.visualization.plot_creators import create_cell_type_comparison_plot
+
+COLUMNS = [
+    'Live/CD4+/GFP+ | Freq. of Parent',
+    'Live/CD8+/GFP+ | Freq. of Parent',
+    'Live/T Cells | Freq. of Parent',
+]
+
+
+class TestResolveCellTypeLabels:
+    """Test the label maps and their reuse."""
+
+    def test_labels(self):
+        labels = resolve_cell_type_labels(COLUMNS)
+
+        assert labels.base[COLUMNS[0]] == 'CD4+ GFP+'
+        assert labels.enhanced[COLUMNS[2]] == 'T Cells'
+        assert labels.column_for('CD8+ GFP+') == COLUMNS[1]
+        assert labels.column_for(f"Mean of {COLUMNS[2]}") == COLUMNS[2]
+        assert labels.column_for('B Cells') is None
+
+    def test_memoized_per_column_set(self):
+        assert resolve_cell_type_labels(list(COLUMNS)) is resolve_cell_type_labels(COLUMNS)
+        assert resolve_cell_type_labels(COLUMNS[:2]) is not resolve_cell_type_labels(COLUMNS)
+
+
+class TestLabelConsumers:
+    """Test that aggregation and overlays agree on labels."""
+
+    def setup_method(self):
+        rng = np.random.default_rng(2)
+        self.df = pd.DataFrame({col: rng.random(12) * 100 for col in COLUMNS})
+        self.df['Group'] = np.repeat([1, 2, 3], 4)
+
+    def test_aggregated_cell_types(self):
+        combined = aggregate_multiple_metrics_by_group(self.df, COLUMNS)
+
+        assert set(combined['Cell Type']) == set(resolve_cell_type_labels(COLUMNS).enhanced.values())
+
+    def test_overlay_points_take_trace_colors(self):
+        for plot_type in ('bar', 'line'):
+            fig = create_cell_type_comparison_plot(self.df, COLUMNS, plot_type=plot_type, show_individual_points=True)
+
+            trace_colors = {trace.name: trace.marker.color or trace.line.color for trace in fig.data[:-1]}
+            overlay_colors = list(dict.fromkeys(fig.data[-1].marker.color))
+            assert overlay_colors == list(trace_colors.values())
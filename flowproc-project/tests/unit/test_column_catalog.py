@@ -0,0 +1,93 @@
+"""
+Unit tests for the shared column-header catalog.
+"""
+
+import numpy as np
+import pandas as pd
+
+from flowproc.domain.aggregation import AggregationService
+from flowproc.domain.parsing.column_catalog import (
+    ColumnCatalog, all_nan_columns, get_column_catalog, parse_header
+)
+from flowproc.domain.visualization.column_utils import (
+    detect_available_metric_types, detect_flow_columns, get_matching_columns_for_metric
+)
+
+FREQ = 'Lymphocytes/CD4+/CD4+GFP+ | Freq. of Parent (%)'
+MEDIAN = 'Lymphocytes/CD4+ | Median (FITC-A)'
+GEO = 'Lymphocytes/CD8+ | Geometric Mean (PE-A)'
+MEAN = 'Lymphocytes/CD8+ | Mean (PE-A)'
+
+
+class TestParseHeader:
+    """Test what is derived from a single header."""
+
+    def test_gating_path_and_metric(self):
+        info = parse_header(FREQ)
+
+        assert info.path == ('Lymphocytes', 'CD4+', 'CD4+GFP+')
+        assert info.population == 'CD4+GFP+'
+        assert info.metric == 'Freq. of Parent (%)'
+        assert info.metric_types == {'Freq. of Parent'}
+        assert info.flow_categories == ('frequencies',)
+
+    def test_geometric_mean_is_not_mean(self):
+        assert parse_header(GEO).metric_types == {'Geometric Mean'}
+        assert parse_header(GEO).flow_categories == ('geometric_means',)
+        assert parse_header(MEAN).metric_types == {'Mean'}
+
+
+class TestColumnCatalog:
+    """Test catalog queries and sharing."""
+
+    def setup_method(self):
+        self.df = pd.DataFrame({
+            'SampleID': ['SP_1.1', 'SP_1.2'],
+            'Group': [1, 1],
+            FREQ: [10.0, 12.0],
+            MEDIAN: [np.nan, np.nan],
+            GEO: [5.0, 6.0],
+            MEAN: [4.0, 7.0],
+        })
+
+    def test_metric_queries(self):
+        catalog = ColumnCatalog(self.df.columns)
+
+        assert catalog.metric_types == ['Freq. of Parent', 'Median', 'Mean', 'Geometric Mean']
+        assert catalog.columns_for_metric('Mean') == [MEAN]
+        assert catalog.columns_for_metric('cd8+') == [GEO, MEAN]
+        assert catalog.columns_containing('mean') == [GEO, MEAN]
+        assert catalog.columns_by_first_keyword(('median', 'mean')) == {'median': [MEDIAN], 'mean': [GEO, MEAN]}
+
+    def test_column_utils_use_catalog(self):
+        assert detect_available_metric_types(self.df) == ['Freq. of Parent', 'Median', 'Mean', 'Geometric Mean']
+        assert get_matching_columns_for_metric(self.df, 'Freq. of Parent') == [FREQ]
+        flow_cols = detect_flow_columns(self.df)
+        assert flow_cols['means'] == [MEAN] and flow_cols['geometric_means'] == [GEO]
+        assert flow_cols['all_metrics'] == [FREQ, MEDIAN, MEAN, GEO]
+
+    def test_shared_across_filtered_frames(self):
+        catalog = get_column_catalog(self.df)
+
+        assert get_column_catalog(self.df.iloc[:1]) is catalog
+        assert get_column_catalog(list(self.df.columns)) is catalog
+        assert get_column_catalog(self.df.assign(Extra=1)) is not catalog
+
+    def test_returned_lists_do_not_leak_into_cache(self):
+        get_matching_columns_for_metric(self.df, 'Mean').append('bogus')
+
+        assert get_matching_columns_for_metric(self.df, 'Mean') == [MEAN]
+
+    def test_all_nan_columns(self):
+        assert all_nan_columns(self.df) == {MEDIAN}
+        assert all_nan_columns(self.df.fillna(1.0)) == frozenset()
+
+    def test_aggregation_skips_empty_columns(self):
+        df = pd.concat([self.df, self.df], ignore_index=True)
+        df['SampleID'] = ['SP_1.1', 'SP_1.2', 'SP_2.1', 'SP_2.2']
+        df['Group'] = [1, 1, 2, 2]
+        df['Animal'] = [1, 2, 1, 2]
+
+        result = AggregationService(df).aggregate_all_metrics(metrics=['Median', 'Mean'])
+
+        assert result.metrics == ['Mean']
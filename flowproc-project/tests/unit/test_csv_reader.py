@@ -0,0 +1,39 @@
+"""
+Unit tests for CSVReader cleaning and shared text-marker detection.
+"""
+
+import pandas as pd
+import pytest
+
+from flowproc.domain.parsing.csv_reader import CSVReader
+from flowproc.domain.parsing.validation_utils import has_text_markers
+
+
+@pytest.mark.parametrize("values, expected", [
+    (["1.5", "2.0"], False),
+    (["*4.51", "2.0"], True),
+    (["OOR <", "3"], True),
+    (["≥ 10", "3"], True),
+    (["ND", None], True),
+    (["BLQ"], True),
+    ([None, None], False),
+    ([1.5, 2.5], False),
+])
+def test_has_text_markers(values, expected):
+    assert has_text_markers(pd.Series(values)) is expected
+
+
+def test_clean_dataframe_converts_and_preserves(tmp_path):
+    csv = tmp_path / "plate.csv"
+    csv.write_text(
+        "SampleID,Count,Conc,Marker\n"
+        "SP_1.1, 10 ,4.5,*4.51\n"
+        "SP_1.2,20,\"5.5,\",OOR <\n"
+    )
+
+    df = CSVReader().read(csv)
+
+    assert df['SampleID'].tolist() == ['SP_1.1', 'SP_1.2']
+    assert df['Count'].tolist() == [10, 20]
+    assert df['Conc'].tolist() == [4.5, 5.5]
+    assert df['Marker'].tolist() == ['*4.51', 'OOR <']
@@ -0,0 +1,101 @@
+"""
+Unit tests for shape-preserving downsampling of plot points.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from flowproc.domain.visualization.downsampling import (
+    downsample_frame, lttb_indices, minmax_indices, point_budget
+)
+from flowproc.domain.visualization.time_plots import create_timecourse_visualization
+
+
+class TestReducers:
+    """Test LTTB and min-max index selection."""
+
+    def setup_method(self):
+        rng = np.random.default_rng(0)
+        self.x = np.linspace(0, 10, 5000)
+        self.y = np.sin(self.x) + rng.normal(0, 0.05, len(self.x))
+        self.y[2500] = 10.0  # a spike random sampling would almost always miss
+
+    def test_lttb_keeps_ends_and_spike(self):
+        kept = lttb_indices(self.x, self.y, 100)
+
+        assert len(kept) == 100
+        assert kept[0] == 0 and kept[-1] == len(self.x) - 1
+        assert 2500 in kept
+        assert np.all(np.diff(kept) > 0)
+
+    def test_minmax_keeps_extremes(self):
+        kept = minmax_indices(self.y, 100)
+
+        assert len(kept) <= 100
+        assert self.y.argmax() in kept
+        assert self.y.argmin() in kept
+
+    def test_small_input_unchanged(self):
+        assert list(lttb_indices(self.x[:5], self.y[:5], 10)) == [0, 1, 2, 3, 4]
+        assert list(minmax_indices(self.y[:5], 10)) == [0, 1, 2, 3, 4]
+
+
+class TestDownsampleFrame:
+    """Test per-series budgets on frames."""
+
+    def setup_method(self):
+        rng = np.random.default_rng(1)
+        n = 3000
+        self.df = pd.DataFrame({
+            'Time': np.tile(np.arange(n, dtype=float), 2),
+            'Value': rng.normal(size=2 * n),
+            'Group': np.repeat([1, 2], n),
+        })
+
+    def test_budget_per_group(self):
+        result = downsample_frame(self.df, 'Value', x='Time', by='Group', max_points=200, method='lttb')
+
+        assert result.groupby('Group').size().tolist() == [200, 200]
+        for _, group in result.groupby('Group'):
+            assert group['Time'].is_monotonic_increasing
+        assert result.index.isin(self.df.index).all()
+
+    def test_missing_values_dropped(self):
+        df = self.df.head(10).copy()
+        df.loc[3, 'Value'] = np.nan
+
+        assert 3 not in downsample_frame(df, 'Value', max_points=100).index
+
+    def test_lttb_requires_x(self):
+        with pytest.raises(ValueError):
+            downsample_frame(self.df, 'Value', method='lttb')
+
+    def test_point_budget_follows_width(self):
+        assert point_budget(1200) > point_budget(800)
+        assert point_budget(10) == 100
+
+
+class TestTimecourseDownsampling:
+    """Test that statistics use all data and raw lines are reduced."""
+
+    def setup_method(self):
+        rng = np.random.default_rng(2)
+        times = np.repeat(np.arange(4) * 24.0, 50)
+        self.df = pd.DataFrame({
+            'Time': np.tile(times, 2),
+            'Group': np.repeat([1, 2], len(times)),
+            'Lymphocytes/CD4+ | Freq. of Parent': rng.normal(50, 5, 2 * len(times)),
+        })
+
+    def test_mean_uses_full_data(self):
+        fig = create_timecourse_visualization(self.df, group_by='Group', sample_size=10)
+
+        col = 'Lymphocytes/CD4+ | Freq. of Parent'
+        expected = self.df[self.df['Group'] == 1].groupby('Time')[col].mean().tolist()
+        assert list(fig.data[0].y) == pytest.approx(expected)
+
+    def test_raw_lines_downsampled(self):
+        fig = create_timecourse_visualization(self.df, group_by='Group', aggregation='raw', sample_size=20)
+
+        assert [len(trace.y) for trace in fig.data] == [20, 20]
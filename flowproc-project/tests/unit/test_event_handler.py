@@ -2,11 +2,16 @@
 Unit tests for the EventHandler class.
 """
 
+import time
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 
+from PySide6.QtCore import QCoreApplication
+
+from flowproc.domain.validation import InputValidator, InputValidationResult
 from flowproc.presentation.gui.views.components.event_handler import EventHandler
+from flowproc.presentation.gui.workers.validation_worker import ValidationWorker
 
 
 class TestEventHandler:
@@ -364,4 +369,97 @@ class TestEventHandler:
         assert result is False
         
         # Should show warning dialog
-        mock_warning.assert_called_once() 
\ No newline at end of file
+        mock_warning.assert_called_once()
+
+
+class TestSelectionValidation:
+    """Test that the selected paths are validated on a validation worker."""
+
+    @pytest.fixture
+    def event_handler(self, qt_app, mock_main_window, mock_state_manager, mock_file_manager,
+                      mock_processing_coordinator, mock_ui_builder):
+        """Create an EventHandler wired to a mock path entry."""
+        handler = EventHandler(mock_main_window, mock_state_manager, mock_file_manager, mock_processing_coordinator)
+        handler.main_window.ui_builder = mock_ui_builder[0]
+        yield handler
+        handler.cleanup()
+
+    @staticmethod
+    def select(event_handler, widgets, paths):
+        """Enter paths in the path field."""
+        widgets['path_entry'].text.return_value = "; ".join(str(path) for path in paths)
+        event_handler.update_preview_paths()
+
+    @staticmethod
+    def deliver_results(event_handler):
+        """Wait for the validation workers and deliver their signals."""
+        for worker in event_handler.findChildren(ValidationWorker):
+            worker.wait()
+        QCoreApplication.sendPostedEvents(event_handler)
+
+    def test_valid_csv_files_become_preview_paths_in_selection_order(self, event_handler, mock_ui_builder, tmp_path):
+        """Test that only valid selected CSV files are previewed, in selection order."""
+        _, widgets = mock_ui_builder
+        second = tmp_path / "b.csv"
+        first = tmp_path / "a.csv"
+        for path in (first, second):
+            path.write_text("SampleID,Count\nSP_A1_1.fcs,10\n")
+        (tmp_path / "empty.csv").touch()
+        folder = tmp_path / "folder"
+        folder.mkdir()
+        (folder / "c.csv").write_text("SampleID,Count\nSP_A1_1.fcs,10\n")
+
+        self.select(event_handler, widgets,
+                    [second, tmp_path / "missing.csv", tmp_path / "empty.csv", first, folder])
+        self.deliver_results(event_handler)
+
+        assert event_handler.state_manager.preview_paths == [str(second), str(first)]
+        assert event_handler.state_manager.last_csv == second
+        assert event_handler.validation_worker is None
+        event_handler.state_manager.update_status.assert_called()
+
+    def test_new_selection_replaces_pending_results(self, event_handler, mock_ui_builder, tmp_path):
+        """Test that results for a previous selection are not previewed."""
+        _, widgets = mock_ui_builder
+        old, new = tmp_path / "old.csv", tmp_path / "new.csv"
+        for path in (old, new):
+            path.write_text("SampleID,Count\nSP_A1_1.fcs,10\n")
+
+        self.select(event_handler, widgets, [old])
+        self.select(event_handler, widgets, [new])
+        self.deliver_results(event_handler)
+
+        assert event_handler.state_manager.preview_paths == [str(new)]
+        assert event_handler.state_manager.last_csv == new
+
+    def test_reselection_does_not_wait_for_slow_validation(self, event_handler, mock_ui_builder, tmp_path):
+        """Test that a new selection returns while the previous one is still being checked."""
+        _, widgets = mock_ui_builder
+        paths = [tmp_path / f"{i}.csv" for i in range(8)]
+        for path in paths:
+            path.write_text("SampleID,Count\nSP_A1_1.fcs,10\n")
+
+        def slow_validate_file(validator, file_path):
+            time.sleep(0.5)
+            return InputValidationResult(is_valid=True)
+
+        with patch.object(InputValidator, '_validate_file', slow_validate_file):
+            self.select(event_handler, widgets, paths)
+            started = time.monotonic()
+            self.select(event_handler, widgets, paths[:1])
+            assert time.monotonic() - started < 0.25
+            self.deliver_results(event_handler)
+
+        assert event_handler.state_manager.preview_paths == [str(paths[0])]
+
+    @patch('flowproc.presentation.gui.views.components.event_handler.QMessageBox.warning')
+    def test_preview_waits_for_validation_results(self, mock_warning, event_handler, mock_ui_builder, tmp_path):
+        """Test that a preview requested during validation runs once the results are in."""
+        _, widgets = mock_ui_builder
+
+        self.select(event_handler, widgets, [tmp_path / "missing.csv"])
+        event_handler.preview_csv()
+        mock_warning.assert_not_called()
+
+        self.deliver_results(event_handler)
+        mock_warning.assert_called_once()
@@ -0,0 +1,92 @@
+"""
+Unit tests for the memoized figure cache.
+"""
+
+from dataclasses import replace
+
+import pandas as pd
+
+from flowproc.domain.visualization import flow_cytometry_visualizer
+from flowproc.domain.visualization.figure_cache import FigureCache, figure_cache
+from flowproc.presentation.gui.views.dialogs.visualization_dialog import render_visualization
+from flowproc.presentation.gui.views.dialogs.visualization_options import VisualizationOptions
+from flowproc.testing import generate_synthetic_data
+
+
+class TestFigureCacheKeys:
+    """Test that keys change exactly when the figure inputs do."""
+
+    def setup_method(self):
+        self.df = pd.DataFrame({'Group': [1, 1, 2], 'Value': [1.0, 2.0, 3.0]})
+        self.options = VisualizationOptions(plot_type='bar', y_axis='Value')
+
+    def test_same_inputs_same_key(self):
+        key = FigureCache.make_key(self.df, self.options, ['A', 'B'])
+
+        assert FigureCache.make_key(self.df.copy(), replace(self.options), ['A', 'B']) == key
+
+    def test_data_options_and_labels_change_key(self):
+        key = FigureCache.make_key(self.df, self.options, ['A', 'B'])
+        changed = self.df.copy()
+        changed.loc[2, 'Value'] = 4.0
+
+        assert FigureCache.make_key(changed, self.options, ['A', 'B']) != key
+        assert FigureCache.make_key(self.df.rename(columns={'Value': 'Other'}), self.options, ['A', 'B']) != key
+        assert FigureCache.make_key(self.df, replace(self.options, plot_type='box'), ['A', 'B']) != key
+        assert FigureCache.make_key(self.df, self.options, ['A', 'C']) != key
+
+
+class TestFigureCacheEviction:
+    """Test the byte budget."""
+
+    def test_least_recently_used_evicted(self):
+        cache = FigureCache(max_bytes=100)
+        cache.put('a', 'A', 40)
+        cache.put('b', 'B', 40)
+        cache.get('a')
+
+        cache.put('c', 'C', 40)
+
+        assert cache.get('a') == 'A' and cache.get('c') == 'C'
+        assert cache.get('b') is None
+        assert cache.get_stats()['bytes'] == 80
+
+    def test_oversized_value_not_cached(self):
+        cache = FigureCache(max_bytes=100)
+        cache.put('a', 'A', 40)
+
+        cache.put('big', 'B', 101)
+
+        assert cache.get('big') is None and cache.get('a') == 'A'
+
+
+class TestRenderVisualizationCache:
+    """Test that revisiting a view in the dialog skips rebuilding the figure."""
+
+    def setup_method(self):
+        figure_cache.clear()
+        self.df = generate_synthetic_data(n_groups=2, n_animals=3, n_timepoints=1, n_tissues=1, n_metrics=2, seed=3)
+        self.y = next(c for c in self.df.columns if ' | ' in c)
+
+    def teardown_method(self):
+        figure_cache.clear()
+
+    def test_revisit_uses_cache(self, monkeypatch):
+        calls = []
+        original_plot = flow_cytometry_visualizer.plot
+
+        def counting_plot(*args, **kwargs):
+            calls.append(kwargs['plot_type'])
+            return original_plot(*args, **kwargs)
+
+        monkeypatch.setattr(flow_cytometry_visualizer, 'plot', counting_plot)
+        bar = VisualizationOptions(plot_type='bar', y_axis=self.y)
+        box = replace(bar, plot_type='box')
+
+        first = render_visualization(None, self.df, bar, None, lambda: None)
+        render_visualization(None, self.df, box, None, lambda: None)
+        again = render_visualization(None, self.df, bar, None, lambda: None)
+
+        assert calls == ['bar', 'box']
+        assert again.figure_json == first.figure_json and again.fig is first.fig
+        assert again.status_text == first.status_text
@@ -0,0 +1,171 @@
+"""
+Unit tests for the file summary preview engine and its table model.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pandas as pd
+import shiboken6
+from PySide6.QtCore import Qt
+
+from flowproc.domain.parsing import load_and_parse_df
+from flowproc.domain.parsing.preview import FileSummary, clear_summary_cache, summarize_csv
+from flowproc.presentation.gui.views.widgets.preview_summary_model import (
+    PENDING_TEXT, PREVIEW_COLUMNS, PreviewSummaryModel, create_preview_view
+)
+from flowproc.testing.synthetic_data import SyntheticDatasetConfig, write_synthetic_dataset
+
+
+class TestSummarizeCsv:
+    """Test that summaries match the full parsing pipeline."""
+
+    def setup_method(self):
+        clear_summary_cache()
+
+    def test_matches_full_parse(self, tmp_path):
+        config = SyntheticDatasetConfig(n_files=2, n_groups=3, n_animals=4, n_timepoints=2,
+                                        n_tissues=2, marker_rate=0.1, sample_header='Sample')
+        for path in write_synthetic_dataset(tmp_path, config):
+            df, _ = load_and_parse_df(path)
+
+            assert summarize_csv(path, sample_rows=5) == FileSummary.from_dataframe(path, df)
+
+    def test_unnamed_id_column_and_footer(self, tmp_path):
+        path, = write_synthetic_dataset(tmp_path, SyntheticDatasetConfig(n_groups=2, n_animals=3))
+
+        summary = summarize_csv(path)
+
+        assert summary.samples == 6
+        assert summary.groups == (1, 2) and summary.animals == (1, 2, 3)
+        assert summary.error is None
+
+    def test_cached_until_file_changes(self, tmp_path):
+        path, = write_synthetic_dataset(tmp_path, SyntheticDatasetConfig(n_groups=2, n_animals=2))
+        summary = summarize_csv(path)
+
+        assert summarize_csv(str(path)) is summary
+
+        pd.DataFrame({'Sample': ['SP_1.1.fcs', 'SP_1.1.fcs'], 'A | Count': [1, 2]}).to_csv(path, index=False)
+        assert summarize_csv(path).error == "Failed to parse (Duplicate sample IDs found)"
+
+    def test_invalid_file(self, tmp_path):
+        assert summarize_csv(tmp_path / 'missing.csv').error == "Invalid file"
+        (tmp_path / 'notes.txt').write_text('SP_1.1')
+        assert summarize_csv(tmp_path / 'notes.txt').error == "Invalid file"
+
+
+class TestPreviewSummaryModel:
+    """Test on-demand, concurrent summarization and cell texts."""
+
+    def setup_method(self):
+        self.calls = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def _summarize(self, path):
+        self.release.wait(5)
+        self.calls.append(path.name)
+        if path.name == 'bad.csv':
+            return FileSummary(path=path, error="Invalid file")
+        if path.name == 'crash.csv':
+            raise RuntimeError("boom")
+        return FileSummary(path=path, samples=4, groups=(1, 2, 3), animals=(2,), timepoints=(), tissues=('BM', 'SP'))
+
+    @staticmethod
+    def _wait(model, qt_app):
+        deadline = time.monotonic() + 5
+        while model.pending_rows() and time.monotonic() < deadline:
+            qt_app.processEvents()
+            time.sleep(0.01)
+
+    def test_rows_summarized_on_demand(self, qt_app):
+        model = PreviewSummaryModel([f'f{i}.csv' for i in range(200)], summarize=self._summarize)
+
+        assert model.rowCount() == 200 and model.columnCount() == len(PREVIEW_COLUMNS)
+        assert self.calls == []
+
+        assert model.data(model.index(150, 2)) == PENDING_TEXT
+        assert model.data(model.index(150, 0)) == 'f150.csv'
+        model.data(model.index(150, 5))
+        self._wait(model, qt_app)
+
+        assert self.calls == ['f150.csv']
+        assert model.data(model.index(150, 2)) == '3: 1 - 3'
+
+    def test_rows_stream_in_as_completed(self, qt_app):
+        model = PreviewSummaryModel([f'f{i}.csv' for i in range(20)], summarize=self._summarize)
+        changed = []
+        model.dataChanged.connect(lambda top_left, bottom_right: changed.append(top_left.row()))
+
+        for row in range(20):
+            model.row_texts(row)
+        self._wait(model, qt_app)
+
+        assert sorted(changed) == list(range(20))
+        assert model.summarized_rows() == 20
+
+    def test_cancel_drops_queued_rows(self, qt_app):
+        executor = ThreadPoolExecutor(max_workers=1)
+        model = PreviewSummaryModel([f'f{i}.csv' for i in range(10)], summarize=self._summarize, executor=executor)
+        self.release.clear()
+
+        for row in range(10):
+            model.row_texts(row)
+        model.cancel()
+        self.release.set()
+        self._wait(model, qt_app)
+        executor.shutdown()
+
+        assert len(self.calls) < 10
+        assert model.summarized_rows() == len(self.calls)
+
+    def test_cell_texts(self, qt_app):
+        model = PreviewSummaryModel(['a.csv', 'bad.csv', 'crash.csv'], summarize=self._summarize)
+        display = Qt.ItemDataRole.DisplayRole
+        for row in range(3):
+            model.row_texts(row)
+        self._wait(model, qt_app)
+
+        assert [model.data(model.index(0, col), display) for col in range(6)] == [
+            'a.csv', '4', '3: 1 - 3', '2', 'N/A', '2: BM, SP'
+        ]
+        assert model.data(model.index(1, 0), display) == 'bad.csv - Error: Invalid file'
+        assert model.data(model.index(1, 3), display) == 'Error'
+        assert model.data(model.index(2, 0), display) == 'crash.csv - Error: Failed to parse (boom)'
+        assert model.headerData(3, Qt.Orientation.Horizontal, display) == 'Animal Range'
+
+    def test_closing_view_drops_queued_rows(self, qt_app):
+        executor = ThreadPoolExecutor(max_workers=1)
+        self.release.clear()
+        blocker = executor.submit(self.release.wait, 5)
+        with patch('flowproc.presentation.gui.views.widgets.preview_summary_model._shared_executor',
+                   return_value=executor):
+            view = create_preview_view([f'f{i}.csv' for i in range(5)])
+            model = view.model()
+            for row in range(5):
+                model.row_texts(row)
+        futures = list(model._pending.values())
+
+        shiboken6.delete(view)
+        self.release.set()
+        blocker.result()
+        executor.shutdown()
+
+        assert all(future.cancelled() for future in futures)
+
+    def test_row_finished_after_model_deleted(self, qt_app):
+        executor = ThreadPoolExecutor(max_workers=1)
+        model = PreviewSummaryModel(['a.csv'], summarize=self._summarize, executor=executor)
+        self.release.clear()
+        model.row_texts(0)
+        future = model._pending[0]
+
+        shiboken6.delete(model)
+        self.release.set()
+        executor.shutdown()
+
+        assert future.exception() is None
+        assert self.calls == ['a.csv']
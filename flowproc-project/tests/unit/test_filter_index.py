@@ -0,0 +1,84 @@
+"""
+Unit tests for the precomputed tissue/timepoint filter index.
+"""
+
+import numpy as np
+import pandas as pd
+
+from flowproc.domain.processing.filter_index import FilterIndex
+from flowproc.presentation.gui.views.components.processing_coordinator import ProcessingCoordinator
+from flowproc.presentation.gui.views.dialogs.visualization_filters import build_time_entries
+from flowproc.presentation.gui.views.dialogs.visualization_options import VisualizationOptions
+
+
+class TestFilterIndex:
+    """Test row positions and value listings."""
+
+    def setup_method(self):
+        self.df = pd.DataFrame({
+            'Tissue': ['SP', 'BM', None, 'SP', 'UNK', 'BM'],
+            'Time': [0.0, 24.0, 24.0, np.nan, 0.0, 48.0],
+            'Value': range(6),
+        }, index=list('abcdef'))
+        self.index = FilterIndex(self.df)
+
+    def test_values_match_unique(self):
+        assert self.index.values('Tissue') == list(self.df['Tissue'].dropna().unique())
+        assert self.index.values('Time') == list(self.df['Time'].dropna().unique())
+        assert self.index.values('Organ') == [] and not self.index.has_data('Organ')
+        assert self.index.has_real_tissue_data()
+
+    def test_rows_match_isin(self):
+        for values in (['SP'], ['SP', 'BM'], ['XX'], []):
+            expected = np.flatnonzero(self.df['Tissue'].isin(values))
+            np.testing.assert_array_equal(self.index.rows('Tissue', values), expected)
+        np.testing.assert_array_equal(self.index.rows_excluding('Tissue', 'UNK'),
+                                      np.flatnonzero(self.df['Tissue'] != 'UNK'))
+
+    def test_counts(self):
+        assert self.index.count('Tissue', 'SP') == 2
+        assert self.index.count('Time', 24) == 2
+        assert self.index.count('Tissue', 'XX') == 0
+
+    def test_time_entries_use_counts(self):
+        entries, has_time_data = build_time_entries(self.df, self.index)
+
+        assert has_time_data
+        assert [entry['value'] for entry in entries] == [0.0, 24.0, 48.0]
+        assert entries[1]['display'].endswith('[2 samples]')
+
+
+class TestApplyFilters:
+    """Test that filtering through the index matches masking the data."""
+
+    def setup_method(self):
+        rng = np.random.default_rng(0)
+        self.df = pd.DataFrame({
+            'Tissue': rng.choice(['SP', 'BM', 'LN'], 200),
+            'Time': rng.choice([0.0, 24.0, 72.0], 200),
+            'Value': rng.normal(size=200),
+        })
+        self.index = FilterIndex(self.df)
+
+    def test_tissue_and_time_selection(self):
+        options = VisualizationOptions(selected_tissues=['SP', 'LN'], selected_times=[24.0])
+        expected = self.df[self.df['Tissue'].isin(['SP', 'LN']) & self.df['Time'].isin([24.0])]
+
+        filtered = ProcessingCoordinator.apply_filters(self.df, options, self.index)
+
+        pd.testing.assert_frame_equal(filtered, expected)
+
+    def test_show_all_does_not_share_columns(self):
+        filtered = ProcessingCoordinator.apply_filters(self.df, VisualizationOptions(), self.index)
+        filtered['Extra'] = 1
+
+        assert len(filtered) == len(self.df)
+        assert 'Extra' not in self.df.columns
+
+    def test_stale_index_rebuilt(self):
+        smaller = self.df.iloc[:50]
+        options = VisualizationOptions(selected_tissues=['BM'], selected_times=[0.0, 72.0])
+
+        filtered = ProcessingCoordinator.apply_filters(smaller, options, self.index)
+
+        assert len(filtered) == ((smaller['Tissue'] == 'BM') & smaller['Time'].isin([0.0, 72.0])).sum()
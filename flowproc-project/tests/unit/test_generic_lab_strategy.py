@@ -0,0 +1,55 @@
+"""
+Unit tests for the generic lab data parsing strategy.
+"""
+
+import logging
+
+import pandas as pd
+
+from flowproc.domain.parsing import GenericLabParsingStrategy
+
+
+class TestGenericLabParsingStrategy:
+    """Test SampleID construction and timepoint parsing."""
+
+    def setup_method(self):
+        self.strategy = GenericLabParsingStrategy()
+
+    def test_sample_ids_and_times(self):
+        df = pd.DataFrame({
+            'group': [1, 1, 2, 2],
+            'Rep': [1, 2, 1, 2],
+            'Time': ['0hr', '30min', 'Day 1', None],
+            'ALT': [10.0, 12.0, 11.0, 9.0],
+        })
+
+        result = self.strategy.parse(df)
+
+        assert result['SampleID'].tolist() == ['G1_R1_T0hr', 'G1_R2_T30min', 'G2_R1_TDay 1', 'G2_R2_TNone']
+        assert result['Time'].iloc[:3].tolist() == [0.0, 0.5, 24.0]
+        assert pd.isna(result['Time'].iloc[3])
+        assert result['Animal'].tolist() == [1, 2, 1, 2]
+        # The input frame is left untouched
+        assert df.columns.tolist() == ['group', 'Rep', 'Time', 'ALT']
+
+    def test_sample_ids_without_timepoint(self):
+        df = pd.DataFrame({'Group': ['A', 'B'], 'Replicate': [3, 4]})
+
+        result = self.strategy.parse(df)
+
+        assert result['SampleID'].tolist() == ['GA_R3', 'GB_R4']
+        assert 'Time' not in result.columns
+
+    def test_unparsed_timepoints_reported_once(self, caplog):
+        df = pd.DataFrame({
+            'Group': [1] * 6,
+            'Replicate': range(6),
+            'Timepoint': ['6h', 'pre-dose', 'pre-dose', 'pre-dose', '6h', 'baseline'],
+        })
+
+        with caplog.at_level(logging.WARNING, logger='flowproc.domain.parsing.generic_lab_strategy'):
+            result = self.strategy.parse(df)
+
+        warnings = [r.getMessage() for r in caplog.records if r.name.endswith('generic_lab_strategy')]
+        assert warnings == ["Could not parse 2 timepoint value(s) in 4 rows: 'pre-dose', 'baseline'"]
+        assert result['Time'].notna().tolist() == [True, False, False, False, True, False]
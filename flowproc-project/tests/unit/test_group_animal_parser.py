@@ -0,0 +1,78 @@
+"""
+Unit tests for batch group/animal parsing.
+"""
+
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from flowproc.domain.parsing.csv_reader import CSVReader
+from flowproc.domain.parsing.group_animal_parser import GroupAnimalParser
+
+
+class TestParseSeries:
+    """Test that parse_series agrees with per-value parse()."""
+
+    def setup_method(self):
+        self.parser = GroupAnimalParser()
+
+    def test_matches_parse(self):
+        texts = pd.Series([
+            'SP_A1_1.2.fcs', 'G3A4', 'Group 5 x Animal 6', '7_8',
+            # Primary pattern wins even when an alternative matches earlier
+            'G1A2_3.4',
+            # Out-of-range first match falls back to the next pattern
+            'SP_0.5_2_3',
+            'nothing', '', 'SP_A1_1.2.fcs',
+        ], index=range(10, 19))
+
+        result = self.parser.parse_series(texts)
+
+        assert result.index.equals(texts.index)
+        for text, group, animal in zip(texts, result['Group'], result['Animal']):
+            expected = self.parser.parse(text)
+            if expected is None:
+                assert pd.isna(group) and pd.isna(animal)
+            else:
+                assert (group, animal) == expected
+
+    def test_non_strings_and_dtypes(self):
+        result = self.parser.parse_series(pd.Series(['1.2', None, np.nan, 3.0]))
+
+        assert result['Group'].dtype == 'Int64'
+        assert result['Group'].tolist()[0] == 1
+        assert result['Group'].isna().tolist() == [False, True, True, True]
+
+    def test_range_validation(self):
+        parser = GroupAnimalParser(max_group=10)
+
+        result = parser.parse_series(pd.Series(['SP_11.2', 'SP_10.2']))
+
+        assert result['Group'].isna().tolist() == [True, False]
+
+    def test_overflowing_numbers(self):
+        texts = pd.Series([f"SP_{'9' * 25}.2", f"SP_1.{'9' * 400}", 'SP_1.2'])
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', RuntimeWarning)
+            result = self.parser.parse_series(texts)
+
+        for text, group, animal in zip(texts, result['Group'], result['Animal']):
+            expected = self.parser.parse(text)
+            if expected is None:
+                assert pd.isna(group) and pd.isna(animal)
+            else:
+                assert (group, animal) == expected
+        assert result['Group'].tolist()[2] == 1
+
+
+class TestCSVReaderGroupColumn:
+    """Test the Group column derived from Sample names."""
+
+    def test_group_column(self):
+        df = pd.DataFrame({'Sample': ['SP_1.2', ' G3A4 ', 'junk', 'SP_-1.2', None], 'X': ['1'] * 5})
+
+        result = CSVReader()._clean_dataframe(df)
+
+        assert result['Group'].tolist() == ['Group 1', 'Group 3', 'Unknown', 'Unknown', 'Unknown']
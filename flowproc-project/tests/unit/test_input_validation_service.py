@@ -7,6 +7,8 @@ all validation logic from the GUI layer and provides consistent validation behav
 
 import pytest
 import tempfile
+import threading
+import time
 import os
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -321,4 +323,85 @@ class TestInputValidationService:
         
         assert result.is_valid
         assert len(result.warnings) > 0
-        assert "Many input files detected" in result.warnings[0] 
\ No newline at end of file
+        assert "Many input files detected" in result.warnings[0] 
+
+
+class TestConcurrentPathValidation:
+    """Test per-file streaming and cancellation of path validation."""
+
+    def setup_method(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.csv_dir = self.temp_dir / "acquisition"
+        self.csv_dir.mkdir()
+        for i in range(30):
+            (self.csv_dir / f"sample_{i:02d}.csv").write_text("Well,Group,Animal\nA1,1,1")
+        (self.csv_dir / "empty.csv").write_text("")
+        (self.csv_dir / "notes.txt").write_text("not data")
+        self.extra = self.temp_dir / "extra.csv"
+        self.extra.write_text("Well,Group,Animal\nA1,1,1")
+
+    def teardown_method(self):
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_results_in_selection_order(self):
+        paths = [str(self.extra), str(self.csv_dir)]
+        parallel = InputValidator(InputValidationConfig(max_workers=8)).validate_input_paths(paths)
+        serial = InputValidator(InputValidationConfig(max_workers=1)).validate_input_paths(paths)
+
+        assert parallel.valid_paths == serial.valid_paths
+        assert parallel.valid_paths[0] == str(self.extra)
+        assert parallel.file_count == 31
+        assert parallel.errors == serial.errors
+
+    def test_each_file_reported_once(self):
+        reported = []
+        validator = InputValidator(InputValidationConfig(max_workers=4))
+
+        validator.validate_input_paths(
+            [str(self.csv_dir), str(self.csv_dir / "sample_00.csv")],
+            on_file=lambda path, result: reported.append((path, result.is_valid)),
+        )
+
+        assert len(reported) == 31
+        assert (str(self.csv_dir / "empty.csv"), False) in reported
+
+    def test_checkpoint_cancels(self):
+        from flowproc.domain.validation import ValidationCancelled
+        seen = []
+
+        def checkpoint():
+            if len(seen) >= 3:
+                raise ValidationCancelled()
+
+        with pytest.raises(ValidationCancelled):
+            validate_gui_inputs(
+                [str(self.csv_dir)], str(self.temp_dir),
+                on_file=lambda path, result: seen.append(path), checkpoint=checkpoint,
+            )
+
+        assert 3 <= len(seen) < 31
+
+    def test_queued_files_skipped_after_cancel(self):
+        from flowproc.domain.validation import ValidationCancelled
+        cancelled = threading.Event()
+        checked = []
+        validator = InputValidator(InputValidationConfig(max_workers=2))
+        validate_file = validator._validate_file
+
+        def slow_validate_file(file_path):
+            checked.append(file_path)
+            cancelled.set()
+            time.sleep(0.05)
+            return validate_file(file_path)
+
+        def checkpoint():
+            if cancelled.is_set():
+                raise ValidationCancelled()
+
+        validator._validate_file = slow_validate_file
+        with pytest.raises(ValidationCancelled):
+            validator.validate_input_paths([str(self.csv_dir)], checkpoint=checkpoint)
+
+        # Only the files already being checked when the flag was set are stat'ed
+        assert len(checked) <= 2
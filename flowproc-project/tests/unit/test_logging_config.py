@@ -0,0 +1,105 @@
+"""
+Unit tests for log level resolution and queued file logging.
+"""
+
+import logging
+import logging.handlers
+import threading
+
+import pytest
+
+from flowproc import logging_config
+from flowproc.logging_config import (
+    ENV_LOG_LEVEL, PERFORMANCE, flush_logging, resolve_log_level, setup_logging, shutdown_logging
+)
+from flowproc.infrastructure.monitoring.tracing import Tracer
+
+
+class TestResolveLogLevel:
+    """Test level names, numbers and the environment fallback."""
+
+    def test_names_and_numbers(self):
+        assert resolve_log_level('PERF') == PERFORMANCE
+        assert resolve_log_level('debug') == logging.DEBUG
+        assert resolve_log_level(logging.WARNING) == logging.WARNING
+        assert resolve_log_level('bogus') == logging.INFO
+
+    def test_environment_fallback(self, monkeypatch):
+        monkeypatch.setenv(ENV_LOG_LEVEL, 'PERF')
+        assert resolve_log_level() == PERFORMANCE
+
+        monkeypatch.delenv(ENV_LOG_LEVEL)
+        assert resolve_log_level() == logging.INFO
+
+
+class TestQueuedLogging:
+    """Test that records reach the log file through the background listener."""
+
+    def setup_method(self):
+        self.root = logging.getLogger()
+        self.saved_handlers = self.root.handlers[:]
+        self.saved_level = self.root.level
+        # Start from an unconfigured root so setup_logging installs its queue
+        self.root.handlers.clear()
+
+    def teardown_method(self):
+        shutdown_logging()
+        self.root.handlers[:] = self.saved_handlers
+        self.root.setLevel(self.saved_level)
+
+    @pytest.fixture
+    def log_file(self, tmp_path, monkeypatch):
+        monkeypatch.setenv('FLOWPROC_LOG_ROOT', str(tmp_path))
+        monkeypatch.delenv(ENV_LOG_LEVEL, raising=False)
+        return tmp_path / 'logs' / 'processing.log'
+
+    def test_records_written_after_flush(self, log_file):
+        assert setup_logging(filemode='w', level='PERF')
+        assert isinstance(logging_config._queue_handler, logging.handlers.QueueHandler)
+        assert logging_config._queue_handler in self.root.handlers
+
+        logging.getLogger('flowproc.test').log(PERFORMANCE, "stage timing")
+        logging.getLogger('flowproc.test').debug("filter diagnostics")
+        flush_logging()
+
+        text = log_file.read_text(encoding='utf-8')
+        assert "Logging initialized (level PERF)" in text
+        assert "PERF - stage timing" in text
+        assert "filter diagnostics" not in text
+
+    def test_setup_is_idempotent(self, log_file):
+        setup_logging(filemode='w')
+        handler = logging_config._queue_handler
+
+        assert setup_logging(filemode='w')
+        assert logging_config._queue_handler is handler
+        assert self.root.handlers.count(handler) == 1
+
+    def test_tracer_logs_span_timings_at_perf(self, log_file):
+        setup_logging(filemode='w', level='PERF')
+
+        with Tracer().span("parse.read"):
+            pass
+        flush_logging()
+
+        assert "PERF - parse.read took" in log_file.read_text(encoding='utf-8')
+
+    def test_concurrent_flushes_keep_one_listener(self, log_file):
+        setup_logging(filemode='w', level='INFO')
+        listener = logging_config._listener
+        logger = logging.getLogger('flowproc.test')
+
+        def log_and_flush(n):
+            for i in range(50):
+                logger.info("thread %d record %d", n, i)
+                flush_logging()
+
+        threads = [threading.Thread(target=log_and_flush, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert logging_config._listener is listener
+        text = log_file.read_text(encoding='utf-8')
+        assert all(f"thread {n} record 49" in text for n in range(4))
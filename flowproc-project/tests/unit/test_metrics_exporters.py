@@ -0,0 +1,144 @@
+"""
+Unit tests for run metrics and the Prometheus/JSON-lines/HTTP sinks.
+"""
+
+import json
+import urllib.request
+
+import pytest
+
+from flowproc.infrastructure.monitoring import exporters
+from flowproc.infrastructure.monitoring.exporters import (
+    JsonLinesSink, MetricsHTTPServer, PrometheusTextfileSink, RunMetrics, render_prometheus
+)
+from flowproc.infrastructure.monitoring.tracing import Tracer
+
+
+@pytest.fixture
+def metrics():
+    tracer = Tracer()
+    with tracer.span("process_csv.parse"):
+        pass
+    run = RunMetrics(tracer=tracer)
+    run.record_file(rows=100, bytes_read=2048, bytes_written=4096)
+    run.record_failure()
+    run.register_cache("lookups", lambda: (3, 1))
+    return run
+
+
+class TestRunMetrics:
+    """Test snapshot contents and exposition rendering."""
+
+    def test_snapshot(self, metrics):
+        snapshot = metrics.snapshot()
+
+        assert snapshot.counters == {
+            'files_processed': 1, 'files_failed': 1, 'rows_processed': 100,
+            'bytes_read': 2048, 'bytes_written': 4096,
+        }
+        assert snapshot.cache_hit_ratios == {"lookups": 0.75}
+        assert snapshot.peak_rss_bytes > 0
+        assert snapshot.rows_per_second > 0
+        assert list(snapshot.latencies) == ["process_csv.parse"]
+
+    def test_render_prometheus(self, metrics):
+        text = render_prometheus(metrics.snapshot())
+
+        assert "# TYPE flowproc_files_processed_total counter" in text
+        assert "flowproc_rows_processed_total 100" in text
+        assert 'flowproc_cache_hit_ratio{cache="lookups"} 0.75' in text
+        assert 'flowproc_stage_latency_seconds_bucket{stage="process_csv.parse",le="+Inf"} 1' in text
+        assert 'flowproc_stage_latency_seconds_count{stage="process_csv.parse"} 1' in text
+        assert text.endswith("\n")
+
+
+class TestSinks:
+    """Test each sink's output."""
+
+    def test_textfile_sink_replaces_file(self, metrics, tmp_path):
+        path = tmp_path / "flowproc.prom"
+        sink = PrometheusTextfileSink(path)
+
+        sink.emit(metrics.snapshot())
+        sink.emit(metrics.snapshot())
+
+        assert path.read_text().count("# TYPE flowproc_files_failed_total counter") == 1
+        assert not (tmp_path / "flowproc.prom.tmp").exists()
+
+    def test_jsonl_sink_appends(self, metrics, tmp_path):
+        path = tmp_path / "metrics.jsonl"
+        sink = JsonLinesSink(path)
+
+        sink.emit(metrics.snapshot())
+        sink.emit(metrics.snapshot())
+
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert len(records) == 2
+        assert records[0]['bytes_written'] == 4096
+        assert records[0]['stage_latency_seconds']['process_csv.parse']['count'] == 1
+
+    def test_http_endpoint(self, metrics):
+        server = MetricsHTTPServer(0, metrics=metrics)
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{server.port}/metrics", timeout=5) as response:
+                body = response.read().decode()
+        finally:
+            server.close()
+
+        assert "flowproc_bytes_read_total 2048" in body
+
+    def test_configure_sinks_from_environment(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(exporters, '_sinks', [])
+        monkeypatch.setattr(exporters, '_env_configured', False)
+        environ = {
+            exporters.ENV_TEXTFILE: str(tmp_path / "run.prom"),
+            exporters.ENV_JSONL: str(tmp_path / "run.jsonl"),
+        }
+
+        sinks = exporters.configure_sinks(environ=environ)
+        exporters.publish_metrics()
+
+        assert [type(s) for s in sinks] == [PrometheusTextfileSink, JsonLinesSink]
+        assert (tmp_path / "run.prom").exists()
+        assert (tmp_path / "run.jsonl").exists()
+
+    def test_bad_sink_settings_are_not_raised(self, tmp_path, monkeypatch, metrics):
+        monkeypatch.setattr(exporters, '_sinks', [])
+        monkeypatch.setattr(exporters, '_env_configured', False)
+        busy = MetricsHTTPServer(0, metrics=metrics)
+        try:
+            assert exporters.configure_sinks(environ={exporters.ENV_PORT: 'abc'}) == []
+            sinks = exporters.configure_sinks(
+                jsonl=tmp_path / "run.jsonl", environ={exporters.ENV_PORT: str(busy.port)}
+            )
+        finally:
+            busy.close()
+
+        assert [type(s) for s in sinks] == [JsonLinesSink]
+        assert exporters._env_configured
+
+    def test_sink_must_implement_emit(self):
+        with pytest.raises(TypeError):
+            exporters.MetricsSink()
+
+
+class TestRuns:
+    """Test that runs reset and publish only at the outermost level."""
+
+    def test_nested_run_joins_outer_run(self, metrics, monkeypatch):
+        monkeypatch.setattr(exporters, 'run_metrics', metrics)
+        published = []
+        monkeypatch.setattr(exporters, 'publish_metrics', lambda: published.append(metrics.snapshot()))
+
+        exporters.begin_run()
+        metrics.record_file(rows=5)
+        exporters.begin_run()
+        metrics.record_file(rows=7)
+        exporters.end_run()
+        assert published == []
+        exporters.end_run()
+
+        snapshot, = published
+        assert snapshot.counters['files_processed'] == 2
+        assert snapshot.counters['rows_processed'] == 12
+        assert snapshot.counters['files_failed'] == 0
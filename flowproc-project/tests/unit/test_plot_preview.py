@@ -0,0 +1,42 @@
+"""
+Unit tests for the plot preview bridge used by the visualization dialog.
+"""
+
+from flowproc.presentation.gui.views.dialogs.plot_preview import PlotPreviewBridge
+
+
+class TestPlotPreviewBridge:
+    """Test update delivery before and after the page is ready."""
+
+    def setup_method(self):
+        self.figures = []
+        self.messages = []
+
+    def _make_bridge(self):
+        bridge = PlotPreviewBridge()
+        bridge.figure_changed.connect(self.figures.append)
+        bridge.message_changed.connect(self.messages.append)
+        return bridge
+
+    def test_only_latest_update_is_delivered_when_page_becomes_ready(self, qt_app):
+        bridge = self._make_bridge()
+        bridge.show_figure('{"data": [1]}')
+        bridge.show_message("<p>error</p>")
+        bridge.show_figure('{"data": [2]}')
+
+        assert self.figures == []
+
+        bridge.page_ready()
+
+        assert self.figures == ['{"data": [2]}']
+        assert self.messages == []
+
+    def test_updates_pass_through_once_ready(self, qt_app):
+        bridge = self._make_bridge()
+        bridge.page_ready()
+
+        bridge.show_figure('{"data": []}')
+        bridge.show_message("<p>error</p>")
+
+        assert self.figures == ['{"data": []}']
+        assert self.messages == ["<p>error</p>"]
@@ -0,0 +1,106 @@
+"""
+Unit tests for PlotRenderWorker request coalescing and supersession.
+"""
+
+import threading
+import time
+
+from PySide6.QtCore import QObject
+
+from flowproc.presentation.gui.workers import plot_worker
+from flowproc.presentation.gui.workers.plot_worker import PlotRenderWorker
+
+
+def _wait_until(app, condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.01)
+    app.processEvents()
+    return condition()
+
+
+class TestPlotRenderWorker:
+    """Test that only the latest submitted render is delivered."""
+
+    def setup_method(self):
+        self.completed = []
+        self.failed = []
+
+    def _make_worker(self):
+        worker = PlotRenderWorker()
+        worker.render_completed.connect(lambda rid, result: self.completed.append((rid, result)))
+        worker.render_failed.connect(lambda rid, msg: self.failed.append((rid, msg)))
+        return worker
+
+    def test_newer_request_supersedes_running_one(self, qt_app):
+        worker = self._make_worker()
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_task(checkpoint):
+            started.set()
+            release.wait(5)
+            checkpoint()
+            return "stale"
+
+        first = worker.submit(slow_task)
+        assert started.wait(5)
+        second = worker.submit(lambda checkpoint: "fresh")
+        third = worker.submit(lambda checkpoint: "latest")
+        release.set()
+
+        assert _wait_until(qt_app, lambda: self.completed)
+        assert worker.stop()
+        assert first < second < third
+        # The queued second request was replaced before it ever ran
+        assert self.completed == [(third, "latest")]
+        assert self.failed == []
+
+    def test_failure_is_reported(self, qt_app):
+        worker = self._make_worker()
+
+        def broken_task(checkpoint):
+            raise ValueError("bad data")
+
+        request_id = worker.submit(broken_task)
+
+        assert _wait_until(qt_app, lambda: self.failed)
+        assert worker.stop()
+        assert self.failed == [(request_id, "bad data")]
+
+    def test_restarts_after_stop(self, qt_app):
+        worker = self._make_worker()
+        worker.submit(lambda checkpoint: 1)
+        assert _wait_until(qt_app, lambda: self.completed)
+        assert worker.stop()
+
+        request_id = worker.submit(lambda checkpoint: 2)
+
+        assert _wait_until(qt_app, lambda: len(self.completed) == 2)
+        assert worker.stop()
+        assert self.completed[-1] == (request_id, 2)
+
+    def test_detached_worker_outlives_its_owner(self, qt_app):
+        owner = QObject()
+        worker = PlotRenderWorker(owner)
+        worker.render_completed.connect(lambda rid, result: self.completed.append((rid, result)))
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_task(checkpoint):
+            started.set()
+            release.wait(5)
+            return "late"
+
+        worker.submit(slow_task)
+        assert started.wait(5)
+        assert not worker.stop(timeout_ms=10)
+        worker.detach()
+        del worker
+        owner.deleteLater()
+        qt_app.processEvents()
+        release.set()
+
+        assert _wait_until(qt_app, lambda: not plot_worker._detached_workers)
+        assert self.completed == []
@@ -0,0 +1,103 @@
+"""
+Unit tests for per-file stage profiling.
+"""
+
+import time
+
+import pytest
+
+from flowproc.domain.export import process_csv
+from flowproc.infrastructure.monitoring import profiling
+from flowproc.infrastructure.monitoring.profiling import ProfileConfig, configure_profiling, profile_file
+from flowproc.infrastructure.monitoring.tracing import Tracer
+from flowproc.testing import SyntheticDatasetConfig, write_synthetic_dataset
+
+
+class TestProfileFile:
+    """Test stage aggregation and report files."""
+
+    def setup_method(self):
+        self.tracer = Tracer()
+
+    def test_stage_report_and_collapsed_stacks(self, tmp_path):
+        config = ProfileConfig(output_dir=tmp_path)
+
+        with profile_file("input.csv", config, tracer=self.tracer) as profile:
+            with self.tracer.span("stage"):
+                for _ in range(2):
+                    with self.tracer.span("step"):
+                        time.sleep(0.01)
+
+        stages = {s.path: s for s in profile.stages}
+        assert stages[("profile", "stage", "step")].calls == 2
+        stage = stages[("profile", "stage")]
+        assert stage.self_time == pytest.approx(stage.total - stages[("profile", "stage", "step")].total)
+        assert "  stage" in profile.report_path.read_text()
+        collapsed = profile.collapsed_path.read_text().splitlines()
+        assert any(line.startswith("profile;stage;step ") for line in collapsed)
+        assert profile.pstats_path is None
+
+    def test_stages_survive_ring_buffer_eviction(self, tmp_path):
+        tracer = Tracer(max_spans=4)
+
+        with profile_file("input.csv", ProfileConfig(output_dir=tmp_path), tracer=tracer) as profile:
+            for _ in range(10):
+                with tracer.span("parse"):
+                    with tracer.span("step"):
+                        pass
+
+        stages = {s.path: s for s in profile.stages}
+        assert stages[("profile", "parse")].calls == 10
+        assert stages[("profile", "parse", "step")].calls == 10
+        assert len(tracer.get_spans()) == 4
+
+    def test_cprofile_report_written_when_block_fails(self, tmp_path):
+        config = ProfileConfig(mode='cprofile', output_dir=tmp_path)
+
+        with pytest.raises(RuntimeError):
+            with profile_file("input.csv", config, tracer=self.tracer) as profile:
+                raise RuntimeError("boom")
+
+        assert profile.success is False
+        assert profile.pstats_path.exists()
+        assert "Status: failed" in profile.report_path.read_text()
+
+    def test_disabled_yields_none(self, monkeypatch):
+        monkeypatch.setattr(profiling, '_config', None)
+        monkeypatch.setattr(profiling, '_env_configured', True)
+
+        with profile_file("input.csv") as profile:
+            pass
+
+        assert profile is None
+
+
+class TestConfigureProfiling:
+    """Test configuration from the environment."""
+
+    def test_environment(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(profiling, '_config', None)
+        monkeypatch.setattr(profiling, '_env_configured', False)
+
+        config = configure_profiling(environ={
+            profiling.ENV_PROFILE: 'true', profiling.ENV_PROFILE_DIR: str(tmp_path)
+        })
+
+        assert config.mode == 'stages'
+        assert config.output_dir == tmp_path
+        assert configure_profiling(environ={}) is None
+
+    def test_process_csv_reports_pipeline_stages(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(profiling, '_config', ProfileConfig(mode='sample', output_dir=tmp_path / "profiles"))
+        monkeypatch.setattr(profiling, '_env_configured', True)
+        csv_path, = write_synthetic_dataset(tmp_path, SyntheticDatasetConfig(n_metrics=4))
+
+        process_csv(csv_path, tmp_path / "out.xlsx")
+
+        report, = (tmp_path / "profiles").glob("*.profile.txt")
+        text = report.read_text()
+        for stage in ("parse.read", "parse.detect_type", "parse.sample_ids", "process_csv.map",
+                      "process_csv.build", "process_csv.reshape", "process_csv.write"):
+            assert stage in text
+        collapsed, = (tmp_path / "profiles").glob("*.collapsed")
+        assert "_process_csv" in collapsed.read_text()
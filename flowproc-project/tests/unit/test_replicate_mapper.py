@@ -0,0 +1,78 @@
+"""
+Unit tests for ReplicateMapper lookup-table mapping and caching.
+"""
+
+import numpy as np
+import pandas as pd
+
+from flowproc.domain.export.replicate_mapper import ReplicateMapper
+
+
+def _plate(animals_by_group):
+    rows = [
+        {'Group': group, 'Animal': animal}
+        for group, animals in animals_by_group.items()
+        for animal in animals
+    ]
+    return pd.DataFrame(rows)
+
+
+class TestReplicateMapper:
+    """Test replicate assignment and the fingerprinted mapping cache."""
+
+    def test_animals_ranked_within_group(self):
+        df = _plate({1: [7, 3, 5], 2: [2, 9]})
+
+        result = ReplicateMapper().map_replicates(df)
+
+        assert result['Replicate'].tolist() == [3, 1, 2, 1, 2]
+
+    def test_manual_replicates_leave_extra_animals_unmapped(self):
+        df = _plate({1: [1, 2, 3]})
+
+        result = ReplicateMapper(auto_map=False).map_replicates(df, replicates=[1, 2])
+
+        assert result['Replicate'].iloc[:2].tolist() == [1, 2]
+        assert np.isnan(result['Replicate'].iloc[2])
+
+    def test_tissues_are_mapped_independently(self):
+        df = pd.DataFrame({
+            'Tissue': ['SP', 'SP', 'BM', 'BM'],
+            'Group': [1, 1, 1, 1],
+            'Animal': [1, 2, 2, 3],
+        })
+
+        result = ReplicateMapper().map_replicates(df)
+
+        assert result['Replicate'].tolist() == [1, 2, 1, 2]
+
+    def test_same_layout_reuses_cached_mapping(self):
+        mapper = ReplicateMapper()
+        first = _plate({1: [1, 2], 2: [1, 2]})
+        second = first.sample(frac=1, random_state=0).reset_index(drop=True)
+
+        mapper.map_replicates(first)
+        mapper.map_replicates(second)
+
+        assert len(mapper._mapping_cache) == 1
+        assert (second['Replicate'] == second['Animal']).all()
+
+    def test_different_animals_do_not_share_cache_entry(self):
+        mapper = ReplicateMapper()
+
+        mapper.map_replicates(_plate({1: [1, 2]}))
+        result = mapper.map_replicates(_plate({1: [5, 6]}))
+
+        assert len(mapper._mapping_cache) == 2
+        assert result['Replicate'].tolist() == [1, 2]
+
+    def test_missing_tissue_ranked_as_own_tissue(self):
+        df = pd.DataFrame({
+            'Group': [1, 1, 1, 1, 2, 2],
+            'Animal': [1, 2, 1, 2, 1, 2],
+            'Tissue': ['SP', 'SP', 'BM', None, 'SP', 'BM'],
+        })
+
+        result = ReplicateMapper().map_replicates(df)
+
+        assert result['Replicate'].tolist() == [1, 2, 1, 1, 1, 1]
@@ -0,0 +1,115 @@
+"""
+Unit tests for single-document study reports.
+"""
+
+import re
+
+import plotly.graph_objects as go
+import pytest
+
+from flowproc.application.workflows.visualization import VisualizationWorkflow
+from flowproc.domain.visualization.report_builder import StudyReport
+from flowproc.domain.visualization.static_renderer import UnsupportedGlyphError
+from flowproc.testing import generate_synthetic_data
+
+
+class TestStudyReport:
+    """Test report assembly and HTML/PDF output."""
+
+    def setup_method(self):
+        self.report = StudyReport('Study 1')
+
+    def test_concurrent_build_keeps_order(self):
+        def make(i):
+            if i == 2:
+                raise ValueError('bad column')
+            return go.Figure(go.Bar(x=[1, 2], y=[i, i + 1]))
+
+        specs = [(f"Figure {i}", 'Tissue: SP' if i < 3 else 'Tissue: BM', lambda i=i: make(i)) for i in range(5)]
+
+        errors = self.report.add_figures(specs, max_workers=3)
+
+        assert [entry.title for entry in self.report.figures] == ['Figure 0', 'Figure 1', 'Figure 3', 'Figure 4']
+        assert len(errors) == 1 and 'Figure 2' in errors[0]
+        assert all(entry.figure_json is not None for entry in self.report.figures)
+
+    def test_html_shares_assets_and_renders_lazily(self):
+        for i in range(3):
+            fig = go.Figure(go.Scatter(x=[0, 1], y=[i, i]), layout={'template': 'plotly_white', 'height': 300})
+            self.report.add_figure(fig, section=f"Time: {i}")
+
+        html = self.report.to_html(include_plotlyjs='cdn')
+
+        assert html.count('cdn.plot.ly') == 1
+        assert html.count('class="report-figure"') == 3
+        # One shared template instead of one per figure
+        assert len(re.findall(r'id="template-\d+"', html)) == 1
+        assert 'plotly_white' not in html.split('id="template-0"')[0]
+        assert 'IntersectionObserver' in html
+        assert html.count('<h2') == 3 and '<nav>' in html
+        assert 'height: 300px' in html
+
+    def test_script_content_escaped(self):
+        self.report.add_figure(go.Figure(layout={'title': {'text': '</script><b>x</b>'}}))
+
+        html = self.report.to_html(include_plotlyjs=False)
+
+        assert '</script><b>' not in html
+        assert self.report.figures[0].title == '</script><b>x</b>'
+
+    def test_pdf_one_page_per_figure(self):
+        for i in range(3):
+            self.report.add_figure(go.Figure(go.Bar(x=[1], y=[i + 1])), title=f"Bar {i}")
+
+        pdf = self.report.to_pdf()
+
+        assert pdf.startswith(b'%PDF')
+        assert b'/Count 3' in pdf
+        assert len(re.findall(rb'/Type /Page\b', pdf)) == 3
+
+    def test_failed_pdf_keeps_existing_file(self, tmp_path):
+        target = tmp_path / 'report.pdf'
+        target.write_bytes(b'previous report')
+        self.report.add_figure(go.Figure(go.Bar(x=['脾臓'], y=[1])))
+
+        with pytest.raises(UnsupportedGlyphError):
+            self.report.write_pdf(target)
+
+        assert target.read_bytes() == b'previous report'
+
+
+class TestCreateReport:
+    """Test the workflow entry point."""
+
+    def test_one_report_per_study(self, tmp_path):
+        df = generate_synthetic_data(n_groups=2, n_animals=3, n_timepoints=2, n_tissues=2, n_metrics=2, seed=4)
+        metric = next(c for c in df.columns if ' | ' in c)
+        config = {
+            'output_dir': str(tmp_path),
+            'report': {
+                'title': 'Synthetic',
+                'formats': ['html', 'pdf'],
+                'split_by': 'Tissue',
+                'include_plotlyjs': False,
+                'plots': [{'type': 'bar', 'y': metric}, {'type': 'timecourse', 'y': 'Freq. of Parent'}],
+            },
+        }
+
+        results = VisualizationWorkflow().create_report(df, config)
+
+        assert results['success'] and not results['errors']
+        assert results['plots_created'] == 2 * df['Tissue'].nunique()
+        assert sorted(p.name for p in tmp_path.iterdir()) == ['report.html', 'report.pdf']
+        html = (tmp_path / 'report.html').read_text()
+        for tissue in df['Tissue'].unique():
+            assert f"Tissue: {tissue}" in html
+
+    def test_missing_split_column(self, tmp_path):
+        df = generate_synthetic_data(n_groups=2, n_animals=2, n_timepoints=1, n_tissues=1, n_metrics=1, seed=4)
+
+        results = VisualizationWorkflow().create_report(
+            df, {'output_dir': str(tmp_path), 'report': {'split_by': 'Organ', 'plots': [{'type': 'bar'}]}}
+        )
+
+        assert not results['success']
+        assert 'Organ' in results['errors'][0]
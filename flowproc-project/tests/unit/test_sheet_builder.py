@@ -0,0 +1,56 @@
+"""
+Unit tests for SheetBuilder data and ID sheet writers.
+"""
+
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook
+
+from flowproc.domain.export.sheet_builder import SheetBuilder
+
+
+def _summary():
+    return pd.DataFrame({
+        'Group': [1, 2],
+        'Time': [2.5, np.nan],
+        'SampleID': ['SP_A1.1', 'SP_B1.2'],
+        'Mean': [[10.0, np.nan, 30.0], 42.0],
+    })
+
+
+class TestSheetBuilder:
+    """Test row layout of data and ID sheets."""
+
+    def setup_method(self):
+        self.builder = SheetBuilder()
+        self.wb = Workbook()
+
+    def _rows(self, ws):
+        return [list(r) for r in ws.iter_rows(min_row=3, values_only=True)]
+
+    def test_data_sheet_expands_replicates(self):
+        ws = self.builder.create_data_sheet(
+            self.wb, 'Mean', _summary(), ['Group', 'Time'], ['Mean'], 3
+        )
+
+        assert self._rows(ws) == [
+            [1, '2:30', 10.0, None, 30.0],
+            [2, '', 42.0, None, None],
+        ]
+
+    def test_id_sheet_repeats_sample_id_per_filled_slot(self):
+        ws = self.builder.create_id_sheet(
+            self.wb, 'Mean', _summary(), ['Group', 'Time'], ['Mean'], 3
+        )
+
+        assert self._rows(ws) == [
+            [1, '2:30', 'SP_A1.1', 'SP_A1.1', 'SP_A1.1'],
+            [2, '', 'SP_B1.2', None, None],
+        ]
+
+    def test_missing_value_column_leaves_block_empty(self):
+        ws = self.builder.create_data_sheet(
+            self.wb, 'Mean', _summary(), ['Group'], ['Mean', 'Count'], 2
+        )
+
+        assert self._rows(ws)[0][:5] == [1, 10.0, None, None, None]
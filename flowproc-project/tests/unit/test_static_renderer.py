@@ -0,0 +1,144 @@
+"""
+Unit tests for browser-free SVG/PDF rendering of Plotly figures.
+"""
+
+import re
+import zlib
+import xml.etree.ElementTree as ET
+
+import plotly.graph_objects as go
+import pytest
+
+from flowproc.domain.visualization.plot_creators import plot
+from flowproc.domain.visualization.plotly_renderer import PlotlyRenderer
+from flowproc.domain.visualization.static_renderer import UnsupportedGlyphError, figure_to_pdf, figure_to_svg
+from flowproc.domain.visualization.time_plots import create_timecourse_visualization
+from flowproc.testing import generate_synthetic_data
+
+SVG_NS = '{http://www.w3.org/2000/svg}'
+
+
+def _pdf_content(pdf: bytes) -> bytes:
+    stream = re.search(rb'stream\n(.*?)\nendstream', pdf, re.S).group(1)
+    return zlib.decompress(stream)
+
+
+def _svg_texts(svg: str):
+    return [el.text for el in ET.fromstring(svg).iter(f'{SVG_NS}text')]
+
+
+class TestFigureToSvg:
+    """Test SVG output for the chart types the app produces."""
+
+    def setup_method(self):
+        self.df = generate_synthetic_data(
+            n_groups=3, n_animals=4, n_timepoints=3, n_tissues=1, n_metrics=3, seed=1
+        )
+        self.y = next(c for c in self.df.columns if ' | ' in c)
+
+    def test_bar_with_points(self):
+        fig = plot(self.df, y=self.y, plot_type='bar', show_individual_points=True)
+
+        svg = figure_to_svg(fig)
+        root = ET.fromstring(svg)
+
+        assert root.get('width') == '800' and root.get('height') == '350'
+        texts = _svg_texts(svg)
+        assert 'Count' in texts and 'Group' in texts and 'Mean ± SEM' in texts
+        # Background, plot area and one rect per bar
+        assert len(list(root.iter(f'{SVG_NS}rect'))) >= 5
+        assert len(list(root.iter(f'{SVG_NS}circle'))) == len(self.df)
+
+    def test_timecourse_legend_and_error_bars(self):
+        fig = create_timecourse_visualization(self.df, metric='Freq. of Parent', group_by='Group')
+
+        svg = figure_to_svg(fig)
+
+        texts = _svg_texts(svg)
+        assert {'Group 1', 'Group 2', 'Group 3', 'Groups', 'Time'} <= set(texts)
+        # Each group: a line, plus a stem and two caps per error bar
+        assert len(re.findall('<polyline', svg)) >= 3 * (1 + 3 * 3)
+
+    def test_box_and_histogram(self):
+        box = figure_to_svg(plot(self.df, y=self.y, plot_type='box'))
+        hist = figure_to_svg(go.Figure([go.Histogram(x=self.df[self.y], name='counts')]))
+
+        ET.fromstring(box)
+        assert len(list(ET.fromstring(hist).iter(f'{SVG_NS}rect'))) > 3
+
+    def test_gaps_split_lines(self):
+        fig = go.Figure([go.Scatter(x=[0, 1, None, 0, 1], y=[1, 2, None, 3, 4], mode='lines')])
+        no_grid = {'showgrid': False, 'zeroline': False}
+        fig.update_layout(xaxis=no_grid, yaxis=no_grid)
+
+        svg = figure_to_svg(fig, width=400, height=300)
+
+        assert len(re.findall('<polyline', svg)) == 2
+
+    def test_accepts_figure_dict(self):
+        fig = go.Figure([go.Bar(x=['a', 'b'], y=[1, 2])], layout={'title': {'text': 'Dict'}})
+
+        assert 'Dict' in _svg_texts(figure_to_svg(fig.to_dict()))
+
+
+class TestFigureToPdf:
+    """Test the structure of the generated PDF."""
+
+    def test_valid_structure(self):
+        fig = go.Figure([go.Bar(x=[1, 2], y=[3, 4], marker_color='rgba(0, 0, 255, 0.5)')],
+                        layout={'width': 500, 'height': 300})
+
+        pdf = figure_to_pdf(fig)
+
+        assert pdf.startswith(b'%PDF-1.4') and pdf.rstrip().endswith(b'%%EOF')
+        assert b'/MediaBox [0 0 500 300]' in pdf
+        assert b'/ca 0.5' in pdf
+        startxref = int(re.search(rb'startxref\n(\d+)', pdf).group(1))
+        assert pdf[startxref:].startswith(b'xref')
+        # Every xref entry points at its object
+        offsets = re.findall(rb'(\d{10}) 00000 n', pdf)
+        for number, offset in enumerate(offsets, start=1):
+            assert pdf[int(offset):].startswith(b'%d 0 obj' % number)
+
+    def test_greek_and_math_labels_use_symbol_font(self):
+        fig = go.Figure([go.Bar(x=['γδ T cells'], y=[1])], layout={'title': {'text': 'CD4 ≥ 5%'}})
+
+        content = _pdf_content(figure_to_pdf(fig))
+
+        assert b'/BaseFont /Symbol' in figure_to_pdf(fig)
+        assert b'/F3 12 Tf (gd) Tj /F1 12 Tf ( T cells) Tj' in content
+        assert b'(CD4 ) Tj /F3' in content and b'(\xb3) Tj' in content
+        assert b'?' not in content
+
+    def test_unsupported_glyphs_raise(self):
+        fig = go.Figure([go.Bar(x=['脾臓'], y=[1])])
+
+        with pytest.raises(UnsupportedGlyphError):
+            figure_to_pdf(fig)
+
+
+class TestPlotlyRendererNativeExport:
+    """Test that SVG/PDF export no longer needs a browser."""
+
+    def test_export_svg_and_pdf(self, tmp_path):
+        fig = go.Figure([go.Scatter(x=[1, 2, 3], y=[2, 1, 3])])
+        renderer = PlotlyRenderer()
+
+        renderer.export_to_svg(fig, str(tmp_path / 'plot.svg'))
+        PlotlyRenderer.save_plot(fig, str(tmp_path / 'plot.pdf'), format='pdf')
+
+        ET.parse(tmp_path / 'plot.svg')
+        assert (tmp_path / 'plot.pdf').read_bytes().startswith(b'%PDF')
+
+    def test_pdf_falls_back_to_browser_for_unsupported_glyphs(self, tmp_path, monkeypatch):
+        fig = go.Figure([go.Bar(x=['脾臓'], y=[1])])
+        renderer = PlotlyRenderer()
+        exported = []
+        monkeypatch.setattr(renderer, 'check_pdf_capabilities',
+                            lambda: {'selenium': True, 'browsers': {'chrome': True}})
+        monkeypatch.setattr(renderer, 'export_to_pdf_selenium', lambda *args: exported.append(args))
+
+        renderer.export_to_pdf(fig, str(tmp_path / 'plot.pdf'))
+
+        assert len(exported) == 1
+        assert not (tmp_path / 'plot.pdf').exists()
@@ -0,0 +1,52 @@
+"""
+Unit tests for the synthetic flow cytometry data generator.
+"""
+
+from flowproc.domain.parsing import load_and_parse_df
+from flowproc.testing import SyntheticDatasetConfig, generate_synthetic_data, write_synthetic_dataset
+from flowproc.testing.synthetic_data import main
+
+
+class TestGenerateSyntheticData:
+    """Test the in-memory generator."""
+
+    def test_shape_and_reproducibility(self):
+        df = generate_synthetic_data(n_groups=3, n_animals=2, n_timepoints=2, n_tissues=2, n_metrics=6, seed=7)
+
+        assert len(df) == 3 * 2 * 2 * 2
+        assert df['SampleID'].is_unique
+        assert len([c for c in df.columns if ' | ' in c]) == 6
+        assert df.equals(generate_synthetic_data(n_groups=3, n_animals=2, n_timepoints=2,
+                                                 n_tissues=2, n_metrics=6, seed=7))
+
+    def test_n_samples_sets_animals(self):
+        df = generate_synthetic_data(n_samples=100, n_groups=5, n_timepoints=2)
+
+        assert df['Animal'].max() == 10
+
+
+class TestWriteSyntheticDataset:
+    """Test the written exports parse back to the generated structure."""
+
+    def test_files_round_trip(self, tmp_path):
+        config = SyntheticDatasetConfig(
+            n_files=3, n_groups=2, n_animals=3, n_timepoints=2, n_metrics=4,
+            marker_rate=0.2, accented_headers=True, encodings=('utf-8', 'latin-1', 'utf-8-sig')
+        )
+
+        paths = write_synthetic_dataset(tmp_path, config)
+
+        assert [p.name for p in paths] == ['synthetic_0001.csv', 'synthetic_0002.csv', 'synthetic_0003.csv']
+        assert paths[1].read_bytes().decode('latin-1').splitlines()[-1].startswith('SD,')
+        for path in paths:
+            df, sid_col = load_and_parse_df(path)
+            assert len(df) == 12
+            assert sorted(df['Time'].unique()) == [0.0, 24.0]
+            assert 'Lymphocytes/Naïve T | Freq. of Parent' in df.columns
+
+    def test_cli(self, tmp_path, capsys):
+        assert main([str(tmp_path), '--files', '2', '--rows', '8', '--no-footer']) == 0
+
+        assert len(list(tmp_path.glob('*.csv'))) == 2
+        last_line = (tmp_path / 'synthetic_0001.csv').read_text().splitlines()[-1]
+        assert last_line.startswith('SP_')
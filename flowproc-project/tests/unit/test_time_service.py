@@ -5,6 +5,7 @@ Tests all time parsing and formatting functionality that was previously
 duplicated across multiple modules.
 """
 
+import pandas as pd
 import pytest
 from flowproc.domain.parsing.time_service import TimeService, TimeFormat, parse_time, format_time, parse_formatted_time
 
@@ -208,6 +209,23 @@ class TestTimeService:
             result = self.service.parse(text)
             assert result == expected, f"Unit conversion failed for '{text}': expected {expected}, got {result}"
 
+    def test_pattern_precedence(self):
+        """Test that earlier patterns win even when a later one matches first in the text."""
+        # GENERAL would match "2 hour" first, but TIMECOURSE has precedence
+        assert self.service.parse("Sample_2 hour_Day 3") == 72.0
+        # FILENAME has precedence over the PREFIX match at the start
+        assert self.service.parse("2 foo_Sample_3 hour") == 3.0
+
+    def test_parse_many(self):
+        """Test column-wise parsing of repeated values."""
+        values = pd.Series(["Day 3", "2 hour_SP_", "Day 3", None, "invalid"], index=[5, 6, 7, 8, 9])
+
+        result = self.service.parse_many(values)
+
+        assert result.index.tolist() == [5, 6, 7, 8, 9]
+        assert result.iloc[:3].tolist() == [72.0, 2.0, 72.0]
+        assert result.iloc[3:].isna().all()
+
 
 class TestTimeServiceIntegration:
     """Test integration with existing code patterns."""
@@ -0,0 +1,58 @@
+"""
+Unit tests for TissueParser precedence, mapping updates and column parsing.
+"""
+
+import pandas as pd
+import pytest
+
+from flowproc.domain.parsing.tissue_parser import TissueParser, extract_tissues
+
+
+@pytest.fixture
+def isolated_mappings(monkeypatch):
+    """Keep add_mapping changes from leaking into other tests."""
+    monkeypatch.setattr(TissueParser, 'TISSUE_MAP', dict(TissueParser.TISSUE_MAP))
+    monkeypatch.setattr(TissueParser, 'REVERSE_MAP', dict(TissueParser.REVERSE_MAP))
+    monkeypatch.setattr(TissueParser, '_mapping_version', TissueParser._mapping_version)
+
+
+class TestTissueParser:
+    """Test tissue detection order and batch parsing."""
+
+    def setup_method(self):
+        self.parser = TissueParser()
+
+    @pytest.mark.parametrize("text, expected", [
+        ("SP_A1_1.1", "SP"),
+        ("bm", "BM"),
+        ("Bone Marrow", "BM"),
+        # Earlier mapping wins regardless of position in the text
+        ("liver and spleen", "SP"),
+        ("bone_marrow_1.1", "BM"),
+        ("2 hours_LN_A1_1.1", "LN"),
+        ("thymus-1.1", "TH"),
+        ("nothing here", "UNK"),
+    ])
+    def test_parse_precedence(self, text, expected):
+        assert self.parser.parse(text) == expected
+
+    def test_add_mapping_rebuilds_matcher(self, isolated_mappings):
+        other = TissueParser()
+        assert other.parse("XY_1.1") == "UNK"
+
+        self.parser.add_mapping("XY", "Xylem")
+
+        assert other.parse("XY_1.1") == "XY"
+        assert other.parse("xylem 1.1") == "XY"
+
+    def test_parse_series(self):
+        values = pd.Series(["SP_1.1", None, "spleen_1.2", "other"], index=[3, 4, 5, 6])
+
+        result = extract_tissues(values)
+
+        assert result.index.tolist() == [3, 4, 5, 6]
+        assert result.tolist() == ["SP", "UNK", "SP", "UNK"]
+
+    def test_parse_series_rejects_non_strings(self):
+        with pytest.raises(ValueError, match="Sample ID must be a string"):
+            self.parser.parse_series(pd.Series([1, 2]))
@@ -0,0 +1,119 @@
+"""
+Unit tests for span tracing and the MetricsCollector built on it.
+"""
+
+import threading
+import time
+
+import pytest
+
+from flowproc.infrastructure.monitoring.metrics import MetricsCollector
+from flowproc.infrastructure.monitoring.tracing import LatencyHistogram, Tracer
+
+
+class TestTracer:
+    """Test span nesting, failure recording and bounded storage."""
+
+    def setup_method(self):
+        self.tracer = Tracer(max_spans=5)
+
+    def test_nested_spans_record_parent(self):
+        with self.tracer.span("batch") as batch:
+            with self.tracer.span("file", name="a.csv") as file_span:
+                pass
+
+        spans = {s.name: s for s in self.tracer.get_spans()}
+        assert spans["file"].parent_id == batch.span_id
+        assert spans["batch"].parent_id is None
+        assert file_span.metadata == {"name": "a.csv"}
+        assert spans["batch"].duration >= spans["file"].duration
+        assert spans["file"].rss_delta_mb is not None
+        assert self.tracer.current_span() is None
+
+    def test_failed_span_is_recorded_and_reraised(self):
+        with pytest.raises(ValueError):
+            with self.tracer.span("parse"):
+                raise ValueError("bad row")
+
+        span, = self.tracer.get_spans("parse")
+        assert span.success is False
+        assert span.error_message == "bad row"
+
+    def test_decorator_and_ring_buffer(self):
+        @self.tracer.trace()
+        def work():
+            return 42
+
+        for _ in range(8):
+            assert work() == 42
+
+        assert len(self.tracer.get_spans()) == 5
+        summary = self.tracer.get_latency_summary()
+        assert summary[work.__qualname__]["count"] == 8
+
+    def test_threads_do_not_share_parents(self):
+        barrier = threading.Barrier(2)
+
+        def run(name):
+            with self.tracer.span(name):
+                barrier.wait(5)
+                with self.tracer.span(f"{name}.child"):
+                    pass
+
+        threads = [threading.Thread(target=run, args=(n,)) for n in ("t1", "t2")]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        spans = {s.name: s for s in self.tracer.get_spans()}
+        assert spans["t1.child"].parent_id == spans["t1"].span_id
+        assert spans["t2.child"].parent_id == spans["t2"].span_id
+
+
+class TestLatencyHistogram:
+    """Test bucket counts and percentiles."""
+
+    def test_percentiles(self):
+        histogram = LatencyHistogram(buckets=(0.01, 0.1))
+        for value in range(1, 101):
+            histogram.observe(value / 1000)
+
+        summary = histogram.summary()
+        assert summary["count"] == 100
+        assert summary["p50"] == pytest.approx(0.05)
+        assert summary["p95"] == pytest.approx(0.095)
+        assert summary["p99"] == pytest.approx(0.099)
+        assert histogram.bucket_counts == [10, 90, 0]
+
+
+class TestMetricsCollector:
+    """Test that operation ids close the operation they belong to."""
+
+    def test_nested_operations_are_attributed_by_id(self):
+        collector = MetricsCollector(tracer=Tracer())
+
+        outer = collector.start_operation("process_batch")
+        inner = collector.start_operation("process_file")
+        collector.end_operation(outer, success=False, error_message="aborted")
+        collector.end_operation(inner)
+        collector.end_operation("unknown")
+
+        metrics = {m.operation_name: m for m in collector.get_metrics()}
+        assert metrics["process_batch"].success is False
+        assert metrics["process_file"].success is True
+        assert metrics["process_file"].parent_id == outer
+        assert collector.get_summary()["completed_operations"] == 2
+
+    def test_cpu_usage_is_sampled(self):
+        collector = MetricsCollector(tracer=Tracer())
+
+        operation = collector.start_operation("busy")
+        deadline = time.process_time() + 0.05
+        while time.process_time() < deadline:
+            pass
+        collector.end_operation(operation)
+
+        metric, = collector.get_metrics("busy")
+        assert metric.cpu_usage_percent > 0
+        assert collector.get_summary()["average_cpu_usage_percent"] == metric.cpu_usage_percent
@@ -0,0 +1,70 @@
+"""
+Unit tests for WebGL rendering and trace consolidation of large plots.
+"""
+
+import numpy as np
+import plotly.graph_objects as go
+
+from flowproc.domain.visualization.plot_creators import create_timecourse_visualization, plot
+from flowproc.domain.visualization.plot_utils import apply_webgl_rendering
+from flowproc.domain.visualization.time_plots import create_timecourse_visualization as create_gui_timecourse
+from flowproc.testing import generate_synthetic_data
+
+
+class TestApplyWebglRendering:
+    """Test the automatic switch to Scattergl."""
+
+    def test_small_figure_unchanged(self):
+        fig = go.Figure([go.Scatter(x=[1, 2], y=[3, 4])])
+
+        assert isinstance(apply_webgl_rendering(fig).data[0], go.Scatter)
+
+    def test_large_figure_switched(self):
+        n = 100
+        fig = go.Figure([
+            go.Bar(x=[1], y=[1]),
+            go.Scatter(x=np.arange(n), y=np.arange(n), error_y=dict(array=np.ones(n)), name='points'),
+        ])
+
+        fig = apply_webgl_rendering(fig, point_threshold=n - 1)
+
+        assert isinstance(fig.data[0], go.Bar)
+        assert isinstance(fig.data[1], go.Scattergl)
+        assert fig.data[1].name == 'points'
+        assert len(fig.data[1].error_y.array) == n
+
+
+class TestTraceConsolidation:
+    """Test that large plots stay at one trace per legend group."""
+
+    def setup_method(self):
+        self.df = generate_synthetic_data(
+            n_groups=30, n_animals=2, n_timepoints=3, n_tissues=1, n_metrics=40, seed=3
+        )
+
+    def test_overlay_timecourse_one_trace_per_group(self):
+        fig = create_timecourse_visualization(
+            self.df, metric='Freq. of Parent', group_by='Group', max_cell_types=10
+        )
+
+        assert len(fig.data) == 30
+        first = fig.data[0]
+        # 10 metrics x 3 timepoints, separated by 9 gaps
+        assert len(first.x) == 39
+        assert first.x[3] is None
+        assert len(set(first.marker.color) - {'black'}) == 10
+
+    def test_gui_timecourse_one_trace_per_group(self):
+        fig = create_gui_timecourse(self.df, metric='Freq. of Parent', group_by='Group', max_cell_types=10)
+
+        assert [trace.name for trace in fig.data] == [f"Group {g}" for g in range(1, 31)]
+
+    def test_individual_points_in_one_trace(self):
+        y = next(c for c in self.df.columns if ' | ' in c)
+
+        fig = plot(self.df, y=y, plot_type='bar', show_individual_points=True)
+
+        points = [trace for trace in fig.data if trace.name == 'Individual Points']
+        assert len(points) == 1
+        assert len(points[0].y) == len(self.df)
+        assert len(points[0].marker.color) == len(self.df)